@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -23,6 +23,53 @@ class Settings(BaseSettings):
         ["http://localhost:3000", "http://localhost:8080"], env="CORS_ORIGINS"
     )
 
+    # Response cache settings（TTL が 0 でスナップショットキャッシュを無効化。
+    # 保持するボディ（圧縮済みを含む）の合計バイト数の上限）
+    snapshot_cache_ttl_seconds: float = Field(60.0, env="SNAPSHOT_CACHE_TTL_SECONDS")
+    snapshot_cache_max_bytes: int = Field(
+        64 * 1024 * 1024, env="SNAPSHOT_CACHE_MAX_BYTES"
+    )
+
+    # Webhook settings（false で台帳更新の Webhook 配信を停止）
+    webhooks_enabled: bool = Field(True, env="WEBHOOKS_ENABLED")
+
+    # Admin API settings（Webhook 購読の管理APIの X-Admin-Api-Key と比較する。
+    # 未設定の場合は管理APIをすべて拒否する）
+    admin_api_key: Optional[str] = Field(None, env="ADMIN_API_KEY")
+
+    # Tracing settings（none / console / otlp。otlp の場合は OTLP/HTTP で
+    # TRACING_OTLP_ENDPOINT へ送る。未設定の場合は OTEL_EXPORTER_OTLP_* の
+    # 環境変数・既定の http://localhost:4318/v1/traces）
+    tracing_exporter: Literal["none", "console", "otlp"] = Field(
+        "none", env="TRACING_EXPORTER"
+    )
+    tracing_otlp_endpoint: Optional[str] = Field(None, env="TRACING_OTLP_ENDPOINT")
+
+    # Profiling settings（X-Profile ヘッダーのプロファイルに必要なトークン。
+    # 未設定の場合は DEBUG に関わらず無効）
+    profiling_token: Optional[str] = Field(None, env="PROFILING_TOKEN")
+
+    # Event loop watchdog settings（この秒数を超えるブロックのスタックを
+    # 警告ログに出力する。0 で遅延の計測ごと無効化）
+    loop_block_threshold_seconds: float = Field(
+        0.25, env="LOOP_BLOCK_THRESHOLD_SECONDS"
+    )
+
+    # Read backend settings（postgres の場合、公開データの読み取りを PostgREST を
+    # 経由せず DATABASE_URL の PostgreSQL へ asyncpg のコネクションプールで直接行う。
+    # PgBouncer のトランザクションモード経由で接続する場合は
+    # DATABASE_STATEMENT_CACHE_SIZE=0 でプリペアドステートメントのキャッシュを切る）
+    read_backend: Literal["postgrest", "postgres"] = Field(
+        "postgrest", env="READ_BACKEND"
+    )
+    database_url: Optional[str] = Field(None, env="DATABASE_URL")
+    database_pool_min_size: int = Field(2, env="DATABASE_POOL_MIN_SIZE")
+    database_pool_max_size: int = Field(10, env="DATABASE_POOL_MAX_SIZE")
+    database_statement_cache_size: int = Field(100, env="DATABASE_STATEMENT_CACHE_SIZE")
+    database_command_timeout_seconds: float = Field(
+        10.0, env="DATABASE_COMMAND_TIMEOUT_SECONDS"
+    )
+
     # Supabase settings
     supabase_url: Optional[str] = Field(None, env="SUPABASE_URL")
     supabase_secret_key: Optional[str] = Field(None, env="SUPABASE_SECRET_KEY")
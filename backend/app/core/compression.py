@@ -0,0 +1,147 @@
+"""レスポンス圧縮のエンコーディング
+
+Accept-Encoding のネゴシエーションと、br / zstd / gzip の圧縮処理を提供する。
+brotli・zstandard パッケージが無い環境では該当エンコーディングを使わない。
+"""
+
+import zlib
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - 依存が無い環境では gzip のみ
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - 依存が無い環境では gzip のみ
+    zstandard = None
+
+# これより小さいボディは圧縮しない（ヘッダー分で効果が相殺されるため）
+COMPRESSION_MINIMUM_SIZE = 1024
+
+# 利用可能なエンコーディング（q 値が同じ場合はこの順に優先する）
+SUPPORTED_ENCODINGS: tuple[str, ...] = tuple(
+    encoding
+    for encoding, available in (
+        ("br", brotli is not None),
+        ("zstd", zstandard is not None),
+        ("gzip", True),
+    )
+    if available
+)
+
+# リクエストごとに圧縮する場合の圧縮レベル（速度優先）
+_DYNAMIC_LEVELS = {"br": 4, "zstd": 3, "gzip": 6}
+
+# キャッシュに保存する場合の圧縮レベル（1回だけ圧縮するため圧縮率優先）
+_PRECOMPRESS_LEVELS = {"br": 9, "zstd": 12, "gzip": 9}
+
+# gzip 形式（ヘッダー・トレーラー付き）で出力する zlib の wbits
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+def negotiate_encoding(accept_encoding: str | None) -> str | None:
+    """Accept-Encoding ヘッダーから使用するエンコーディングを選ぶ
+
+    q 値の最も高い対応エンコーディングを返す。"*" は未指定の対応
+    エンコーディングすべてに適用し、q=0 は除外として扱う。
+
+    Args:
+        accept_encoding: Accept-Encoding ヘッダーの値
+
+    Returns:
+        str | None: "br" / "zstd" / "gzip"。圧縮しない場合は None
+    """
+    if not accept_encoding:
+        return None
+
+    qualities: dict[str, float] = {}
+    wildcard: float | None = None
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name == "*":
+            wildcard = quality
+        elif name:
+            qualities[name] = quality
+
+    best: str | None = None
+    best_quality = 0.0
+    for encoding in SUPPORTED_ENCODINGS:
+        quality = qualities.get(encoding, wildcard or 0.0)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(data: bytes, encoding: str, *, precompress: bool = False) -> bytes:
+    """バイト列を指定のエンコーディングで一括圧縮する
+
+    Args:
+        data: 圧縮するバイト列
+        encoding: "br" / "zstd" / "gzip"
+        precompress: キャッシュ保存用に圧縮率優先のレベルを使うかどうか
+
+    Returns:
+        bytes: 圧縮済みのバイト列
+    """
+    level = (_PRECOMPRESS_LEVELS if precompress else _DYNAMIC_LEVELS)[encoding]
+    if encoding == "br":
+        return brotli.compress(data, quality=level)
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=level).compress(data)
+    compressor = zlib.compressobj(level, zlib.DEFLATED, _GZIP_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+class StreamCompressor:
+    """ストリーミングレスポンス用の逐次圧縮器
+
+    断片ごとに圧縮結果をフラッシュし、受信側が逐次展開できるようにする。
+    """
+
+    def __init__(self, encoding: str):
+        level = _DYNAMIC_LEVELS[encoding]
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=level)
+        elif encoding == "zstd":
+            self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+        else:
+            self._compressor = zlib.compressobj(level, zlib.DEFLATED, _GZIP_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        """断片を圧縮し、ここまでの圧縮結果を返す
+
+        Args:
+            data: 圧縮する断片
+
+        Returns:
+            bytes: 圧縮済みの断片
+        """
+        if self.encoding == "br":
+            return self._compressor.process(data) + self._compressor.flush()
+        if self.encoding == "zstd":
+            return self._compressor.compress(data) + self._compressor.flush(
+                zstandard.COMPRESSOBJ_FLUSH_BLOCK
+            )
+        return self._compressor.compress(data) + self._compressor.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+
+    def finish(self) -> bytes:
+        """圧縮を終了し、残りの圧縮結果を返す
+
+        Returns:
+            bytes: 圧縮ストリームの終端
+        """
+        if self.encoding == "br":
+            return self._compressor.finish()
+        return self._compressor.flush()
@@ -0,0 +1,164 @@
+"""MessagePack のコンテントネゴシエーション
+
+Accept: application/msgpack のリクエストにはレスポンスを MessagePack で、
+Content-Type: application/msgpack のリクエストボディは MessagePack として
+読む。スキーマ・エンドポイントは JSON と共通で、表現形式のみ切り替える。
+"""
+
+from collections.abc import Callable, Coroutine
+from contextvars import ContextVar
+from typing import Any
+
+import msgpack
+from fastapi import Request, Response
+from pydantic_core import to_jsonable_python
+
+from app.core.profiling import ProfiledRoute
+from app.utils.json_stream import unwrap_models
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+# 受け付ける MessagePack のメディアタイプ（旧来の x- 付きを含む）
+MSGPACK_MEDIA_TYPES: tuple[str, ...] = (MSGPACK_MEDIA_TYPE, "application/x-msgpack")
+
+_JSON_MEDIA_TYPE = "application/json"
+_WILDCARD_MEDIA_TYPES: tuple[str, ...] = ("application/*", "*/*")
+
+# 処理中のリクエストが MessagePack のレスポンスを求めているかどうか
+_msgpack_requested: ContextVar[bool] = ContextVar("msgpack_requested", default=False)
+
+
+def _media_type(value: str) -> str:
+    return value.partition(";")[0].strip().lower()
+
+
+def _quality(params: str) -> float:
+    for param in params.split(";"):
+        name, _, value = param.strip().partition("=")
+        if name == "q":
+            try:
+                return float(value)
+            except ValueError:
+                return 0.0
+    return 1.0
+
+
+def prefers_msgpack(accept: str | None) -> bool:
+    """Accept ヘッダーが JSON より MessagePack を優先しているか判定する
+
+    MessagePack の q 値が application/json の明示指定より高く、
+    ワイルドカード（*/*, application/*）以上の場合に MessagePack とする。
+
+    Args:
+        accept: Accept ヘッダーの値
+
+    Returns:
+        bool: MessagePack で返す場合は True
+    """
+    if not accept:
+        return False
+
+    msgpack_quality = 0.0
+    json_quality = 0.0
+    wildcard_quality = 0.0
+    for item in accept.split(","):
+        media_type, _, params = item.strip().partition(";")
+        media_type = media_type.strip().lower()
+        quality = _quality(params)
+        if media_type in MSGPACK_MEDIA_TYPES:
+            msgpack_quality = max(msgpack_quality, quality)
+        elif media_type == _JSON_MEDIA_TYPE:
+            json_quality = max(json_quality, quality)
+        elif media_type in _WILDCARD_MEDIA_TYPES:
+            wildcard_quality = max(wildcard_quality, quality)
+
+    return (
+        msgpack_quality > 0
+        and msgpack_quality > json_quality
+        and msgpack_quality >= wildcard_quality
+    )
+
+
+def msgpack_requested() -> bool:
+    """処理中のリクエストが MessagePack のレスポンスを求めているかどうか
+
+    NegotiatedRoute のエンドポイント内でのみ True になりうる。
+
+    Returns:
+        bool: MessagePack で返す場合は True
+    """
+    return _msgpack_requested.get()
+
+
+def encode_msgpack(value: Any) -> bytes:
+    """値をJSONレスポンスと同じ構造の MessagePack に変換する
+
+    Pydanticモデルはエイリアス付きの辞書に展開し、UUID・日付等は
+    JSON と同じ文字列表現にする。
+
+    Args:
+        value: 直列化する値
+
+    Returns:
+        bytes: MessagePack
+    """
+    return msgpack.packb(
+        unwrap_models(value),
+        default=to_jsonable_python,
+        use_bin_type=True,
+    )
+
+
+class MsgpackRequest(Request):
+    """ボディを MessagePack として読むリクエスト
+
+    FastAPI はボディの解析に request.json() を使うため、これを
+    MessagePack の展開に置き換える。
+    """
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = msgpack.unpackb(await self.body(), raw=False)
+        return self._json
+
+
+def _with_json_content_type(scope: dict) -> dict:
+    # FastAPI は Content-Type が JSON の場合のみ request.json() でボディを読む
+    headers = [
+        (name, value) for name, value in scope["headers"] if name != b"content-type"
+    ]
+    headers.append((b"content-type", _JSON_MEDIA_TYPE.encode()))
+    return {**scope, "headers": headers}
+
+
+class NegotiatedRoute(ProfiledRoute):
+    """JSON と MessagePack を切り替えるルート
+
+    APIRouter(route_class=NegotiatedRoute) で使用する。レスポンスの
+    MessagePack 化は PydanticJSONResponse と snapshot_response が
+    msgpack_requested() を参照して行う。ストリーミングレスポンスは
+    JSON のまま返す。同期エンドポイントのプロファイルは ProfiledRoute が行う。
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        original_route_handler = super().get_route_handler()
+
+        async def negotiated_route_handler(request: Request) -> Response:
+            content_type = request.headers.get("content-type", "")
+            if _media_type(content_type) in MSGPACK_MEDIA_TYPES:
+                request = MsgpackRequest(
+                    _with_json_content_type(request.scope), request.receive
+                )
+
+            token = _msgpack_requested.set(
+                prefers_msgpack(request.headers.get("accept"))
+            )
+            try:
+                response = await original_route_handler(request)
+            finally:
+                _msgpack_requested.reset(token)
+
+            response.headers.add_vary_header("Accept")
+            return response
+
+        return negotiated_route_handler
@@ -0,0 +1,154 @@
+"""台帳更新イベントのプロセス内配信
+
+同期APIで台帳が変わったときのイベントを、購読者（SSE 接続等）ごとの
+上限付きキューへ配る。配信はキューへの追加のみで待機しないため、
+遅い購読者が同期処理を止めることはない。キューが溢れた購読者は
+切断し、再接続と再取得を促す。
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+
+# 購読者ごとに保持する未送信イベントの上限
+SUBSCRIBER_QUEUE_SIZE = 100
+
+
+@dataclass(frozen=True)
+class LedgerUpdateEvent:
+    """台帳更新イベント
+
+    Attributes:
+        ledger_id: 台帳ID（public_ledgers.id）
+        ledger_type: 台帳種別（political_fund / election_fund）
+        election_id: 選挙ID（選挙台帳のみ）
+        total_income: 収入合計
+        total_expense: 支出合計
+        journal_count: 仕訳件数
+        source: 発生元（"ledger" / "journals"）
+    """
+
+    ledger_id: str
+    ledger_type: str
+    election_id: str | None
+    total_income: int
+    total_expense: int
+    journal_count: int
+    source: str
+
+    def to_dict(self) -> dict:
+        """JSON に変換できる辞書を返す"""
+        return asdict(self)
+
+
+class Subscription:
+    """購読者1件分のイベントキュー
+
+    Args:
+        maxsize: 未送信イベントの上限
+        wants_events: 現在イベントを必要としているかを返す関数
+            （未指定の場合は常に必要とする）
+    """
+
+    def __init__(
+        self,
+        maxsize: int = SUBSCRIBER_QUEUE_SIZE,
+        wants_events: Callable[[], bool] | None = None,
+    ):
+        self._queue: asyncio.Queue[LedgerUpdateEvent | None] = asyncio.Queue(
+            maxsize=maxsize
+        )
+        self.overflowed = False
+        self._wants_events = wants_events
+
+    @property
+    def wants_events(self) -> bool:
+        """現在イベントを必要としているかどうか"""
+        return self._wants_events is None or self._wants_events()
+
+    def offer(self, event: LedgerUpdateEvent) -> bool:
+        """イベントを待機せずにキューへ追加する
+
+        Args:
+            event: 台帳更新イベント
+
+        Returns:
+            bool: 追加できた場合は True。溢れた場合は False
+        """
+        try:
+            self._queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    def close(self) -> None:
+        """未送信イベントを破棄し、購読の終了を通知する"""
+        self.overflowed = True
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(None)
+
+    async def get(self) -> LedgerUpdateEvent | None:
+        """次のイベントを待つ
+
+        Returns:
+            LedgerUpdateEvent | None: イベント。購読が終了した場合は None
+        """
+        return await self._queue.get()
+
+
+class Broadcaster:
+    """台帳更新イベントを購読者へ配る
+
+    同一イベントループ上での利用を前提とする（マルチワーカー構成では
+    ワーカーごとに独立）。
+    """
+
+    def __init__(self, queue_size: int = SUBSCRIBER_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._subscriptions: set[Subscription] = set()
+
+    @property
+    def has_subscribers(self) -> bool:
+        """イベントを必要としている購読者がいるかどうか"""
+        return any(subscription.wants_events for subscription in self._subscriptions)
+
+    def publish(self, event: LedgerUpdateEvent) -> None:
+        """イベントを全購読者へ配る
+
+        キューが溢れた購読者は配信対象から外し、購読を終了させる。
+
+        Args:
+            event: 台帳更新イベント
+        """
+        for subscription in list(self._subscriptions):
+            if not subscription.offer(event):
+                self._subscriptions.discard(subscription)
+                subscription.close()
+
+    @asynccontextmanager
+    async def subscribe(
+        self,
+        maxsize: int | None = None,
+        wants_events: Callable[[], bool] | None = None,
+    ) -> AsyncIterator[Subscription]:
+        """イベントを購読する
+
+        Args:
+            maxsize: 未送信イベントの上限（未指定の場合は queue_size）
+            wants_events: 現在イベントを必要としているかを返す関数。False の
+                間は has_subscribers の判定から外れる（イベントは届く）
+
+        Yields:
+            Subscription: 購読者のイベントキュー（抜けると購読を解除する）
+        """
+        subscription = Subscription(maxsize or self.queue_size, wants_events)
+        self._subscriptions.add(subscription)
+        try:
+            yield subscription
+        finally:
+            self._subscriptions.discard(subscription)
+
+
+ledger_events = Broadcaster()
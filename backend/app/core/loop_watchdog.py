@@ -0,0 +1,104 @@
+"""イベントループのブロック検出
+
+async def のエンドポイントから同期的な supabase-py の呼び出しを行うと、
+その間イベントループが止まり他のリクエストも待たされる。イベントループ上の
+タスクで一定間隔の sleep の遅れ（遅延）を計測して Prometheus メトリクスに
+記録する。あわせて別スレッドで、しきい値を超えて再開しないループの
+スレッドのスタックを取得し、ブロックしている処理を警告ログに出力する。
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+
+from app.core.metrics import event_loop_blocks_total, event_loop_lag_seconds
+
+logger = logging.getLogger(__name__)
+
+# 遅延を計測する間隔（秒）
+LOOP_LAG_INTERVAL_SECONDS = 0.1
+# この秒数を超えて再開しない場合にブロックとしてスタックを出力する
+LOOP_BLOCK_THRESHOLD_SECONDS = 0.25
+
+
+class LoopWatchdog:
+    """イベントループの遅延計測とブロック検出
+
+    start() はイベントループ上で呼び出す。ブロック1回につき警告は1回のみ
+    出力する（ブロック中の最初のスタック）。
+
+    Args:
+        threshold_seconds: ブロックとみなす秒数
+        interval_seconds: 遅延を計測する間隔（秒）
+    """
+
+    def __init__(
+        self,
+        threshold_seconds: float = LOOP_BLOCK_THRESHOLD_SECONDS,
+        interval_seconds: float = LOOP_LAG_INTERVAL_SECONDS,
+    ):
+        self._threshold_seconds = threshold_seconds
+        self._interval_seconds = interval_seconds
+        self._last_tick = time.monotonic()
+        self._loop_thread_id: int | None = None
+        self._task: asyncio.Task | None = None
+        self._thread: threading.Thread | None = None
+        self._stopping = threading.Event()
+
+    def start(self) -> None:
+        """計測タスクと監視スレッドを開始する"""
+        self._loop_thread_id = threading.get_ident()
+        self._last_tick = time.monotonic()
+        self._stopping.clear()
+        self._task = asyncio.get_running_loop().create_task(self._measure())
+        self._thread = threading.Thread(
+            target=self._monitor, name="loop-watchdog", daemon=True
+        )
+        self._thread.start()
+
+    async def stop(self) -> None:
+        """計測タスクと監視スレッドを停止する"""
+        self._stopping.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._thread is not None:
+            await asyncio.to_thread(self._thread.join)
+            self._thread = None
+
+    async def _measure(self) -> None:
+        while True:
+            started = time.monotonic()
+            await asyncio.sleep(self._interval_seconds)
+            now = time.monotonic()
+            event_loop_lag_seconds.observe(
+                max(0.0, now - started - self._interval_seconds)
+            )
+            self._last_tick = now
+
+    def _monitor(self) -> None:
+        reported_tick = None
+        check_interval = min(self._interval_seconds, self._threshold_seconds / 2)
+        while not self._stopping.wait(check_interval):
+            tick = self._last_tick
+            # 予定どおりなら interval_seconds ごとに tick が進む
+            blocked = time.monotonic() - tick - self._interval_seconds
+            if blocked <= self._threshold_seconds or tick == reported_tick:
+                continue
+            reported_tick = tick
+            event_loop_blocks_total.inc()
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame else ""
+            logger.warning(
+                "イベントループが %.3f 秒以上ブロックされています\n%s",
+                blocked,
+                stack,
+                extra={"blocked_seconds": round(blocked, 3)},
+            )
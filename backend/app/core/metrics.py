@@ -0,0 +1,205 @@
+"""Prometheus メトリクス
+
+HTTP リクエスト（ルート別のレイテンシ・レスポンスサイズ・処理中件数）、
+Supabase へのクエリ（テーブル・操作別の件数・レイテンシ）、イベントループの
+遅延を集計する。
+ラベルの組ごとの子メトリクスは初回に生成して保持し、リクエストごとの
+ラベル解決を省く。
+"""
+
+import threading
+from collections.abc import Iterable
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+
+# ルートに一致しなかったリクエスト（404 等）のラベル
+UNMATCHED_ROUTE = "<unmatched>"
+
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+# イベントループの遅延は 1 ms 未満が正常のため、細かい刻みから始める
+LOOP_LAG_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+
+# 256 B 〜 64 MiB（4 倍刻み）
+SIZE_BUCKETS: tuple[float, ...] = tuple(256 * 4**exponent for exponent in range(10))
+
+registry = CollectorRegistry(auto_describe=True)
+
+http_request_duration_seconds = Histogram(
+    "http_request_duration_seconds",
+    "HTTP リクエストの処理時間（秒）",
+    ("method", "route"),
+    buckets=LATENCY_BUCKETS,
+    registry=registry,
+)
+http_response_size_bytes = Histogram(
+    "http_response_size_bytes",
+    "HTTP レスポンスボディのサイズ（バイト、圧縮後）",
+    ("method", "route"),
+    buckets=SIZE_BUCKETS,
+    registry=registry,
+)
+http_requests_total = Counter(
+    "http_requests_total",
+    "HTTP リクエスト数",
+    ("method", "route", "status"),
+    registry=registry,
+)
+http_requests_in_progress = Gauge(
+    "http_requests_in_progress",
+    "処理中の HTTP リクエスト数",
+    registry=registry,
+)
+supabase_query_duration_seconds = Histogram(
+    "supabase_query_duration_seconds",
+    "Supabase（PostgREST）クエリの所要時間（秒）",
+    ("table", "operation"),
+    buckets=LATENCY_BUCKETS,
+    registry=registry,
+)
+supabase_query_errors_total = Counter(
+    "supabase_query_errors_total",
+    "失敗した Supabase（PostgREST）クエリ数",
+    ("table", "operation"),
+    registry=registry,
+)
+event_loop_lag_seconds = Histogram(
+    "event_loop_lag_seconds",
+    "イベントループの遅延（予定時刻から実際に再開するまでの秒数）",
+    buckets=LOOP_LAG_BUCKETS,
+    registry=registry,
+)
+event_loop_blocks_total = Counter(
+    "event_loop_blocks_total",
+    "しきい値を超えてイベントループがブロックされた回数",
+    registry=registry,
+)
+
+
+class _RouteMetrics:
+    """ルート1件分の子メトリクス"""
+
+    __slots__ = ("duration", "size", "statuses", "_method", "_route")
+
+    def __init__(self, method: str, route: str):
+        self._method = method
+        self._route = route
+        self.duration = http_request_duration_seconds.labels(method, route)
+        self.size = http_response_size_bytes.labels(method, route)
+        self.statuses: dict[int, Counter] = {}
+
+    def count(self, status_code: int) -> None:
+        counter = self.statuses.get(status_code)
+        if counter is None:
+            counter = http_requests_total.labels(
+                self._method, self._route, str(status_code)
+            )
+            self.statuses[status_code] = counter
+        counter.inc()
+
+
+class _QueryMetrics:
+    """テーブル・操作1組分の子メトリクス"""
+
+    __slots__ = ("duration", "errors")
+
+    def __init__(self, table: str, operation: str):
+        self.duration = supabase_query_duration_seconds.labels(table, operation)
+        self.errors = supabase_query_errors_total.labels(table, operation)
+
+
+_lock = threading.Lock()
+_route_metrics: dict[tuple[str, str], _RouteMetrics] = {}
+_query_metrics: dict[tuple[str, str], _QueryMetrics] = {}
+
+
+def route_metrics(method: str, route: str) -> _RouteMetrics:
+    """メソッド・ルートの子メトリクスを返す（無ければ生成する）
+
+    Args:
+        method: HTTP メソッド
+        route: ルートのパステンプレート（例: /api/v1/polimoney/elections/{election_id}/journals）
+
+    Returns:
+        _RouteMetrics: 子メトリクス
+    """
+    key = (method, route)
+    metrics = _route_metrics.get(key)
+    if metrics is None:
+        with _lock:
+            metrics = _route_metrics.get(key)
+            if metrics is None:
+                metrics = _RouteMetrics(method, route)
+                _route_metrics[key] = metrics
+    return metrics
+
+
+def preallocate_route_metrics(routes: Iterable[tuple[str, str]]) -> None:
+    """既知のメソッド・ルートの子メトリクスを事前に生成する
+
+    Args:
+        routes: (HTTP メソッド, パステンプレート) の組
+    """
+    for method, route in routes:
+        route_metrics(method, route)
+
+
+def observe_query(table: str, operation: str, seconds: float, failed: bool) -> None:
+    """Supabase クエリ1回分を記録する
+
+    Args:
+        table: テーブル名
+        operation: 操作（select / insert / update / upsert / delete）
+        seconds: 所要時間（秒）
+        failed: 例外で終了した場合は True
+    """
+    key = (table, operation)
+    metrics = _query_metrics.get(key)
+    if metrics is None:
+        with _lock:
+            metrics = _query_metrics.setdefault(key, _QueryMetrics(table, operation))
+    metrics.duration.observe(seconds)
+    if failed:
+        metrics.errors.inc()
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Prometheus のテキスト形式でメトリクスを出力する
+
+    Returns:
+        tuple[bytes, str]: 本文と Content-Type
+    """
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -0,0 +1,213 @@
+"""リクエスト単位のプロファイラー
+
+sys.setprofile で関数の呼び出し・復帰を記録し、呼び出しスタックごとの
+自己時間を集計する。結果は flamegraph.pl / speedscope / inferno がそのまま
+読める folded 形式（"親;子;孫 マイクロ秒"）で出力する。
+
+sys.setprofile はスレッド単位のため、プロファイラーはイベントループの
+スレッドに加えて、スレッドプールで動く同期エンドポイント（def）の実行中は
+そのワーカースレッドにも掛ける（ProfiledRoute）。ビルダー
+（app/utils/*_response.py）やリポジトリの読み込みはワーカースレッドで動く。
+記録するのはプロファイル中のリクエストのコンテキスト（contextvars）で
+動く処理のみで、同じスレッドで動く他のリクエストの処理は混ざらない。
+ストリーミングレスポンスの生成（iterate_in_threadpool）は対象外。
+イベントループのスレッドでプロファイラーを入れ子にすると外側の
+プロファイラーの復元順が崩れるため、同時に使えるのは1つのみ
+（ProfilingMiddleware が同時実行を拒否する）。
+"""
+
+import asyncio
+import hmac
+import os
+import sys
+import time
+from collections import Counter
+from collections.abc import Callable, Coroutine, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache, wraps
+from types import FrameType
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+from app.config import settings
+
+_SITE_PACKAGES = f"{os.sep}site-packages{os.sep}"
+
+# 処理中のリクエストのプロファイラー（プロファイル中のみ設定される）
+_current_profiler: ContextVar["StackProfiler | None"] = ContextVar(
+    "current_profiler", default=None
+)
+
+
+def profiling_allowed(token: str | None) -> bool:
+    """プロファイルの実行を許可するかどうかを判定する
+
+    PROFILING_TOKEN と一致するトークンが渡された場合のみ許可する。
+    DEBUG は既定で有効のため、デバッグモードでも許可の条件にしない。
+
+    Args:
+        token: リクエストの X-Profile-Token ヘッダーの値
+
+    Returns:
+        bool: 許可する場合は True
+    """
+    if not settings.profiling_token or not token:
+        return False
+    return hmac.compare_digest(token, settings.profiling_token)
+
+
+@lru_cache(maxsize=4096)
+def _short_path(filename: str) -> str:
+    _, separator, package_path = filename.rpartition(_SITE_PACKAGES)
+    if separator:
+        return package_path
+    if filename.startswith(os.getcwd()):
+        return os.path.relpath(filename)
+    return filename
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    label = (
+        f"{code.co_qualname} ({_short_path(code.co_filename)}:{code.co_firstlineno})"
+    )
+    # folded 形式ではセミコロンがスタックの区切り
+    return label.replace(";", ":")
+
+
+def _builtin_label(function: Any) -> str:
+    module = getattr(function, "__module__", None) or "builtins"
+    name = getattr(function, "__qualname__", None) or repr(function)
+    return f"{module}.{name}".replace(";", ":")
+
+
+class _ThreadStacks:
+    """1スレッド分の記録中のスタックと集計結果"""
+
+    __slots__ = ("stacks", "path", "last")
+
+    def __init__(self) -> None:
+        self.stacks: Counter = Counter()
+        self.path: tuple[str, ...] = ()
+        self.last = time.perf_counter_ns()
+
+
+class StackProfiler:
+    """呼び出しスタックごとの自己時間を集計する決定的プロファイラー
+
+    with ブロックの間、現在のスレッドの関数呼び出しのうち、ブロックと
+    同じコンテキストで動くものを記録する。profile_thread() で他の
+    スレッドも対象にできる。ブロック開始前から実行中の関数の復帰は無視する。
+    """
+
+    def __init__(self) -> None:
+        self._threads: list[_ThreadStacks] = []
+        self._previous_profile: Any = None
+        self._token: Any = None
+
+    @property
+    def stacks(self) -> Counter:
+        """スタック（ラベルのタプル）ごとの自己時間（ナノ秒、全スレッドの合計）"""
+        stacks: Counter = Counter()
+        for thread in self._threads:
+            stacks.update(thread.stacks)
+        return stacks
+
+    def _profile_function(self) -> Callable[[FrameType, str, Any], None]:
+        thread = _ThreadStacks()
+        self._threads.append(thread)
+
+        def profile(frame: FrameType, event: str, arg: Any) -> None:
+            now = time.perf_counter_ns()
+            if _current_profiler.get() is not self:
+                # 他のリクエストの処理は記録せず、その時間も含めない
+                thread.last = now
+                return
+            if thread.path:
+                thread.stacks[thread.path] += now - thread.last
+            if event == "call":
+                thread.path += (_frame_label(frame),)
+            elif event == "c_call":
+                thread.path += (_builtin_label(arg),)
+            elif thread.path:
+                # return / c_return / c_exception
+                thread.path = thread.path[:-1]
+            # 記録処理自体の時間は含めない
+            thread.last = time.perf_counter_ns()
+
+        return profile
+
+    @contextmanager
+    def profile_thread(self) -> Iterator[None]:
+        """ブロックの間、現在のスレッドもプロファイルの対象にする
+
+        スレッドプールのワーカースレッドで使う。
+        """
+        previous_profile = sys.getprofile()
+        sys.setprofile(self._profile_function())
+        try:
+            yield
+        finally:
+            sys.setprofile(previous_profile)
+
+    def __enter__(self) -> "StackProfiler":
+        self._token = _current_profiler.set(self)
+        self._previous_profile = sys.getprofile()
+        sys.setprofile(self._profile_function())
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        sys.setprofile(self._previous_profile)
+        _current_profiler.reset(self._token)
+
+    def folded(self) -> str:
+        """folded 形式のプロファイルを返す
+
+        Returns:
+            str: 1行1スタックの "親;子;孫 マイクロ秒"（自己時間の降順）
+        """
+        return "".join(
+            f"{';'.join(path)} {nanoseconds // 1000}\n"
+            for path, nanoseconds in self.stacks.most_common()
+            if nanoseconds >= 1000
+        )
+
+
+def profile_in_thread(function: Callable[..., Any]) -> Callable[..., Any]:
+    """スレッドプールで実行する関数を処理中のプロファイルの対象にする
+
+    プロファイル中でなければそのまま呼び出す。
+
+    Args:
+        function: 同期関数
+
+    Returns:
+        Callable[..., Any]: 同じシグネチャの関数
+    """
+
+    @wraps(function)
+    def profiled(*args: Any, **kwargs: Any) -> Any:
+        profiler = _current_profiler.get()
+        if profiler is None:
+            return function(*args, **kwargs)
+        with profiler.profile_thread():
+            return function(*args, **kwargs)
+
+    return profiled
+
+
+class ProfiledRoute(APIRoute):
+    """同期エンドポイントをワーカースレッドでもプロファイルするルート
+
+    APIRouter(route_class=ProfiledRoute) で使用する。同期エンドポイント
+    （def）は FastAPI がスレッドプールで実行するため、イベントループの
+    スレッドのプロファイラーでは記録できない。
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        if not asyncio.iscoroutinefunction(self.dependant.call):
+            self.dependant.call = profile_in_thread(self.dependant.call)
+        return super().get_route_handler()
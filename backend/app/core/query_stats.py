@@ -0,0 +1,118 @@
+"""リクエスト単位の Supabase クエリ集計
+
+処理中のリクエストで実行したクエリの回数・所要時間をテーブル・操作別に
+数える。Server-Timing ヘッダーの出力と、同じクエリを行ごとに繰り返す
+処理（N+1）の検出、テストでのクエリ数の上限チェックに使う。
+"""
+
+import threading
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+# 1リクエストで同じテーブル・操作のクエリがこの回数を超えたら N+1 とみなす
+N_PLUS_ONE_THRESHOLD = 20
+
+QueryListener = Callable[[str, str, float], None]
+
+
+@dataclass
+class QueryStats:
+    """クエリの集計結果
+
+    Attributes:
+        count: クエリ回数
+        seconds: 所要時間の合計（秒）
+        per_query: (テーブル, 操作) ごとのクエリ回数
+    """
+
+    count: int = 0
+    seconds: float = 0.0
+    per_query: Counter = field(default_factory=Counter)
+
+    def add(self, table: str, operation: str, seconds: float) -> None:
+        """クエリ1回分を加算する
+
+        Args:
+            table: テーブル名
+            operation: 操作
+            seconds: 所要時間（秒）
+        """
+        self.count += 1
+        self.seconds += seconds
+        self.per_query[(table, operation)] += 1
+
+    def repeated_queries(
+        self, threshold: int = N_PLUS_ONE_THRESHOLD
+    ) -> list[tuple[str, str, int]]:
+        """しきい値を超えて繰り返されたクエリを返す
+
+        Args:
+            threshold: 回数のしきい値
+
+        Returns:
+            list[tuple[str, str, int]]: (テーブル, 操作, 回数)
+        """
+        return [
+            (table, operation, count)
+            for (table, operation), count in self.per_query.items()
+            if count > threshold
+        ]
+
+
+# 処理中のリクエストの集計（リクエスト外では None）
+_current_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+_listeners: list[QueryListener] = []
+_listeners_lock = threading.Lock()
+
+
+def record_query(table: str, operation: str, seconds: float) -> None:
+    """クエリ1回分を処理中のリクエストの集計と登録済みのリスナーへ渡す
+
+    Args:
+        table: テーブル名
+        operation: 操作
+        seconds: 所要時間（秒）
+    """
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.add(table, operation, seconds)
+    for listener in _listeners:
+        listener(table, operation, seconds)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """ブロック内（リクエスト処理）のクエリを集計する
+
+    Yields:
+        QueryStats: 集計結果（ブロック内で実行したクエリが加算される）
+    """
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@contextmanager
+def capture_queries() -> Iterator[QueryStats]:
+    """スレッド・イベントループをまたいで全クエリを集計する
+
+    TestClient のようにアプリが別スレッドで動く場合のテスト用。
+
+    Yields:
+        QueryStats: 集計結果
+    """
+    stats = QueryStats()
+    with _listeners_lock:
+        _listeners.append(stats.add)
+    try:
+        yield stats
+    finally:
+        with _listeners_lock:
+            _listeners.remove(stats.add)
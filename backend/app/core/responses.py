@@ -0,0 +1,62 @@
+"""レスポンスクラス
+
+アプリ全体の既定レスポンスクラスとして、orjson でJSON化する
+レスポンスクラスを提供する。Pydanticモデルは response_model による
+再検証を経ずに直接JSON化する。
+"""
+
+from typing import Any, Mapping
+
+from fastapi.responses import JSONResponse
+from starlette.background import BackgroundTask
+
+from app.core.content_negotiation import (
+    MSGPACK_MEDIA_TYPE,
+    encode_msgpack,
+    msgpack_requested,
+)
+from app.core.tracing import start_span
+from app.utils.json_stream import encode_json
+
+
+class PydanticJSONResponse(JSONResponse):
+    """Pydanticモデルをそのまま直列化する orjson ベースのJSONレスポンス
+
+    main.py で default_response_class に設定しており、通常の
+    エンドポイントの戻り値（response_model 適用済みの値）もこのクラスで
+    orjson により直列化される。
+
+    エンドポイントがこのレスポンスを直接返した場合、FastAPI は
+    response_model による検証・変換を行わない。ビルダーが検証なしで
+    構築したモデル（model_construct、仕訳は出力形式の辞書）を、
+    エイリアス付きで1回だけ直列化する。
+
+    NegotiatedRoute のエンドポイントで MessagePack が求められた場合は、
+    同じ構造を MessagePack で直列化する。
+    """
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        media_type: str | None = None,
+        background: BackgroundTask | None = None,
+    ) -> None:
+        if media_type is None and msgpack_requested():
+            media_type = MSGPACK_MEDIA_TYPE
+        super().__init__(content, status_code, headers, media_type, background)
+
+    def render(self, content: Any) -> bytes:
+        """レスポンスボディを生成する
+
+        Args:
+            content: Pydanticモデル、またはJSON化可能な値
+
+        Returns:
+            bytes: JSON（MessagePack が求められた場合は MessagePack）ボディ
+        """
+        with start_span("serialize", {"media_type": self.media_type}):
+            if self.media_type == MSGPACK_MEDIA_TYPE:
+                return encode_msgpack(content)
+            return encode_json(content)
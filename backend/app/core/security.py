@@ -1 +1,41 @@
-# Auth0関連のコードは削除されました
+"""管理APIの認証
+
+管理用エンドポイントは X-Admin-Api-Key ヘッダーの値を設定の
+ADMIN_API_KEY と比較して認可する。ADMIN_API_KEY が未設定の場合は
+すべて拒否する。
+"""
+
+import hmac
+
+from fastapi import HTTPException, Security, status
+from fastapi.security import APIKeyHeader
+
+from app.config import settings
+
+ADMIN_API_KEY_HEADER = "X-Admin-Api-Key"
+
+_admin_api_key_header = APIKeyHeader(name=ADMIN_API_KEY_HEADER, auto_error=False)
+
+
+def require_admin_api_key(
+    api_key: str | None = Security(_admin_api_key_header),
+) -> None:
+    """管理APIキーを検証する依存関係
+
+    Args:
+        api_key: X-Admin-Api-Key ヘッダーの値
+
+    Raises:
+        HTTPException: ADMIN_API_KEY が未設定の場合（503）、キーが無いか
+            一致しない場合（401）
+    """
+    if not settings.admin_api_key:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="管理APIキーが設定されていません",
+        )
+    if not api_key or not hmac.compare_digest(api_key, settings.admin_api_key):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="管理APIキーが不正です",
+        )
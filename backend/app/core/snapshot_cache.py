@@ -0,0 +1,228 @@
+"""レスポンススナップショットのキャッシュ
+
+読み取り系エンドポイントのレスポンスボディをプロセス内に一定時間保持する。
+表現形式（JSON / MessagePack）ごとに別のスナップショットとし、
+圧縮済みのボディもエンコーディングごとに保持し、キャッシュヒット時は
+圧縮処理を行わずに返す。件数と、圧縮済みを含むボディの合計バイト数に
+上限を設け、超過時は最も古く使われたものから破棄する。
+
+同期APIによる書き込み時に全件破棄するが、破棄できるのは書き込みを
+処理したプロセスのキャッシュのみ。他のワーカープロセスやレプリカは
+最大で TTL（SNAPSHOT_CACHE_TTL_SECONDS）の間、更新前のレスポンスを返す。
+
+キャッシュミス時の組み立て・直列化・圧縮（br / zstd は高圧縮率の設定）は
+ブロッキング処理のため、snapshot_response は同期のハンドラー（FastAPI が
+スレッドプールで実行する）から呼び、イベントループ上では実行しない。
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from fastapi import Request, Response
+
+from app.config import settings
+from app.core.compression import COMPRESSION_MINIMUM_SIZE, compress, negotiate_encoding
+from app.core.content_negotiation import (
+    MSGPACK_MEDIA_TYPE,
+    encode_msgpack,
+    msgpack_requested,
+)
+from app.core.responses import PydanticJSONResponse
+from app.core.tracing import start_span
+from app.utils.json_stream import encode_json
+
+
+@dataclass
+class Snapshot:
+    """キャッシュ済みのレスポンスボディ
+
+    Attributes:
+        body: 非圧縮のボディ
+        created_at: 作成時刻（time.monotonic）
+        variants: エンコーディングをキーとした圧縮済みボディ
+        size: 非圧縮・圧縮済みボディの合計バイト数
+    """
+
+    body: bytes
+    created_at: float
+    variants: dict[str, bytes] = field(default_factory=dict)
+    size: int = field(init=False)
+    _on_resize: Callable[[], None] | None = field(
+        default=None, repr=False, compare=False
+    )
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self.size = len(self.body) + sum(map(len, self.variants.values()))
+
+    def encoded(self, encoding: str) -> bytes:
+        """指定エンコーディングの圧縮済みボディを返す
+
+        初回のみ圧縮し、以降は保持した結果を返す。同時に初回アクセスが
+        あった場合は1スレッドだけが圧縮し、他はその結果を待つ。
+
+        Args:
+            encoding: "br" / "zstd" / "gzip"
+
+        Returns:
+            bytes: 圧縮済みボディ
+        """
+        variant = self.variants.get(encoding)
+        if variant is not None:
+            return variant
+        with self._lock:
+            variant = self.variants.get(encoding)
+            if variant is not None:
+                return variant
+            variant = compress(self.body, encoding, precompress=True)
+            self.variants[encoding] = variant
+            self.size += len(variant)
+        if self._on_resize is not None:
+            self._on_resize()
+        return variant
+
+
+class SnapshotCache:
+    """TTL・件数上限・バイト数上限付きのスナップショットキャッシュ
+
+    Args:
+        ttl_seconds: 有効期間（秒）。0 以下の場合はキャッシュしない
+        max_entries: 保持する最大件数（超過時は最も古く使われたものから破棄）
+        max_bytes: 保持するボディ（圧縮済みを含む）の合計バイト数の上限
+            （超過時は最も古く使われたものから破棄）。非圧縮のボディだけで
+            上限を超えるものは保持しない
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int = 256,
+        max_bytes: int = 64 * 1024 * 1024,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, Snapshot] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """キャッシュが有効かどうか"""
+        return self.ttl_seconds > 0
+
+    def get(self, key: str) -> Snapshot | None:
+        """有効期間内のスナップショットを取得する
+
+        Args:
+            key: キャッシュキー
+
+        Returns:
+            Snapshot | None: スナップショット。無い・期限切れの場合は None
+        """
+        with self._lock:
+            snapshot = self._entries.get(key)
+            if snapshot is None:
+                return None
+            if time.monotonic() - snapshot.created_at >= self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return snapshot
+
+    @property
+    def total_bytes(self) -> int:
+        """保持しているボディ（圧縮済みを含む）の合計バイト数"""
+        with self._lock:
+            return sum(snapshot.size for snapshot in self._entries.values())
+
+    def put(self, key: str, body: bytes) -> Snapshot:
+        """ボディをスナップショットとして保存する
+
+        Args:
+            key: キャッシュキー
+            body: 非圧縮のボディ
+
+        Returns:
+            Snapshot: 保存したスナップショット（上限を超えるボディの場合は
+                保存せずに返す）
+        """
+        if len(body) > self.max_bytes:
+            return Snapshot(body=body, created_at=time.monotonic())
+        snapshot = Snapshot(
+            body=body, created_at=time.monotonic(), _on_resize=self._evict
+        )
+        with self._lock:
+            self._entries[key] = snapshot
+            self._entries.move_to_end(key)
+        self._evict()
+        return snapshot
+
+    def _evict(self) -> None:
+        # 圧縮済みボディは保存後に増えるため、その都度も呼ばれる
+        with self._lock:
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            total = sum(snapshot.size for snapshot in self._entries.values())
+            while total > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                total -= evicted.size
+
+    def invalidate(self) -> None:
+        """全スナップショットを破棄する
+
+        破棄するのはこのプロセスのキャッシュのみ。
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+snapshot_cache = SnapshotCache(
+    ttl_seconds=settings.snapshot_cache_ttl_seconds,
+    max_bytes=settings.snapshot_cache_max_bytes,
+)
+
+
+def snapshot_response(request: Request, build: Callable[[], Any]) -> Response:
+    """スナップショットキャッシュを経由してレスポンスを返す
+
+    キャッシュキーはパス・クエリ文字列と表現形式。キャッシュに無い場合は
+    build の戻り値を JSON（MessagePack が求められた場合は MessagePack）に
+    直列化して保存する。Accept-Encoding に応じて圧縮済みボディを返す。
+    ブロッキング処理を含むため、同期のハンドラーから呼ぶこと。
+
+    Args:
+        request: リクエスト
+        build: レスポンスの値（Pydanticモデル等）を組み立てる関数
+
+    Returns:
+        Response: JSON または MessagePack のレスポンス
+    """
+    if not snapshot_cache.enabled:
+        return PydanticJSONResponse(build())
+
+    if msgpack_requested():
+        media_type, encode = MSGPACK_MEDIA_TYPE, encode_msgpack
+    else:
+        media_type, encode = "application/json", encode_json
+
+    key = f"{media_type} {request.url.path}?{request.url.query}"
+    snapshot = snapshot_cache.get(key)
+    if snapshot is None:
+        content = build()
+        with start_span("serialize", {"media_type": media_type}):
+            snapshot = snapshot_cache.put(key, encode(content))
+
+    headers = {"Vary": "Accept-Encoding"}
+    body = snapshot.body
+    encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+    if encoding is not None and len(body) >= COMPRESSION_MINIMUM_SIZE:
+        body = snapshot.encoded(encoding)
+        headers["Content-Encoding"] = encoding
+
+    return Response(content=body, media_type=media_type, headers=headers)
@@ -0,0 +1,137 @@
+"""構造化ログ（JSON）の設定
+
+ログを1行1件の JSON で出力する。ログの書き出しは QueueHandler /
+QueueListener により別スレッドで行い、リクエスト処理のスレッド・
+イベントループでは標準出力への書き込みを待たない。処理中のリクエストの
+リクエストIDを各ログに付ける。
+"""
+
+import atexit
+import logging
+import queue
+import sys
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+import orjson
+
+# 処理中のリクエストのリクエストID（リクエスト外では None）
+request_id_var: ContextVar[str | None] = ContextVar("request_id", default=None)
+
+# LogRecord の標準の属性（これ以外を extra の項目として出力する）
+_RESERVED_ATTRS = frozenset(
+    logging.LogRecord("", 0, "", 0, "", None, None).__dict__
+) | {"message", "asctime", "request_id"}
+
+_listener: QueueListener | None = None
+
+
+class RequestIdFilter(logging.Filter):
+    """処理中のリクエストIDをログレコードに付けるフィルター
+
+    ContextVar はログを出力したスレッドでしか参照できないため、
+    キューへ渡す前（QueueHandler）に適用する。
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """リクエストIDを付ける
+
+        Args:
+            record: ログレコード
+
+        Returns:
+            bool: 常に True（ログを破棄しない）
+        """
+        record.request_id = request_id_var.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """ログレコードを1行の JSON に変換するフォーマッター
+
+    logger.info(..., extra={...}) で渡した項目はそのままキーとして出力する。
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """ログレコードを JSON 文字列にする
+
+        Args:
+            record: ログレコード
+
+        Returns:
+            str: JSON 文字列
+        """
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc)
+            .isoformat(timespec="milliseconds")
+            .replace("+00:00", "Z"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        request_id = getattr(record, "request_id", None)
+        if request_id is not None:
+            entry["request_id"] = request_id
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS:
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            # QueueHandler で文字列化済みの例外
+            entry["exception"] = record.exc_text
+        # ログ出力は失敗させないため、JSON化できない値は文字列にする
+        return orjson.dumps(entry, default=str).decode()
+
+
+class _StructuredQueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 既定の prepare は例外を message に埋め込むため、整形はリスナー側の
+        # JsonFormatter に任せ、例外は文字列化だけしてから渡す
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def _stop_listener() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def configure_logging(level: int) -> None:
+    """ルートロガーを JSON 出力・非同期書き出しに設定する
+
+    既存のハンドラーは取り除く。書き出しスレッドはプロセス終了時に
+    残りのログを出力してから停止する。
+
+    Args:
+        level: ルートロガーのログレベル
+    """
+    global _listener
+    _stop_listener()
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(JsonFormatter())
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+
+    queue_handler = _StructuredQueueHandler(log_queue)
+    queue_handler.addFilter(RequestIdFilter())
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    _listener.start()
+
+
+atexit.register(_stop_listener)
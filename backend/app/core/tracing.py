@@ -0,0 +1,131 @@
+"""OpenTelemetry によるトレーシング
+
+HTTP リクエスト・ビルダーの処理段階・Supabase（PostgREST）や PostgreSQL の
+呼び出しごとにスパンを記録する。スパンの生成・親子関係・バッチ出力は
+OpenTelemetry SDK が行い、このモジュールは設定値からのトレーサー
+プロバイダーの構築と、無効時に何もしない start_span のみを持つ。
+
+スパンは OTLP（HTTP/protobuf）でコレクターへ送るか、コンソールへ出力する。
+上流の traceparent ヘッダーは W3C Trace Context のプロパゲーターで
+引き継ぐ（app.middleware.tracing）。
+
+エクスポーターを設定しない場合（既定）はスパンを作らず、計測の負荷はない。
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from opentelemetry.context import Context
+from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    ConsoleSpanExporter,
+    SpanExporter,
+)
+from opentelemetry.trace import Span, SpanKind, Tracer
+
+SERVICE_NAME = "polimoney-hub"
+
+# 設定済みのトレーサー（None の場合はトレーシング無効）
+_provider: TracerProvider | None = None
+_tracer: Tracer | None = None
+
+
+def tracing_enabled() -> bool:
+    """トレーシングが有効かどうかを返す
+
+    Returns:
+        bool: トレーサープロバイダーが設定されている場合は True
+    """
+    return _tracer is not None
+
+
+def create_tracer_provider(exporter: SpanExporter) -> TracerProvider:
+    """終了したスパンを別スレッドでまとめて exporter へ出力するプロバイダーを作る
+
+    Args:
+        exporter: 出力先
+
+    Returns:
+        TracerProvider: service.name を設定したトレーサープロバイダー
+    """
+    provider = TracerProvider(resource=Resource.create({"service.name": SERVICE_NAME}))
+    provider.add_span_processor(BatchSpanProcessor(exporter))
+    return provider
+
+
+def set_tracer_provider(provider: TracerProvider | None) -> None:
+    """スパンを記録するトレーサープロバイダーを設定する（None で無効化）
+
+    OpenTelemetry のグローバルなプロバイダーは1度しか設定できないため、
+    このモジュールで保持する。以前のプロバイダーは出力待ちのスパンを
+    出力してから停止する。
+
+    Args:
+        provider: トレーサープロバイダー
+    """
+    global _provider, _tracer
+    previous, _provider = _provider, provider
+    _tracer = provider.get_tracer(__name__) if provider is not None else None
+    if previous is not None:
+        previous.shutdown()
+
+
+def configure_tracing(exporter: str, otlp_endpoint: str | None = None) -> None:
+    """設定値に従ってトレーシングを有効にする
+
+    Args:
+        exporter: "none" / "console" / "otlp"
+        otlp_endpoint: exporter が "otlp" の場合の送信先。未指定の場合は
+            OTEL_EXPORTER_OTLP_* の環境変数（既定は http://localhost:4318/v1/traces）
+
+    Raises:
+        ValueError: 未知のエクスポーターが指定された場合
+    """
+    if exporter == "none":
+        set_tracer_provider(None)
+    elif exporter == "console":
+        set_tracer_provider(create_tracer_provider(ConsoleSpanExporter()))
+    elif exporter == "otlp":
+        set_tracer_provider(
+            create_tracer_provider(OTLPSpanExporter(endpoint=otlp_endpoint))
+        )
+    else:
+        raise ValueError(f"未知のトレースエクスポーターです: {exporter}")
+
+
+@contextmanager
+def start_span(
+    name: str,
+    attributes: dict[str, Any] | None = None,
+    *,
+    kind: str = "INTERNAL",
+    context: Context | None = None,
+) -> Iterator[Span | None]:
+    """ブロックの処理をスパンとして記録する
+
+    処理中のスパンがあればその子スパンとする。ブロック内で例外が発生した
+    場合はスパンに記録して再送出する。
+
+    Args:
+        name: スパン名
+        attributes: 属性
+        kind: SERVER / CLIENT / INTERNAL
+        context: 上流から引き継いだコンテキスト。指定時は処理中の
+            スパンより優先する
+
+    Yields:
+        Span | None: 記録中のスパン（トレーシング無効時は None）
+    """
+    tracer = _tracer
+    if tracer is None:
+        yield None
+        return
+
+    with tracer.start_as_current_span(
+        name, context=context, kind=SpanKind[kind], attributes=attributes
+    ) as span:
+        yield span
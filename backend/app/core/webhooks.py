@@ -0,0 +1,368 @@
+"""Webhook の配信
+
+台帳更新イベントを購読し、一定時間内に届いたイベントを通知先 URL ごとに
+まとめて POST する。配信はバックグラウンドのタスクで並行に行い、
+失敗時は指数バックオフで再送する。同期APIのリクエスト処理は待たない。
+
+通知先のホストは登録時に加えて送信のたびに名前解決し、グローバルな
+アドレスであることを確認したうえで、そのアドレスへ直接接続する
+（DNS の応答を登録後に内部アドレスへ変える DNS rebinding を防ぐ）。
+"""
+
+import asyncio
+import hashlib
+import hmac
+import ipaddress
+import logging
+import random
+import socket
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import httpx
+
+from app.core.events import Broadcaster, LedgerUpdateEvent, ledger_events
+from app.utils.json_stream import encode_json
+
+logger = logging.getLogger(__name__)
+
+# 最初のイベントからこの秒数の間に届いたイベントを1回の配信にまとめる
+WEBHOOK_COALESCE_SECONDS = 2.0
+
+# 1配信あたりの最大試行回数と再送間隔（秒）
+WEBHOOK_MAX_ATTEMPTS = 5
+WEBHOOK_RETRY_BASE_SECONDS = 1.0
+WEBHOOK_RETRY_MAX_SECONDS = 60.0
+
+WEBHOOK_TIMEOUT_SECONDS = 10.0
+
+# 同時に送信する配信数の上限
+WEBHOOK_MAX_CONCURRENCY = 16
+
+# 配信待ちのイベントの上限（超過時は溢れた分を破棄して購読し直す）
+WEBHOOK_QUEUE_SIZE = 10_000
+
+# 有効な購読の有無を確認し直す間隔（秒）。購読が無い間は台帳更新イベントの
+# 発行（集計値の読み出し）を省くため、登録直後はこの時間だけ配信が遅れうる
+WEBHOOK_SUBSCRIPTION_REFRESH_SECONDS = 30.0
+
+SIGNATURE_HEADER = "X-Polimoney-Signature"
+DELIVERY_HEADER = "X-Polimoney-Delivery"
+
+
+@dataclass(frozen=True)
+class WebhookSubscription:
+    """Webhook の購読1件
+
+    Attributes:
+        id: 購読ID
+        url: 通知先 URL
+        secret: 署名用の共有鍵（未設定の場合は署名しない）
+        election_id: 通知対象の選挙ID
+        ledger_id: 通知対象の台帳ID
+    """
+
+    id: str
+    url: str
+    secret: str | None = None
+    election_id: str | None = None
+    ledger_id: str | None = None
+
+    def matches(self, event: LedgerUpdateEvent) -> bool:
+        """イベントが通知対象かどうか
+
+        Args:
+            event: 台帳更新イベント
+
+        Returns:
+            bool: 通知対象の場合は True
+        """
+        if self.ledger_id is not None:
+            return self.ledger_id == event.ledger_id
+        return self.election_id is not None and self.election_id == event.election_id
+
+
+SubscriptionLoader = Callable[[list[LedgerUpdateEvent]], list[WebhookSubscription]]
+
+HostResolver = Callable[[str], Awaitable[list[str]]]
+
+
+async def resolve_host(host: str) -> list[str]:
+    """ホスト名を IP アドレスに解決する（イベントループは止めない）
+
+    Args:
+        host: ホスト名
+
+    Returns:
+        list[str]: IP アドレス
+
+    Raises:
+        OSError: 解決できない場合
+    """
+    infos = await asyncio.get_running_loop().getaddrinfo(
+        host, None, type=socket.SOCK_STREAM
+    )
+    return [info[4][0] for info in infos]
+
+
+def is_global_address(address: str) -> bool:
+    """IP アドレスがグローバル（ループバック・プライベート等でない）かどうか
+
+    Args:
+        address: IP アドレス（IPv6 のスコープID付きも可）
+
+    Returns:
+        bool: グローバルな場合は True
+    """
+    return ipaddress.ip_address(address.split("%")[0]).is_global
+
+
+def sign_payload(secret: str, body: bytes) -> str:
+    """ペイロードの HMAC-SHA256 署名ヘッダー値を返す
+
+    Args:
+        secret: 共有鍵
+        body: リクエストボディ
+
+    Returns:
+        str: "sha256=<hex>"
+    """
+    digest = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return f"sha256={digest}"
+
+
+def _is_retryable(status_code: int) -> bool:
+    return status_code >= 500 or status_code in (408, 429)
+
+
+class WebhookDispatcher:
+    """台帳更新イベントを Webhook で配信する
+
+    Args:
+        load_subscriptions: イベントに該当する購読を読み出す関数
+            （同期関数。別スレッドで実行する）
+        has_active_subscriptions: 有効な購読が1件以上あるかを返す関数
+            （同期関数。別スレッドで refresh_seconds ごとに実行する）。
+            未指定の場合は常にイベントを購読する
+        broadcaster: 購読元
+        client: 送信に使う HTTP クライアント（未指定の場合は作成する）
+        coalesce_seconds: イベントをまとめる時間（秒）
+        max_attempts: 1配信あたりの最大試行回数
+        retry_base_seconds: 再送間隔の初期値（秒）
+        max_concurrency: 同時に送信する配信数の上限
+        refresh_seconds: 有効な購読の有無を確認し直す間隔（秒）
+        resolve_host: 送信時に通知先のホストを解決する関数
+    """
+
+    def __init__(
+        self,
+        load_subscriptions: SubscriptionLoader,
+        *,
+        has_active_subscriptions: Callable[[], bool] | None = None,
+        broadcaster: Broadcaster = ledger_events,
+        client: httpx.AsyncClient | None = None,
+        coalesce_seconds: float = WEBHOOK_COALESCE_SECONDS,
+        max_attempts: int = WEBHOOK_MAX_ATTEMPTS,
+        retry_base_seconds: float = WEBHOOK_RETRY_BASE_SECONDS,
+        max_concurrency: int = WEBHOOK_MAX_CONCURRENCY,
+        refresh_seconds: float = WEBHOOK_SUBSCRIPTION_REFRESH_SECONDS,
+        resolve_host: HostResolver = resolve_host,
+    ):
+        self._resolve_host = resolve_host
+        self._load_subscriptions = load_subscriptions
+        self._has_active_subscriptions = has_active_subscriptions
+        self.refresh_seconds = refresh_seconds
+        # 確認できるまでは購読があるものとして扱う
+        self.has_subscriptions = True
+        self._broadcaster = broadcaster
+        self._owns_client = client is None
+        self._client = client or httpx.AsyncClient(timeout=WEBHOOK_TIMEOUT_SECONDS)
+        self.coalesce_seconds = coalesce_seconds
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._task: asyncio.Task | None = None
+        self._refresh_task: asyncio.Task | None = None
+        self._deliveries: set[asyncio.Task] = set()
+
+    def start(self) -> None:
+        """イベントの購読と配信を開始する"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        if self._refresh_task is None and self._has_active_subscriptions is not None:
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        """購読を停止し、配信中のタスクを取り消す"""
+        tasks = [*self._deliveries]
+        for task in (self._task, self._refresh_task):
+            if task is not None:
+                tasks.append(task)
+        self._task = None
+        self._refresh_task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def drain(self) -> None:
+        """配信中のタスクがすべて終わるまで待つ"""
+        while self._deliveries:
+            await asyncio.gather(*self._deliveries, return_exceptions=True)
+
+    async def refresh(self) -> None:
+        """有効な購読の有無を確認し直す
+
+        確認に失敗した場合は購読があるものとして扱う。
+        """
+        try:
+            self.has_subscriptions = await asyncio.to_thread(
+                self._has_active_subscriptions
+            )
+        except Exception:
+            logger.warning("Webhook の購読の有無の確認に失敗しました", exc_info=True)
+            self.has_subscriptions = True
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self.refresh_seconds)
+
+    async def _run(self) -> None:
+        while True:
+            async with self._broadcaster.subscribe(
+                WEBHOOK_QUEUE_SIZE, wants_events=lambda: self.has_subscriptions
+            ) as subscription:
+                closed = False
+                while not closed:
+                    events, closed = await self._collect(subscription)
+                    if events:
+                        await self.dispatch(events)
+            logger.warning(
+                "Webhook の配信待ちが上限を超えたため、イベントを破棄しました"
+            )
+
+    async def _collect(self, subscription) -> tuple[list[LedgerUpdateEvent], bool]:
+        first = await subscription.get()
+        if first is None:
+            return [], True
+
+        events = [first]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.coalesce_seconds
+        while (remaining := deadline - loop.time()) > 0:
+            try:
+                event = await asyncio.wait_for(subscription.get(), timeout=remaining)
+            except asyncio.TimeoutError:
+                break
+            if event is None:
+                return events, True
+            events.append(event)
+        return events, False
+
+    async def dispatch(self, events: list[LedgerUpdateEvent]) -> None:
+        """イベントを通知先 URL ごとにまとめて配信タスクを起動する
+
+        同じ台帳のイベントは最新のもののみ送る。配信の完了は待たない。
+
+        Args:
+            events: 台帳更新イベント（発生順）
+        """
+        latest = list({event.ledger_id: event for event in events}.values())
+        try:
+            subscriptions = await asyncio.to_thread(self._load_subscriptions, latest)
+        except Exception:
+            logger.warning("Webhook の購読の読み出しに失敗しました", exc_info=True)
+            return
+
+        batches: dict[tuple[str, str | None], list[LedgerUpdateEvent]] = {}
+        for subscription in subscriptions:
+            batch = batches.setdefault((subscription.url, subscription.secret), [])
+            for event in latest:
+                if subscription.matches(event) and event not in batch:
+                    batch.append(event)
+
+        for (url, secret), batch in batches.items():
+            if not batch:
+                continue
+            task = asyncio.create_task(self.deliver(url, secret, batch))
+            self._deliveries.add(task)
+            task.add_done_callback(self._deliveries.discard)
+
+    async def deliver(
+        self, url: str, secret: str | None, events: list[LedgerUpdateEvent]
+    ) -> bool:
+        """イベントをまとめて1つの通知先へ送る
+
+        5xx・408・429・通信エラーの場合は指数バックオフ（ジッター付き）で
+        再送する。それ以外の 4xx は再送しない。通知先のホストは試行ごとに
+        解決し、グローバルでないアドレスが含まれる場合は送信せずに中止する。
+        接続は確認したアドレスへ行い、Host ヘッダーと TLS の SNI・証明書の
+        検証には元のホスト名を使う。
+
+        Args:
+            url: 通知先 URL
+            secret: 署名用の共有鍵
+            events: 送信するイベント
+
+        Returns:
+            bool: 配信できた場合は True
+        """
+        delivery_id = str(uuid4())
+        body = encode_json(
+            {
+                "delivery_id": delivery_id,
+                "sent_at": datetime.now(timezone.utc).isoformat(),
+                "events": [event.to_dict() for event in events],
+            }
+        )
+        target = httpx.URL(url)
+        headers = {
+            "Content-Type": "application/json",
+            "Host": target.netloc.decode("ascii"),
+            DELIVERY_HEADER: delivery_id,
+        }
+        if secret:
+            headers[SIGNATURE_HEADER] = sign_payload(secret, body)
+
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                addresses = await self._resolve_host(target.host)
+                if not addresses or not all(map(is_global_address, addresses)):
+                    logger.warning(
+                        "Webhook の通知先が内部ネットワークのアドレスに解決されたため"
+                        "配信を中止しました: %s",
+                        url,
+                    )
+                    return False
+                async with self._semaphore:
+                    response = await self._client.post(
+                        target.copy_with(host=addresses[0]),
+                        content=body,
+                        headers=headers,
+                        extensions={"sni_hostname": target.host},
+                    )
+                if response.is_success:
+                    return True
+                if not _is_retryable(response.status_code):
+                    logger.warning(
+                        "Webhook の配信を中止しました: %s (status=%s)",
+                        url,
+                        response.status_code,
+                    )
+                    return False
+            except (httpx.HTTPError, OSError) as exc:
+                logger.info("Webhook の送信に失敗しました: %s (%s)", url, exc)
+
+            if attempt < self.max_attempts:
+                delay = min(
+                    self.retry_base_seconds * 2 ** (attempt - 1),
+                    WEBHOOK_RETRY_MAX_SECONDS,
+                )
+                await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+
+        logger.warning("Webhook の配信に %s 回失敗しました: %s", self.max_attempts, url)
+        return False
@@ -0,0 +1,148 @@
+"""Supabaseクライアントの計測ラッパー
+
+supabase.table(...) から始まるクエリビルダーの連鎖をそのまま転送し、
+execute() の所要時間をテーブル・操作別に記録する（Prometheus メトリクスと
+リクエスト単位の集計）。トレーシングが有効な場合は呼び出しごとにスパンを
+作り、テーブルとフィルターの形（値を除いたメソッドと列名の並び）を付ける。
+ルーター・ユーティリティ側のコードは通常の Client と同じように扱える。
+"""
+
+import time
+from typing import Any
+
+from supabase import Client
+
+from app.core.metrics import observe_query
+from app.core.query_stats import record_query
+from app.core.tracing import start_span, tracing_enabled
+
+# クエリの操作を決めるビルダーのメソッド
+_OPERATIONS = frozenset({"select", "insert", "update", "upsert", "delete"})
+
+# 第1引数が列名のビルダーのメソッド（フィルターの形に列名を含める）
+_COLUMN_METHODS = frozenset(
+    {
+        "eq",
+        "neq",
+        "gt",
+        "gte",
+        "lt",
+        "lte",
+        "like",
+        "ilike",
+        "is_",
+        "in_",
+        "contains",
+        "contained_by",
+        "filter",
+        "text_search",
+        "order",
+    }
+)
+
+
+def _describe_call(name: str, args: tuple) -> str:
+    # 値（フィルター条件・書き込むデータ）は含めない
+    if name in _COLUMN_METHODS and args and isinstance(args[0], str):
+        return f"{name}({args[0]})"
+    return name
+
+
+class InstrumentedQuery:
+    """クエリビルダーの計測プロキシ
+
+    Args:
+        builder: postgrest のリクエストビルダー
+        table: テーブル名
+        operation: 操作（select / insert / update / upsert / delete）
+        shape: これまでに呼び出したメソッドの並び（トレーシング有効時のみ）
+    """
+
+    __slots__ = ("_builder", "_table", "_operation", "_shape")
+
+    def __init__(
+        self,
+        builder: Any,
+        table: str,
+        operation: str = "select",
+        shape: tuple[str, ...] = (),
+    ):
+        self._builder = builder
+        self._table = table
+        self._operation = operation
+        self._shape = shape
+
+    def _wrap(self, result: Any, operation: str, shape: tuple[str, ...]) -> Any:
+        if hasattr(result, "execute"):
+            return InstrumentedQuery(result, self._table, operation, shape)
+        return result
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._builder, name)
+        if not callable(attr):
+            # not_ のようにビルダー自身を返すプロパティ
+            return self._wrap(attr, self._operation, self._shape)
+
+        operation = name if name in _OPERATIONS else self._operation
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            shape = self._shape
+            if tracing_enabled():
+                shape += (_describe_call(name, args),)
+            return self._wrap(attr(*args, **kwargs), operation, shape)
+
+        return call
+
+    def execute(self) -> Any:
+        """クエリを実行し、所要時間を記録する"""
+        with start_span(
+            f"{self._operation} {self._table}",
+            {
+                "db.system": "postgrest",
+                "db.sql.table": self._table,
+                "db.operation": self._operation,
+                "db.filter_shape": ".".join(self._shape),
+            },
+            kind="CLIENT",
+        ):
+            started = time.perf_counter()
+            failed = True
+            try:
+                response = self._builder.execute()
+                failed = False
+                return response
+            finally:
+                elapsed = time.perf_counter() - started
+                observe_query(self._table, self._operation, elapsed, failed)
+                record_query(self._table, self._operation, elapsed)
+
+
+class InstrumentedClient:
+    """Supabaseクライアントの計測プロキシ
+
+    table() 以外の属性はそのまま元のクライアントへ転送する。
+
+    Args:
+        client: Supabaseクライアント
+    """
+
+    __slots__ = ("_client",)
+
+    def __init__(self, client: Client):
+        self._client = client
+
+    def table(self, table_name: str) -> InstrumentedQuery:
+        """計測付きのクエリビルダーを返す
+
+        Args:
+            table_name: テーブル名
+
+        Returns:
+            InstrumentedQuery: クエリビルダーのプロキシ
+        """
+        return InstrumentedQuery(self._client.table(table_name), table_name)
+
+    from_ = table
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
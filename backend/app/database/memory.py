@@ -0,0 +1,988 @@
+"""インメモリの Supabase クライアント
+
+supabase.table(...) から始まるクエリビルダーの連鎖を、メモリ上のテーブル
+（行の辞書のリスト）に対して実行する。テスト・ベンチマークで、ネットワーク
+や MagicMock の固定応答に左右されずに、フィルターに応じた結果・クエリ回数・
+処理時間を確かめるために使う。
+
+対応する構文:
+    - select: 列名・"*"・多対一の埋め込み（"alias:fk_column(...)"、
+      "alias:table(...)"、"!inner"）・count="exact"・head=True
+    - フィルター: eq / neq / gt / gte / lt / lte / in_ / is_（埋め込み先の列は
+      "alias.column"）と or_（"and(...)" の入れ子・引用符付きの値を含む）
+    - order / range / limit / single / maybe_single
+    - 書き込み: insert / update / upsert（on_conflict・ignore_duplicates）/
+      delete
+
+テーブルの列・既定値・NOT NULL・一意制約は db/schema-normalized.sql と
+db/migrate-*.sql に合わせて TABLE_COLUMNS・UNIQUE_KEYS に写しており、
+存在しない列の参照や制約違反は PostgREST と同じコードの APIError になる
+（TABLE_COLUMNS にないテーブルは検証しない）。初期データの行には既定値を
+補う（NOT NULL の列も省略できる）。
+
+フィルター・並び替えの結果は保持し、range によるページ分割の取得を
+行数に比例した時間で返す（書き込んだテーブルの結果は破棄する）。
+latency_seconds を指定すると、execute() ごとにその秒数だけ同期的に待ち、
+PostgREST への往復を模擬する。
+"""
+
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+from uuid import uuid4
+
+from postgrest.exceptions import APIError
+
+# 列の既定値の種類（TABLE_COLUMNS の値。それ以外の値はその値が既定値）
+REQUIRED = "<NOT NULL>"  # NOT NULL で既定値なし
+NOW = "<NOW()>"
+GEN_RANDOM_UUID = "<gen_random_uuid()>"
+
+_AUDIT_COLUMNS = {"is_active": True, "created_at": NOW, "updated_at": NOW}
+
+# テーブル → 列 → 既定値（None は NULL 可で既定値なし）
+TABLE_COLUMNS: dict[str, dict[str, Any]] = {
+    "municipalities": {
+        "code": REQUIRED,
+        "prefecture_name": REQUIRED,
+        "city_name": None,
+        "prefecture_name_kana": None,
+        "city_name_kana": None,
+        **_AUDIT_COLUMNS,
+    },
+    "districts": {
+        "id": GEN_RANDOM_UUID,
+        "name": REQUIRED,
+        "type": REQUIRED,
+        "prefecture_codes": None,
+        "municipality_code": None,
+        "description": None,
+        **_AUDIT_COLUMNS,
+    },
+    "politicians": {
+        "id": GEN_RANDOM_UUID,
+        "name": REQUIRED,
+        "name_kana": None,
+        "created_at": NOW,
+        "updated_at": NOW,
+    },
+    "organizations": {
+        "id": GEN_RANDOM_UUID,
+        "name": REQUIRED,
+        "type": REQUIRED,
+        "logo_url": None,
+        **_AUDIT_COLUMNS,
+    },
+    "elections": {
+        "id": GEN_RANDOM_UUID,
+        "name": REQUIRED,
+        "type": REQUIRED,
+        "district_id": None,
+        "election_date": REQUIRED,
+        **_AUDIT_COLUMNS,
+    },
+    "master_metadata": {"table_name": REQUIRED, "last_updated_at": NOW},
+    "account_codes": {
+        "code": REQUIRED,
+        "name": REQUIRED,
+        "name_kana": None,
+        "type": REQUIRED,
+        "report_category": REQUIRED,
+        "ledger_type": "both",
+        "is_public_subsidy_eligible": False,
+        "display_order": REQUIRED,
+        "polimoney_category": None,
+        "parent_code": None,
+        "description": None,
+        **_AUDIT_COLUMNS,
+    },
+    "election_types": {
+        "code": REQUIRED,
+        "name": REQUIRED,
+        "description": None,
+        "display_order": REQUIRED,
+        "is_active": True,
+        "created_at": NOW,
+    },
+    "public_subsidy_items": {
+        "id": GEN_RANDOM_UUID,
+        "election_type_code": REQUIRED,
+        "account_code": REQUIRED,
+        "item_name": REQUIRED,
+        "unit": None,
+        "unit_price_limit": None,
+        "quantity_formula": None,
+        "max_quantity": None,
+        "total_limit": None,
+        "notes": None,
+        "effective_from": None,
+        "effective_until": None,
+        **_AUDIT_COLUMNS,
+    },
+    "politician_organizations": {
+        "id": GEN_RANDOM_UUID,
+        "politician_id": REQUIRED,
+        "organization_id": REQUIRED,
+        "role": "representative",
+        **_AUDIT_COLUMNS,
+    },
+    "politician_elections": {
+        "id": GEN_RANDOM_UUID,
+        "politician_id": REQUIRED,
+        "election_id": REQUIRED,
+        "created_at": NOW,
+    },
+    "public_ledgers": {
+        "id": GEN_RANDOM_UUID,
+        "ledger_type": REQUIRED,
+        "politician_organization_id": None,
+        "politician_election_id": None,
+        "fiscal_year": REQUIRED,
+        "total_income": 0,
+        "total_expense": 0,
+        "journal_count": 0,
+        "ledger_source_id": REQUIRED,
+        "is_test": False,
+        "last_updated_at": REQUIRED,
+        "first_synced_at": REQUIRED,
+        "created_at": NOW,
+    },
+    "public_contacts": {
+        "id": GEN_RANDOM_UUID,
+        "ledger_id": REQUIRED,
+        "contact_source_id": REQUIRED,
+        "contact_type": REQUIRED,
+        "name": None,
+        "address": None,
+        "occupation": None,
+        "is_name_private": False,
+        "is_address_private": False,
+        "is_occupation_private": False,
+        "privacy_reason_type": None,
+        "privacy_reason_other": None,
+        "hub_organization_id": None,
+        "synced_at": REQUIRED,
+        "created_at": NOW,
+    },
+    "public_journals": {
+        "id": GEN_RANDOM_UUID,
+        "ledger_id": REQUIRED,
+        "journal_source_id": REQUIRED,
+        "date": None,
+        "description": None,
+        "amount": REQUIRED,
+        "contact_id": None,
+        "account_code": None,
+        "classification": None,
+        "non_monetary_basis": None,
+        "note": None,
+        "public_expense_amount": None,
+        "content_hash": REQUIRED,
+        "is_test": False,
+        "synced_at": REQUIRED,
+        "created_at": NOW,
+    },
+    "ledger_change_logs": {
+        "id": GEN_RANDOM_UUID,
+        "ledger_id": REQUIRED,
+        "changed_at": REQUIRED,
+        "change_summary": REQUIRED,
+        "change_details": None,
+        "created_at": NOW,
+    },
+    "webhook_subscriptions": {
+        "id": GEN_RANDOM_UUID,
+        "url": REQUIRED,
+        "secret": None,
+        "election_id": None,
+        "ledger_id": None,
+        "is_active": True,
+        "created_at": NOW,
+    },
+}
+
+# 主キー以外の一意制約
+UNIQUE_KEYS: dict[str, tuple[tuple[str, ...], ...]] = {
+    "politician_organizations": (("politician_id", "organization_id"),),
+    "politician_elections": (("politician_id", "election_id"),),
+    "public_ledgers": (("ledger_source_id",),),
+    "public_contacts": (("contact_source_id",),),
+    "public_journals": (("journal_source_id",),),
+}
+
+# 外部キー: (テーブル, 列) → 参照先テーブル（db/schema-normalized.sql に対応）
+FOREIGN_KEYS: dict[tuple[str, str], str] = {
+    ("districts", "municipality_code"): "municipalities",
+    ("elections", "district_id"): "districts",
+    ("account_codes", "parent_code"): "account_codes",
+    ("public_subsidy_items", "election_type_code"): "election_types",
+    ("public_subsidy_items", "account_code"): "account_codes",
+    ("politician_organizations", "politician_id"): "politicians",
+    ("politician_organizations", "organization_id"): "organizations",
+    ("politician_elections", "politician_id"): "politicians",
+    ("politician_elections", "election_id"): "elections",
+    ("public_ledgers", "politician_organization_id"): "politician_organizations",
+    ("public_ledgers", "politician_election_id"): "politician_elections",
+    ("public_contacts", "ledger_id"): "public_ledgers",
+    ("public_contacts", "hub_organization_id"): "organizations",
+    ("public_journals", "ledger_id"): "public_ledgers",
+    ("public_journals", "contact_id"): "public_contacts",
+    ("ledger_change_logs", "ledger_id"): "public_ledgers",
+    ("webhook_subscriptions", "election_id"): "elections",
+    ("webhook_subscriptions", "ledger_id"): "public_ledgers",
+}
+
+# 主キーが id 以外のテーブル
+PRIMARY_KEYS: dict[str, str] = {
+    "municipalities": "code",
+    "account_codes": "code",
+    "election_types": "code",
+    "master_metadata": "table_name",
+}
+
+
+@dataclass
+class MemoryResponse:
+    """クエリの実行結果（postgrest の APIResponse と同じ属性）
+
+    Attributes:
+        data: 行のリスト（single / maybe_single の場合は行）
+        count: 件数（count="exact" を指定しない場合は None）
+    """
+
+    data: Any
+    count: int | None = None
+
+
+@dataclass(frozen=True)
+class _Embed:
+    alias: str
+    table: str
+    fk_column: str
+    inner: bool
+    columns: tuple
+
+
+def _api_error(code: str, message: str) -> APIError:
+    return APIError({"message": message, "code": code, "hint": None, "details": None})
+
+
+def _split_top_level(text: str) -> list[str]:
+    # 括弧・引用符の外にあるカンマで区切る
+    parts, depth, quoted, current = [], 0, False, []
+    for char in text:
+        if char == '"':
+            quoted = not quoted
+        elif char == "," and depth == 0 and not quoted:
+            parts.append("".join(current))
+            current = []
+            continue
+        elif char == "(" and not quoted:
+            depth += 1
+        elif char == ")" and not quoted:
+            depth -= 1
+        current.append(char)
+    parts.append("".join(current))
+    return [part.strip() for part in parts if part.strip()]
+
+
+def _parse_columns(table: str, text: str) -> tuple:
+    # 列名（str）と埋め込み（_Embed）の並び
+    columns: list[str | _Embed] = []
+    for part in _split_top_level("".join(text.split())):
+        if "(" not in part:
+            columns.append(part)
+            continue
+        head, inner_text = part[:-1].split("(", 1)
+        alias, _, hint = head.rpartition(":")
+        hint, _, modifier = hint.partition("!")
+        if (table, hint) in FOREIGN_KEYS:
+            fk_column, target = hint, FOREIGN_KEYS[(table, hint)]
+        else:
+            target = hint
+            fk_column = next(
+                (
+                    column
+                    for (source, column), referenced in FOREIGN_KEYS.items()
+                    if source == table and referenced == target
+                ),
+                None,
+            )
+            if fk_column is None:
+                raise _api_error(
+                    "PGRST200",
+                    f"Could not find a relationship between '{table}' and "
+                    f"'{hint}' in the schema cache",
+                )
+        columns.append(
+            _Embed(
+                alias=alias or hint,
+                table=target,
+                fk_column=fk_column,
+                inner=modifier == "inner",
+                columns=_parse_columns(target, inner_text),
+            )
+        )
+    return tuple(columns)
+
+
+def _unquote(value: str) -> str:
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return value[1:-1]
+    return value
+
+
+def _parse_logic(text: str) -> tuple:
+    """or_ の条件（"col.op.value,and(...)"）を条件の並びにする
+
+    条件は (列, 演算子, 値) または ("and" / "or", 条件の並び)。
+    """
+    conditions: list[tuple] = []
+    for part in _split_top_level(text):
+        if part.startswith(("and(", "or(")) and part.endswith(")"):
+            operator, _, inner = part[:-1].partition("(")
+            conditions.append((operator, _parse_logic(inner)))
+            continue
+        column, operator, value = part.split(".", 2)
+        if operator == "in":
+            items = _split_top_level(value.removeprefix("(").removesuffix(")"))
+            conditions.append((column, operator, tuple(map(_unquote, items))))
+        else:
+            conditions.append((column, operator, _unquote(value)))
+    return tuple(conditions)
+
+
+def _condition_columns(condition: tuple) -> Iterable[str]:
+    if len(condition) == 2:
+        for child in condition[1]:
+            yield from _condition_columns(child)
+    else:
+        yield condition[0]
+
+
+def _coerce(row_value: Any, value: Any) -> Any:
+    # PostgREST と同じく、フィルター値は列の型として比較する
+    if isinstance(value, str) and row_value is not None:
+        if isinstance(row_value, bool):
+            return value.lower() == "true"
+        if isinstance(row_value, (int, float)):
+            return type(row_value)(value)
+    return value
+
+
+def _matches(row_value: Any, operator: str, value: Any) -> bool:
+    if operator == "is":
+        if value in (None, "null"):
+            return row_value is None
+        return row_value is (str(value).lower() == "true")
+    if operator == "in":
+        return row_value is not None and any(
+            row_value == _coerce(row_value, item) for item in value
+        )
+    if row_value is None:
+        return False
+    value = _coerce(row_value, value)
+    if operator == "eq":
+        return row_value == value
+    if operator == "neq":
+        return row_value != value
+    if operator == "gt":
+        return row_value > value
+    if operator == "gte":
+        return row_value >= value
+    if operator == "lt":
+        return row_value < value
+    return row_value <= value
+
+
+def _evaluate(row: dict, condition: tuple) -> bool:
+    if len(condition) == 2:
+        operator, children = condition
+        results = (_evaluate(row, child) for child in children)
+        return any(results) if operator == "or" else all(results)
+    column, operator, value = condition
+    return _matches(row.get(column), operator, value)
+
+
+def _index_key(value: Any) -> str:
+    # フィルター値（文字列）と列の値（数値・真偽値を含む）を同じキーにする
+    return str(value).lower() if isinstance(value, bool) else str(value)
+
+
+def _sort_rows(rows: list[dict], orders: tuple) -> list[dict]:
+    # 後ろのキーから安定ソートを重ねる（NULL は昇順で末尾、降順で先頭）
+    for column, desc in reversed(orders):
+        rows = sorted(
+            rows,
+            key=lambda row: (
+                row.get(column) is None,
+                row.get(column) if row.get(column) is not None else 0,
+            ),
+            reverse=desc,
+        )
+    return rows
+
+
+def _default_value(default: Any) -> Any:
+    if default == GEN_RANDOM_UUID:
+        return str(uuid4())
+    if default == NOW:
+        return datetime.now(timezone.utc).isoformat()
+    if default == REQUIRED:
+        return None
+    return default
+
+
+class InMemorySupabase:
+    """メモリ上のテーブルに対してクエリを実行する Supabase クライアント
+
+    Args:
+        tables: テーブル名 → 行（辞書）のリスト。行は PostgREST の JSON と同じ
+            表現（UUID・日付は文字列）で渡す。省略した列には既定値を補う
+        latency_seconds: execute() ごとの待ち時間（秒）
+
+    Raises:
+        ValueError: 初期データの行にテーブルに存在しない列がある場合
+    """
+
+    def __init__(
+        self,
+        tables: dict[str, list[dict]] | None = None,
+        latency_seconds: float = 0.0,
+    ):
+        self.tables: dict[str, list[dict]] = {
+            name: self._seed_rows(name, rows) for name, rows in (tables or {}).items()
+        }
+        self.latency_seconds = latency_seconds
+        # テーブル名 → (フィルター, 並び順) → 結果
+        self._results: dict[str, dict[tuple, list[dict]]] = {}
+        self._column_indexes: dict[tuple[str, str], dict[Any, list[dict]]] = {}
+
+    @staticmethod
+    def _seed_rows(table: str, rows: Iterable[dict]) -> list[dict]:
+        columns = TABLE_COLUMNS.get(table)
+        if columns is None:
+            return list(rows)
+        seeded = []
+        for row in rows:
+            unknown = row.keys() - columns.keys()
+            if unknown:
+                raise ValueError(
+                    f"{table} に存在しない列です: {', '.join(sorted(unknown))}"
+                )
+            if len(row) < len(columns):
+                row = dict(row)
+                for column in columns.keys() - row.keys():
+                    row[column] = _default_value(columns[column])
+            seeded.append(row)
+        return seeded
+
+    def clear_cache(self) -> None:
+        """保持しているフィルター結果・索引を破棄する
+
+        生成後に tables を直接変更した場合に呼び出す。
+        """
+        self._results.clear()
+        self._column_indexes.clear()
+
+    def table(self, table_name: str) -> "MemoryQuery":
+        """テーブルのクエリビルダーを返す
+
+        Args:
+            table_name: テーブル名
+
+        Returns:
+            MemoryQuery: クエリビルダー
+        """
+        return MemoryQuery(self, table_name)
+
+    from_ = table
+
+    def _column_index(self, table: str, column: str) -> dict[Any, list[dict]]:
+        key = (table, column)
+        index = self._column_indexes.get(key)
+        if index is None:
+            index = {}
+            for row in self.tables.get(table, []):
+                if row.get(column) is not None:
+                    index.setdefault(_index_key(row[column]), []).append(row)
+            self._column_indexes[key] = index
+        return index
+
+    def _lookup(self, table: str, value: Any) -> dict | None:
+        if value is None:
+            return None
+        key_column = PRIMARY_KEYS.get(table, "id")
+        rows = self._column_index(table, key_column).get(_index_key(value))
+        return rows[0] if rows else None
+
+    def _unique_keys(self, table: str) -> tuple[tuple[str, ...], ...]:
+        return ((PRIMARY_KEYS.get(table, "id"),), *UNIQUE_KEYS.get(table, ()))
+
+    def _find_by_key(self, table: str, key: tuple[str, ...], row: dict) -> dict | None:
+        # 一意キーの値が一致する行（NULL を含むキーは一致しない）
+        if any(row.get(column) is None for column in key):
+            return None
+        candidates = self._column_index(table, key[0]).get(_index_key(row[key[0]]), [])
+        for candidate in candidates:
+            if all(
+                _index_key(candidate.get(column)) == _index_key(row[column])
+                for column in key[1:]
+            ):
+                return candidate
+        return None
+
+    def _check_write_columns(self, table: str, values: dict) -> None:
+        columns = TABLE_COLUMNS.get(table)
+        if columns is None:
+            return
+        for column, value in values.items():
+            if column not in columns:
+                raise _api_error(
+                    "PGRST204",
+                    f"Could not find the '{column}' column of '{table}' "
+                    "in the schema cache",
+                )
+            if value is None and columns[column] == REQUIRED:
+                raise _api_error(
+                    "23502",
+                    f'null value in column "{column}" of relation "{table}" '
+                    "violates not-null constraint",
+                )
+
+    def _check_unique(
+        self, table: str, row: dict, key: tuple[str, ...], current: dict | None = None
+    ) -> None:
+        # current は更新前の行（自身との一致は違反にしない）
+        existing = self._find_by_key(table, key, row)
+        if existing is not None and existing is not current:
+            raise _api_error(
+                "23505",
+                "duplicate key value violates unique constraint "
+                f'"{table}_{"_".join(key)}_key"',
+            )
+
+    def _new_row(self, table: str, values: dict) -> dict:
+        row = dict(values)
+        columns = TABLE_COLUMNS.get(table)
+        if columns is None:
+            if PRIMARY_KEYS.get(table, "id") == "id":
+                row.setdefault("id", str(uuid4()))
+            return row
+        for column, default in columns.items():
+            if column not in row and default != REQUIRED:
+                row[column] = _default_value(default)
+        missing = [column for column in columns if column not in row]
+        if missing:
+            raise _api_error(
+                "23502",
+                f'null value in column "{missing[0]}" of relation "{table}" '
+                "violates not-null constraint",
+            )
+        self._check_write_columns(table, row)
+        return row
+
+    def _filtered_rows(self, table: str, filters: tuple, orders: tuple) -> list[dict]:
+        results = self._results.setdefault(table, {})
+        key = (filters, orders)
+        rows = results.get(key)
+        if rows is not None:
+            return rows
+
+        rows = self.tables.get(table, [])
+        for condition in filters:
+            if (
+                len(condition) == 3
+                and condition[1] == "eq"
+                and condition[2] is not None
+            ):
+                # 等価条件は列の索引から候補を絞る（候補にも全条件を適用する）
+                column, _, value = condition
+                rows = self._column_index(table, column).get(_index_key(value), [])
+                break
+            if len(condition) == 3 and condition[1] == "in":
+                # in 条件も索引から候補を絞る（元の行の順序は保つ）
+                column, _, values = condition
+                index = self._column_index(table, column)
+                candidates = {
+                    id(row)
+                    for value in values
+                    if value is not None
+                    for row in index.get(_index_key(value), [])
+                }
+                rows = [row for row in rows if id(row) in candidates]
+                break
+        rows = [row for row in rows if all(_evaluate(row, f) for f in filters)]
+        rows = _sort_rows(rows, orders)
+        results[key] = rows
+        return rows
+
+    def _insert(self, table: str, values: list[dict]) -> list[dict]:
+        unique_keys = self._unique_keys(table)
+        for key in unique_keys:
+            self._column_index(table, key[0])
+        indexes = [
+            (column, index)
+            for (indexed_table, column), index in self._column_indexes.items()
+            if indexed_table == table
+        ]
+        rows = self.tables.setdefault(table, [])
+        inserted: list[dict] = []
+        try:
+            for value in values:
+                row = self._new_row(table, value)
+                for key in unique_keys:
+                    self._check_unique(table, row, key)
+                for column, index in indexes:
+                    if row.get(column) is not None:
+                        index.setdefault(_index_key(row[column]), []).append(row)
+                rows.append(row)
+                inserted.append(row)
+        except APIError:
+            # 文の途中で失敗した場合は、その文で追加した行を戻す
+            self._delete(table, inserted)
+            raise
+        self._results.pop(table, None)
+        return inserted
+
+    def _update(self, table: str, rows: list[dict], values: dict) -> list[dict]:
+        self._check_write_columns(table, values)
+        for key in self._unique_keys(table):
+            if not set(key) & values.keys():
+                continue
+            if len(rows) > 1 and set(key) <= values.keys():
+                # 複数行を同じ一意キーの値にする更新
+                self._check_unique(table, {**rows[0], **values}, key, current=None)
+            for row in rows:
+                self._check_unique(table, {**row, **values}, key, current=row)
+        for row in rows:
+            for column, value in values.items():
+                current = row.get(column)
+                if current == value:
+                    continue
+                index = self._column_indexes.get((table, column))
+                if index is not None:
+                    if current is not None:
+                        bucket = index[_index_key(current)]
+                        bucket[:] = [other for other in bucket if other is not row]
+                    if value is not None:
+                        index.setdefault(_index_key(value), []).append(row)
+                row[column] = value
+        self._results.pop(table, None)
+        return rows
+
+    def _upsert(
+        self,
+        table: str,
+        values: list[dict],
+        on_conflict: tuple[str, ...],
+        ignore_duplicates: bool,
+    ) -> list[dict]:
+        if TABLE_COLUMNS.get(table) is not None and on_conflict not in {
+            tuple(key) for key in self._unique_keys(table)
+        }:
+            raise _api_error(
+                "42P10",
+                "there is no unique or exclusion constraint matching "
+                "the ON CONFLICT specification",
+            )
+        affected = []
+        for value in values:
+            existing = self._find_by_key(table, on_conflict, value)
+            if existing is None:
+                affected.extend(self._insert(table, [value]))
+            elif not ignore_duplicates:
+                affected.extend(self._update(table, [existing], value))
+        return affected
+
+    def _delete(self, table: str, rows: list[dict]) -> list[dict]:
+        if rows:
+            removed = {id(row) for row in rows}
+            self.tables[table] = [
+                row for row in self.tables.get(table, []) if id(row) not in removed
+            ]
+            for key in [key for key in self._column_indexes if key[0] == table]:
+                del self._column_indexes[key]
+            self._results.pop(table, None)
+        return rows
+
+    def _project(self, table: str, row: dict, columns: tuple) -> dict:
+        output: dict[str, Any] = {}
+        for column in columns:
+            if isinstance(column, _Embed):
+                target = self._lookup(column.table, row.get(column.fk_column))
+                output[column.alias] = (
+                    None
+                    if target is None
+                    else self._project(column.table, target, column.columns)
+                )
+            elif column == "*":
+                output.update(row)
+            else:
+                output[column] = row.get(column)
+        return output
+
+
+class MemoryQuery:
+    """InMemorySupabase のクエリビルダー
+
+    postgrest のビルダーと同じく、メソッドは自身を変更して返す。
+
+    Args:
+        client: クライアント
+        table: テーブル名
+    """
+
+    def __init__(self, client: InMemorySupabase, table: str):
+        self._client = client
+        self._table = table
+        self._operation = "select"
+        self._values: Any = None
+        self._columns: tuple = ("*",)
+        self._filters: list[tuple] = []
+        self._orders: list[tuple[str, bool]] = []
+        self._range: tuple[int, int] | None = None
+        self._limit: int | None = None
+        self._single: str | None = None
+        self._count: str | None = None
+        self._head = False
+        self._on_conflict: tuple[str, ...] = ()
+        self._ignore_duplicates = False
+
+    def select(
+        self, *columns: str, count: str | None = None, head: bool = False, **_: Any
+    ) -> "MemoryQuery":
+        """取得する列（埋め込みを含む）と件数の取得を指定する"""
+        self._columns = _parse_columns(self._table, ",".join(columns) or "*")
+        self._count = count
+        self._head = head
+        return self
+
+    def insert(self, values: dict | list[dict], **_: Any) -> "MemoryQuery":
+        """行を追加する（追加した行を返す）"""
+        self._operation = "insert"
+        self._values = [values] if isinstance(values, dict) else list(values)
+        return self
+
+    def update(self, values: dict, **_: Any) -> "MemoryQuery":
+        """フィルターに一致する行を更新する（更新した行を返す）"""
+        self._operation = "update"
+        self._values = values
+        return self
+
+    def upsert(
+        self,
+        values: dict | list[dict],
+        *,
+        on_conflict: str = "",
+        ignore_duplicates: bool = False,
+        **_: Any,
+    ) -> "MemoryQuery":
+        """一意キーが一致する行は更新し、それ以外は追加する
+
+        on_conflict を省略した場合は主キーで判定する。
+        """
+        self._operation = "upsert"
+        self._values = [values] if isinstance(values, dict) else list(values)
+        self._on_conflict = tuple(
+            column.strip() for column in on_conflict.split(",") if column.strip()
+        ) or (
+            PRIMARY_KEYS.get(self._table, "id"),
+        )
+        self._ignore_duplicates = ignore_duplicates
+        return self
+
+    def delete(self, **_: Any) -> "MemoryQuery":
+        """フィルターに一致する行を削除する（削除した行を返す）"""
+        self._operation = "delete"
+        return self
+
+    def _filter(self, column: str, operator: str, value: Any) -> "MemoryQuery":
+        self._filters.append((column, operator, value))
+        return self
+
+    def eq(self, column: str, value: Any) -> "MemoryQuery":
+        """column = value"""
+        return self._filter(column, "eq", value)
+
+    def neq(self, column: str, value: Any) -> "MemoryQuery":
+        """column <> value"""
+        return self._filter(column, "neq", value)
+
+    def gt(self, column: str, value: Any) -> "MemoryQuery":
+        """column > value"""
+        return self._filter(column, "gt", value)
+
+    def gte(self, column: str, value: Any) -> "MemoryQuery":
+        """column >= value"""
+        return self._filter(column, "gte", value)
+
+    def lt(self, column: str, value: Any) -> "MemoryQuery":
+        """column < value"""
+        return self._filter(column, "lt", value)
+
+    def lte(self, column: str, value: Any) -> "MemoryQuery":
+        """column <= value"""
+        return self._filter(column, "lte", value)
+
+    def in_(self, column: str, values: Iterable[Any]) -> "MemoryQuery":
+        """column IN (values)"""
+        return self._filter(column, "in", tuple(values))
+
+    def is_(self, column: str, value: Any) -> "MemoryQuery":
+        """column IS value（null / true / false）"""
+        return self._filter(column, "is", value)
+
+    def or_(self, filters: str) -> "MemoryQuery":
+        """いずれかの条件に一致する（PostgREST の or=(...) の構文）"""
+        self._filters.append(("or", _parse_logic(filters)))
+        return self
+
+    def order(self, column: str, *, desc: bool = False, **_: Any) -> "MemoryQuery":
+        """並び順を追加する"""
+        self._orders.append((column, desc))
+        return self
+
+    def range(self, start: int, end: int) -> "MemoryQuery":
+        """取得する行の範囲（両端を含む）を指定する"""
+        self._range = (start, end)
+        return self
+
+    def limit(self, size: int) -> "MemoryQuery":
+        """取得する行数の上限を指定する"""
+        self._limit = size
+        return self
+
+    def single(self) -> "MemoryQuery":
+        """1行のみを取得する（0行・複数行はエラー）"""
+        self._single = "single"
+        return self
+
+    def maybe_single(self) -> "MemoryQuery":
+        """0行または1行を取得する"""
+        self._single = "maybe_single"
+        return self
+
+    def execute(self) -> MemoryResponse | None:
+        """クエリを実行する
+
+        Returns:
+            MemoryResponse | None: 実行結果。postgrest と同じく、maybe_single で
+            該当行が無い場合はレスポンスではなく None
+
+        Raises:
+            APIError: 存在しない列を参照した場合、制約に違反した場合、
+                single / maybe_single で該当行が条件に合わない場合
+        """
+        client = self._client
+        if client.latency_seconds:
+            time.sleep(client.latency_seconds)
+        self._check_read_columns()
+        own_filters = tuple(f for f in self._filters if "." not in f[0])
+        embed_filters = [f for f in self._filters if "." in f[0]]
+        if self._operation == "insert":
+            rows = client._insert(self._table, self._values)
+        elif self._operation == "upsert":
+            rows = client._upsert(
+                self._table, self._values, self._on_conflict, self._ignore_duplicates
+            )
+        elif self._operation in ("update", "delete"):
+            matched = list(client._filtered_rows(self._table, own_filters, ()))
+            if self._operation == "update":
+                rows = client._update(self._table, matched, self._values)
+            else:
+                rows = client._delete(self._table, matched)
+        else:
+            rows = client._filtered_rows(self._table, own_filters, tuple(self._orders))
+
+        if embed_filters:
+            kept = []
+            for row in rows:
+                nulled = self._apply_embed_filters(row, embed_filters)
+                if nulled is not None:
+                    kept.append((row, nulled))
+        else:
+            kept = [(row, ()) for row in rows]
+        count = len(kept) if self._count is not None else None
+        data = []
+        for row, nulled in [] if self._head else self._slice(kept):
+            output = client._project(self._table, row, self._columns)
+            for alias in nulled:
+                output[alias] = None
+            data.append(output)
+
+        if self._single is None:
+            return MemoryResponse(data=data, count=count)
+        if len(data) > 1 or (self._single == "single" and not data):
+            raise _api_error(
+                "PGRST116", "JSON object requested, multiple (or no) rows returned"
+            )
+        if not data:
+            return None
+        return MemoryResponse(data=data[0], count=count)
+
+    def _slice(self, rows: list) -> list:
+        if self._range is not None:
+            rows = rows[self._range[0] : self._range[1] + 1]
+        if self._limit is not None:
+            rows = rows[: self._limit]
+        return rows
+
+    def _check_read_columns(self) -> None:
+        """選択・フィルター・並び替えの列がテーブルに存在するか確かめる"""
+        embeds: dict[str, _Embed] = {}
+
+        def check(table: str, columns: Iterable[str]) -> None:
+            known = TABLE_COLUMNS.get(table)
+            for column in columns:
+                if known is not None and column != "*" and column not in known:
+                    raise _api_error("42703", f"column {table}.{column} does not exist")
+
+        def check_select(table: str, columns: tuple) -> None:
+            check(table, (c for c in columns if not isinstance(c, _Embed)))
+            for column in columns:
+                if isinstance(column, _Embed):
+                    check_select(column.table, column.columns)
+                    if table == self._table:
+                        embeds[column.alias] = column
+
+        check_select(self._table, self._columns)
+        for condition in self._filters:
+            for path in _condition_columns(condition):
+                alias, _, column = path.rpartition(".")
+                if alias in embeds:
+                    check(embeds[alias].table, (column,))
+                elif alias:
+                    raise _api_error(
+                        "PGRST108",
+                        f"'{alias}' is not an embedded resource in this request",
+                    )
+                else:
+                    check(self._table, (column,))
+        check(self._table, (column for column, _ in self._orders))
+
+    def _apply_embed_filters(self, row: dict, filters: list) -> set[str] | None:
+        """埋め込み先の列に対するフィルターを参照先の行で評価する
+
+        Returns:
+            set[str] | None: 行を除外する場合は None。それ以外は条件に合わず
+            null にする（inner でない）埋め込みの別名
+        """
+        embeds = {
+            column.alias: column
+            for column in self._columns
+            if isinstance(column, _Embed)
+        }
+        nulled: set[str] = set()
+        for path, operator, value in filters:
+            alias, column = path.split(".", 1)
+            embed = embeds[alias]
+            target = self._client._lookup(embed.table, row.get(embed.fk_column))
+            if target is not None and _matches(target.get(column), operator, value):
+                continue
+            if embed.inner:
+                return None
+            nulled.add(alias)
+        return nulled
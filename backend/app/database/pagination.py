@@ -0,0 +1,56 @@
+"""PostgRESTのレンジ指定による分割取得ユーティリティ
+
+Supabase（PostgREST）は1リクエストあたりの返却件数に上限があるため、
+大量の行を読む場合は range 指定でページ単位に取得する。
+"""
+
+from collections.abc import Callable, Iterator
+from typing import Any
+
+# PostgREST の既定の最大返却件数（db-max-rows）に合わせる
+DEFAULT_PAGE_SIZE = 1000
+
+
+def fetch_pages(
+    build_query: Callable[[], Any],
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> Iterator[list[dict]]:
+    """クエリ結果をページ単位で順に取得する
+
+    build_query はページごとに呼び出され、フィルタと並び順を設定済みの
+    クエリビルダーを返すこと。並び順が一意でない場合、ページ境界で
+    行の重複・欠落が起こりうるため、主キー等で順序を確定させること。
+
+    Args:
+        build_query: range 未指定のクエリビルダーを返す関数
+        page_size: 1ページあたりの取得件数
+
+    Yields:
+        list[dict]: 1ページ分の行（空ページは返さない）
+    """
+    offset = 0
+    while True:
+        response = build_query().range(offset, offset + page_size - 1).execute()
+        rows = response.data or []
+        if rows:
+            yield rows
+        if len(rows) < page_size:
+            return
+        offset += page_size
+
+
+def iter_rows(
+    build_query: Callable[[], Any],
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> Iterator[dict]:
+    """クエリ結果を1行ずつ順に取得する
+
+    Args:
+        build_query: range 未指定のクエリビルダーを返す関数
+        page_size: 1ページあたりの取得件数
+
+    Yields:
+        dict: 1行分のデータ
+    """
+    for page in fetch_pages(build_query, page_size):
+        yield from page
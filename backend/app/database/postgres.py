@@ -0,0 +1,138 @@
+"""PostgreSQL 直結のコネクションプール
+
+公開データの読み取りを PostgREST を経由せず行うための asyncpg の
+コネクションプールを管理する。ビルダー（同期関数）はアプリのイベント
+ループ上で呼ばれるため、プールは専用スレッドのイベントループで動かし、
+読み取りリポジトリ（PostgresReadRepository）からスレッドをまたいで使う。
+"""
+
+import asyncio
+import threading
+from collections.abc import Coroutine
+from typing import TYPE_CHECKING, Any
+
+import asyncpg
+
+if TYPE_CHECKING:
+    # app.repositories の依存関係（dependencies）がこのモジュールを参照するため
+    from app.repositories.postgres import PostgresReadRepository
+
+# 接続ごとに設定するサーバーパラメーター。row_to_json の timestamptz を
+# PostgREST（UTC）と同じ +00:00 表記にする
+SERVER_SETTINGS = {
+    "application_name": "polimoney-hub",
+    "timezone": "UTC",
+}
+
+
+class PostgresPool:
+    """専用スレッドのイベントループで動く asyncpg のコネクションプール
+
+    start() / close() はアプリのイベントループ上で await する。
+
+    Args:
+        dsn: 接続文字列（postgresql://...）
+        min_size: プールの最小接続数
+        max_size: プールの最大接続数
+        statement_cache_size: 接続ごとのプリペアドステートメントのキャッシュ数
+            （0 で無効。PgBouncer のトランザクションモード経由の場合）
+        command_timeout: 1文あたりのタイムアウト（秒）
+        server_settings: SERVER_SETTINGS に追加・上書きするサーバーパラメーター
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        *,
+        min_size: int = 2,
+        max_size: int = 10,
+        statement_cache_size: int = 100,
+        command_timeout: float | None = 10.0,
+        server_settings: dict[str, str] | None = None,
+    ):
+        self._dsn = dsn
+        self._pool_options = {
+            "min_size": min_size,
+            "max_size": max_size,
+            "statement_cache_size": statement_cache_size,
+            "command_timeout": command_timeout,
+            "server_settings": {**SERVER_SETTINGS, **(server_settings or {})},
+        }
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._pool: asyncpg.Pool | None = None
+        self._repository: "PostgresReadRepository | None" = None
+
+    @property
+    def repository(self) -> "PostgresReadRepository":
+        """このプールを使う読み取りリポジトリ（start() 後のみ）"""
+        if self._repository is None:
+            raise RuntimeError("PostgreSQL のコネクションプールが開始されていません")
+        return self._repository
+
+    async def _submit(self, coroutine: Coroutine[Any, Any, Any]) -> Any:
+        future = asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+        return await asyncio.wrap_future(future)
+
+    async def _create_pool(self) -> asyncpg.Pool:
+        # create_pool() はコルーチンではなく await 可能な Pool を返すため包む
+        return await asyncpg.create_pool(self._dsn, **self._pool_options)
+
+    async def start(self) -> None:
+        """プール用のスレッドを起動し、接続を確立する
+
+        Raises:
+            OSError, asyncpg.PostgresError: 接続できない場合
+        """
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="postgres-pool", daemon=True
+        )
+        self._thread.start()
+        try:
+            self._pool = await self._submit(self._create_pool())
+        except BaseException:
+            self._stop_loop()
+            raise
+        from app.repositories.postgres import PostgresReadRepository
+
+        self._repository = PostgresReadRepository(self._pool, self._loop)
+
+    async def close(self) -> None:
+        """接続を閉じ、プール用のスレッドを停止する"""
+        if self._loop is None:
+            return
+        self._repository = None
+        if self._pool is not None:
+            await self._submit(self._pool.close())
+            self._pool = None
+        self._stop_loop()
+
+    def _stop_loop(self) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+        self._thread = None
+
+
+_pool: PostgresPool | None = None
+
+
+def set_postgres_pool(pool: PostgresPool | None) -> None:
+    """読み取りに使うコネクションプールを設定する（None で解除）
+
+    Args:
+        pool: 開始済みのコネクションプール
+    """
+    global _pool
+    _pool = pool
+
+
+def get_postgres_pool() -> PostgresPool | None:
+    """読み取りに使うコネクションプールを返す
+
+    Returns:
+        PostgresPool | None: 未設定の場合は None
+    """
+    return _pool
@@ -9,11 +9,14 @@ from supabase import Client, create_client
 from supabase.lib.client_options import ClientOptions
 
 from app.config import settings
+from app.database.instrumentation import InstrumentedClient
 
 
 def _create_supabase_client(api_key: str) -> Client:
     """Supabaseクライアントを作成する内部ヘルパー関数。
 
+    クエリの所要時間を記録する InstrumentedClient で包んで返す。
+
     Args:
         api_key (str): SupabaseのAPIキー（公開キーまたはService Roleキー）。
 
@@ -34,7 +37,8 @@ def _create_supabase_client(api_key: str) -> Client:
         persist_session=False,
     )
 
-    return create_client(settings.supabase_url, api_key, options=options)
+    client = create_client(settings.supabase_url, api_key, options=options)
+    return InstrumentedClient(client)
 
 
 def get_supabase_client() -> Client:
@@ -1,23 +1,95 @@
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import Depends, FastAPI, Request, status
+from fastapi import Depends, FastAPI, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from app.config import settings
-from app.database.supabase import get_admin_supabase_client_dep
-from app.routers import election_funds, health, polimoney, political_funds, sync
+from app.core.loop_watchdog import LoopWatchdog
+from app.core.responses import PydanticJSONResponse
+from app.core.structured_logging import configure_logging
+from app.core.tracing import configure_tracing, set_tracer_provider
+from app.core.webhooks import WebhookDispatcher
+from app.database.postgres import PostgresPool, set_postgres_pool
+from app.database.supabase import (
+    get_admin_supabase_client,
+    get_admin_supabase_client_dep,
+)
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.profiling import ProfilingMiddleware
+from app.middleware.request_id import RequestIdMiddleware
+from app.middleware.server_timing import ServerTimingMiddleware
+from app.middleware.tracing import TracingMiddleware
+from app.routers import (
+    election_funds,
+    exports,
+    health,
+    metrics,
+    polimoney,
+    political_funds,
+    sync,
+    webhooks,
+)
 from app.utils.polimoney_response import MultipleCandidatesException
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO if settings.env == "development" else logging.WARNING,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+from app.utils.webhooks import (
+    fetch_webhook_subscriptions_for_events,
+    has_active_webhook_subscriptions,
 )
+
+# Configure logging（JSON 1行1件、書き出しは別スレッド）
+configure_logging(logging.INFO if settings.env == "development" else logging.WARNING)
+# アクセスログ（リクエストID・処理時間）は本番でも出力する
+logging.getLogger("app.access").setLevel(logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _create_webhook_dispatcher() -> WebhookDispatcher | None:
+    """Webhook の配信を行うディスパッチャーを作成する
+
+    Returns:
+        WebhookDispatcher | None: 無効化されている、または Supabase が
+            未設定の場合は None
+    """
+    if not settings.webhooks_enabled:
+        return None
+    try:
+        supabase = get_admin_supabase_client()
+    except HTTPException:
+        logger.warning("Supabase が未設定のため Webhook の配信を無効にします")
+        return None
+    return WebhookDispatcher(
+        lambda events: fetch_webhook_subscriptions_for_events(supabase, events),
+        has_active_subscriptions=lambda: has_active_webhook_subscriptions(supabase),
+    )
+
+
+async def _start_postgres_pool() -> PostgresPool | None:
+    """読み取りを PostgreSQL 直結で行う場合のコネクションプールを開始する
+
+    Returns:
+        PostgresPool | None: READ_BACKEND が postgres 以外の場合は None
+
+    Raises:
+        RuntimeError: READ_BACKEND=postgres で DATABASE_URL が未設定の場合
+    """
+    if settings.read_backend != "postgres":
+        return None
+    if not settings.database_url:
+        raise RuntimeError("READ_BACKEND=postgres には DATABASE_URL の設定が必要です")
+    pool = PostgresPool(
+        settings.database_url,
+        min_size=settings.database_pool_min_size,
+        max_size=settings.database_pool_max_size,
+        statement_cache_size=settings.database_statement_cache_size,
+        command_timeout=settings.database_command_timeout_seconds,
+    )
+    await pool.start()
+    set_postgres_pool(pool)
+    return pool
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """FastAPIアプリケーションのライフサイクルを管理するコンテキストマネージャー
@@ -36,9 +108,31 @@ async def lifespan(app: FastAPI):
     """
     logger.info("Starting Polimoney API server...")
 
+    configure_tracing(settings.tracing_exporter, settings.tracing_otlp_endpoint)
+
+    loop_watchdog = None
+    if settings.loop_block_threshold_seconds > 0:
+        loop_watchdog = LoopWatchdog(settings.loop_block_threshold_seconds)
+        loop_watchdog.start()
+
+    postgres_pool = await _start_postgres_pool()
+
+    webhook_dispatcher = _create_webhook_dispatcher()
+    if webhook_dispatcher is not None:
+        webhook_dispatcher.start()
+
     yield
 
     logger.info("Shutting down Polimoney API server...")
+    if webhook_dispatcher is not None:
+        await webhook_dispatcher.stop()
+    if postgres_pool is not None:
+        set_postgres_pool(None)
+        await postgres_pool.close()
+    if loop_watchdog is not None:
+        await loop_watchdog.stop()
+    # 出力待ちのスパンを書き出して停止する
+    set_tracer_provider(None)
 
 
 # Create FastAPI application
@@ -47,6 +141,7 @@ app = FastAPI(
     description="政治資金収支報告書・選挙運動費用収支報告書管理システム",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=PydanticJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
@@ -61,30 +156,23 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# レスポンス圧縮（br / zstd / gzip）
+app.add_middleware(CompressionMiddleware)
 
-@app.middleware("http")
-async def add_request_id(request: Request, call_next):
-    """HTTPリクエストに一意のリクエストIDを付与するミドルウェア
+# X-Profile: 1 のリクエストのプロファイル（PROFILING_TOKEN と一致するトークンがある場合のみ）
+app.add_middleware(ProfilingMiddleware)
 
-    各リクエストに対してUUIDを生成し、レスポンスヘッダーに
-    X-Request-IDとして追加する。これによりログの追跡と
-    デバッグが容易になる。
+# リクエストごとのクエリ回数・所要時間（Server-Timing）と N+1 の検出
+app.add_middleware(ServerTimingMiddleware)
 
-    Args:
-        request (Request): FastAPIのリクエストオブジェクト
-        call_next (Callable): 次のミドルウェアまたはエンドポイントを呼び出す関数
+# リクエストのスパン（ビルダーの処理段階・Supabase の呼び出しを子スパンとする）
+app.add_middleware(TracingMiddleware)
 
-    Returns:
-        Response: リクエストIDが追加されたレスポンスオブジェクト
-    """
-    import uuid
+# リクエストIDの引き継ぎ・アクセスログ（内側のミドルウェアのログにもIDを付ける）
+app.add_middleware(RequestIdMiddleware)
 
-    request_id = str(uuid.uuid4())
-
-    response = await call_next(request)
-    print(f"request_id: {request_id}", flush=True)
-    response.headers["X-Request-ID"] = request_id
-    return response
+# ルート別のレイテンシ・レスポンスサイズ（圧縮後）を記録するため最も外側に置く
+app.add_middleware(MetricsMiddleware)
 
 
 @app.exception_handler(MultipleCandidatesException)
@@ -137,6 +225,9 @@ async def global_exception_handler(request: Request, exc: Exception):
 # Include routers
 app.include_router(health.router, tags=["health"])
 
+# Prometheus メトリクス
+app.include_router(metrics.router, tags=["metrics"])
+
 # app.include_router(auth.router, prefix="/api/v1", tags=["authentication"])
 
 # app.include_router(
@@ -167,6 +258,21 @@ app.include_router(
     tags=["polimoney"],
 )
 
+# 仕訳の一括エクスポート（NDJSON / CSV / Parquet / Arrow IPC）
+app.include_router(
+    exports.router,
+    prefix="/api/v1",
+    tags=["exports"],
+)
+
+# Webhook 購読の管理 — admin権限と管理APIキー（X-Admin-Api-Key）が必要
+app.include_router(
+    webhooks.router,
+    prefix="/api/v1",
+    tags=["webhooks"],
+    dependencies=[Depends(get_admin_supabase_client_dep)],
+)
+
 # 同期API（Ledger → Hub）— admin権限が必要
 app.include_router(
     sync.router,
@@ -0,0 +1,138 @@
+"""レスポンス圧縮ミドルウェア
+
+Accept-Encoding に応じて br / zstd / gzip でレスポンスを圧縮する。
+ストリーミングレスポンスは断片ごとに圧縮して送出する。
+"""
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.compression import (
+    COMPRESSION_MINIMUM_SIZE,
+    StreamCompressor,
+    compress,
+    negotiate_encoding,
+)
+
+# 圧縮対象の Content-Type（Parquet 等の圧縮済み形式は対象外）
+COMPRESSIBLE_MEDIA_TYPES: tuple[str, ...] = (
+    "application/json",
+    "application/x-ndjson",
+    "application/msgpack",
+    "application/vnd.apache.arrow.stream",
+    "text/",
+)
+
+# 逐次届く必要があるため圧縮しない Content-Type
+UNCOMPRESSIBLE_MEDIA_TYPES: tuple[str, ...] = ("text/event-stream",)
+
+
+def _is_compressible(headers: Headers) -> bool:
+    if "content-encoding" in headers:
+        return False
+    content_type = headers.get("content-type", "")
+    if content_type.startswith(UNCOMPRESSIBLE_MEDIA_TYPES):
+        return False
+    return content_type.startswith(COMPRESSIBLE_MEDIA_TYPES)
+
+
+class CompressionMiddleware:
+    """Accept-Encoding のネゴシエーションでレスポンスを圧縮するASGIミドルウェア
+
+    Content-Encoding 設定済みのレスポンス（圧縮済みスナップショット等）と、
+    minimum_size 未満の一括レスポンスはそのまま返す。
+
+    Args:
+        app: ASGIアプリケーション
+        minimum_size: 圧縮する一括レスポンスの最小サイズ（バイト）
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = COMPRESSION_MINIMUM_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(send, encoding, self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """レスポンス開始メッセージを保留し、最初のボディで圧縮方法を決める"""
+
+    def __init__(self, send: Send, encoding: str, minimum_size: int):
+        self._send = send
+        self._encoding = encoding
+        self._minimum_size = minimum_size
+        self._start_message: Message | None = None
+        self._compressor: StreamCompressor | None = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self._start_message = message
+            return
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        if self._start_message is not None:
+            await self._send_first_body(message)
+            return
+
+        if self._passthrough:
+            await self._send(message)
+            return
+
+        more_body = message.get("more_body", False)
+        body = self._compressor.compress(message.get("body", b""))
+        if not more_body:
+            body += self._compressor.finish()
+        await self._send(
+            {"type": "http.response.body", "body": body, "more_body": more_body}
+        )
+
+    async def _send_first_body(self, message: Message) -> None:
+        start_message = self._start_message
+        self._start_message = None
+        headers = MutableHeaders(raw=start_message["headers"])
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if not _is_compressible(headers) or (
+            not more_body and len(body) < self._minimum_size
+        ):
+            self._passthrough = True
+            await self._send(start_message)
+            await self._send(message)
+            return
+
+        headers["Content-Encoding"] = self._encoding
+        headers.add_vary_header("Accept-Encoding")
+
+        if not more_body:
+            body = compress(body, self._encoding)
+            headers["Content-Length"] = str(len(body))
+            await self._send(start_message)
+            await self._send({"type": "http.response.body", "body": body})
+            return
+
+        # ストリーミング時は長さが確定しないため Content-Length を外す
+        del headers["Content-Length"]
+        self._compressor = StreamCompressor(self._encoding)
+        await self._send(start_message)
+        await self._send(
+            {
+                "type": "http.response.body",
+                "body": self._compressor.compress(body),
+                "more_body": True,
+            }
+        )
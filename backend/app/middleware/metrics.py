@@ -0,0 +1,85 @@
+"""HTTP メトリクス収集ミドルウェア
+
+リクエストごとの処理時間・レスポンスサイズ・ステータスをルートの
+パステンプレート単位で Prometheus メトリクスに記録する。
+"""
+
+import time
+
+from starlette.routing import BaseRoute, Route
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import (
+    UNMATCHED_ROUTE,
+    http_requests_in_progress,
+    preallocate_route_metrics,
+    route_metrics,
+)
+
+
+def route_paths(routes: list[BaseRoute]) -> dict:
+    """エンドポイント関数からパステンプレートへの対応表を作る
+
+    ルーティング後の scope["endpoint"] からパステンプレートを引くために使う。
+
+    Args:
+        routes: アプリケーションのルート
+
+    Returns:
+        dict: エンドポイント関数 → パステンプレート
+    """
+    return {route.endpoint: route.path for route in routes if isinstance(route, Route)}
+
+
+class MetricsMiddleware:
+    """ルート別のレイテンシ・レスポンスサイズを記録するASGIミドルウェア
+
+    圧縮後のサイズと圧縮処理を含めた時間を計測するため、最も外側に追加する。
+
+    Args:
+        app: ASGIアプリケーション
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._paths: dict | None = None
+
+    def _resolve_route(self, scope: Scope) -> str:
+        if self._paths is None:
+            routes = scope["app"].routes
+            self._paths = route_paths(routes)
+            preallocate_route_metrics(
+                (method, route.path)
+                for route in routes
+                if isinstance(route, Route)
+                for method in route.methods or ()
+            )
+        return self._paths.get(scope.get("endpoint"), UNMATCHED_ROUTE)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        http_requests_in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            http_requests_in_progress.dec()
+            metrics = route_metrics(scope["method"], self._resolve_route(scope))
+            metrics.duration.observe(elapsed)
+            metrics.size.observe(size)
+            metrics.count(status_code)
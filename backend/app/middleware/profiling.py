@@ -0,0 +1,92 @@
+"""X-Profile ヘッダーによるリクエスト単位のプロファイル
+
+X-Profile: 1 を付けたリクエストをプロファイラー付きで処理し、本来の
+レスポンスの代わりに folded 形式のプロファイル（text/plain）を返す。
+本来のステータスコードは X-Profile-Status ヘッダーで返す。
+
+例:
+    curl -H "X-Profile: 1" -H "X-Profile-Token: ..." \\
+        https://.../api/v1/polimoney/ledgers/<id>/journals > ledger.folded
+    flamegraph.pl ledger.folded > ledger.svg  # speedscope でも読める
+
+PROFILING_TOKEN が設定され、X-Profile-Token が一致する場合のみ有効で、
+それ以外は X-Profile ヘッダーを無視して通常どおり処理する。
+
+同期エンドポイントはワーカースレッドで記録するため、ルーターの
+route_class に ProfiledRoute（またはその派生の NegotiatedRoute）を使う。
+プロファイラー（sys.setprofile）はイベントループのスレッドに掛かるため、
+同時に実行できるプロファイルは1件のみで、実行中の X-Profile リクエストは
+409 を返す。
+"""
+
+from fastapi import status
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.profiling import StackProfiler, profiling_allowed
+
+PROFILE_HEADER = b"x-profile"
+PROFILE_TOKEN_HEADER = "x-profile-token"
+
+# プロファイル中かどうか（イベントループのスレッドでのみ読み書きする）
+_profiling_active = False
+
+
+class ProfilingMiddleware:
+    """X-Profile が付いたリクエストのプロファイルを返すASGIミドルウェア
+
+    ヘッダーが無いリクエストはヘッダーを走査するだけでそのまま処理する。
+
+    Args:
+        app: ASGIアプリケーション
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or (PROFILE_HEADER, b"1") not in scope["headers"]:
+            await self.app(scope, receive, send)
+            return
+        if not profiling_allowed(Headers(scope=scope).get(PROFILE_TOKEN_HEADER)):
+            await self.app(scope, receive, send)
+            return
+
+        global _profiling_active
+        if _profiling_active:
+            response = JSONResponse(
+                {"detail": "他のリクエストのプロファイルを実行中です"},
+                status_code=status.HTTP_409_CONFLICT,
+            )
+            await response(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def discard(message: Message) -> None:
+            # 本来のレスポンスは返さない（ボディの生成はプロファイルに含める）
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+
+        _profiling_active = True
+        try:
+            with StackProfiler() as profiler:
+                await self.app(scope, receive, discard)
+        finally:
+            _profiling_active = False
+
+        body = profiler.folded().encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"text/plain; charset=utf-8"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"x-profile-status", str(status_code).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,87 @@
+"""リクエストIDの付与と処理時間のログ出力を行うミドルウェア
+
+上流（ロードバランサー・呼び出し元）から X-Request-ID が渡された場合は
+それを引き継ぎ、無い場合は生成する。リクエストIDはレスポンスヘッダーと
+処理中のログに付け、レスポンス完了時に処理時間をアクセスログとして出力する。
+"""
+
+import logging
+import re
+import time
+import uuid
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.structured_logging import request_id_var
+
+REQUEST_ID_HEADER = "X-Request-ID"
+
+# ログ・ヘッダーへそのまま書き出すため、引き継ぐ値の文字種と長さを制限する
+_REQUEST_ID_PATTERN = re.compile(r"^[A-Za-z0-9._:\-]{1,128}$")
+
+access_logger = logging.getLogger("app.access")
+
+
+def resolve_request_id(header: str | None) -> str:
+    """引き継ぐリクエストIDを決める
+
+    Args:
+        header: リクエストの X-Request-ID ヘッダーの値
+
+    Returns:
+        str: 妥当な値ならそのまま、そうでなければ新しい UUID
+    """
+    if header and _REQUEST_ID_PATTERN.match(header):
+        return header
+    return str(uuid.uuid4())
+
+
+class RequestIdMiddleware:
+    """リクエストIDの付与とアクセスログを行うASGIミドルウェア
+
+    レスポンスボディを送り終えるまでを処理時間とするため、
+    ストリーミングレスポンスでも出力完了までの時間を記録する。
+
+    Args:
+        app: ASGIアプリケーション
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = resolve_request_id(
+            Headers(scope=scope).get(REQUEST_ID_HEADER.lower())
+        )
+        token = request_id_var.set(request_id)
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = request_id
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            access_logger.info(
+                "%s %s %d",
+                scope["method"],
+                scope["path"],
+                status_code,
+                extra={
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status": status_code,
+                    "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+                },
+            )
+            request_id_var.reset(token)
@@ -0,0 +1,80 @@
+"""Server-Timing ヘッダーを付与するミドルウェア
+
+リクエスト処理中の Supabase クエリの回数・所要時間を集計し、
+レスポンスの Server-Timing ヘッダーで返す。同じクエリを行ごとに
+繰り返すリクエスト（N+1）を検出した場合は警告ログを出力する。
+"""
+
+import logging
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.query_stats import N_PLUS_ONE_THRESHOLD, QueryStats, track_queries
+
+logger = logging.getLogger(__name__)
+
+
+def format_server_timing(stats: QueryStats, total_seconds: float) -> str:
+    """Server-Timing ヘッダーの値を組み立てる
+
+    Args:
+        stats: クエリの集計結果
+        total_seconds: ヘッダー送出までの処理時間（秒）
+
+    Returns:
+        str: 例 'db;dur=12.3;desc="3 queries", app;dur=15.0'
+    """
+    return (
+        f'db;dur={stats.seconds * 1000:.1f};desc="{stats.count} queries", '
+        f"app;dur={total_seconds * 1000:.1f}"
+    )
+
+
+class ServerTimingMiddleware:
+    """クエリ回数・所要時間を Server-Timing ヘッダーで返すASGIミドルウェア
+
+    ヘッダーはレスポンス開始時点の集計のため、ストリーミングレスポンスでは
+    出力中に実行したクエリを含まない。
+
+    Args:
+        app: ASGIアプリケーション
+        n_plus_one_threshold: N+1 とみなす同一クエリの回数
+    """
+
+    def __init__(self, app: ASGIApp, n_plus_one_threshold: int = N_PLUS_ONE_THRESHOLD):
+        self.app = app
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        with track_queries() as stats:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing",
+                        format_server_timing(stats, time.perf_counter() - started),
+                    )
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                repeated = stats.repeated_queries(self.n_plus_one_threshold)
+                if repeated:
+                    logger.warning(
+                        "N+1 クエリの可能性があります: %s %s %s",
+                        scope["method"],
+                        scope["path"],
+                        ", ".join(
+                            f"{table}.{operation}x{count}"
+                            for table, operation, count in repeated
+                        ),
+                    )
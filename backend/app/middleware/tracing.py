@@ -0,0 +1,64 @@
+"""HTTP リクエストのスパンを記録するミドルウェア
+
+リクエストごとにルートスパン（kind=SERVER）を作り、ビルダーの処理段階や
+Supabase の呼び出しのスパンをその子として記録する。上流から traceparent
+ヘッダーが渡された場合は同じトレースを引き継ぐ。
+"""
+
+from opentelemetry.propagate import extract
+from opentelemetry.trace import StatusCode
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import UNMATCHED_ROUTE
+from app.core.tracing import start_span, tracing_enabled
+from app.middleware.metrics import route_paths
+
+
+class TracingMiddleware:
+    """リクエスト単位のスパンを記録するASGIミドルウェア
+
+    スパン名はルートのパステンプレート（例 "GET /api/v1/ledgers/{ledger_id}"）
+    とし、ステータスコードを属性に付ける。トレーシング無効時はそのまま
+    アプリケーションを呼び出す。
+
+    Args:
+        app: ASGIアプリケーション
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._paths: dict | None = None
+
+    def _resolve_route(self, scope: Scope) -> str:
+        if self._paths is None:
+            self._paths = route_paths(scope["app"].routes)
+        return self._paths.get(scope.get("endpoint"), UNMATCHED_ROUTE)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not tracing_enabled():
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        with start_span(
+            f"{method} {scope['path']}",
+            {"http.request.method": method, "url.path": scope["path"]},
+            kind="SERVER",
+            context=extract(Headers(scope=scope)),
+        ) as span:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    span.set_attribute("http.response.status_code", status_code)
+                    if status_code >= 500:
+                        span.set_status(StatusCode.ERROR)
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = self._resolve_route(scope)
+                span.update_name(f"{method} {route}")
+                span.set_attribute("http.route", route)
@@ -0,0 +1,19 @@
+"""読み取りリポジトリ
+
+レスポンス組み立てが依存するデータ取得のインターフェース（ReadRepository）と、
+PostgREST・PostgreSQL 直結・インメモリの各バックエンドを提供する。
+"""
+
+from app.repositories.base import ReadRepository
+from app.repositories.dependencies import get_read_repository_dep
+from app.repositories.memory import InMemoryReadRepository
+from app.repositories.postgres import PostgresReadRepository
+from app.repositories.postgrest import PostgrestReadRepository
+
+__all__ = [
+    "InMemoryReadRepository",
+    "PostgresReadRepository",
+    "PostgrestReadRepository",
+    "ReadRepository",
+    "get_read_repository_dep",
+]
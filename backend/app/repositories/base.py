@@ -0,0 +1,79 @@
+"""読み取りリポジトリのインターフェース
+
+レスポンス組み立て（app/utils の各ビルダー）が必要とする読み取りを
+まとめたもの。バックエンド（PostgREST・PostgreSQL 直結・インメモリ）は
+いずれもこのインターフェースを実装し、行は PostgREST が返す JSON と同じ
+形（UUID・日付は文字列、埋め込みはネストした辞書）で返す。ビルダーは
+バックエンドを意識せずに同じ出力を組み立てられる。
+"""
+
+from collections.abc import Iterator
+from typing import Protocol
+from uuid import UUID
+
+
+class ReadRepository(Protocol):
+    """公開データの読み取りリポジトリ"""
+
+    # 台帳
+
+    def get_ledger(self, ledger_id: UUID) -> dict | None:
+        """台帳（public_ledgers の全列）を取得する。存在しなければ None"""
+
+    def list_candidate_ledgers(self, election_id: UUID) -> list[dict]:
+        """選挙の候補者台帳（選挙台帳のみ）を台帳ID順に取得する
+
+        行は id, total_income, total_expense, journal_count と
+        politician_elections（id, election_id, politician_id,
+        politicians（id, name, name_kana））のネストを持つ。
+        """
+
+    # 仕訳
+
+    def iter_ledger_journals(self, ledger_id: UUID) -> Iterator[dict]:
+        """台帳の仕訳（public_journals の全列）を日付・ID順に取得する"""
+
+    def iter_journals_for_ledgers(self, ledger_ids: list[str]) -> Iterator[dict]:
+        """複数台帳の仕訳を台帳ID・日付・ID順に取得する"""
+
+    def public_expense_totals(self, ledger_ids: list[str]) -> dict[str, int]:
+        """台帳ごとの公費負担合計（正の値のみ）を ledger_id をキーに取得する"""
+
+    # 選挙・政治家・政治団体
+
+    def election_exists(self, election_id: UUID) -> bool:
+        """選挙が存在するかどうか"""
+
+    def list_published_elections(self) -> list[dict]:
+        """選挙台帳が1件以上ある選挙を取得する
+
+        行は id, name, type, election_date と district（id, name）のネストを
+        持つ。選挙ごとに1行で、並び順は問わない。
+        """
+
+    def get_politician_election(self, politician_election_id: UUID) -> dict | None:
+        """候補者（politician_elections）を政治家・選挙のネスト付きで取得する
+
+        行は id と politicians（id, name, name_kana）・elections（id, name,
+        type, election_date, district_id）のネストを持つ。
+        """
+
+    def get_politician_organization(
+        self, politician_organization_id: UUID
+    ) -> dict | None:
+        """政治家と政治団体の関係を政治家・政治団体のネスト付きで取得する
+
+        行は id と politicians（id, name, name_kana）・organizations（id,
+        name, type）のネストを持つ。
+        """
+
+    def get_district(self, district_id: UUID) -> dict | None:
+        """選挙区（id, name）を取得する。存在しなければ None"""
+
+    # マスタ
+
+    def get_election_type(self, code: str) -> dict | None:
+        """選挙種別（code, name）を取得する。存在しなければ None"""
+
+    def get_account_code_names(self) -> dict[str, str]:
+        """勘定科目マスタ全件のコード→名称の対応表を取得する"""
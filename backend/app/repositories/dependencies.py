@@ -0,0 +1,55 @@
+"""読み取りリポジトリの依存性注入
+
+バックエンドは設定（READ_BACKEND）で起動時に決める。postgrest の場合は
+Supabase クライアント（get_supabase_client_dep）を包み、postgres の場合は
+起動時に開始したコネクションプールのリポジトリを使う。
+"""
+
+from fastapi import Depends, HTTPException, status
+from supabase import Client
+
+from app.config import settings
+from app.database.postgres import get_postgres_pool
+from app.database.supabase import get_supabase_client_dep
+from app.repositories.base import ReadRepository
+from app.repositories.postgrest import PostgrestReadRepository
+
+
+def get_postgrest_repository_dep(
+    supabase: Client = Depends(get_supabase_client_dep),
+) -> ReadRepository:
+    """PostgREST（Supabase クライアント）の読み取りリポジトリ取得関数。
+
+    Args:
+        supabase: 通常権限のSupabaseクライアント
+
+    Returns:
+        ReadRepository: 読み取りリポジトリ
+    """
+    return PostgrestReadRepository(supabase)
+
+
+def get_postgres_repository_dep() -> ReadRepository:
+    """PostgreSQL 直結の読み取りリポジトリ取得関数。
+
+    Returns:
+        ReadRepository: 読み取りリポジトリ
+
+    Raises:
+        HTTPException: コネクションプールが開始されていない場合。
+    """
+    pool = get_postgres_pool()
+    if pool is None:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="PostgreSQL connection pool is not started",
+        )
+    return pool.repository
+
+
+# FastAPIの依存性注入で使用する読み取りリポジトリ取得関数
+get_read_repository_dep = (
+    get_postgres_repository_dep
+    if settings.read_backend == "postgres"
+    else get_postgrest_repository_dep
+)
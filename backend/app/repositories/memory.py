@@ -0,0 +1,31 @@
+"""インメモリの読み取りリポジトリ
+
+PostgREST バックエンドのクエリを、メモリ上のテーブル（InMemorySupabase）に
+対して評価する。テスト・ベンチマーク・DB を用意しないローカル実行用。
+"""
+
+from app.database.memory import InMemorySupabase
+from app.database.pagination import DEFAULT_PAGE_SIZE
+from app.repositories.postgrest import PostgrestReadRepository
+
+
+class InMemoryReadRepository(PostgrestReadRepository):
+    """メモリ上のテーブルを読む読み取りリポジトリ
+
+    Args:
+        tables: テーブル名 → 行（辞書）のリスト（InMemorySupabase と同じ形式）
+        latency_seconds: クエリごとの待ち時間（秒）
+        page_size: 仕訳を分割取得する際の1ページあたりの件数
+
+    Attributes:
+        supabase: 行を保持するインメモリの Supabase クライアント
+    """
+
+    def __init__(
+        self,
+        tables: dict[str, list[dict]] | None = None,
+        latency_seconds: float = 0.0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ):
+        self.supabase = InMemorySupabase(tables, latency_seconds)
+        super().__init__(self.supabase, page_size)
@@ -0,0 +1,372 @@
+"""PostgreSQL 直結（asyncpg）による読み取りリポジトリ
+
+PostgREST を経由せず、asyncpg のコネクションプールで SQL を直接実行する。
+埋め込みに相当する結合は1文の SQL で行い、行は json_build_object /
+row_to_json で PostgREST と同じ JSON 表現（UUID・日付は文字列、埋め込みは
+ネストしたオブジェクト）にしてから返す。
+
+文は固定の SQL のみで、asyncpg が接続ごとに文をプリペアしてキャッシュ
+するため（statement cache）、2回目以降は解析・計画を省いて実行される。
+
+ビルダーは同期関数のため、メソッドも同期で呼び出す。コルーチンは
+プールを作成したイベントループ（アプリのイベントループとは別スレッドで
+動かすこと）へ渡し、結果を待つ。結果を待つ間は呼び出し元のスレッドが
+止まるため、アプリのイベントループからは呼ばず、スレッドプールで
+実行される同期のハンドラーから呼ぶ。
+
+仕訳は (date, id) のキーセットでページングする。前ページの最後の行の
+日付・ID より後を読むため、OFFSET と違って後ろのページでも読み飛ばす行が
+無く、idx_public_journals_ledger_date (ledger_id, date, id) の範囲走査になる。
+"""
+
+import asyncio
+import time
+from collections.abc import Callable, Coroutine, Iterator
+from datetime import date
+from typing import Any
+from uuid import UUID
+
+import asyncpg
+import orjson
+
+from app.core.metrics import observe_query
+from app.core.query_stats import record_query
+from app.core.tracing import start_span
+from app.database.pagination import DEFAULT_PAGE_SIZE
+
+LEDGER_SQL = "SELECT row_to_json(l) FROM public_ledgers l WHERE l.id = $1"
+
+CANDIDATE_LEDGERS_SQL = """
+SELECT json_build_object(
+    'id', l.id,
+    'total_income', l.total_income,
+    'total_expense', l.total_expense,
+    'journal_count', l.journal_count,
+    'politician_elections', json_build_object(
+        'id', pe.id,
+        'election_id', pe.election_id,
+        'politician_id', pe.politician_id,
+        'politicians', CASE WHEN p.id IS NULL THEN NULL ELSE json_build_object(
+            'id', p.id, 'name', p.name, 'name_kana', p.name_kana
+        ) END
+    )
+)
+FROM public_ledgers l
+JOIN politician_elections pe ON pe.id = l.politician_election_id
+LEFT JOIN politicians p ON p.id = pe.politician_id
+WHERE pe.election_id = $1 AND l.ledger_type = 'election_fund'
+ORDER BY l.id
+"""
+
+# 仕訳の先頭ページ。1ページに収まる場合（大半の台帳）は1回で読み終わる
+LEDGER_JOURNALS_SQL = """
+SELECT row_to_json(j)
+FROM public_journals j
+WHERE j.ledger_id = $1
+ORDER BY j.date, j.id
+LIMIT $2
+"""
+
+JOURNALS_FOR_LEDGERS_SQL = """
+SELECT row_to_json(j)
+FROM public_journals j
+WHERE j.ledger_id = ANY($1::uuid[])
+ORDER BY j.ledger_id, j.date, j.id
+LIMIT $2
+"""
+
+# 2ページ目以降。date は NULL を取りうる（ORDER BY では末尾に並ぶ）が、
+# 行の比較は NULL を含む行を除くため、日付のある仕訳を読み終えてから
+# 日付の無い仕訳を ID 順に読む
+LEDGER_JOURNALS_AFTER_SQL = """
+SELECT row_to_json(j)
+FROM public_journals j
+WHERE j.ledger_id = $1 AND (j.date, j.id) > ($3, $4)
+ORDER BY j.date, j.id
+LIMIT $2
+"""
+
+UNDATED_LEDGER_JOURNALS_SQL = """
+SELECT row_to_json(j)
+FROM public_journals j
+WHERE j.ledger_id = $1 AND j.date IS NULL
+ORDER BY j.id
+LIMIT $2
+"""
+
+UNDATED_LEDGER_JOURNALS_AFTER_SQL = """
+SELECT row_to_json(j)
+FROM public_journals j
+WHERE j.ledger_id = $1 AND j.date IS NULL AND j.id > $3
+ORDER BY j.id
+LIMIT $2
+"""
+
+PUBLIC_EXPENSE_TOTALS_SQL = """
+SELECT ledger_id::text, sum(public_expense_amount)
+FROM public_journals
+WHERE ledger_id = ANY($1::uuid[]) AND public_expense_amount > 0
+GROUP BY ledger_id
+"""
+
+ELECTION_EXISTS_SQL = "SELECT EXISTS (SELECT 1 FROM elections WHERE id = $1)"
+
+PUBLISHED_ELECTIONS_SQL = """
+SELECT json_build_object(
+    'id', e.id,
+    'name', e.name,
+    'type', e.type,
+    'election_date', e.election_date,
+    'district', CASE WHEN d.id IS NULL THEN NULL ELSE json_build_object(
+        'id', d.id, 'name', d.name
+    ) END
+)
+FROM elections e
+LEFT JOIN districts d ON d.id = e.district_id
+WHERE EXISTS (
+    SELECT 1
+    FROM politician_elections pe
+    JOIN public_ledgers l ON l.politician_election_id = pe.id
+    WHERE pe.election_id = e.id AND l.ledger_type = 'election_fund'
+)
+"""
+
+POLITICIAN_ELECTION_SQL = """
+SELECT json_build_object(
+    'id', pe.id,
+    'politicians', CASE WHEN p.id IS NULL THEN NULL ELSE json_build_object(
+        'id', p.id, 'name', p.name, 'name_kana', p.name_kana
+    ) END,
+    'elections', CASE WHEN e.id IS NULL THEN NULL ELSE json_build_object(
+        'id', e.id,
+        'name', e.name,
+        'type', e.type,
+        'election_date', e.election_date,
+        'district_id', e.district_id
+    ) END
+)
+FROM politician_elections pe
+LEFT JOIN politicians p ON p.id = pe.politician_id
+LEFT JOIN elections e ON e.id = pe.election_id
+WHERE pe.id = $1
+"""
+
+POLITICIAN_ORGANIZATION_SQL = """
+SELECT json_build_object(
+    'id', po.id,
+    'politicians', CASE WHEN p.id IS NULL THEN NULL ELSE json_build_object(
+        'id', p.id, 'name', p.name, 'name_kana', p.name_kana
+    ) END,
+    'organizations', CASE WHEN o.id IS NULL THEN NULL ELSE json_build_object(
+        'id', o.id, 'name', o.name, 'type', o.type
+    ) END
+)
+FROM politician_organizations po
+LEFT JOIN politicians p ON p.id = po.politician_id
+LEFT JOIN organizations o ON o.id = po.organization_id
+WHERE po.id = $1
+"""
+
+DISTRICT_SQL = (
+    "SELECT json_build_object('id', id, 'name', name) FROM districts WHERE id = $1"
+)
+
+ELECTION_TYPE_SQL = (
+    "SELECT json_build_object('code', code, 'name', name) "
+    "FROM election_types WHERE code = $1"
+)
+
+ACCOUNT_CODE_NAMES_SQL = "SELECT code, name FROM account_codes"
+
+
+def _dated_key(row: dict) -> tuple[date, str]:
+    return date.fromisoformat(row["date"]), row["id"]
+
+
+def _undated_key(row: dict) -> tuple[str]:
+    return (row["id"],)
+
+
+class PostgresReadRepository:
+    """asyncpg のコネクションプールを使う読み取りリポジトリ
+
+    Args:
+        pool: asyncpg のコネクションプール
+        loop: pool を作成したイベントループ（呼び出し元とは別スレッドで動くこと）
+        page_size: 仕訳を分割取得する際の1ページあたりの件数
+    """
+
+    def __init__(
+        self,
+        pool: asyncpg.Pool,
+        loop: asyncio.AbstractEventLoop,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ):
+        self._pool = pool
+        self._loop = loop
+        self._page_size = page_size
+
+    def _run(self, coroutine: Coroutine[Any, Any, Any]) -> Any:
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def _fetch(self, table: str, sql: str, *args: Any) -> list:
+        # PostgREST 経由のクエリ（InstrumentedQuery）と同じく計測する
+        with start_span(
+            f"select {table}",
+            {
+                "db.system": "postgresql",
+                "db.sql.table": table,
+                "db.operation": "select",
+            },
+            kind="CLIENT",
+        ):
+            started = time.perf_counter()
+            failed = True
+            try:
+                rows = self._run(self._pool.fetch(sql, *args))
+                failed = False
+                return rows
+            finally:
+                elapsed = time.perf_counter() - started
+                observe_query(table, "select", elapsed, failed)
+                record_query(table, "select", elapsed)
+
+    def _fetch_json(self, table: str, sql: str, *args: Any) -> list[dict]:
+        return [orjson.loads(row[0]) for row in self._fetch(table, sql, *args)]
+
+    def _fetch_json_one(self, table: str, sql: str, *args: Any) -> dict | None:
+        rows = self._fetch_json(table, sql, *args)
+        return rows[0] if rows else None
+
+    def _iter_journal_pages(
+        self,
+        sql: str,
+        after_sql: str,
+        key_of: Callable[[dict], tuple],
+        ledger_id: str,
+        *key: Any,
+    ) -> Iterator[dict]:
+        """1台帳の仕訳をキーセットでページングして読む
+
+        key を省略した場合は sql で先頭から読み、以降は after_sql に
+        前ページの最後の行のキー（key_of の戻り値）を渡して続きを読む。
+        """
+        while True:
+            rows = self._fetch_json(
+                "public_journals",
+                after_sql if key else sql,
+                ledger_id,
+                self._page_size,
+                *key,
+            )
+            yield from rows
+            if len(rows) < self._page_size:
+                return
+            key = key_of(rows[-1])
+
+    def _iter_ledger_journals_after(self, ledger_id: str, last: dict) -> Iterator[dict]:
+        """1台帳の仕訳のうち last より後（日付・ID順）を読む"""
+        if last["date"] is not None:
+            yield from self._iter_journal_pages(
+                LEDGER_JOURNALS_AFTER_SQL,
+                LEDGER_JOURNALS_AFTER_SQL,
+                _dated_key,
+                ledger_id,
+                *_dated_key(last),
+            )
+        yield from self._iter_journal_pages(
+            UNDATED_LEDGER_JOURNALS_SQL,
+            UNDATED_LEDGER_JOURNALS_AFTER_SQL,
+            _undated_key,
+            ledger_id,
+            *(_undated_key(last) if last["date"] is None else ()),
+        )
+
+    def get_ledger(self, ledger_id: UUID) -> dict | None:
+        """台帳（public_ledgers の全列）を取得する。存在しなければ None"""
+        return self._fetch_json_one("public_ledgers", LEDGER_SQL, str(ledger_id))
+
+    def list_candidate_ledgers(self, election_id: UUID) -> list[dict]:
+        """選挙の候補者台帳（選挙台帳のみ）を台帳ID順に取得する"""
+        return self._fetch_json(
+            "public_ledgers", CANDIDATE_LEDGERS_SQL, str(election_id)
+        )
+
+    def iter_ledger_journals(self, ledger_id: UUID) -> Iterator[dict]:
+        """台帳の仕訳（public_journals の全列）を日付・ID順に取得する"""
+        rows = self._fetch_json(
+            "public_journals", LEDGER_JOURNALS_SQL, str(ledger_id), self._page_size
+        )
+        yield from rows
+        if len(rows) == self._page_size:
+            yield from self._iter_ledger_journals_after(str(ledger_id), rows[-1])
+
+    def iter_journals_for_ledgers(self, ledger_ids: list[str]) -> Iterator[dict]:
+        """複数台帳の仕訳を台帳ID・日付・ID順に取得する
+
+        先頭ページは全台帳をまとめて読む。収まらなかった場合は、最後の行の
+        台帳の続きと、それより後の台帳を1台帳ずつ読む。
+        """
+        rows = self._fetch_json(
+            "public_journals",
+            JOURNALS_FOR_LEDGERS_SQL,
+            list(ledger_ids),
+            self._page_size,
+        )
+        yield from rows
+        if len(rows) < self._page_size:
+            return
+        last = rows[-1]
+        yield from self._iter_ledger_journals_after(last["ledger_id"], last)
+        # ORDER BY の uuid の順（バイト順）は UUID の整数値の順と同じ
+        last_ledger_id = UUID(last["ledger_id"])
+        for ledger_id in sorted({UUID(ledger_id) for ledger_id in ledger_ids}):
+            if ledger_id > last_ledger_id:
+                yield from self.iter_ledger_journals(ledger_id)
+
+    def public_expense_totals(self, ledger_ids: list[str]) -> dict[str, int]:
+        """台帳ごとの公費負担合計（正の値のみ）を DB 側で集計して取得する"""
+        rows = self._fetch(
+            "public_journals", PUBLIC_EXPENSE_TOTALS_SQL, list(ledger_ids)
+        )
+        return {ledger_id: int(total) for ledger_id, total in rows}
+
+    def election_exists(self, election_id: UUID) -> bool:
+        """選挙が存在するかどうか"""
+        rows = self._fetch("elections", ELECTION_EXISTS_SQL, str(election_id))
+        return bool(rows[0][0])
+
+    def list_published_elections(self) -> list[dict]:
+        """選挙台帳が1件以上ある選挙を取得する"""
+        return self._fetch_json("elections", PUBLISHED_ELECTIONS_SQL)
+
+    def get_politician_election(self, politician_election_id: UUID) -> dict | None:
+        """候補者（politician_elections）を政治家・選挙のネスト付きで取得する"""
+        return self._fetch_json_one(
+            "politician_elections",
+            POLITICIAN_ELECTION_SQL,
+            str(politician_election_id),
+        )
+
+    def get_politician_organization(
+        self, politician_organization_id: UUID
+    ) -> dict | None:
+        """政治家と政治団体の関係を政治家・政治団体のネスト付きで取得する"""
+        return self._fetch_json_one(
+            "politician_organizations",
+            POLITICIAN_ORGANIZATION_SQL,
+            str(politician_organization_id),
+        )
+
+    def get_district(self, district_id: UUID) -> dict | None:
+        """選挙区（id, name）を取得する。存在しなければ None"""
+        return self._fetch_json_one("districts", DISTRICT_SQL, str(district_id))
+
+    def get_election_type(self, code: str) -> dict | None:
+        """選挙種別（code, name）を取得する。存在しなければ None"""
+        return self._fetch_json_one("election_types", ELECTION_TYPE_SQL, code)
+
+    def get_account_code_names(self) -> dict[str, str]:
+        """勘定科目マスタ全件のコード→名称の対応表を取得する"""
+        rows = self._fetch("account_codes", ACCOUNT_CODE_NAMES_SQL)
+        return {code: name for code, name in rows}
@@ -0,0 +1,228 @@
+"""PostgREST（Supabase クライアント）による読み取りリポジトリ
+
+これまでビルダーに直接書かれていた supabase.table(...) のクエリを
+そのまま移したもの。埋め込み（リソース埋め込み）で結合し、件数の多い
+仕訳は range 指定のページ分割で読む。
+"""
+
+from collections.abc import Iterator
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from postgrest import APIResponse
+from supabase import Client
+
+from app.database.pagination import DEFAULT_PAGE_SIZE, iter_rows
+from app.utils.journals import fetch_account_code_names, iter_ledger_journal_rows
+
+
+def _require_data(data: list[dict] | None, detail: str) -> list[dict]:
+    if data is None:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=detail,
+        )
+    return data
+
+
+def _maybe_single_data(response: APIResponse | None) -> dict | None:
+    # maybe_single().execute() は該当行が無い場合にレスポンスではなく None を返す
+    return response.data if response else None
+
+
+class PostgrestReadRepository:
+    """Supabase クライアントを使う読み取りリポジトリ
+
+    Args:
+        supabase: Supabaseクライアント
+        page_size: 仕訳を分割取得する際の1ページあたりの件数
+    """
+
+    def __init__(self, supabase: Client, page_size: int = DEFAULT_PAGE_SIZE):
+        self._supabase = supabase
+        self._page_size = page_size
+
+    def get_ledger(self, ledger_id: UUID) -> dict | None:
+        """台帳（public_ledgers の全列）を取得する。存在しなければ None"""
+        response = (
+            self._supabase.table("public_ledgers")
+            .select("*")
+            .eq("id", str(ledger_id))
+            .maybe_single()
+            .execute()
+        )
+        return _maybe_single_data(response)
+
+    def list_candidate_ledgers(self, election_id: UUID) -> list[dict]:
+        """選挙の候補者台帳（選挙台帳のみ）を台帳ID順に取得する
+
+        中間テーブルを inner join で埋め込み、選挙IDで絞り込む。
+        """
+        response = (
+            self._supabase.table("public_ledgers")
+            .select(
+                """
+                id,
+                total_income,
+                total_expense,
+                journal_count,
+                politician_elections:politician_election_id!inner(
+                    id,
+                    election_id,
+                    politician_id,
+                    politicians:politician_id(id, name, name_kana)
+                )
+                """
+            )
+            .eq("ledger_type", "election_fund")
+            .eq("politician_elections.election_id", str(election_id))
+            .order("id")
+            .execute()
+        )
+        return _require_data(response.data, "候補者一覧の取得に失敗しました")
+
+    def iter_ledger_journals(self, ledger_id: UUID) -> Iterator[dict]:
+        """台帳の仕訳（public_journals の全列）を日付・ID順に取得する"""
+        return iter_ledger_journal_rows(self._supabase, ledger_id, self._page_size)
+
+    def iter_journals_for_ledgers(self, ledger_ids: list[str]) -> Iterator[dict]:
+        """複数台帳の仕訳を1つの IN クエリで台帳ID・日付・ID順に取得する"""
+        return iter_rows(
+            lambda: self._supabase.table("public_journals")
+            .select("*")
+            .in_("ledger_id", ledger_ids)
+            .order("ledger_id")
+            .order("date")
+            .order("id"),
+            self._page_size,
+        )
+
+    def public_expense_totals(self, ledger_ids: list[str]) -> dict[str, int]:
+        """台帳ごとの公費負担合計（正の値のみ）を ledger_id をキーに取得する
+
+        公費負担が正の仕訳の台帳ID・金額列のみを読み、クライアント側で集計する。
+        """
+        rows = iter_rows(
+            lambda: self._supabase.table("public_journals")
+            .select("id, ledger_id, public_expense_amount")
+            .in_("ledger_id", ledger_ids)
+            .gt("public_expense_amount", 0)
+            .order("id"),
+            self._page_size,
+        )
+        totals: dict[str, int] = {}
+        for row in rows:
+            ledger_id = row["ledger_id"]
+            totals[ledger_id] = totals.get(ledger_id, 0) + row["public_expense_amount"]
+        return totals
+
+    def election_exists(self, election_id: UUID) -> bool:
+        """選挙が存在するかどうか"""
+        response = (
+            self._supabase.table("elections")
+            .select("id")
+            .eq("id", str(election_id))
+            .maybe_single()
+            .execute()
+        )
+        return bool(_maybe_single_data(response))
+
+    def list_published_elections(self) -> list[dict]:
+        """選挙台帳が1件以上ある選挙を取得する
+
+        選挙台帳から中間テーブル経由で選挙情報を埋め込んで読み、
+        同一選挙の重複（複数候補者）を除く。
+        """
+        response = (
+            self._supabase.table("public_ledgers")
+            .select(
+                """
+                politician_election_id,
+                politician_elections:politician_election_id(
+                    election_id,
+                    elections:election_id(
+                        id,
+                        name,
+                        type,
+                        election_date,
+                        district:districts(id, name)
+                    )
+                )
+                """
+            )
+            .eq("ledger_type", "election_fund")
+            .execute()
+        )
+        ledgers = _require_data(response.data, "選挙一覧の取得に失敗しました")
+
+        election_map: dict[str, dict] = {}
+        for ledger in ledgers:
+            pol_elec = ledger.get("politician_elections")
+            if not pol_elec:
+                continue
+            election_data = pol_elec.get("elections")
+            if election_data and election_data["id"] not in election_map:
+                election_map[election_data["id"]] = election_data
+        return list(election_map.values())
+
+    def get_politician_election(self, politician_election_id: UUID) -> dict | None:
+        """候補者（politician_elections）を政治家・選挙のネスト付きで取得する"""
+        response = (
+            self._supabase.table("politician_elections")
+            .select(
+                """
+                id,
+                politicians:politician_id(id, name, name_kana),
+                elections:election_id(id, name, type, election_date, district_id)
+                """
+            )
+            .eq("id", str(politician_election_id))
+            .maybe_single()
+            .execute()
+        )
+        return _maybe_single_data(response)
+
+    def get_politician_organization(
+        self, politician_organization_id: UUID
+    ) -> dict | None:
+        """政治家と政治団体の関係を政治家・政治団体のネスト付きで取得する"""
+        response = (
+            self._supabase.table("politician_organizations")
+            .select(
+                """
+                id,
+                politicians:politician_id(id, name, name_kana),
+                organizations:organization_id(id, name, type)
+                """
+            )
+            .eq("id", str(politician_organization_id))
+            .maybe_single()
+            .execute()
+        )
+        return _maybe_single_data(response)
+
+    def get_district(self, district_id: UUID) -> dict | None:
+        """選挙区（id, name）を取得する。存在しなければ None"""
+        response = (
+            self._supabase.table("districts")
+            .select("id, name")
+            .eq("id", str(district_id))
+            .maybe_single()
+            .execute()
+        )
+        return _maybe_single_data(response)
+
+    def get_election_type(self, code: str) -> dict | None:
+        """選挙種別（code, name）を取得する。存在しなければ None"""
+        response = (
+            self._supabase.table("election_types")
+            .select("code, name")
+            .eq("code", code)
+            .maybe_single()
+            .execute()
+        )
+        return _maybe_single_data(response)
+
+    def get_account_code_names(self) -> dict[str, str]:
+        """勘定科目マスタ全件のコード→名称の対応表を取得する"""
+        return fetch_account_code_names(self._supabase)
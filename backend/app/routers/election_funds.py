@@ -1,27 +1,40 @@
 """選挙運動費用収支報告書のAPIエンドポイント
 
 public_journalsとpublic_ledgersテーブルから選挙資金データを取得する。
+
+リポジトリ（PostgREST・PostgreSQL 直結）の読み出しはブロッキングのため、
+ハンドラーは同期関数とし、イベントループではなくスレッドプールで実行させる。
 """
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
-from supabase import Client
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 
 from app import schemas
-from app.database.supabase import get_supabase_client_dep
-from app.utils.election_funds_response import build_election_funds_response
+from app.core.content_negotiation import NegotiatedRoute
+from app.core.snapshot_cache import snapshot_response
+from app.repositories import ReadRepository, get_read_repository_dep
+from app.utils.election_funds_response import (
+    build_election_funds_response,
+    stream_election_funds_response,
+)
 
-router = APIRouter()
+router = APIRouter(route_class=NegotiatedRoute)
 
 
 @router.get(
     "/election-funds/{ledger_id}",
     response_model=schemas.ElectionFundsResponse,
 )
-async def get_election_funds_by_ledger_id(
+def get_election_funds_by_ledger_id(
+    request: Request,
     ledger_id: UUID,
-    supabase: Client = Depends(get_supabase_client_dep),
+    stream: bool = Query(
+        default=False,
+        description="true の場合、仕訳を逐次出力する（仕訳数の多い台帳向け）",
+    ),
+    repository: ReadRepository = Depends(get_read_repository_dep),
 ):
     """指定した台帳IDの選挙資金データを取得する
 
@@ -29,8 +42,10 @@ async def get_election_funds_by_ledger_id(
     選挙情報、政治家情報を取得する。
 
     Args:
+        request: リクエスト
         ledger_id: 台帳ID（public_ledgers.id）
-        supabase: Supabaseクライアント
+        stream: ストリーミング出力するかどうか
+        repository: 読み取りリポジトリ
 
     Returns:
         schemas.ElectionFundsResponse: 選挙資金データ
@@ -39,4 +54,11 @@ async def get_election_funds_by_ledger_id(
         HTTPException: 指定されたデータが見つからない場合
             - 404: 台帳が存在しない場合、または選挙運動の台帳でない場合
     """
-    return build_election_funds_response(supabase, ledger_id)
+    if stream:
+        return StreamingResponse(
+            stream_election_funds_response(repository, ledger_id),
+            media_type="application/json",
+        )
+    return snapshot_response(
+        request, lambda: build_election_funds_response(repository, ledger_id)
+    )
@@ -0,0 +1,147 @@
+"""一括エクスポートのAPIエンドポイント
+
+条件に合う台帳の仕訳を NDJSON / CSV / Parquet / Arrow IPC で一括取得する。
+台帳ごとのAPIを繰り返し呼ぶ代わりに使用する。
+対象台帳の取得はレスポンスを返す前に行うブロッキング処理のため、
+ハンドラーは同期関数とし、FastAPI のスレッドプールで実行する。
+"""
+
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from supabase import Client
+
+from app.database.supabase import get_supabase_client_dep
+from app.utils.journal_export import (
+    ExportFormat,
+    LedgerType,
+    iter_filtered_export_rows,
+    stream_journal_export,
+)
+from app.utils.journal_export_columnar import iter_arrow_stream, iter_parquet
+
+router = APIRouter(prefix="/exports")
+
+EXPORT_MEDIA_TYPES: dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+PARQUET_MEDIA_TYPE = "application/vnd.apache.parquet"
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+
+@router.get(
+    "/journals",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()},
+            "description": "仕訳の一括データ",
+        }
+    },
+)
+def export_journals(
+    format: ExportFormat = Query(default="ndjson", description="出力形式"),
+    election_id: UUID | None = Query(default=None, description="選挙ID"),
+    fiscal_year: int | None = Query(default=None, description="会計年度"),
+    ledger_type: LedgerType | None = Query(default=None, description="台帳種別"),
+    supabase: Client = Depends(get_supabase_client_dep),
+):
+    """条件に合う台帳の仕訳を一括で取得する
+
+    仕訳1件を1行とし、台帳・選挙・政治家の識別子と勘定科目名・
+    選挙種別名を結合して出力する。データはページ単位で読みながら
+    逐次出力する。
+
+    Args:
+        format: 出力形式（ndjson / csv）
+        election_id: 選挙ID（指定時は選挙台帳のみ）
+        fiscal_year: 会計年度
+        ledger_type: 台帳種別（political_fund / election_fund）
+        supabase: Supabaseクライアント
+
+    Returns:
+        StreamingResponse: NDJSON または CSV
+    """
+    return StreamingResponse(
+        stream_journal_export(supabase, format, election_id, fiscal_year, ledger_type),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="journals.{format}"'},
+    )
+
+
+@router.get(
+    "/journals.parquet",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {PARQUET_MEDIA_TYPE: {}},
+            "description": "仕訳の一括データ（Parquet）",
+        }
+    },
+)
+def export_journals_parquet(
+    election_id: UUID | None = Query(default=None, description="選挙ID"),
+    fiscal_year: int | None = Query(default=None, description="会計年度"),
+    ledger_type: LedgerType | None = Query(default=None, description="台帳種別"),
+    supabase: Client = Depends(get_supabase_client_dep),
+):
+    """条件に合う台帳の仕訳を Parquet で一括取得する
+
+    列は型付き（UUID・日付・整数金額）で、コード・名称列は辞書エンコードする。
+    レコードバッチ単位で行グループを書き出しながら逐次出力する。
+
+    Args:
+        election_id: 選挙ID（指定時は選挙台帳のみ）
+        fiscal_year: 会計年度
+        ledger_type: 台帳種別（political_fund / election_fund）
+        supabase: Supabaseクライアント
+
+    Returns:
+        StreamingResponse: Parquet ファイル
+    """
+    rows = iter_filtered_export_rows(supabase, election_id, fiscal_year, ledger_type)
+    return StreamingResponse(
+        iter_parquet(rows),
+        media_type=PARQUET_MEDIA_TYPE,
+        headers={"Content-Disposition": 'attachment; filename="journals.parquet"'},
+    )
+
+
+@router.get(
+    "/journals.arrow",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {ARROW_STREAM_MEDIA_TYPE: {}},
+            "description": "仕訳の一括データ（Arrow IPC ストリーム）",
+        }
+    },
+)
+def export_journals_arrow(
+    election_id: UUID | None = Query(default=None, description="選挙ID"),
+    fiscal_year: int | None = Query(default=None, description="会計年度"),
+    ledger_type: LedgerType | None = Query(default=None, description="台帳種別"),
+    supabase: Client = Depends(get_supabase_client_dep),
+):
+    """条件に合う台帳の仕訳を Arrow IPC ストリーム形式で一括取得する
+
+    列の型は Parquet 出力と同じ。
+
+    Args:
+        election_id: 選挙ID（指定時は選挙台帳のみ）
+        fiscal_year: 会計年度
+        ledger_type: 台帳種別（political_fund / election_fund）
+        supabase: Supabaseクライアント
+
+    Returns:
+        StreamingResponse: Arrow IPC ストリーム
+    """
+    rows = iter_filtered_export_rows(supabase, election_id, fiscal_year, ledger_type)
+    return StreamingResponse(
+        iter_arrow_stream(rows),
+        media_type=ARROW_STREAM_MEDIA_TYPE,
+        headers={"Content-Disposition": 'attachment; filename="journals.arrow"'},
+    )
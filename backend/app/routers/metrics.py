@@ -0,0 +1,21 @@
+"""Prometheus メトリクスのエンドポイント"""
+
+from fastapi import APIRouter, Response
+
+from app.core.metrics import render_metrics
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """Prometheus のテキスト形式でメトリクスを返す
+
+    ルート別のリクエスト処理時間・レスポンスサイズ・処理中件数と、
+    テーブル別の Supabase クエリの件数・所要時間を含む。
+
+    Returns:
+        Response: Prometheus のテキスト形式のメトリクス
+    """
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
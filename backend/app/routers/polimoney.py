@@ -1,35 +1,54 @@
 """Polimoney APIエンドポイント
 
 公開済み選挙データの一覧取得など、Polimoney向けAPIを提供する。
+
+リポジトリ（PostgREST・PostgreSQL 直結）の読み出しはブロッキングのため、
+ハンドラーは同期関数とし、イベントループではなくスレッドプールで実行させる。
 """
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import StreamingResponse
 from supabase import Client
 
 from app import schemas
+from app.core.content_negotiation import NegotiatedRoute
+from app.core.responses import PydanticJSONResponse
+from app.core.snapshot_cache import snapshot_response
 from app.database.supabase import get_supabase_client_dep
+from app.repositories import ReadRepository, get_read_repository_dep
+from app.utils.change_feed import (
+    CHANGE_FEED_DEFAULT_LIMIT,
+    CHANGE_FEED_MAX_LIMIT,
+    build_changes_response,
+)
 from app.utils.election_funds_response import (
     build_election_funds_response,
     build_election_funds_response_for_ledger,
     fetch_election_ledger_or_raise,
+    stream_election_funds_response,
+    stream_election_funds_response_for_ledger,
 )
+from app.utils.ledger_events import iter_ledger_event_stream
 from app.utils.polimoney_response import (
+    build_election_bundle_response,
     build_election_candidates_response,
     build_elections_list_response,
     resolve_ledger_for_election,
+    stream_election_bundle_response,
 )
 
-router = APIRouter(prefix="/polimoney")
+router = APIRouter(prefix="/polimoney", route_class=NegotiatedRoute)
 
 
 @router.get(
     "/elections",
     response_model=schemas.ElectionsListResponse,
 )
-async def get_polimoney_elections(
-    supabase: Client = Depends(get_supabase_client_dep),
+def get_polimoney_elections(
+    request: Request,
+    repository: ReadRepository = Depends(get_read_repository_dep),
 ):
     """収支データが公開されている選挙の一覧を取得する
 
@@ -37,7 +56,8 @@ async def get_polimoney_elections(
     同一選挙に複数候補者の台帳がある場合は重複を除去する。
 
     Args:
-        supabase: Supabaseクライアント
+        request: リクエスト
+        repository: 読み取りリポジトリ
 
     Returns:
         schemas.ElectionsListResponse: 公開済み選挙一覧
@@ -45,7 +65,7 @@ async def get_polimoney_elections(
     Raises:
         HTTPException: データ取得に失敗した場合
     """
-    return build_elections_list_response(supabase)
+    return snapshot_response(request, lambda: build_elections_list_response(repository))
 
 
 @router.get(
@@ -55,13 +75,18 @@ async def get_polimoney_elections(
         status.HTTP_400_BAD_REQUEST: {"model": schemas.MultipleCandidatesError},
     },
 )
-async def get_polimoney_election_journals(
+def get_polimoney_election_journals(
+    request: Request,
     election_id: UUID,
     politician_id: UUID | None = Query(
         default=None,
         description="政治家 ID（同じ選挙に複数候補者がいる場合は必須）",
     ),
-    supabase: Client = Depends(get_supabase_client_dep),
+    stream: bool = Query(
+        default=False,
+        description="true の場合、仕訳を逐次出力する（仕訳数の多い台帳向け）",
+    ),
+    repository: ReadRepository = Depends(get_read_repository_dep),
 ):
     """指定選挙の収支データを Polimoney JSON 形式で取得する
 
@@ -69,9 +94,11 @@ async def get_polimoney_election_journals(
     同一選挙に複数候補者がいる場合は politician_id の指定が必須。
 
     Args:
+        request: リクエスト
         election_id: 選挙ID
         politician_id: 政治家ID（複数候補時は必須）
-        supabase: Supabaseクライアント
+        stream: ストリーミング出力するかどうか
+        repository: 読み取りリポジトリ
 
     Returns:
         schemas.ElectionFundsResponse: 選挙収支データ
@@ -80,25 +107,34 @@ async def get_polimoney_election_journals(
         HTTPException: 選挙・台帳が見つからない場合（404）
         MultipleCandidatesException: 複数候補者かつ politician_id 未指定（400）
     """
-    ledger_id = resolve_ledger_for_election(supabase, election_id, politician_id)
-    return build_election_funds_response(supabase, ledger_id)
+    ledger_id = resolve_ledger_for_election(repository, election_id, politician_id)
+    if stream:
+        return StreamingResponse(
+            stream_election_funds_response(repository, ledger_id),
+            media_type="application/json",
+        )
+    return snapshot_response(
+        request, lambda: build_election_funds_response(repository, ledger_id)
+    )
 
 
 @router.get(
     "/elections/{election_id}/candidates",
     response_model=schemas.ElectionCandidatesResponse,
 )
-async def get_polimoney_election_candidates(
+def get_polimoney_election_candidates(
+    request: Request,
     election_id: UUID,
-    supabase: Client = Depends(get_supabase_client_dep),
+    repository: ReadRepository = Depends(get_read_repository_dep),
 ):
     """指定選挙の候補者（収支データ公開済み）一覧を取得する
 
     該当選挙に紐づく public_ledgers と政治家情報を返却する。
 
     Args:
+        request: リクエスト
         election_id: 選挙ID
-        supabase: Supabaseクライアント
+        repository: 読み取りリポジトリ
 
     Returns:
         schemas.ElectionCandidatesResponse: 候補者一覧
@@ -106,24 +142,73 @@ async def get_polimoney_election_candidates(
     Raises:
         HTTPException: 候補者が見つからない、またはデータ取得に失敗した場合
     """
-    return build_election_candidates_response(supabase, election_id)
+    return snapshot_response(
+        request, lambda: build_election_candidates_response(repository, election_id)
+    )
+
+
+@router.get(
+    "/elections/{election_id}/bundle",
+    response_model=schemas.ElectionBundleResponse,
+)
+def get_polimoney_election_bundle(
+    request: Request,
+    election_id: UUID,
+    stream: bool = Query(
+        default=False,
+        description="true の場合、候補者単位で逐次出力する（大規模な選挙向け）",
+    ),
+    repository: ReadRepository = Depends(get_read_repository_dep),
+):
+    """指定選挙の候補者一覧と各候補者の仕訳一覧をまとめて取得する
+
+    候補者ごとに candidates / journals を呼び分ける代わりに、
+    候補者1クエリと仕訳1クエリ（台帳IDの IN 指定）で全件を返却する。
+
+    Args:
+        request: リクエスト
+        election_id: 選挙ID
+        stream: ストリーミング出力するかどうか
+        repository: 読み取りリポジトリ
+
+    Returns:
+        schemas.ElectionBundleResponse: 候補者と仕訳の一覧
+
+    Raises:
+        HTTPException: 選挙・候補者が見つからない、またはデータ取得に失敗した場合
+    """
+    if stream:
+        return StreamingResponse(
+            stream_election_bundle_response(repository, election_id),
+            media_type="application/json",
+        )
+    return snapshot_response(
+        request, lambda: build_election_bundle_response(repository, election_id)
+    )
 
 
 @router.get(
     "/ledgers/{ledger_id}/journals",
     response_model=schemas.ElectionFundsResponse,
 )
-async def get_polimoney_ledger_journals(
+def get_polimoney_ledger_journals(
+    request: Request,
     ledger_id: UUID,
-    supabase: Client = Depends(get_supabase_client_dep),
+    stream: bool = Query(
+        default=False,
+        description="true の場合、仕訳を逐次出力する（仕訳数の多い台帳向け）",
+    ),
+    repository: ReadRepository = Depends(get_read_repository_dep),
 ):
     """台帳IDを指定して収支データを Polimoney JSON 形式で取得する
 
     選挙台帳（election_id が設定されている台帳）のみ対応する。
 
     Args:
+        request: リクエスト
         ledger_id: 台帳ID（public_ledgers.id）
-        supabase: Supabaseクライアント
+        stream: ストリーミング出力するかどうか
+        repository: 読み取りリポジトリ
 
     Returns:
         schemas.ElectionFundsResponse: 収支データ
@@ -133,5 +218,84 @@ async def get_polimoney_ledger_journals(
             - 404: 台帳が存在しない場合
             - 400: 選挙台帳以外の場合
     """
-    ledger = fetch_election_ledger_or_raise(supabase, ledger_id)
-    return build_election_funds_response_for_ledger(supabase, ledger_id, ledger)
+    ledger = fetch_election_ledger_or_raise(repository, ledger_id)
+    if stream:
+        return StreamingResponse(
+            stream_election_funds_response_for_ledger(repository, ledger_id, ledger),
+            media_type="application/json",
+        )
+    return snapshot_response(
+        request,
+        lambda: build_election_funds_response_for_ledger(repository, ledger_id, ledger),
+    )
+
+
+@router.get(
+    "/changes",
+    response_model=schemas.ChangesResponse,
+)
+def get_polimoney_changes(
+    since: str | None = Query(
+        default=None,
+        description="前回レスポンスの next_cursor（未指定の場合は先頭から）",
+    ),
+    limit: int = Query(
+        default=CHANGE_FEED_DEFAULT_LIMIT,
+        ge=1,
+        le=CHANGE_FEED_MAX_LIMIT,
+        description="台帳・選挙・仕訳それぞれの最大件数",
+    ),
+    supabase: Client = Depends(get_supabase_client_dep),
+):
+    """カーソル以降に変更された台帳・選挙・仕訳を取得する
+
+    台帳は last_updated_at、選挙は updated_at、仕訳は synced_at の順に返す。
+    next_cursor を次回の since に指定すると差分のみを取得できる。
+    has_more が True の間は続けて取得する。削除は含まない。
+
+    Args:
+        since: 前回レスポンスの next_cursor
+        limit: リソースごとの最大件数
+        supabase: Supabaseクライアント
+
+    Returns:
+        schemas.ChangesResponse: 変更フィード
+
+    Raises:
+        HTTPException: カーソルが不正な場合（400）
+    """
+    # 内容がカーソルごとに異なり再利用されないため、スナップショットは使わない
+    return PydanticJSONResponse(build_changes_response(supabase, since, limit))
+
+
+@router.get(
+    "/events",
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {"content": {"text/event-stream": {}}},
+    },
+)
+async def get_polimoney_events(
+    election_id: UUID | None = Query(
+        default=None,
+        description="選挙 ID（指定した場合、その選挙の台帳の更新のみ通知する）",
+    ),
+):
+    """台帳の更新を Server-Sent Events で通知する
+
+    同期APIで台帳・仕訳が更新されるたびに ledger_updated イベントとして
+    台帳ID・選挙ID・最新の集計値を送る。受信が追いつかない場合は
+    reset イベントを送って切断するため、クライアントは再接続して
+    最新データを取得し直す。
+
+    Args:
+        election_id: 選挙ID（未指定の場合は全台帳）
+
+    Returns:
+        StreamingResponse: text/event-stream のレスポンス
+    """
+    return StreamingResponse(
+        iter_ledger_event_stream(election_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -4,6 +4,7 @@ Ledger から Hub への公開データ同期を受け付ける。
 contacts → journals → ledger の順に同期する。
 """
 
+import logging
 from datetime import datetime, timezone
 from typing import Literal, Optional
 from uuid import UUID
@@ -12,9 +13,15 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, model_validator
 from supabase import Client
 
+from app.core.content_negotiation import NegotiatedRoute
+from app.core.snapshot_cache import snapshot_cache
+from app.core.tracing import start_span
 from app.database.supabase import get_admin_supabase_client_dep
+from app.utils.ledger_events import publish_ledger_updates
 
-router = APIRouter()
+logger = logging.getLogger(__name__)
+
+router = APIRouter(route_class=NegotiatedRoute)
 
 
 def _utc_now() -> str:
@@ -95,80 +102,86 @@ async def sync_contacts(
     errors: list[SyncContactError] = []
 
     for contact in contacts:
-        try:
-            # contact_source_id で既存レコードを検索
-            existing = (
-                supabase.table("public_contacts")
-                .select("id")
-                .eq("contact_source_id", contact.contact_source_id)
-                .maybe_single()
-                .execute()
-            )
-
-            # 非公開フィールドは NULL にする
-            name = None if contact.is_name_private else contact.name
-            address = None if contact.is_address_private else contact.address
-            occupation = (
-                None if contact.is_occupation_private else contact.occupation
-            )
-
-            record = {
-                "contact_source_id": contact.contact_source_id,
-                "ledger_id": contact.ledger_id,
-                "contact_type": contact.contact_type,
-                "name": name,
-                "address": address,
-                "occupation": occupation,
-                "is_name_private": contact.is_name_private,
-                "is_address_private": contact.is_address_private,
-                "is_occupation_private": contact.is_occupation_private,
-                "privacy_reason_type": contact.privacy_reason_type,
-                "privacy_reason_other": contact.privacy_reason_other,
-                "hub_organization_id": contact.hub_organization_id,
-                "synced_at": _utc_now(),
-            }
-
-            if existing and existing.data:
-                # 更新
-                hub_contact_id = existing.data["id"]
-                supabase.table("public_contacts").update(record).eq(
-                    "id", hub_contact_id
-                ).execute()
-
-                results.append(
-                    SyncContactResult(
-                        hub_contact_id=hub_contact_id,
-                        contact_source_id=contact.contact_source_id,
-                        action="updated",
-                    )
-                )
-            else:
-                # 新規作成
-                insert_result = (
+        with start_span(
+            "sync_contact", {"contact_source_id": contact.contact_source_id}
+        ):
+            try:
+                # contact_source_id で既存レコードを検索
+                existing = (
                     supabase.table("public_contacts")
-                    .insert(record)
                     .select("id")
-                    .single()
+                    .eq("contact_source_id", contact.contact_source_id)
+                    .maybe_single()
                     .execute()
                 )
 
-                results.append(
-                    SyncContactResult(
-                        hub_contact_id=insert_result.data["id"],
-                        contact_source_id=contact.contact_source_id,
-                        action="created",
-                    )
+                # 非公開フィールドは NULL にする
+                name = None if contact.is_name_private else contact.name
+                address = None if contact.is_address_private else contact.address
+                occupation = (
+                    None if contact.is_occupation_private else contact.occupation
                 )
 
-        except Exception as e:
-            print(f"[Sync] Error syncing contact {contact.contact_source_id}: {e}")
-            errors.append(
-                SyncContactError(
-                    contact_source_id=contact.contact_source_id,
-                    error=str(e),
+                record = {
+                    "contact_source_id": contact.contact_source_id,
+                    "ledger_id": contact.ledger_id,
+                    "contact_type": contact.contact_type,
+                    "name": name,
+                    "address": address,
+                    "occupation": occupation,
+                    "is_name_private": contact.is_name_private,
+                    "is_address_private": contact.is_address_private,
+                    "is_occupation_private": contact.is_occupation_private,
+                    "privacy_reason_type": contact.privacy_reason_type,
+                    "privacy_reason_other": contact.privacy_reason_other,
+                    "hub_organization_id": contact.hub_organization_id,
+                    "synced_at": _utc_now(),
+                }
+
+                if existing and existing.data:
+                    # 更新
+                    hub_contact_id = existing.data["id"]
+                    supabase.table("public_contacts").update(record).eq(
+                        "id", hub_contact_id
+                    ).execute()
+
+                    results.append(
+                        SyncContactResult(
+                            hub_contact_id=hub_contact_id,
+                            contact_source_id=contact.contact_source_id,
+                            action="updated",
+                        )
+                    )
+                else:
+                    # 新規作成
+                    insert_result = (
+                        supabase.table("public_contacts")
+                        .insert(record)
+                        .select("id")
+                        .single()
+                        .execute()
+                    )
+
+                    results.append(
+                        SyncContactResult(
+                            hub_contact_id=insert_result.data["id"],
+                            contact_source_id=contact.contact_source_id,
+                            action="created",
+                        )
+                    )
+
+            except Exception as e:
+                logger.exception(
+                    "関係者の同期に失敗しました",
+                    extra={"contact_source_id": contact.contact_source_id},
                 )
-            )
-            continue
+                errors.append(
+                    SyncContactError(
+                        contact_source_id=contact.contact_source_id,
+                        error=str(e),
+                    )
+                )
+                continue
 
     return SyncContactsResponse(data=results, errors=errors)
 
@@ -211,57 +224,88 @@ class SyncJournalResult(BaseModel):
     errors: int = 0
 
 
-@router.post(
-    "/sync/journals",
-    response_model=dict,
-)
-async def sync_journals(
-    request: SyncJournalsRequest,
-    supabase: Client = Depends(get_admin_supabase_client_dep),
-):
-    """仕訳データを Ledger から Hub に同期する
+# 既存検索・台帳解決・書き込みをまとめて行う仕訳の件数（in フィルターの値は
+# URL のクエリ文字列に入るため、長くなりすぎない件数にする）
+SYNC_JOURNAL_CHUNK_SIZE = 100
 
-    journal_source_id をキーとして upsert する。
-    contact_id は Hub の public_contacts.id を指定する。
+
+def _sync_journal_chunk(
+    supabase: Client,
+    journals: list[SyncJournalInput],
+    hub_ledger_ids: dict[str, str],
+    result: SyncJournalResult,
+    changed_ledger_ids: set[str],
+) -> None:
+    """仕訳のチャンクを既存検索・台帳解決・書き込みの各1往復で同期する
 
     Args:
-        request: 同期する仕訳データ
         supabase: Supabaseクライアント（admin権限）
-
-    Returns:
-        dict: 同期結果
+        journals: 同期する仕訳
+        hub_ledger_ids: ledger_source_id から public_ledgers.id への対応
+            （解決済みの台帳は問い合わせず、新たに解決した台帳を追加する）
+        result: 件数を加算する同期結果
+        changed_ledger_ids: 書き込んだ仕訳の台帳IDを追加する集合
     """
-    result = SyncJournalResult()
+    # 同じ仕訳が複数含まれる場合は最後のものを同期する
+    latest = {journal.journal_source_id: journal for journal in journals}
+    result.skipped += len(journals) - len(latest)
 
-    for journal in request.journals:
-        try:
-            # 既存レコードを検索
-            existing = (
-                supabase.table("public_journals")
-                .select("id, content_hash")
-                .eq("journal_source_id", journal.journal_source_id)
-                .maybe_single()
-                .execute()
-            )
+    try:
+        # 既存レコードを検索
+        existing_rows = (
+            supabase.table("public_journals")
+            .select("id, journal_source_id, content_hash")
+            .in_("journal_source_id", list(latest))
+            .execute()
+        )
 
-            # ledger_source_id から Hub 側の public_ledgers.id を解決
-            hub_ledger = (
+        # ledger_source_id から Hub 側の public_ledgers.id を解決
+        unresolved = {
+            journal.ledger_source_id for journal in latest.values()
+        } - hub_ledger_ids.keys()
+        if unresolved:
+            hub_ledgers = (
                 supabase.table("public_ledgers")
-                .select("id")
-                .eq("ledger_source_id", journal.ledger_source_id)
-                .maybe_single()
+                .select("id, ledger_source_id")
+                .in_("ledger_source_id", sorted(unresolved))
                 .execute()
             )
-            if not hub_ledger or not hub_ledger.data:
-                print(
-                    f"[Sync] Hub ledger not found for source_id {journal.ledger_source_id}"
-                )
-                result.errors += 1
-                continue
+            hub_ledger_ids.update(
+                (row["ledger_source_id"], row["id"]) for row in hub_ledgers.data
+            )
+    except Exception:
+        logger.exception(
+            "仕訳の同期に失敗しました", extra={"journal_count": len(latest)}
+        )
+        result.errors += len(latest)
+        return
+
+    existing = {row["journal_source_id"]: row for row in existing_rows.data}
+    records: list[dict] = []
+    created = 0
+    for journal in latest.values():
+        hub_ledger_id = hub_ledger_ids.get(journal.ledger_source_id)
+        if hub_ledger_id is None:
+            logger.warning(
+                "仕訳の同期先の台帳が見つかりません",
+                extra={
+                    "journal_source_id": journal.journal_source_id,
+                    "ledger_source_id": journal.ledger_source_id,
+                },
+            )
+            result.errors += 1
+            continue
 
-            hub_ledger_id = hub_ledger.data["id"]
+        current = existing.get(journal.journal_source_id)
+        if current is None:
+            created += 1
+        elif current.get("content_hash") == journal.content_hash:
+            # ハッシュが同じならスキップ
+            result.skipped += 1
+            continue
 
-            record = {
+        records.append(
+            {
                 "journal_source_id": journal.journal_source_id,
                 "ledger_id": hub_ledger_id,
                 "date": journal.date,
@@ -277,28 +321,65 @@ async def sync_journals(
                 "is_test": journal.is_test,
                 "synced_at": _utc_now(),
             }
+        )
+
+    if not records:
+        return
 
-            if existing and existing.data:
-                # ハッシュが同じならスキップ
-                if existing.data.get("content_hash") == journal.content_hash:
-                    result.skipped += 1
-                    continue
-
-                # 更新
-                supabase.table("public_journals").update(record).eq(
-                    "id", existing.data["id"]
-                ).execute()
-                result.updated += 1
-            else:
-                # 新規作成
-                supabase.table("public_journals").insert(record).execute()
-                result.created += 1
-
-        except Exception as e:
-            print(
-                f"[Sync] Error syncing journal {journal.journal_source_id}: {e}"
+    try:
+        # 新規作成と更新を journal_source_id の upsert でまとめて書き込む
+        supabase.table("public_journals").upsert(
+            records, on_conflict="journal_source_id"
+        ).execute()
+    except Exception:
+        logger.exception(
+            "仕訳の同期に失敗しました", extra={"journal_count": len(records)}
+        )
+        result.errors += len(records)
+        return
+
+    result.created += created
+    result.updated += len(records) - created
+    changed_ledger_ids.update(record["ledger_id"] for record in records)
+
+
+@router.post(
+    "/sync/journals",
+    response_model=dict,
+)
+async def sync_journals(
+    request: SyncJournalsRequest,
+    supabase: Client = Depends(get_admin_supabase_client_dep),
+):
+    """仕訳データを Ledger から Hub に同期する
+
+    journal_source_id をキーとして upsert する。
+    contact_id は Hub の public_contacts.id を指定する。
+    SYNC_JOURNAL_CHUNK_SIZE 件ごとに、既存検索・台帳解決・書き込みを
+    それぞれ1往復で行う（仕訳の件数に比例して往復が増えない）。
+
+    Args:
+        request: 同期する仕訳データ
+        supabase: Supabaseクライアント（admin権限）
+
+    Returns:
+        dict: 同期結果
+    """
+    result = SyncJournalResult()
+    changed_ledger_ids: set[str] = set()
+    hub_ledger_ids: dict[str, str] = {}
+
+    for start in range(0, len(request.journals), SYNC_JOURNAL_CHUNK_SIZE):
+        chunk = request.journals[start : start + SYNC_JOURNAL_CHUNK_SIZE]
+        with start_span("sync_journal_chunk", {"journal_count": len(chunk)}):
+            _sync_journal_chunk(
+                supabase, chunk, hub_ledger_ids, result, changed_ledger_ids
             )
-            result.errors += 1
+
+    # 公開データが変わったため、キャッシュ済みのレスポンスを破棄する
+    if result.created or result.updated:
+        snapshot_cache.invalidate()
+        publish_ledger_updates(supabase, changed_ledger_ids, source="journals")
 
     return {"data": result.model_dump()}
 
@@ -387,6 +468,8 @@ async def sync_ledger(
         supabase.table("public_ledgers").update(record).eq(
             "id", existing.data["id"]
         ).execute()
+        snapshot_cache.invalidate()
+        publish_ledger_updates(supabase, [existing.data["id"]], source="ledger")
         return {
             "data": {**record, "id": existing.data["id"]},
             "action": "updated",
@@ -401,6 +484,8 @@ async def sync_ledger(
             .single()
             .execute()
         )
+        snapshot_cache.invalidate()
+        publish_ledger_updates(supabase, [insert_result.data["id"]], source="ledger")
         return {
             "data": {**record, "id": insert_result.data["id"]},
             "action": "created",
@@ -478,7 +563,10 @@ async def record_change_log(
             }
         ).execute()
     except Exception as e:
-        print(f"[Sync] Error recording change log: {e}")
+        logger.exception(
+            "変更ログの記録に失敗しました",
+            extra={"ledger_source_id": data.ledger_source_id},
+        )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"変更ログの記録に失敗しました: {e}",
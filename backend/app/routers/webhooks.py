@@ -0,0 +1,88 @@
+"""Webhook 購読の管理エンドポイント
+
+台帳更新の通知先 URL を選挙単位・台帳単位で登録する。
+通知は同期APIでの更新後にバックグラウンドで配信される。
+すべてのエンドポイントに管理APIキー（X-Admin-Api-Key）が必要。
+通知先 URL の名前解決や Supabase の読み書きはブロッキング処理のため、
+ハンドラーは同期関数とし、FastAPI のスレッドプールで実行する。
+"""
+
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, status
+from supabase import Client
+
+from app import schemas
+from app.core.content_negotiation import NegotiatedRoute
+from app.core.security import require_admin_api_key
+from app.database.supabase import get_admin_supabase_client_dep
+from app.utils.webhooks import (
+    create_webhook_subscription,
+    delete_webhook_subscription,
+    list_webhook_subscriptions,
+)
+
+router = APIRouter(
+    prefix="/webhooks",
+    route_class=NegotiatedRoute,
+    dependencies=[Depends(require_admin_api_key)],
+)
+
+
+@router.post(
+    "",
+    response_model=schemas.WebhookSubscriptionItem,
+    status_code=status.HTTP_201_CREATED,
+)
+def post_webhook_subscription(
+    request: schemas.WebhookSubscriptionCreate,
+    supabase: Client = Depends(get_admin_supabase_client_dep),
+):
+    """Webhook 購読を登録する
+
+    Args:
+        request: 通知先 URL と通知対象（選挙ID または 台帳ID）
+        supabase: Supabaseクライアント（admin権限）
+
+    Returns:
+        schemas.WebhookSubscriptionItem: 登録した購読
+    """
+    return create_webhook_subscription(supabase, request)
+
+
+@router.get(
+    "",
+    response_model=schemas.WebhookSubscriptionsResponse,
+)
+def get_webhook_subscriptions(
+    supabase: Client = Depends(get_admin_supabase_client_dep),
+):
+    """Webhook 購読の一覧を取得する
+
+    Args:
+        supabase: Supabaseクライアント（admin権限）
+
+    Returns:
+        schemas.WebhookSubscriptionsResponse: 購読一覧
+    """
+    return list_webhook_subscriptions(supabase)
+
+
+@router.delete(
+    "/{subscription_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+def remove_webhook_subscription(
+    subscription_id: UUID,
+    supabase: Client = Depends(get_admin_supabase_client_dep),
+):
+    """Webhook 購読を削除する
+
+    Args:
+        subscription_id: 購読ID
+        supabase: Supabaseクライアント（admin権限）
+
+    Raises:
+        HTTPException: 購読が見つからない場合（404）
+    """
+    delete_webhook_subscription(supabase, subscription_id)
@@ -3,3 +3,4 @@ from .election_funds import *
 from .polimoney import *
 from .political_funds import *
 from .user import *
+from .webhooks import *
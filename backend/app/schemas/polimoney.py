@@ -3,13 +3,17 @@
 公開済み選挙一覧など、Polimoney向けエンドポイントのレスポンス形式。
 """
 
-from datetime import date
+from datetime import date, datetime
 from typing import Optional
 from uuid import UUID
 
 from pydantic import BaseModel
 
-from app.schemas.election_funds import ElectionFundsSummary, PoliticianInfo
+from app.schemas.election_funds import (
+    ElectionFundsDataItem,
+    ElectionFundsSummary,
+    PoliticianInfo,
+)
 
 
 class ElectionListItem(BaseModel):
@@ -76,6 +80,119 @@ class ElectionCandidatesResponse(BaseModel):
     total_count: int
 
 
+class CandidateBundleItem(CandidateListItem):
+    """選挙バンドルの候補者1件（仕訳一覧を含む）
+
+    Attributes:
+        ledger_id: 台帳ID
+        politician: 政治家情報
+        summary: サマリー情報
+        journals: 仕訳一覧（日付順）
+    """
+
+    journals: list[ElectionFundsDataItem]
+
+
+class ElectionBundleResponse(BaseModel):
+    """選挙バンドルレスポンス
+
+    候補者一覧と各候補者の仕訳一覧をまとめて返却する。
+
+    Attributes:
+        api_version: APIバージョン
+        election_id: 選挙ID
+        data: 候補者一覧（仕訳を含む）
+        total_count: 候補者数
+    """
+
+    api_version: str = "v1"
+    election_id: UUID
+    data: list[CandidateBundleItem]
+    total_count: int
+
+
+class ChangedLedgerItem(BaseModel):
+    """変更フィードの台帳1件
+
+    Attributes:
+        id: 台帳ID
+        ledger_type: 台帳種別（political_fund / election_fund）
+        fiscal_year: 会計年度
+        election_id: 選挙ID（選挙台帳のみ）
+        politician_id: 政治家ID
+        total_income: 収入合計
+        total_expense: 支出合計
+        journal_count: 仕訳件数
+        last_updated_at: 最終更新日時
+    """
+
+    id: UUID
+    ledger_type: str
+    fiscal_year: int
+    election_id: Optional[UUID] = None
+    politician_id: Optional[UUID] = None
+    total_income: int = 0
+    total_expense: int = 0
+    journal_count: int = 0
+    last_updated_at: datetime
+
+
+class ChangedElectionItem(BaseModel):
+    """変更フィードの選挙1件
+
+    Attributes:
+        id: 選挙ID
+        name: 選挙名
+        type: 選挙タイプコード
+        election_date: 選挙日
+        district_id: 選挙区ID
+        updated_at: 更新日時
+    """
+
+    id: UUID
+    name: str
+    type: str
+    election_date: date
+    district_id: Optional[UUID] = None
+    updated_at: datetime
+
+
+class ChangedJournalItem(ElectionFundsDataItem):
+    """変更フィードの仕訳1件
+
+    Attributes:
+        ledger_id: 台帳ID
+        synced_at: 同期日時
+        その他: ElectionFundsDataItem と同じ
+    """
+
+    ledger_id: UUID
+    synced_at: datetime
+
+
+class ChangesResponse(BaseModel):
+    """変更フィードレスポンス
+
+    since カーソル以降に変更された台帳・選挙・仕訳を、それぞれ更新日時順に
+    返却する。next_cursor を次回の since に指定すると続きを取得できる。
+
+    Attributes:
+        api_version: APIバージョン
+        ledgers: 変更された台帳（last_updated_at 順）
+        elections: 変更された選挙（updated_at 順）
+        journals: 変更された仕訳（synced_at 順）
+        next_cursor: 次回取得用のカーソル
+        has_more: 取得しきれていない変更があるかどうか
+    """
+
+    api_version: str = "v1"
+    ledgers: list[ChangedLedgerItem]
+    elections: list[ChangedElectionItem]
+    journals: list[ChangedJournalItem]
+    next_cursor: str
+    has_more: bool
+
+
 class CandidateRef(BaseModel):
     """複数候補者エラー時の候補者参照
 
@@ -0,0 +1,68 @@
+"""Webhook 購読のスキーマ定義
+
+台帳更新の通知先（webhook_subscriptions）の登録・一覧の形式。
+"""
+
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import AnyHttpUrl, BaseModel, model_validator
+
+
+class WebhookSubscriptionCreate(BaseModel):
+    """Webhook 購読の登録リクエスト
+
+    election_id と ledger_id のどちらか一方を指定する。
+
+    Attributes:
+        url: 通知先 URL
+        secret: 署名用の共有鍵（指定時は X-Polimoney-Signature を付与する）
+        election_id: 通知対象の選挙ID
+        ledger_id: 通知対象の台帳ID
+    """
+
+    url: AnyHttpUrl
+    secret: Optional[str] = None
+    election_id: Optional[UUID] = None
+    ledger_id: Optional[UUID] = None
+
+    @model_validator(mode="after")
+    def validate_target(self) -> "WebhookSubscriptionCreate":
+        if (self.election_id is None) == (self.ledger_id is None):
+            raise ValueError(
+                "election_id と ledger_id のどちらか一方を指定してください"
+            )
+        return self
+
+
+class WebhookSubscriptionItem(BaseModel):
+    """Webhook 購読1件
+
+    Attributes:
+        id: 購読ID
+        url: 通知先 URL
+        has_secret: 署名用の共有鍵が設定されているか
+        election_id: 通知対象の選挙ID
+        ledger_id: 通知対象の台帳ID
+        is_active: 有効かどうか
+        created_at: 登録日時
+    """
+
+    id: UUID
+    url: str
+    has_secret: bool
+    election_id: Optional[UUID] = None
+    ledger_id: Optional[UUID] = None
+    is_active: bool = True
+    created_at: Optional[datetime] = None
+
+
+class WebhookSubscriptionsResponse(BaseModel):
+    """Webhook 購読一覧レスポンス
+
+    Attributes:
+        data: 購読一覧
+    """
+
+    data: list[WebhookSubscriptionItem]
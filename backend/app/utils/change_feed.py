@@ -0,0 +1,229 @@
+"""変更フィードユーティリティ
+
+台帳・選挙・仕訳を更新日時とIDの組（キーセット）で順に読み、前回取得位置
+以降の変更だけを返す。取得位置は不透明なカーソル文字列として受け渡す。
+"""
+
+import base64
+import binascii
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+import orjson
+from fastapi import HTTPException, status
+from supabase import Client
+
+from app import schemas
+from app.utils.election_funds_response import build_election_funds_data_item
+from app.utils.master_data import get_account_code_names
+from app.utils.political_funds_response import build_political_funds_data_item
+
+# 1リソースあたりの既定・最大取得件数
+CHANGE_FEED_DEFAULT_LIMIT = 500
+CHANGE_FEED_MAX_LIMIT = 1000
+
+# 書き込み途中の行を読み飛ばさないよう、直近この秒数の変更は次回以降に返す
+# （更新日時は書き込み側で採番するため、コミット順と前後しうる）
+CHANGE_FEED_SETTLE_SECONDS = 5.0
+
+# リソース名 → (テーブル名, 更新日時の列名)
+_RESOURCES: dict[str, tuple[str, str]] = {
+    "ledgers": ("public_ledgers", "last_updated_at"),
+    "elections": ("elections", "updated_at"),
+    "journals": ("public_journals", "synced_at"),
+}
+
+_SELECTS: dict[str, str] = {
+    "ledgers": """
+        id, ledger_type, fiscal_year, total_income, total_expense,
+        journal_count, last_updated_at,
+        politician_elections:politician_election_id(election_id, politician_id),
+        politician_organizations:politician_organization_id(politician_id)
+    """,
+    "elections": "id, name, type, election_date, district_id, updated_at",
+    "journals": "*, public_ledgers:ledger_id(ledger_type)",
+}
+
+Position = tuple[str, str]
+
+
+def encode_cursor(positions: dict[str, Position]) -> str:
+    """リソースごとの取得位置をカーソル文字列に変換する
+
+    Args:
+        positions: リソース名をキーとした (更新日時, ID)
+
+    Returns:
+        str: URL セーフな Base64 のカーソル
+    """
+    payload = orjson.dumps(
+        {name: list(position) for name, position in positions.items()}
+    )
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str | None) -> dict[str, Position]:
+    """カーソル文字列をリソースごとの取得位置に変換する
+
+    Args:
+        cursor: encode_cursor で生成したカーソル。None の場合は先頭から
+
+    Returns:
+        dict[str, Position]: リソース名をキーとした (更新日時, ID)
+
+    Raises:
+        HTTPException: カーソルが不正な場合（400）
+    """
+    if not cursor:
+        return {}
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = orjson.loads(base64.urlsafe_b64decode(padded))
+        positions = {}
+        for name, (updated_at, row_id) in payload.items():
+            if name not in _RESOURCES:
+                raise ValueError(name)
+            # 形式を検証する（フィルタ文字列へ埋め込むため）
+            datetime.fromisoformat(updated_at)
+            positions[name] = (updated_at, str(UUID(row_id)))
+    except (
+        binascii.Error,
+        orjson.JSONDecodeError,
+        AttributeError,
+        TypeError,
+        ValueError,
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="カーソルが不正です",
+        ) from None
+    return positions
+
+
+def fetch_changed_rows(
+    supabase: Client,
+    resource: str,
+    position: Position | None,
+    settled_before: str,
+    limit: int,
+) -> list[dict]:
+    """取得位置より後に変更された行を更新日時・ID順に取得する
+
+    Args:
+        supabase: Supabaseクライアント
+        resource: リソース名（ledgers / elections / journals）
+        position: 前回の取得位置（None の場合は先頭から）
+        settled_before: この日時以前の変更のみ返す
+        limit: 取得件数（続きの有無を判定するため limit + 1 件読む）
+
+    Returns:
+        list[dict]: 最大 limit + 1 件の行
+    """
+    table, column = _RESOURCES[resource]
+    query = supabase.table(table).select(_SELECTS[resource])
+    if position is not None:
+        updated_at, row_id = position
+        query = query.or_(
+            f'{column}.gt."{updated_at}",'
+            f'and({column}.eq."{updated_at}",id.gt.{row_id})'
+        )
+    response = (
+        query.lte(column, settled_before)
+        .order(column)
+        .order("id")
+        .limit(limit + 1)
+        .execute()
+    )
+    return response.data or []
+
+
+def _build_ledger_item(ledger_data: dict) -> schemas.ChangedLedgerItem:
+    pol_elec = ledger_data.get("politician_elections") or {}
+    pol_org = ledger_data.get("politician_organizations") or {}
+    return schemas.ChangedLedgerItem.model_construct(
+        id=ledger_data["id"],
+        ledger_type=ledger_data["ledger_type"],
+        fiscal_year=ledger_data["fiscal_year"],
+        election_id=pol_elec.get("election_id"),
+        politician_id=pol_elec.get("politician_id") or pol_org.get("politician_id"),
+        total_income=ledger_data.get("total_income") or 0,
+        total_expense=ledger_data.get("total_expense") or 0,
+        journal_count=ledger_data.get("journal_count") or 0,
+        last_updated_at=ledger_data["last_updated_at"],
+    )
+
+
+def _build_election_item(election_data: dict) -> schemas.ChangedElectionItem:
+    return schemas.ChangedElectionItem.model_construct(
+        id=election_data["id"],
+        name=election_data["name"],
+        type=election_data["type"],
+        election_date=election_data["election_date"],
+        district_id=election_data.get("district_id"),
+        updated_at=election_data["updated_at"],
+    )
+
+
+def _build_journal_item(journal_data: dict, account_codes_map: dict[str, str]) -> dict:
+    ledger = journal_data.get("public_ledgers") or {}
+    if ledger.get("ledger_type") == "election_fund":
+        item = build_election_funds_data_item(journal_data, account_codes_map)
+    else:
+        item = build_political_funds_data_item(journal_data, account_codes_map)
+    item["ledger_id"] = journal_data["ledger_id"]
+    item["synced_at"] = journal_data["synced_at"]
+    return item
+
+
+def build_changes_response(
+    supabase: Client,
+    since: str | None,
+    limit: int = CHANGE_FEED_DEFAULT_LIMIT,
+) -> schemas.ChangesResponse:
+    """カーソル以降の変更を取得して変更フィードのレスポンスを組み立てる
+
+    台帳・選挙・仕訳のそれぞれについて最大 limit 件を返す。いずれかに
+    続きがある場合は has_more を True とし、next_cursor を指定して再度
+    取得する。変更の無いリソースの取得位置は据え置く。
+
+    Args:
+        supabase: Supabaseクライアント
+        since: 前回レスポンスの next_cursor（None の場合は先頭から）
+        limit: リソースごとの最大件数
+
+    Returns:
+        schemas.ChangesResponse: 変更フィード
+
+    Raises:
+        HTTPException: カーソルが不正な場合（400）
+    """
+    positions = decode_cursor(since)
+    settled_before = (
+        datetime.now(timezone.utc) - timedelta(seconds=CHANGE_FEED_SETTLE_SECONDS)
+    ).isoformat()
+
+    rows_by_resource: dict[str, list[dict]] = {}
+    has_more = False
+    for resource, (_, column) in _RESOURCES.items():
+        rows = fetch_changed_rows(
+            supabase, resource, positions.get(resource), settled_before, limit
+        )
+        if len(rows) > limit:
+            has_more = True
+            rows = rows[:limit]
+        if rows:
+            positions[resource] = (rows[-1][column], rows[-1]["id"])
+        rows_by_resource[resource] = rows
+
+    journals = rows_by_resource["journals"]
+    account_codes_map = get_account_code_names(supabase) if journals else {}
+
+    return schemas.ChangesResponse.model_construct(
+        api_version="v1",
+        ledgers=[_build_ledger_item(row) for row in rows_by_resource["ledgers"]],
+        elections=[_build_election_item(row) for row in rows_by_resource["elections"]],
+        journals=[_build_journal_item(row, account_codes_map) for row in journals],
+        next_cursor=encode_cursor(positions),
+        has_more=has_more,
+    )
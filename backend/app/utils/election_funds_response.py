@@ -3,20 +3,22 @@
 public_ledgers と public_journals から ElectionFundsResponse を生成する。
 """
 
+from collections.abc import Iterator
 from datetime import datetime
 from uuid import UUID
 
 from fastapi import HTTPException, status
-from supabase import Client
 
 from app import schemas
-from app.models.public_journals import PublicJournal
+from app.core.tracing import start_span
 from app.models.public_ledgers import PublicLedger
+from app.repositories.base import ReadRepository
 from app.utils.category import (
     derive_category,
     get_category_name,
     get_election_type_name,
 )
+from app.utils.json_stream import iter_json_object_with_array
 
 
 def is_positive_public_expense(amount: int | None) -> bool:
@@ -64,25 +66,17 @@ def sum_public_expense_by_ledger(journals_data: list[dict]) -> dict[str, int]:
     return totals
 
 
-def assert_election_exists(supabase: Client, election_id: UUID) -> None:
+def assert_election_exists(repository: ReadRepository, election_id: UUID) -> None:
     """選挙が存在することを確認する
 
     Args:
-        supabase: Supabaseクライアント
+        repository: 読み取りリポジトリ
         election_id: 選挙ID
 
     Raises:
         HTTPException: 選挙が見つからない場合（404）
     """
-    election_response = (
-        supabase.table("elections")
-        .select("id")
-        .eq("id", str(election_id))
-        .maybe_single()
-        .execute()
-    )
-
-    if not election_response.data:
+    if not repository.election_exists(election_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="選挙情報が見つかりません",
@@ -90,7 +84,7 @@ def assert_election_exists(supabase: Client, election_id: UUID) -> None:
 
 
 def fetch_election_ledger_or_raise(
-    supabase: Client,
+    repository: ReadRepository,
     ledger_id: UUID,
     *,
     not_found_detail: str = "台帳が見つかりません",
@@ -99,7 +93,7 @@ def fetch_election_ledger_or_raise(
     """台帳を取得し、選挙台帳であることを確認する
 
     Args:
-        supabase: Supabaseクライアント
+        repository: 読み取りリポジトリ
         ledger_id: 台帳ID
         not_found_detail: 台帳不存在時のエラーメッセージ
         non_election_detail: 非選挙台帳時のエラーメッセージ
@@ -110,27 +104,22 @@ def fetch_election_ledger_or_raise(
     Raises:
         HTTPException: 台帳が存在しない（404）、または選挙台帳でない（400）
     """
-    ledger_response = (
-        supabase.table("public_ledgers")
-        .select("*")
-        .eq("id", str(ledger_id))
-        .maybe_single()
-        .execute()
-    )
+    with start_span("fetch_ledger", {"ledger_id": str(ledger_id)}):
+        ledger_data = repository.get_ledger(ledger_id)
 
-    if not ledger_response.data:
+    if not ledger_data:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=not_found_detail,
         )
 
-    if ledger_response.data.get("ledger_type") != "election_fund":
+    if ledger_data.get("ledger_type") != "election_fund":
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=non_election_detail,
         )
 
-    return PublicLedger(**ledger_response.data)
+    return PublicLedger(**ledger_data)
 
 
 def derive_type_from_classification(classification: str | None) -> str:
@@ -149,46 +138,75 @@ def derive_type_from_classification(classification: str | None) -> str:
     return "選挙運動"
 
 
-def build_election_funds_response_for_ledger(
-    supabase: Client,
-    ledger_id: UUID,
+def build_election_funds_data_item(
+    journal_data: dict,
+    account_codes_map: dict[str, str],
+) -> dict:
+    """public_journals の行を選挙資金データの1件（出力形式の辞書）に変換する
+
+    DBから取得した行は型が保証されているため、PublicJournal や
+    ElectionFundsDataItem のモデル生成・検証を行わず、1パスで
+    レスポンスのJSON形式（schemas.ElectionFundsDataItem のエイリアス形式）の
+    辞書を組み立てる。
+
+    Args:
+        journal_data: public_journals の行
+        account_codes_map: account_code をキーとした勘定科目名
+
+    Returns:
+        dict: 選挙資金データの1件（キーは "id", "date", "amount" ...）
+    """
+    account_code = journal_data.get("account_code")
+    category = derive_category(account_code)
+
+    if account_code and account_code in account_codes_map:
+        category_name = account_codes_map[account_code]
+    else:
+        category_name = get_category_name(category)
+
+    return {
+        "id": journal_data["id"],
+        "date": journal_data.get("date"),
+        "amount": journal_data["amount"],
+        "category": category,
+        "category_name": category_name,
+        "type": derive_type_from_classification(journal_data.get("classification")),
+        "purpose": journal_data.get("description"),
+        "non_monetary_basis": journal_data.get("non_monetary_basis"),
+        "note": journal_data.get("note"),
+        "public_expense_amount": normalize_public_expense_amount(
+            journal_data.get("public_expense_amount")
+        ),
+    }
+
+
+def build_election_funds_meta(
+    repository: ReadRepository,
     ledger: PublicLedger,
-) -> schemas.ElectionFundsResponse:
-    """取得済みの選挙台帳から選挙資金レスポンスを組み立てる
+    public_expense_total: int,
+) -> schemas.ElectionFundsMeta:
+    """選挙台帳のメタ情報（政治家・選挙・サマリー）を組み立てる
 
     Args:
-        supabase: Supabaseクライアント
-        ledger_id: 台帳ID（public_ledgers.id）
+        repository: 読み取りリポジトリ
         ledger: 選挙台帳（politician_election_id が設定済みであること）
+        public_expense_total: 公費負担合計
 
     Returns:
-        schemas.ElectionFundsResponse: 選挙資金データ
+        schemas.ElectionFundsMeta: メタ情報
 
     Raises:
         HTTPException: 関連データが見つからない場合（404）
     """
     # 中間テーブル経由で政治家・選挙情報を取得
-    pol_elec_response = (
-        supabase.table("politician_elections")
-        .select(
-            """
-            id,
-            politicians:politician_id(id, name, name_kana),
-            elections:election_id(id, name, type, election_date, district_id)
-            """
-        )
-        .eq("id", str(ledger.politician_election_id))
-        .maybe_single()
-        .execute()
-    )
+    pol_elec_data = repository.get_politician_election(ledger.politician_election_id)
 
-    if not pol_elec_response.data:
+    if not pol_elec_data:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="政治家・選挙情報が見つかりません",
         )
 
-    pol_elec_data = pol_elec_response.data
     politician_data = pol_elec_data.get("politicians")
     election_data = pol_elec_data.get("elections")
 
@@ -198,7 +216,9 @@ def build_election_funds_response_for_ledger(
             detail="政治家情報が見つかりません",
         )
 
-    politician = schemas.PoliticianInfo(**politician_data)
+    # schemas.PoliticianInfo は political_funds 側の同名クラスに解決されるため、
+    # ElectionFundsMeta が参照する election_funds 側のクラスを明示する
+    politician = schemas.election_funds.PoliticianInfo(**politician_data)
 
     if not election_data:
         raise HTTPException(
@@ -206,33 +226,19 @@ def build_election_funds_response_for_ledger(
             detail="選挙情報が見つかりません",
         )
 
-    district_response = (
-        supabase.table("districts")
-        .select("id, name")
-        .eq("id", str(election_data["district_id"]))
-        .maybe_single()
-        .execute()
-    )
+    district_data = repository.get_district(election_data["district_id"])
 
-    if not district_response.data:
+    if not district_data:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="選挙区情報が見つかりません",
         )
 
-    district_data = district_response.data
-
     election_type_name = get_election_type_name(election_data["type"])
-    election_type_response = (
-        supabase.table("election_types")
-        .select("code, name")
-        .eq("code", election_data["type"])
-        .maybe_single()
-        .execute()
-    )
+    election_type_data = repository.get_election_type(election_data["type"])
 
-    if election_type_response.data:
-        election_type_name = election_type_response.data.get("name", election_type_name)
+    if election_type_data:
+        election_type_name = election_type_data.get("name", election_type_name)
 
     election = schemas.ElectionInfo(
         id=UUID(election_data["id"]),
@@ -244,67 +250,6 @@ def build_election_funds_response_for_ledger(
         election_date=election_data["election_date"],
     )
 
-    journals_response = (
-        supabase.table("public_journals")
-        .select("*")
-        .eq("ledger_id", str(ledger_id))
-        .order("date", desc=False)
-        .execute()
-    )
-
-    journals_data = journals_response.data or []
-
-    account_codes_list = [
-        journal_data.get("account_code")
-        for journal_data in journals_data
-        if journal_data.get("account_code")
-    ]
-    account_codes_map: dict[str, str] = {}
-    if account_codes_list:
-        account_codes_response = (
-            supabase.table("account_codes")
-            .select("code, name")
-            .in_("code", account_codes_list)
-            .execute()
-        )
-        if account_codes_response.data:
-            account_codes_map = {
-                item["code"]: item["name"] for item in account_codes_response.data
-            }
-
-    data_items: list[schemas.ElectionFundsDataItem] = []
-    public_expense_totals = sum_public_expense_by_ledger(journals_data)
-    public_expense_total = public_expense_totals.get(str(ledger_id), 0)
-
-    for journal_data in journals_data:
-        journal = PublicJournal(**journal_data)
-
-        category = derive_category(journal.account_code)
-        category_name = get_category_name(category)
-
-        if journal.account_code and journal.account_code in account_codes_map:
-            category_name = account_codes_map[journal.account_code]
-
-        journal_type = derive_type_from_classification(journal.classification)
-        public_expense_amount = normalize_public_expense_amount(
-            journal.public_expense_amount
-        )
-
-        data_items.append(
-            schemas.ElectionFundsDataItem(
-                id=journal.id,
-                date=journal.date,
-                amount=journal.amount,
-                category=category,
-                category_name=category_name,
-                type=journal_type,
-                purpose=journal.description,
-                non_monetary_basis=journal.non_monetary_basis,
-                note=journal.note,
-                public_expense_amount=public_expense_amount,
-            )
-        )
-
     summary = schemas.ElectionFundsSummary(
         total_income=ledger.total_income,
         total_expense=ledger.total_expense,
@@ -313,7 +258,7 @@ def build_election_funds_response_for_ledger(
         journal_count=ledger.journal_count,
     )
 
-    meta = schemas.ElectionFundsMeta(
+    return schemas.ElectionFundsMeta(
         api_version="v1",
         politician=politician,
         election=election,
@@ -321,11 +266,91 @@ def build_election_funds_response_for_ledger(
         generated_at=datetime.now(),
     )
 
-    return schemas.ElectionFundsResponse(meta=meta, data=data_items)
+
+def build_election_funds_response_for_ledger(
+    repository: ReadRepository,
+    ledger_id: UUID,
+    ledger: PublicLedger,
+) -> schemas.ElectionFundsResponse:
+    """取得済みの選挙台帳から選挙資金レスポンスを組み立てる
+
+    Args:
+        repository: 読み取りリポジトリ
+        ledger_id: 台帳ID（public_ledgers.id）
+        ledger: 選挙台帳（politician_election_id が設定済みであること）
+
+    Returns:
+        schemas.ElectionFundsResponse: 選挙資金データ
+
+    Raises:
+        HTTPException: 関連データが見つからない場合（404）
+    """
+    attributes = {"ledger_id": str(ledger_id), "journal_count": ledger.journal_count}
+    with start_span("fetch_journals", attributes):
+        journals_data = list(repository.iter_ledger_journals(ledger_id))
+        account_codes_map = repository.get_account_code_names()
+
+    public_expense_totals = sum_public_expense_by_ledger(journals_data)
+    with start_span("join_metadata", attributes):
+        meta = build_election_funds_meta(
+            repository,
+            ledger,
+            public_expense_totals.get(str(ledger_id), 0),
+        )
+
+    with start_span("transform", attributes):
+        data_items = [
+            build_election_funds_data_item(journal_data, account_codes_map)
+            for journal_data in journals_data
+        ]
+
+    # data_items は出力形式の辞書のため、外枠も検証せずに組み立てる
+    return schemas.ElectionFundsResponse.model_construct(meta=meta, data=data_items)
+
+
+def stream_election_funds_response_for_ledger(
+    repository: ReadRepository,
+    ledger_id: UUID,
+    ledger: PublicLedger,
+) -> Iterator[bytes]:
+    """取得済みの選挙台帳から選挙資金レスポンスをJSONストリームとして返す
+
+    meta（404判定を含む）はこの関数の呼び出し時に確定させ、仕訳は
+    ページ単位で取得しながら逐次出力する。公費負担合計は仕訳本体より
+    先に集計クエリで求める。出力は build_election_funds_response_for_ledger
+    のJSONと同一になる。
+
+    Args:
+        repository: 読み取りリポジトリ
+        ledger_id: 台帳ID（public_ledgers.id）
+        ledger: 選挙台帳（politician_election_id が設定済みであること）
+
+    Returns:
+        Iterator[bytes]: JSONの断片
+
+    Raises:
+        HTTPException: 関連データが見つからない場合（404）
+    """
+    public_expense_totals = repository.public_expense_totals([str(ledger_id)])
+    meta = build_election_funds_meta(
+        repository,
+        ledger,
+        public_expense_totals.get(str(ledger_id), 0),
+    )
+    account_codes_map = repository.get_account_code_names()
+
+    return iter_json_object_with_array(
+        {"meta": meta},
+        "data",
+        (
+            build_election_funds_data_item(journal_data, account_codes_map)
+            for journal_data in repository.iter_ledger_journals(ledger_id)
+        ),
+    )
 
 
 def fetch_election_ledger_for_response(
-    supabase: Client,
+    repository: ReadRepository,
     ledger_id: UUID,
 ) -> PublicLedger:
     """選挙資金レスポンス用に台帳を取得する
@@ -333,7 +358,7 @@ def fetch_election_ledger_for_response(
     存在しない台帳・非選挙台帳はいずれも404として扱う。
 
     Args:
-        supabase: Supabaseクライアント
+        repository: 読み取りリポジトリ
         ledger_id: 台帳ID
 
     Returns:
@@ -342,32 +367,26 @@ def fetch_election_ledger_for_response(
     Raises:
         HTTPException: 台帳が見つからない、または選挙台帳でない場合（404）
     """
-    ledger_response = (
-        supabase.table("public_ledgers")
-        .select("*")
-        .eq("id", str(ledger_id))
-        .eq("ledger_type", "election_fund")
-        .maybe_single()
-        .execute()
-    )
+    with start_span("fetch_ledger", {"ledger_id": str(ledger_id)}):
+        ledger_data = repository.get_ledger(ledger_id)
 
-    if not ledger_response.data:
+    if not ledger_data or ledger_data.get("ledger_type") != "election_fund":
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="選挙資金の台帳が見つかりません",
         )
 
-    return PublicLedger(**ledger_response.data)
+    return PublicLedger(**ledger_data)
 
 
 def build_election_funds_response(
-    supabase: Client,
+    repository: ReadRepository,
     ledger_id: UUID,
 ) -> schemas.ElectionFundsResponse:
     """台帳IDから選挙資金レスポンスを組み立てる
 
     Args:
-        supabase: Supabaseクライアント
+        repository: 読み取りリポジトリ
         ledger_id: 台帳ID（public_ledgers.id）
 
     Returns:
@@ -376,5 +395,25 @@ def build_election_funds_response(
     Raises:
         HTTPException: 台帳・関連データが見つからない場合（404）
     """
-    ledger = fetch_election_ledger_for_response(supabase, ledger_id)
-    return build_election_funds_response_for_ledger(supabase, ledger_id, ledger)
+    ledger = fetch_election_ledger_for_response(repository, ledger_id)
+    return build_election_funds_response_for_ledger(repository, ledger_id, ledger)
+
+
+def stream_election_funds_response(
+    repository: ReadRepository,
+    ledger_id: UUID,
+) -> Iterator[bytes]:
+    """台帳IDから選挙資金レスポンスをJSONストリームとして返す
+
+    Args:
+        repository: 読み取りリポジトリ
+        ledger_id: 台帳ID（public_ledgers.id）
+
+    Returns:
+        Iterator[bytes]: JSONの断片
+
+    Raises:
+        HTTPException: 台帳・関連データが見つからない場合（404）
+    """
+    ledger = fetch_election_ledger_for_response(repository, ledger_id)
+    return stream_election_funds_response_for_ledger(repository, ledger_id, ledger)
@@ -0,0 +1,329 @@
+"""仕訳一括エクスポートユーティリティ
+
+条件に合う台帳の仕訳を、台帳情報・マスタ名称と結合した1行1仕訳の
+フラットな形式で逐次出力する（NDJSON / CSV）。
+"""
+
+import csv
+import io
+from collections.abc import Iterable, Iterator
+from typing import Literal
+from uuid import UUID
+
+from supabase import Client
+
+from app.database.pagination import iter_rows
+from app.utils.category import (
+    derive_category,
+    get_category_name,
+    get_election_type_name,
+)
+from app.utils.election_funds_response import (
+    derive_type_from_classification,
+    normalize_public_expense_amount,
+)
+from app.utils.json_stream import encode_json
+from app.utils.master_data import get_account_code_names, get_election_type_names
+
+ExportFormat = Literal["ndjson", "csv"]
+LedgerType = Literal["political_fund", "election_fund"]
+
+# 出力列（CSV のヘッダー、NDJSON のキー順）
+EXPORT_COLUMNS: tuple[str, ...] = (
+    "journal_id",
+    "ledger_id",
+    "ledger_type",
+    "fiscal_year",
+    "election_id",
+    "election_type",
+    "election_type_name",
+    "politician_id",
+    "organization_id",
+    "date",
+    "amount",
+    "account_code",
+    "category",
+    "category_name",
+    "type",
+    "purpose",
+    "non_monetary_basis",
+    "note",
+    "public_expense_amount",
+)
+
+# 仕訳の IN クエリ1回あたりの台帳数（URL 長の上限に収めるため）
+LEDGER_ID_CHUNK_SIZE = 100
+
+# 1断片にまとめる行数
+EXPORT_BATCH_SIZE = 500
+
+
+def fetch_export_ledgers(
+    supabase: Client,
+    election_id: UUID | None = None,
+    fiscal_year: int | None = None,
+    ledger_type: LedgerType | None = None,
+) -> list[dict]:
+    """エクスポート対象の台帳を取得する
+
+    選挙ID指定時は中間テーブルを inner join で埋め込んで絞り込むため、
+    選挙台帳のみが対象になる。
+
+    Args:
+        supabase: Supabaseクライアント
+        election_id: 選挙ID
+        fiscal_year: 会計年度
+        ledger_type: 台帳種別
+
+    Returns:
+        list[dict]: public_ledgers の行（台帳ID順、中間テーブルのネスト含む）
+    """
+    election_join = "!inner" if election_id is not None else ""
+    columns = f"""
+        id,
+        ledger_type,
+        fiscal_year,
+        politician_elections:politician_election_id{election_join}(
+            election_id,
+            politician_id,
+            elections:election_id(type)
+        ),
+        politician_organizations:politician_organization_id(
+            politician_id,
+            organization_id
+        )
+        """
+
+    def build_query():
+        query = supabase.table("public_ledgers").select(columns)
+        if election_id is not None:
+            query = query.eq("politician_elections.election_id", str(election_id))
+        if fiscal_year is not None:
+            query = query.eq("fiscal_year", fiscal_year)
+        if ledger_type is not None:
+            query = query.eq("ledger_type", ledger_type)
+        return query.order("id")
+
+    return list(iter_rows(build_query))
+
+
+def _build_ledger_columns(
+    ledger_data: dict,
+    election_type_names: dict[str, str],
+) -> dict:
+    # 台帳単位で共通の列を先に組み立て、仕訳ごとの処理を減らす
+    pol_elec = ledger_data.get("politician_elections") or {}
+    pol_org = ledger_data.get("politician_organizations") or {}
+    election_type = (pol_elec.get("elections") or {}).get("type")
+
+    election_type_name = None
+    if election_type:
+        election_type_name = election_type_names.get(
+            election_type, get_election_type_name(election_type)
+        )
+
+    return {
+        "ledger_id": ledger_data["id"],
+        "ledger_type": ledger_data.get("ledger_type"),
+        "fiscal_year": ledger_data.get("fiscal_year"),
+        "election_id": pol_elec.get("election_id"),
+        "election_type": election_type,
+        "election_type_name": election_type_name,
+        "politician_id": pol_elec.get("politician_id") or pol_org.get("politician_id"),
+        "organization_id": pol_org.get("organization_id"),
+    }
+
+
+def build_export_row(
+    journal_data: dict,
+    ledger_columns: dict,
+    account_codes_map: dict[str, str],
+) -> dict:
+    """public_journals の行をエクスポートの1行に変換する
+
+    Args:
+        journal_data: public_journals の行
+        ledger_columns: 当該台帳の共通列
+        account_codes_map: account_code をキーとした勘定科目名
+
+    Returns:
+        dict: EXPORT_COLUMNS の順に並んだ1行分のデータ
+    """
+    account_code = journal_data.get("account_code")
+    category = derive_category(account_code)
+    category_name = account_codes_map.get(account_code) or get_category_name(category)
+
+    if ledger_columns["ledger_type"] == "election_fund":
+        journal_type = derive_type_from_classification(
+            journal_data.get("classification")
+        )
+    else:
+        journal_type = "政治活動"
+
+    return {
+        "journal_id": journal_data["id"],
+        "ledger_id": ledger_columns["ledger_id"],
+        "ledger_type": ledger_columns["ledger_type"],
+        "fiscal_year": ledger_columns["fiscal_year"],
+        "election_id": ledger_columns["election_id"],
+        "election_type": ledger_columns["election_type"],
+        "election_type_name": ledger_columns["election_type_name"],
+        "politician_id": ledger_columns["politician_id"],
+        "organization_id": ledger_columns["organization_id"],
+        "date": journal_data.get("date"),
+        "amount": journal_data.get("amount"),
+        "account_code": account_code,
+        "category": category,
+        "category_name": category_name,
+        "type": journal_type,
+        "purpose": journal_data.get("description"),
+        "non_monetary_basis": journal_data.get("non_monetary_basis"),
+        "note": journal_data.get("note"),
+        "public_expense_amount": normalize_public_expense_amount(
+            journal_data.get("public_expense_amount")
+        ),
+    }
+
+
+def iter_export_rows(supabase: Client, ledgers: list[dict]) -> Iterator[dict]:
+    """台帳群の仕訳をエクスポート形式の行として順に生成する
+
+    仕訳は台帳IDを LEDGER_ID_CHUNK_SIZE 件ずつ IN 指定し、台帳ID・日付・ID
+    順のページ取得で読む。マスタ名称はキャッシュから解決する。
+
+    Args:
+        supabase: Supabaseクライアント
+        ledgers: fetch_export_ledgers で取得した台帳
+
+    Yields:
+        dict: エクスポートの1行
+    """
+    if not ledgers:
+        return
+
+    account_codes_map = get_account_code_names(supabase)
+    election_type_names = get_election_type_names(supabase)
+    ledger_columns_by_id = {
+        ledger["id"]: _build_ledger_columns(ledger, election_type_names)
+        for ledger in ledgers
+    }
+    ledger_ids = list(ledger_columns_by_id)
+
+    for start in range(0, len(ledger_ids), LEDGER_ID_CHUNK_SIZE):
+        chunk = ledger_ids[start : start + LEDGER_ID_CHUNK_SIZE]
+        rows = iter_rows(
+            lambda chunk=chunk: supabase.table("public_journals")
+            .select("*")
+            .in_("ledger_id", chunk)
+            .order("ledger_id")
+            .order("date")
+            .order("id")
+        )
+        for journal_data in rows:
+            ledger_columns = ledger_columns_by_id.get(journal_data.get("ledger_id"))
+            if ledger_columns is None:
+                continue
+            yield build_export_row(journal_data, ledger_columns, account_codes_map)
+
+
+def _batched(rows: Iterable[dict], batch_size: int) -> Iterator[list[dict]]:
+    batch: list[dict] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def iter_ndjson(
+    rows: Iterable[dict],
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> Iterator[bytes]:
+    """行を NDJSON（1行1オブジェクト）として出力する
+
+    Args:
+        rows: エクスポートの行
+        batch_size: 1断片にまとめる行数
+
+    Yields:
+        bytes: NDJSON の断片（各行は改行で終わる）
+    """
+    for batch in _batched(rows, batch_size):
+        yield b"".join(encode_json(row) + b"\n" for row in batch)
+
+
+def iter_csv(
+    rows: Iterable[dict],
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> Iterator[bytes]:
+    """行をヘッダー付きの CSV（UTF-8）として出力する
+
+    None は空欄として出力する。
+
+    Args:
+        rows: エクスポートの行
+        batch_size: 1断片にまとめる行数
+
+    Yields:
+        bytes: CSV の断片（先頭はヘッダー行）
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(EXPORT_COLUMNS)
+    yield buffer.getvalue().encode("utf-8")
+
+    for batch in _batched(rows, batch_size):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([row[column] for column in EXPORT_COLUMNS] for row in batch)
+        yield buffer.getvalue().encode("utf-8")
+
+
+def iter_filtered_export_rows(
+    supabase: Client,
+    election_id: UUID | None = None,
+    fiscal_year: int | None = None,
+    ledger_type: LedgerType | None = None,
+) -> Iterator[dict]:
+    """条件に合う仕訳をエクスポート形式の行として順に返す
+
+    対象台帳の取得はこの関数の呼び出し時に行い、仕訳は行を取り出しながら読む。
+
+    Args:
+        supabase: Supabaseクライアント
+        election_id: 選挙ID
+        fiscal_year: 会計年度
+        ledger_type: 台帳種別
+
+    Returns:
+        Iterator[dict]: エクスポートの行
+    """
+    ledgers = fetch_export_ledgers(supabase, election_id, fiscal_year, ledger_type)
+    return iter_export_rows(supabase, ledgers)
+
+
+def stream_journal_export(
+    supabase: Client,
+    export_format: ExportFormat,
+    election_id: UUID | None = None,
+    fiscal_year: int | None = None,
+    ledger_type: LedgerType | None = None,
+) -> Iterator[bytes]:
+    """条件に合う仕訳をエクスポート形式で逐次出力する
+
+    Args:
+        supabase: Supabaseクライアント
+        export_format: 出力形式（ndjson / csv）
+        election_id: 選挙ID
+        fiscal_year: 会計年度
+        ledger_type: 台帳種別
+
+    Returns:
+        Iterator[bytes]: 出力の断片
+    """
+    rows = iter_filtered_export_rows(supabase, election_id, fiscal_year, ledger_type)
+    if export_format == "csv":
+        return iter_csv(rows)
+    return iter_ndjson(rows)
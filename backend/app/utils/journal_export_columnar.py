@@ -0,0 +1,181 @@
+"""仕訳一括エクスポートの列指向出力（Parquet / Arrow IPC）
+
+journal_export のエクスポート行をレコードバッチ単位で型付きの列に変換し、
+Parquet または Arrow IPC ストリームとして逐次出力する。
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+from uuid import UUID
+
+import pyarrow as pa
+import pyarrow.ipc
+import pyarrow.parquet as pq
+
+# 1レコードバッチ（Parquet の行グループ）あたりの行数
+RECORD_BATCH_SIZE = 10_000
+
+_DICTIONARY_STRING = pa.dictionary(pa.int32(), pa.string())
+
+# journal_export.EXPORT_COLUMNS と同じ列順。繰り返しの多いコード・名称列は
+# 辞書エンコードする
+EXPORT_ARROW_SCHEMA = pa.schema(
+    [
+        pa.field("journal_id", pa.uuid(), nullable=False),
+        pa.field("ledger_id", pa.uuid(), nullable=False),
+        pa.field("ledger_type", _DICTIONARY_STRING),
+        pa.field("fiscal_year", pa.int32()),
+        pa.field("election_id", pa.uuid()),
+        pa.field("election_type", _DICTIONARY_STRING),
+        pa.field("election_type_name", _DICTIONARY_STRING),
+        pa.field("politician_id", pa.uuid()),
+        pa.field("organization_id", pa.uuid()),
+        pa.field("date", pa.date32()),
+        pa.field("amount", pa.int64()),
+        pa.field("account_code", _DICTIONARY_STRING),
+        pa.field("category", _DICTIONARY_STRING),
+        pa.field("category_name", _DICTIONARY_STRING),
+        pa.field("type", _DICTIONARY_STRING),
+        pa.field("purpose", pa.string()),
+        pa.field("non_monetary_basis", pa.string()),
+        pa.field("note", pa.string()),
+        pa.field("public_expense_amount", pa.int64()),
+    ]
+)
+
+
+def _to_arrow_array(values: list, data_type: pa.DataType) -> pa.Array:
+    if data_type == pa.uuid():
+        return pa.array(
+            [UUID(value).bytes if value else None for value in values],
+            type=data_type,
+        )
+    if data_type == pa.date32():
+        # 日付文字列（YYYY-MM-DD）は列単位でまとめて変換する
+        return pa.array(values, type=pa.string()).cast(data_type)
+    return pa.array(values, type=data_type)
+
+
+def build_record_batch(rows: list[dict]) -> pa.RecordBatch:
+    """エクスポート行を型付きのレコードバッチに変換する
+
+    Args:
+        rows: journal_export.build_export_row で組み立てた行
+
+    Returns:
+        pa.RecordBatch: EXPORT_ARROW_SCHEMA のレコードバッチ
+    """
+    return pa.RecordBatch.from_arrays(
+        [
+            _to_arrow_array([row[field.name] for row in rows], field.type)
+            for field in EXPORT_ARROW_SCHEMA
+        ],
+        schema=EXPORT_ARROW_SCHEMA,
+    )
+
+
+def iter_record_batches(
+    rows: Iterable[dict],
+    batch_size: int = RECORD_BATCH_SIZE,
+) -> Iterator[pa.RecordBatch]:
+    """エクスポート行を batch_size 行ごとのレコードバッチにまとめる
+
+    Args:
+        rows: エクスポートの行
+        batch_size: 1レコードバッチあたりの行数
+
+    Yields:
+        pa.RecordBatch: レコードバッチ
+    """
+    batch: list[dict] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield build_record_batch(batch)
+            batch = []
+    if batch:
+        yield build_record_batch(batch)
+
+
+class _ChunkSink:
+    """書き込まれたバイト列を取り出し可能な追記専用の出力先
+
+    Parquet の書き込みは出力位置（tell）を列チャンクのオフセットに使うため、
+    取り出し済みのバイト数も含めた累計を位置として返す。
+    """
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def writable(self) -> bool:
+        return True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _iter_written(
+    rows: Iterable[dict],
+    open_writer: Callable[[pa.NativeFile], object],
+) -> Iterator[bytes]:
+    sink = _ChunkSink()
+    writer = open_writer(pa.PythonFile(sink, mode="w"))
+    try:
+        for record_batch in iter_record_batches(rows):
+            writer.write_batch(record_batch)
+            data = sink.drain()
+            if data:
+                yield data
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+def iter_parquet(rows: Iterable[dict]) -> Iterator[bytes]:
+    """エクスポート行を Parquet として逐次出力する
+
+    レコードバッチ1つを1行グループとして書き出し、フッターは最後に出力する。
+
+    Args:
+        rows: エクスポートの行
+
+    Returns:
+        Iterator[bytes]: Parquet ファイルの断片
+    """
+    return _iter_written(
+        rows,
+        lambda sink: pq.ParquetWriter(sink, EXPORT_ARROW_SCHEMA, compression="zstd"),
+    )
+
+
+def iter_arrow_stream(rows: Iterable[dict]) -> Iterator[bytes]:
+    """エクスポート行を Arrow IPC ストリーム形式で逐次出力する
+
+    Args:
+        rows: エクスポートの行
+
+    Returns:
+        Iterator[bytes]: Arrow IPC ストリームの断片
+    """
+    return _iter_written(
+        rows,
+        lambda sink: pa.ipc.new_stream(sink, EXPORT_ARROW_SCHEMA),
+    )
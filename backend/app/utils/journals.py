@@ -0,0 +1,60 @@
+"""仕訳データ取得ユーティリティ
+
+台帳単位の public_journals の読み出しと、仕訳のカテゴリ名解決に使う
+勘定科目マスタの取得を提供する。PostgREST の読み取りリポジトリ
+（app.repositories.postgrest）とマスタデータのキャッシュで使う。
+"""
+
+from collections.abc import Iterator
+from uuid import UUID
+
+from supabase import Client
+
+from app.database.pagination import DEFAULT_PAGE_SIZE, iter_rows
+
+
+def fetch_account_code_names(supabase: Client) -> dict[str, str]:
+    """勘定科目マスタ全件からコード→名称の対応表を取得する
+
+    仕訳を先読みせずにカテゴリ名を解決できるよう、マスタ全件を1クエリで読む。
+
+    Args:
+        supabase: Supabaseクライアント
+
+    Returns:
+        dict[str, str]: account_code をキーとした勘定科目名
+    """
+    account_codes_response = (
+        supabase.table("account_codes").select("code, name").execute()
+    )
+    if not account_codes_response.data:
+        return {}
+    return {item["code"]: item["name"] for item in account_codes_response.data}
+
+
+def iter_ledger_journal_rows(
+    supabase: Client,
+    ledger_id: UUID,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> Iterator[dict]:
+    """台帳の仕訳を日付順にページ分割で取得する
+
+    同日の仕訳の並びをページ間で安定させるため、id を第2キーにする。
+
+    Args:
+        supabase: Supabaseクライアント
+        ledger_id: 台帳ID
+        page_size: 1ページあたりの取得件数
+
+    Returns:
+        Iterator[dict]: public_journals の行
+    """
+    return iter_rows(
+        lambda: supabase.table("public_journals")
+        .select("*")
+        .eq("ledger_id", str(ledger_id))
+        .order("date", desc=False)
+        .order("id"),
+        page_size,
+    )
+
@@ -0,0 +1,123 @@
+"""JSONストリーミング出力ユーティリティ
+
+レスポンス全体をメモリ上に構築せず、オブジェクトの外枠と配列要素を
+逐次バイト列として出力する。出力はバッファリング時のJSONと同一になる
+（キー順・エイリアス・区切り文字を揃えている）。
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+import orjson
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+# UTC は pydantic と同じく "Z" で出力し、UUID キー等も文字列化する
+_ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def unwrap_models(value: Any) -> Any:
+    """Pydanticモデルをフィールド単位の辞書に展開する
+
+    仕訳データは検証を省くため出力形式の辞書のままモデルに格納される
+    （model_construct）。モデルのまま直列化すると型不一致の警告と
+    フォールバック処理が発生するため、モデル部分だけをエイリアス付きの
+    辞書に展開し、辞書はそのまま渡す。
+
+    Args:
+        value: 直列化する値
+
+    Returns:
+        Any: モデルを辞書に置き換えた値
+    """
+    if isinstance(value, BaseModel):
+        return {
+            field.alias or name: unwrap_models(getattr(value, name))
+            for name, field in value.model_fields.items()
+        }
+    if isinstance(value, list) and value and isinstance(value[0], (BaseModel, list)):
+        return [unwrap_models(item) for item in value]
+    return value
+
+
+def encode_json(value: Any) -> bytes:
+    """値をレスポンスと同じ形式のJSONバイト列に変換する
+
+    Pydanticモデル・UUID・日付を含む値を orjson でエイリアス付きで
+    直列化する。orjson が扱えない型（Decimal 等）は pydantic の
+    JSON互換変換にフォールバックする。
+
+    Args:
+        value: 直列化する値
+
+    Returns:
+        bytes: 区切り文字に空白を含まないJSON
+    """
+    return orjson.dumps(
+        unwrap_models(value),
+        default=to_jsonable_python,
+        option=_ORJSON_OPTIONS,
+    )
+
+
+def _encode_members(members: dict[str, Any]) -> bytes:
+    return b",".join(
+        encode_json(key) + b":" + encode_json(value) for key, value in members.items()
+    )
+
+
+def iter_json_object_with_array(
+    head: dict[str, Any],
+    array_key: str,
+    items: Iterable[Any],
+    tail: Callable[[int], dict[str, Any]] | None = None,
+    batch_size: int = 500,
+) -> Iterator[bytes]:
+    """配列フィールドを逐次出力するJSONオブジェクトを生成する
+
+    出力されるオブジェクトは head のフィールド、array_key の配列、
+    tail のフィールドの順に並ぶ。tail は配列出力後に件数を受け取って
+    呼び出されるため、total_count 等の集計値を末尾に置ける。
+
+    配列要素は batch_size 件ごとにまとめて直列化し、1つの断片として出力する
+    （ASGI の送信回数と直列化呼び出しを抑えるため）。
+
+    Args:
+        head: 配列より前に出力するフィールド
+        array_key: 配列フィールドのキー
+        items: 配列要素（Pydanticモデル・出力形式の辞書等）
+        tail: 配列件数を受け取り、配列より後に出力するフィールドを返す関数
+        batch_size: 1断片にまとめる配列要素の件数
+
+    Yields:
+        bytes: JSONの断片
+    """
+    prefix = b"{"
+    if head:
+        prefix += _encode_members(head) + b","
+    yield prefix + encode_json(array_key) + b":["
+
+    count = 0
+    batch: list[Any] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield _encode_batch(batch, count)
+            count += len(batch)
+            batch = []
+    if batch:
+        yield _encode_batch(batch, count)
+        count += len(batch)
+
+    suffix = b"]"
+    if tail is not None:
+        tail_members = tail(count)
+        if tail_members:
+            suffix += b"," + _encode_members(tail_members)
+    yield suffix + b"}"
+
+
+def _encode_batch(batch: list[Any], written: int) -> bytes:
+    # リストとして直列化し、外側の [ ] を除いて配列の途中に連結する
+    chunk = encode_json(batch)[1:-1]
+    return chunk if written == 0 else b"," + chunk
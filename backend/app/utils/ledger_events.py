@@ -0,0 +1,130 @@
+"""台帳更新イベントの発行・SSE 出力ユーティリティ
+
+同期APIで変更された台帳の最新の集計値を読み、台帳更新イベントとして
+配信する。また、購読したイベントを Server-Sent Events 形式で出力する。
+"""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Iterable
+from uuid import UUID
+
+from supabase import Client
+
+from app.core.events import Broadcaster, LedgerUpdateEvent, ledger_events
+from app.utils.json_stream import encode_json
+
+logger = logging.getLogger(__name__)
+
+# 接続を維持するためのコメント行の送信間隔（秒）
+SSE_KEEPALIVE_SECONDS = 15.0
+
+# 切断時のクライアントの再接続待ち時間（ミリ秒）
+SSE_RETRY_MILLISECONDS = 3000
+
+
+def publish_ledger_updates(
+    supabase: Client,
+    ledger_ids: Iterable[str],
+    source: str,
+    broadcaster: Broadcaster = ledger_events,
+) -> None:
+    """台帳の最新の集計値を読み、台帳更新イベントを配信する
+
+    イベントを必要とする購読者（SSE 接続、または有効な Webhook 購読が
+    ある場合のディスパッチャー）がいない場合は読み出しを行わない。
+    イベントの配信は同期処理の結果に影響させないため、失敗してもログに
+    記録するのみとする。
+
+    Args:
+        supabase: Supabaseクライアント
+        ledger_ids: 変更された台帳ID
+        source: 発生元（"ledger" / "journals"）
+        broadcaster: 配信先
+    """
+    ledger_ids = list(dict.fromkeys(ledger_ids))
+    if not ledger_ids or not broadcaster.has_subscribers:
+        return
+
+    try:
+        response = (
+            supabase.table("public_ledgers")
+            .select(
+                """
+                id, ledger_type, total_income, total_expense, journal_count,
+                politician_elections:politician_election_id(election_id)
+                """
+            )
+            .in_("id", ledger_ids)
+            .execute()
+        )
+    except Exception:
+        logger.warning("台帳更新イベントの集計値の取得に失敗しました", exc_info=True)
+        return
+
+    for ledger_data in response.data or []:
+        pol_elec = ledger_data.get("politician_elections") or {}
+        broadcaster.publish(
+            LedgerUpdateEvent(
+                ledger_id=ledger_data["id"],
+                ledger_type=ledger_data["ledger_type"],
+                election_id=pol_elec.get("election_id"),
+                total_income=ledger_data.get("total_income") or 0,
+                total_expense=ledger_data.get("total_expense") or 0,
+                journal_count=ledger_data.get("journal_count") or 0,
+                source=source,
+            )
+        )
+
+
+def format_sse(event: str, data: dict) -> bytes:
+    """Server-Sent Events の1イベント分のバイト列を組み立てる
+
+    Args:
+        event: イベント名
+        data: イベントデータ（JSON で1行に直列化する）
+
+    Returns:
+        bytes: "event: ..." と "data: ..." からなる1イベント
+    """
+    return b"event: " + event.encode() + b"\ndata: " + encode_json(data) + b"\n\n"
+
+
+async def iter_ledger_event_stream(
+    election_id: UUID | None = None,
+    broadcaster: Broadcaster = ledger_events,
+    keepalive_seconds: float = SSE_KEEPALIVE_SECONDS,
+) -> AsyncIterator[bytes]:
+    """台帳更新イベントを購読し SSE 形式で逐次出力する
+
+    イベントが無い間は keepalive_seconds ごとにコメント行を送る。
+    受信が追いつかずキューが溢れた場合は reset イベントを送って終了し、
+    クライアントに再接続と最新データの再取得を促す。
+
+    Args:
+        election_id: 指定した場合、その選挙の台帳のイベントのみ出力する
+        broadcaster: 購読元
+        keepalive_seconds: コメント行の送信間隔（秒）
+
+    Yields:
+        bytes: SSE の断片
+    """
+    election_filter = str(election_id) if election_id else None
+
+    async with broadcaster.subscribe() as subscription:
+        yield f"retry: {SSE_RETRY_MILLISECONDS}\n\n".encode()
+        while True:
+            try:
+                event = await asyncio.wait_for(
+                    subscription.get(), timeout=keepalive_seconds
+                )
+            except asyncio.TimeoutError:
+                yield b": keepalive\n\n"
+                continue
+
+            if event is None:
+                yield format_sse("reset", {"reason": "overflow"})
+                return
+            if election_filter and event.election_id != election_filter:
+                continue
+            yield format_sse("ledger_updated", event.to_dict())
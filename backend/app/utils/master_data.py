@@ -0,0 +1,81 @@
+"""マスタデータのキャッシュ
+
+勘定科目名・選挙種別名など、更新頻度の低いマスタテーブルの対応表を
+プロセス内に一定時間保持する。一括エクスポートのように多数の仕訳を
+マスタと突き合わせる処理で、リクエストごとのマスタ読み出しを省く。
+"""
+
+import threading
+import time
+from collections.abc import Callable
+
+from supabase import Client
+
+from app.utils.journals import fetch_account_code_names
+
+# マスタの更新はまれなため、反映まで数分の遅延を許容する
+MASTER_DATA_TTL_SECONDS = 300.0
+
+_lock = threading.Lock()
+_cache: dict[str, tuple[float, dict[str, str]]] = {}
+
+
+def _get_or_load(key: str, loader: Callable[[], dict[str, str]]) -> dict[str, str]:
+    now = time.monotonic()
+    with _lock:
+        entry = _cache.get(key)
+        if entry is not None and now - entry[0] < MASTER_DATA_TTL_SECONDS:
+            return entry[1]
+
+    # 読み出し中はロックを保持しない（同時に期限切れになった場合は重複して読む）
+    value = loader()
+    with _lock:
+        _cache[key] = (now, value)
+    return value
+
+
+def fetch_election_type_names(supabase: Client) -> dict[str, str]:
+    """選挙種別マスタ全件からコード→名称の対応表を取得する
+
+    Args:
+        supabase: Supabaseクライアント
+
+    Returns:
+        dict[str, str]: 選挙種別コードをキーとした選挙種別名
+    """
+    election_types_response = (
+        supabase.table("election_types").select("code, name").execute()
+    )
+    if not election_types_response.data:
+        return {}
+    return {item["code"]: item["name"] for item in election_types_response.data}
+
+
+def get_account_code_names(supabase: Client) -> dict[str, str]:
+    """勘定科目名の対応表をキャッシュ経由で取得する
+
+    Args:
+        supabase: Supabaseクライアント
+
+    Returns:
+        dict[str, str]: account_code をキーとした勘定科目名
+    """
+    return _get_or_load("account_codes", lambda: fetch_account_code_names(supabase))
+
+
+def get_election_type_names(supabase: Client) -> dict[str, str]:
+    """選挙種別名の対応表をキャッシュ経由で取得する
+
+    Args:
+        supabase: Supabaseクライアント
+
+    Returns:
+        dict[str, str]: 選挙種別コードをキーとした選挙種別名
+    """
+    return _get_or_load("election_types", lambda: fetch_election_type_names(supabase))
+
+
+def clear_master_data_cache() -> None:
+    """キャッシュ済みのマスタデータを破棄する"""
+    with _lock:
+        _cache.clear()
@@ -3,16 +3,19 @@
 公開選挙一覧・候補者一覧・台帳解決など、Polimoney向けAPIのビジネスロジック。
 """
 
+from collections.abc import Iterator
 from uuid import UUID
 
 from fastapi import HTTPException, status
-from supabase import Client
 
 from app import schemas
+from app.repositories.base import ReadRepository
 from app.utils.election_funds_response import (
     assert_election_exists,
+    build_election_funds_data_item,
     sum_public_expense_by_ledger,
 )
+from app.utils.json_stream import iter_json_object_with_array
 
 
 class MultipleCandidatesException(Exception):
@@ -86,11 +89,13 @@ def build_candidate_list_item(
     )
 
 
-def build_elections_list_response(supabase: Client) -> schemas.ElectionsListResponse:
+def build_elections_list_response(
+    repository: ReadRepository,
+) -> schemas.ElectionsListResponse:
     """公開済み選挙一覧レスポンスを組み立てる
 
     Args:
-        supabase: Supabaseクライアント
+        repository: 読み取りリポジトリ
 
     Returns:
         schemas.ElectionsListResponse: 公開済み選挙一覧
@@ -98,46 +103,9 @@ def build_elections_list_response(supabase: Client) -> schemas.ElectionsListResp
     Raises:
         HTTPException: データ取得に失敗した場合
     """
-    # 選挙台帳から中間テーブル経由で選挙情報を取得
-    ledgers_response = (
-        supabase.table("public_ledgers")
-        .select(
-            """
-            politician_election_id,
-            politician_elections:politician_election_id(
-                election_id,
-                elections:election_id(
-                    id,
-                    name,
-                    type,
-                    election_date,
-                    district:districts(id, name)
-                )
-            )
-            """
-        )
-        .eq("ledger_type", "election_fund")
-        .execute()
-    )
-
-    if ledgers_response.data is None:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="選挙一覧の取得に失敗しました",
-        )
-
-    election_map: dict[str, dict] = {}
-    for ledger in ledgers_response.data:
-        pol_elec = ledger.get("politician_elections")
-        if not pol_elec:
-            continue
-        election_data = pol_elec.get("elections")
-        if election_data and election_data["id"] not in election_map:
-            election_map[election_data["id"]] = election_data
-
     elections = [
         build_election_list_item(election_data)
-        for election_data in election_map.values()
+        for election_data in repository.list_published_elections()
     ]
     elections.sort(key=lambda e: e.election_date, reverse=True)
 
@@ -148,14 +116,14 @@ def build_elections_list_response(supabase: Client) -> schemas.ElectionsListResp
 
 
 def resolve_ledger_for_election(
-    supabase: Client,
+    repository: ReadRepository,
     election_id: UUID,
     politician_id: UUID | None,
 ) -> UUID:
     """選挙IDから対象台帳IDを解決する
 
     Args:
-        supabase: Supabaseクライアント
+        repository: 読み取りリポジトリ
         election_id: 選挙ID
         politician_id: 政治家ID（複数候補時は必須）
 
@@ -166,45 +134,15 @@ def resolve_ledger_for_election(
         HTTPException: 選挙・台帳が見つからない場合（404）
         MultipleCandidatesException: 複数候補者かつ politician_id 未指定（400）
     """
-    assert_election_exists(supabase, election_id)
-
-    # 中間テーブルから該当する politician_election_id を検索
-    pe_query = (
-        supabase.table("politician_elections")
-        .select("id, politician_id")
-        .eq("election_id", str(election_id))
-    )
-
-    if politician_id is not None:
-        pe_query = pe_query.eq("politician_id", str(politician_id))
-
-    pe_response = pe_query.execute()
-
-    if not pe_response.data:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="選挙資金の台帳が見つかりません",
-        )
-
-    pe_ids = [pe["id"] for pe in pe_response.data]
-
-    # public_ledgers から該当する台帳を取得
-    ledger_query = (
-        supabase.table("public_ledgers")
-        .select("id, politician_election_id")
-        .in_("politician_election_id", pe_ids)
-        .eq("ledger_type", "election_fund")
-    )
-
-    ledgers_response = ledger_query.execute()
-
-    if ledgers_response.data is None:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="選挙収支データの取得に失敗しました",
-        )
-
-    ledgers = ledgers_response.data
+    assert_election_exists(repository, election_id)
+
+    # 中間テーブル経由で選挙の候補者台帳を取得し、政治家で絞り込む
+    ledgers = [
+        ledger
+        for ledger in repository.list_candidate_ledgers(election_id)
+        if politician_id is None
+        or ledger["politician_elections"]["politician_id"] == str(politician_id)
+    ]
 
     if len(ledgers) == 0:
         raise HTTPException(
@@ -213,18 +151,17 @@ def resolve_ledger_for_election(
         )
 
     if len(ledgers) > 1 and politician_id is None:
-        # 複数候補者の politician_id を取得
-        pe_map = {pe["id"]: pe["politician_id"] for pe in pe_response.data}
         raise MultipleCandidatesException(
             schemas.MultipleCandidatesError(
                 error="同一選挙に複数候補者が存在します。politician_id を指定してください。",
                 candidates=[
                     schemas.CandidateRef(
-                        politician_id=UUID(pe_map[ledger["politician_election_id"]]),
+                        politician_id=UUID(
+                            ledger["politician_elections"]["politician_id"]
+                        ),
                         ledger_id=UUID(ledger["id"]),
                     )
                     for ledger in ledgers
-                    if ledger["politician_election_id"] in pe_map
                 ],
             )
         )
@@ -233,13 +170,13 @@ def resolve_ledger_for_election(
 
 
 def build_election_candidates_response(
-    supabase: Client,
+    repository: ReadRepository,
     election_id: UUID,
 ) -> schemas.ElectionCandidatesResponse:
     """選挙候補者一覧レスポンスを組み立てる
 
     Args:
-        supabase: Supabaseクライアント
+        repository: 読み取りリポジトリ
         election_id: 選挙ID
 
     Returns:
@@ -248,74 +185,20 @@ def build_election_candidates_response(
     Raises:
         HTTPException: 候補者が見つからない、またはデータ取得に失敗した場合
     """
-    assert_election_exists(supabase, election_id)
-
-    # 中間テーブルから該当する politician_election を取得
-    pe_response = (
-        supabase.table("politician_elections")
-        .select("id")
-        .eq("election_id", str(election_id))
-        .execute()
-    )
-
-    if not pe_response.data:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="該当選挙の候補者が見つかりません",
-        )
-
-    pe_ids = [pe["id"] for pe in pe_response.data]
+    assert_election_exists(repository, election_id)
 
     # public_ledgers から中間テーブル経由で政治家情報も取得
-    ledgers_response = (
-        supabase.table("public_ledgers")
-        .select(
-            """
-            id,
-            total_income,
-            total_expense,
-            journal_count,
-            politician_elections:politician_election_id(
-                id,
-                politician_id,
-                politicians:politician_id(id, name, name_kana)
-            )
-            """
-        )
-        .in_("politician_election_id", pe_ids)
-        .eq("ledger_type", "election_fund")
-        .execute()
-    )
-
-    if ledgers_response.data is None:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="候補者一覧の取得に失敗しました",
-        )
-
-    ledgers = ledgers_response.data
+    ledgers = repository.list_candidate_ledgers(election_id)
     if len(ledgers) == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="該当選挙の候補者が見つかりません",
         )
 
-    ledger_ids = [ledger["id"] for ledger in ledgers]
-    journals_response = (
-        supabase.table("public_journals")
-        .select("ledger_id, public_expense_amount")
-        .in_("ledger_id", ledger_ids)
-        .execute()
+    public_expense_totals = repository.public_expense_totals(
+        [ledger["id"] for ledger in ledgers]
     )
 
-    if journals_response.data is None:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="候補者一覧の取得に失敗しました",
-        )
-
-    public_expense_totals = sum_public_expense_by_ledger(journals_response.data)
-
     candidates: list[schemas.CandidateListItem] = []
     for ledger in ledgers:
         item = build_candidate_list_item(
@@ -336,3 +219,169 @@ def build_election_candidates_response(
         data=candidates,
         total_count=len(candidates),
     )
+
+
+def fetch_election_bundle_ledgers(
+    repository: ReadRepository, election_id: UUID
+) -> list[dict]:
+    """選挙の候補者台帳（政治家情報を含む）を1クエリで取得する
+
+    仕訳の並び（台帳ID順）と突き合わせるため、台帳ID順で返す。
+    政治家情報の欠落した台帳はバンドルに含めないため、ここで除き、
+    仕訳も読まない。
+
+    Args:
+        repository: 読み取りリポジトリ
+        election_id: 選挙ID
+
+    Returns:
+        list[dict]: public_ledgers の行（politician_elections ネスト含む）
+
+    Raises:
+        HTTPException: 選挙・候補者が見つからない（政治家情報のある台帳が
+            1件も無い場合を含む）、またはデータ取得に失敗した場合
+    """
+    ledgers = repository.list_candidate_ledgers(election_id)
+
+    if len(ledgers) == 0:
+        # 選挙自体が存在しないのか候補者がいないのかを区別する
+        assert_election_exists(repository, election_id)
+
+    ledgers = [
+        ledger
+        for ledger in ledgers
+        if (ledger.get("politician_elections") or {}).get("politicians")
+    ]
+    if len(ledgers) == 0:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="該当選挙の候補者が見つかりません",
+        )
+
+    return ledgers
+
+
+def build_candidate_bundle_item(
+    ledger_data: dict,
+    journals_data: list[dict],
+    account_codes_map: dict[str, str],
+) -> schemas.CandidateBundleItem | None:
+    """台帳データと仕訳データを選挙バンドルの候補者1件に変換する
+
+    Args:
+        ledger_data: public_ledgers の行（politician_elections ネスト含む）
+        journals_data: 当該台帳の public_journals の行（日付順）
+        account_codes_map: account_code をキーとした勘定科目名
+
+    Returns:
+        schemas.CandidateBundleItem | None: 候補者1件。政治家情報が欠落時は None
+    """
+    public_expense_totals = sum_public_expense_by_ledger(journals_data)
+    candidate = build_candidate_list_item(
+        ledger_data,
+        public_expense_totals.get(ledger_data["id"], 0),
+    )
+    if candidate is None:
+        return None
+
+    return schemas.CandidateBundleItem.model_construct(
+        ledger_id=candidate.ledger_id,
+        politician=candidate.politician,
+        summary=candidate.summary,
+        journals=[
+            build_election_funds_data_item(journal_data, account_codes_map)
+            for journal_data in journals_data
+        ],
+    )
+
+
+def iter_election_bundle_items(
+    repository: ReadRepository,
+    ledgers: list[dict],
+) -> Iterator[schemas.CandidateBundleItem]:
+    """候補者ごとに仕訳をまとめた選挙バンドルの要素を順に生成する
+
+    全候補者の仕訳を1つの IN クエリ（台帳ID・日付順、ページ分割）で読み、
+    台帳IDの切り替わりで候補者単位に区切る。保持するのは処理中の
+    候補者1人分の仕訳のみ。
+
+    Args:
+        repository: 読み取りリポジトリ
+        ledgers: 台帳ID順の public_ledgers の行
+
+    Yields:
+        schemas.CandidateBundleItem: 候補者1件（政治家情報の欠落した台帳は除く）
+    """
+    account_codes_map = repository.get_account_code_names()
+    rows = repository.iter_journals_for_ledgers([ledger["id"] for ledger in ledgers])
+    pending = next(rows, None)
+
+    for ledger in ledgers:
+        journals_data: list[dict] = []
+        while pending is not None and pending.get("ledger_id") == ledger["id"]:
+            journals_data.append(pending)
+            pending = next(rows, None)
+
+        item = build_candidate_bundle_item(ledger, journals_data, account_codes_map)
+        if item is not None:
+            yield item
+
+
+def build_election_bundle_response(
+    repository: ReadRepository,
+    election_id: UUID,
+) -> schemas.ElectionBundleResponse:
+    """選挙バンドルレスポンス（候補者一覧＋各候補者の仕訳）を組み立てる
+
+    Args:
+        repository: 読み取りリポジトリ
+        election_id: 選挙ID
+
+    Returns:
+        schemas.ElectionBundleResponse: 候補者と仕訳の一覧
+
+    Raises:
+        HTTPException: 選挙・候補者が見つからない、またはデータ取得に失敗した場合
+    """
+    ledgers = fetch_election_bundle_ledgers(repository, election_id)
+    candidates = list(iter_election_bundle_items(repository, ledgers))
+
+    return schemas.ElectionBundleResponse(
+        election_id=election_id,
+        data=candidates,
+        total_count=len(candidates),
+    )
+
+
+def stream_election_bundle_response(
+    repository: ReadRepository,
+    election_id: UUID,
+) -> Iterator[bytes]:
+    """選挙バンドルレスポンスをJSONストリームとして返す
+
+    候補者の取得（404判定）はこの関数の呼び出し時に行い、
+    仕訳は候補者単位で逐次出力する。出力は build_election_bundle_response
+    のJSONと同一になる。全台帳の政治家情報が欠落している場合も、
+    build_election_bundle_response と同じく出力を始める前に 404 にする
+    （空の data を 200 で返さない）。
+
+    Args:
+        repository: 読み取りリポジトリ
+        election_id: 選挙ID
+
+    Returns:
+        Iterator[bytes]: JSONの断片
+
+    Raises:
+        HTTPException: 選挙・候補者が見つからない、またはデータ取得に失敗した場合
+    """
+    ledgers = fetch_election_bundle_ledgers(repository, election_id)
+
+    return iter_json_object_with_array(
+        {"api_version": "v1", "election_id": election_id},
+        "data",
+        iter_election_bundle_items(repository, ledgers),
+        lambda count: {"total_count": count},
+        # 候補者1人分の仕訳をまとめた要素のため、1件ずつ出力する
+        batch_size=1,
+    )
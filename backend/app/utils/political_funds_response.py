@@ -0,0 +1,214 @@
+"""政治資金レスポンス組み立てユーティリティ
+
+public_ledgers と public_journals から PoliticalFundsResponse を生成する。
+"""
+
+from collections.abc import Iterator
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import HTTPException, status
+
+from app import schemas
+from app.models.public_ledgers import PublicLedger
+from app.repositories.base import ReadRepository
+from app.utils.category import derive_category, get_category_name
+from app.utils.json_stream import iter_json_object_with_array
+
+
+def build_political_funds_data_item(
+    journal_data: dict,
+    account_codes_map: dict[str, str],
+) -> dict:
+    """public_journals の行を政治資金データの1件（出力形式の辞書）に変換する
+
+    DBから取得した行は型が保証されているため、モデル生成・検証を行わず、
+    1パスでレスポンスのJSON形式（schemas.PoliticalFundsDataItem の
+    エイリアス形式）の辞書を組み立てる。
+
+    Args:
+        journal_data: public_journals の行
+        account_codes_map: account_code をキーとした勘定科目名
+
+    Returns:
+        dict: 政治資金データの1件（キーは "id", "date", "amount" ...）
+    """
+    account_code = journal_data.get("account_code")
+
+    # account_codeからcategoryを導出
+    category = derive_category(account_code)
+
+    # account_codesテーブルから取得した名前があれば使用
+    if account_code and account_code in account_codes_map:
+        category_name = account_codes_map[account_code]
+    else:
+        category_name = get_category_name(category)
+
+    # public_expense_amountが0の場合はNoneにする
+    public_expense_amount = journal_data.get("public_expense_amount")
+    if public_expense_amount == 0:
+        public_expense_amount = None
+
+    return {
+        "id": journal_data["id"],
+        "date": journal_data["date"],
+        "amount": journal_data["amount"],
+        "category": category,
+        "category_name": category_name,
+        "type": "政治活動",
+        "purpose": journal_data.get("description"),
+        "non_monetary_basis": journal_data.get("non_monetary_basis"),
+        "note": journal_data.get("note"),
+        "public_expense_amount": public_expense_amount,
+    }
+
+
+def fetch_political_ledger_or_raise(
+    repository: ReadRepository, ledger_id: UUID
+) -> PublicLedger:
+    """政治資金の台帳を取得する
+
+    Args:
+        repository: 読み取りリポジトリ
+        ledger_id: 台帳ID
+
+    Returns:
+        PublicLedger: 政治資金の台帳
+
+    Raises:
+        HTTPException: 台帳が存在しない、または政治団体の台帳でない場合（404）
+    """
+    # public_ledgersを取得（ledger_type='political_fund' であること）
+    ledger_data = repository.get_ledger(ledger_id)
+
+    if not ledger_data or ledger_data.get("ledger_type") != "political_fund":
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="政治資金の台帳が見つかりません",
+        )
+
+    return PublicLedger(**ledger_data)
+
+
+def build_political_funds_meta(
+    repository: ReadRepository,
+    ledger: PublicLedger,
+) -> schemas.PoliticalFundsMeta:
+    """政治資金台帳のメタ情報（政治家・政治団体・サマリー）を組み立てる
+
+    Args:
+        repository: 読み取りリポジトリ
+        ledger: 政治資金の台帳
+
+    Returns:
+        schemas.PoliticalFundsMeta: メタ情報
+
+    Raises:
+        HTTPException: 政治家・政治団体情報が見つからない場合（404）
+    """
+    # 中間テーブル経由で政治家情報と政治団体情報を取得
+    pol_org_data = repository.get_politician_organization(
+        ledger.politician_organization_id
+    )
+
+    if not pol_org_data:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="政治家・政治団体情報が見つかりません",
+        )
+
+    politician_data = pol_org_data.get("politicians")
+    organization_data = pol_org_data.get("organizations")
+
+    if not politician_data:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="政治家情報が見つかりません",
+        )
+
+    if not organization_data:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="政治団体情報が見つかりません",
+        )
+
+    politician = schemas.PoliticianInfo(**politician_data)
+    organization = schemas.OrganizationInfo(**organization_data)
+
+    summary = schemas.PoliticalFundsSummary(
+        total_income=ledger.total_income,
+        total_expense=ledger.total_expense,
+        balance=ledger.total_income - ledger.total_expense,
+        journal_count=ledger.journal_count,
+    )
+
+    return schemas.PoliticalFundsMeta(
+        api_version="v1",
+        politician=politician,
+        organization=organization,
+        summary=summary,
+        generated_at=datetime.now(),
+    )
+
+
+def build_political_funds_response(
+    repository: ReadRepository,
+    ledger_id: UUID,
+) -> schemas.PoliticalFundsResponse:
+    """台帳IDから政治資金レスポンスを組み立てる
+
+    Args:
+        repository: 読み取りリポジトリ
+        ledger_id: 台帳ID（public_ledgers.id）
+
+    Returns:
+        schemas.PoliticalFundsResponse: 政治資金データ
+
+    Raises:
+        HTTPException: 台帳・関連データが見つからない場合（404）
+    """
+    ledger = fetch_political_ledger_or_raise(repository, ledger_id)
+    meta = build_political_funds_meta(repository, ledger)
+    account_codes_map = repository.get_account_code_names()
+
+    data_items = [
+        build_political_funds_data_item(journal_data, account_codes_map)
+        for journal_data in repository.iter_ledger_journals(ledger_id)
+    ]
+
+    # data_items は出力形式の辞書のため、外枠も検証せずに組み立てる
+    return schemas.PoliticalFundsResponse.model_construct(meta=meta, data=data_items)
+
+
+def stream_political_funds_response(
+    repository: ReadRepository,
+    ledger_id: UUID,
+) -> Iterator[bytes]:
+    """台帳IDから政治資金レスポンスをJSONストリームとして返す
+
+    meta（404判定を含む）はこの関数の呼び出し時に確定させ、仕訳は
+    ページ単位で取得しながら逐次出力する。出力は
+    build_political_funds_response のJSONと同一になる。
+
+    Args:
+        repository: 読み取りリポジトリ
+        ledger_id: 台帳ID（public_ledgers.id）
+
+    Returns:
+        Iterator[bytes]: JSONの断片
+
+    Raises:
+        HTTPException: 台帳・関連データが見つからない場合（404）
+    """
+    ledger = fetch_political_ledger_or_raise(repository, ledger_id)
+    meta = build_political_funds_meta(repository, ledger)
+    account_codes_map = repository.get_account_code_names()
+
+    return iter_json_object_with_array(
+        {"meta": meta},
+        "data",
+        (
+            build_political_funds_data_item(journal_data, account_codes_map)
+            for journal_data in repository.iter_ledger_journals(ledger_id)
+        ),
+    )
@@ -0,0 +1,213 @@
+"""Webhook 購読の読み書きユーティリティ
+
+webhook_subscriptions テーブルの登録・一覧・削除と、台帳更新イベントに
+該当する購読の読み出しを行う。
+"""
+
+import socket
+from urllib.parse import urlsplit
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from supabase import Client
+
+from app import schemas
+from app.core.events import LedgerUpdateEvent
+from app.core.webhooks import WebhookSubscription, is_global_address
+
+_SELECT_COLUMNS = "id, url, secret, election_id, ledger_id, is_active, created_at"
+
+
+def build_webhook_subscription_item(row: dict) -> schemas.WebhookSubscriptionItem:
+    """webhook_subscriptions の行をレスポンスに変換する（secret は返さない）
+
+    Args:
+        row: webhook_subscriptions の行
+
+    Returns:
+        schemas.WebhookSubscriptionItem: 購読1件
+    """
+    return schemas.WebhookSubscriptionItem(
+        id=row["id"],
+        url=row["url"],
+        has_secret=bool(row.get("secret")),
+        election_id=row.get("election_id"),
+        ledger_id=row.get("ledger_id"),
+        is_active=row.get("is_active", True),
+        created_at=row.get("created_at"),
+    )
+
+
+def _resolve_host(host: str) -> list[str]:
+    return [info[4][0] for info in socket.getaddrinfo(host, None)]
+
+
+def validate_webhook_url(url: str) -> None:
+    """通知先 URL が外部の https であることを検証する
+
+    配信はサーバー内部のネットワークから行うため、ホストが（名前解決後も
+    含めて）ループバック・プライベート・リンクローカル等のグローバルでない
+    アドレスの URL は登録させない。名前解決はブロッキング処理のため、
+    同期のハンドラーから呼ぶこと。配信時も改めて解決・確認する
+    （WebhookDispatcher.deliver）。
+
+    Args:
+        url: 通知先 URL
+
+    Raises:
+        HTTPException: https でない、ホストを解決できない、またはグローバルで
+            ないアドレスを指す場合（400）
+    """
+    parts = urlsplit(url)
+    if parts.scheme != "https" or not parts.hostname:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="通知先 URL は https で指定してください",
+        )
+    try:
+        addresses = _resolve_host(parts.hostname)
+    except (OSError, UnicodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="通知先 URL のホストを解決できません",
+        ) from None
+    if not addresses or not all(map(is_global_address, addresses)):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="通知先 URL に内部ネットワークのアドレスは指定できません",
+        )
+
+
+def create_webhook_subscription(
+    supabase: Client, request: schemas.WebhookSubscriptionCreate
+) -> schemas.WebhookSubscriptionItem:
+    """Webhook 購読を登録する
+
+    Args:
+        supabase: Supabaseクライアント（admin権限）
+        request: 登録内容
+
+    Returns:
+        schemas.WebhookSubscriptionItem: 登録した購読
+
+    Raises:
+        HTTPException: 通知先 URL が validate_webhook_url の条件を満たさない場合（400）
+    """
+    validate_webhook_url(str(request.url))
+    record = {
+        "url": str(request.url),
+        "secret": request.secret,
+        "election_id": str(request.election_id) if request.election_id else None,
+        "ledger_id": str(request.ledger_id) if request.ledger_id else None,
+    }
+    response = (
+        supabase.table("webhook_subscriptions")
+        .insert(record)
+        .select(_SELECT_COLUMNS)
+        .single()
+        .execute()
+    )
+    return build_webhook_subscription_item(response.data)
+
+
+def list_webhook_subscriptions(
+    supabase: Client,
+) -> schemas.WebhookSubscriptionsResponse:
+    """Webhook 購読の一覧を取得する
+
+    Args:
+        supabase: Supabaseクライアント（admin権限）
+
+    Returns:
+        schemas.WebhookSubscriptionsResponse: 購読一覧（登録日時順）
+    """
+    response = (
+        supabase.table("webhook_subscriptions")
+        .select(_SELECT_COLUMNS)
+        .order("created_at")
+        .execute()
+    )
+    return schemas.WebhookSubscriptionsResponse(
+        data=[build_webhook_subscription_item(row) for row in response.data or []]
+    )
+
+
+def delete_webhook_subscription(supabase: Client, subscription_id: UUID) -> None:
+    """Webhook 購読を削除する
+
+    Args:
+        supabase: Supabaseクライアント（admin権限）
+        subscription_id: 購読ID
+
+    Raises:
+        HTTPException: 購読が見つからない場合（404）
+    """
+    response = (
+        supabase.table("webhook_subscriptions")
+        .delete()
+        .eq("id", str(subscription_id))
+        .execute()
+    )
+    if not response.data:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Webhook の購読が見つかりません",
+        )
+
+
+def has_active_webhook_subscriptions(supabase: Client) -> bool:
+    """有効な Webhook 購読が1件以上あるかどうか
+
+    Args:
+        supabase: Supabaseクライアント（admin権限）
+
+    Returns:
+        bool: 有効な購読がある場合は True
+    """
+    response = (
+        supabase.table("webhook_subscriptions")
+        .select("id")
+        .eq("is_active", True)
+        .limit(1)
+        .execute()
+    )
+    return bool(response.data)
+
+
+def fetch_webhook_subscriptions_for_events(
+    supabase: Client, events: list[LedgerUpdateEvent]
+) -> list[WebhookSubscription]:
+    """台帳更新イベントに該当する有効な購読を取得する
+
+    Args:
+        supabase: Supabaseクライアント（admin権限）
+        events: 台帳更新イベント
+
+    Returns:
+        list[WebhookSubscription]: 台帳IDまたは選挙IDが一致する購読
+    """
+    ledger_ids = sorted({event.ledger_id for event in events})
+    election_ids = sorted({event.election_id for event in events if event.election_id})
+    if not ledger_ids:
+        return []
+
+    filters = [f"ledger_id.in.({','.join(ledger_ids)})"]
+    if election_ids:
+        filters.append(f"election_id.in.({','.join(election_ids)})")
+    response = (
+        supabase.table("webhook_subscriptions")
+        .select("id, url, secret, election_id, ledger_id")
+        .eq("is_active", True)
+        .or_(",".join(filters))
+        .execute()
+    )
+    return [
+        WebhookSubscription(
+            id=row["id"],
+            url=row["url"],
+            secret=row.get("secret"),
+            election_id=row.get("election_id"),
+            ledger_id=row.get("ledger_id"),
+        )
+        for row in response.data or []
+    ]
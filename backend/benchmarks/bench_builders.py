@@ -0,0 +1,111 @@
+"""レスポンス組み立て処理の pytest-benchmark スイート
+
+合成した選挙データ（benchmarks.synthetic）をインメモリの読み取り
+リポジトリに載せ、選挙資金・候補者一覧・選挙一覧の組み立てと公費負担の
+集計、JSON への直列化までを台帳の仕訳件数ごとに計測する。
+インメモリのリポジトリはクエリ結果をキャッシュするため、計測値は
+ネットワークと PostgREST を除いたアプリケーション側の処理時間になる。
+
+実行方法（backend ディレクトリで。pytest-benchmark が必要）:
+    pytest benchmarks/bench_builders.py --benchmark-autosave
+
+    # 保存済みの直近の結果と比較し、平均が 10% 以上悪化したら失敗にする
+    pytest benchmarks/bench_builders.py --benchmark-compare \\
+        --benchmark-compare-fail=mean:10%
+
+    # 100万件を含める（数 GB のメモリを使う）
+    BENCH_JOURNAL_SIZES=1000,10000,100000,1000000 \\
+        pytest benchmarks/bench_builders.py
+
+結果は .benchmarks/ 以下に保存される（--benchmark-storage で変更可）。
+"""
+
+import os
+
+import pytest
+
+from app.repositories import InMemoryReadRepository
+from app.utils.election_funds_response import (
+    build_election_funds_response_for_ledger,
+    sum_public_expense_by_ledger,
+)
+from app.utils.json_stream import encode_json
+from app.utils.polimoney_response import (
+    build_election_candidates_response,
+    build_elections_list_response,
+)
+from benchmarks.synthetic import SyntheticElection, build_synthetic_election
+
+pytest.importorskip("pytest_benchmark")
+
+JOURNAL_SIZES = [
+    int(size)
+    for size in os.environ.get("BENCH_JOURNAL_SIZES", "1000,10000,100000").split(",")
+]
+
+
+@pytest.fixture(scope="module", params=JOURNAL_SIZES, ids=lambda size: f"{size}")
+def dataset(request) -> SyntheticElection:
+    return build_synthetic_election(request.param)
+
+
+@pytest.fixture(scope="module")
+def repository(dataset: SyntheticElection) -> InMemoryReadRepository:
+    repository = InMemoryReadRepository(dataset.tables)
+    # 初回のフィルタ結果をキャッシュに載せ、計測から外す
+    build_election_funds_response_for_ledger(
+        repository, dataset.ledger_id, dataset.ledger
+    )
+    build_election_candidates_response(repository, dataset.election_id)
+    build_elections_list_response(repository)
+    return repository
+
+
+@pytest.fixture
+def bench(benchmark, dataset: SyntheticElection):
+    benchmark.extra_info["journal_count"] = len(dataset.journal_rows)
+    return benchmark
+
+
+def test_build_election_funds_response(bench, repository, dataset):
+    response = bench(
+        build_election_funds_response_for_ledger,
+        repository,
+        dataset.ledger_id,
+        dataset.ledger,
+    )
+
+    assert len(response.data) == len(dataset.journal_rows)
+
+
+def test_build_and_serialize_election_funds_response(bench, repository, dataset):
+    def build_and_serialize() -> bytes:
+        return encode_json(
+            build_election_funds_response_for_ledger(
+                repository, dataset.ledger_id, dataset.ledger
+            )
+        )
+
+    body = bench(build_and_serialize)
+
+    assert body.startswith(b"{")
+
+
+def test_build_election_candidates_response(bench, repository, dataset):
+    response = bench(
+        build_election_candidates_response, repository, dataset.election_id
+    )
+
+    assert len(response.data) == 3
+
+
+def test_build_elections_list_response(bench, repository, dataset):
+    response = bench(build_elections_list_response, repository)
+
+    assert response.total_count == len(dataset.tables["elections"])
+
+
+def test_sum_public_expense_by_ledger(bench, dataset):
+    totals = bench(sum_public_expense_by_ledger, dataset.journal_rows)
+
+    assert totals[str(dataset.ledger_id)] > 0
@@ -0,0 +1,188 @@
+"""仕訳変換ホットループのベンチマーク
+
+100k 件規模の台帳を想定し、仕訳1件あたりの変換・直列化コストを
+旧実装（PublicJournal 経由＋response_model による再検証）と
+現行の高速パス（model_construct＋直接直列化）で比較する。
+
+実行方法（backend ディレクトリで）:
+    python -m benchmarks.bench_journal_transform --rows 100000
+"""
+
+import argparse
+import json
+import random
+import time
+from collections.abc import Callable
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from pydantic import TypeAdapter
+
+from app import schemas
+from app.core.responses import PydanticJSONResponse
+from app.schemas import election_funds as election_funds_schemas
+from app.models.public_journals import PublicJournal
+from app.utils.category import (
+    ACCOUNT_CODE_TO_CATEGORY,
+    derive_category,
+    get_category_name,
+)
+from app.utils.election_funds_response import (
+    build_election_funds_data_item,
+    derive_type_from_classification,
+    normalize_public_expense_amount,
+)
+
+
+def generate_journal_rows(count: int, ledger_id: str, seed: int = 0) -> list[dict]:
+    """public_journals の行に相当する合成データを生成する
+
+    Args:
+        count: 生成件数
+        ledger_id: 台帳ID
+        seed: 乱数シード
+
+    Returns:
+        list[dict]: public_journals の行
+    """
+    rng = random.Random(seed)
+    account_codes = list(ACCOUNT_CODE_TO_CATEGORY)
+    rows = []
+    for index in range(count):
+        rows.append(
+            {
+                "id": str(UUID(int=rng.getrandbits(128), version=4)),
+                "ledger_id": ledger_id,
+                "journal_source_id": str(UUID(int=rng.getrandbits(128), version=4)),
+                "date": f"2026-01-{index % 28 + 1:02d}",
+                "description": "車上運動員報酬",
+                "amount": rng.randint(100, 500_000),
+                "contact_id": None,
+                "account_code": rng.choice(account_codes),
+                "classification": rng.choice(["campaign", "pre-campaign"]),
+                "non_monetary_basis": None,
+                "note": None,
+                "public_expense_amount": rng.choice([None, 0, rng.randint(1, 50_000)]),
+                "content_hash": "0" * 64,
+                "synced_at": "2026-01-30T00:00:00+00:00",
+                "created_at": "2026-01-30T00:00:00+00:00",
+                "is_test": False,
+            }
+        )
+    return rows
+
+
+def legacy_build_data_item(
+    journal_data: dict,
+    account_codes_map: dict[str, str],
+) -> schemas.ElectionFundsDataItem:
+    """旧実装の変換（PublicJournal を検証付きで生成してから出力モデルを生成）"""
+    journal = PublicJournal(**journal_data)
+
+    category = derive_category(journal.account_code)
+    category_name = get_category_name(category)
+
+    if journal.account_code and journal.account_code in account_codes_map:
+        category_name = account_codes_map[journal.account_code]
+
+    return schemas.ElectionFundsDataItem(
+        id=journal.id,
+        date=journal.date,
+        amount=journal.amount,
+        category=category,
+        category_name=category_name,
+        type=derive_type_from_classification(journal.classification),
+        purpose=journal.description,
+        non_monetary_basis=journal.non_monetary_basis,
+        note=journal.note,
+        public_expense_amount=normalize_public_expense_amount(
+            journal.public_expense_amount
+        ),
+    )
+
+
+def _meta() -> election_funds_schemas.ElectionFundsMeta:
+    return election_funds_schemas.ElectionFundsMeta(
+        politician=election_funds_schemas.PoliticianInfo(id=uuid4(), name="候補者"),
+        election=election_funds_schemas.ElectionInfo(
+            id=uuid4(),
+            name="選挙",
+            type="GM",
+            type_name="市区町村議会議員選挙",
+            district_id=uuid4(),
+            district_name="選挙区",
+            election_date="2026-02-01",
+        ),
+        summary=election_funds_schemas.ElectionFundsSummary(),
+        generated_at=datetime.now(),
+    )
+
+
+def legacy_render(rows: list[dict], account_codes_map: dict[str, str]) -> bytes:
+    """旧実装: 検証付き変換 → response_model による再検証 → 標準 json で直列化"""
+    response = schemas.ElectionFundsResponse(
+        meta=_meta(),
+        data=[legacy_build_data_item(row, account_codes_map) for row in rows],
+    )
+    # FastAPI の serialize_response と同じ手順を再現する
+    adapter = TypeAdapter(schemas.ElectionFundsResponse)
+    content = adapter.validate_python(response.model_dump(by_alias=True))
+    jsonable = adapter.dump_python(content, mode="json", by_alias=True)
+    return json.dumps(jsonable, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def fast_render(rows: list[dict], account_codes_map: dict[str, str]) -> bytes:
+    """高速パス: 検証なしで1パス変換し、モデルを直接直列化する"""
+    response = schemas.ElectionFundsResponse.model_construct(
+        meta=_meta(),
+        data=[build_election_funds_data_item(row, account_codes_map) for row in rows],
+    )
+    return PydanticJSONResponse(response).body
+
+
+def _measure(
+    func: Callable[[list[dict], dict[str, str]], object],
+    rows: list[dict],
+    account_codes_map: dict[str, str],
+    repeat: int,
+) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(rows, account_codes_map)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    """ベンチマークを実行して結果を表示する"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rows = generate_journal_rows(args.rows, str(uuid4()))
+    account_codes_map = {"EXP_PRINTING_ELEC": "印刷費"}
+
+    cases: list[tuple[str, Callable]] = [
+        (
+            "transform (legacy)",
+            lambda r, m: [legacy_build_data_item(row, m) for row in r],
+        ),
+        (
+            "transform (fast)",
+            lambda r, m: [build_election_funds_data_item(row, m) for row in r],
+        ),
+        ("transform+serialize (legacy)", legacy_render),
+        ("transform+serialize (fast)", fast_render),
+    ]
+
+    print(f"rows={args.rows} repeat={args.repeat} (best of)")
+    for name, func in cases:
+        elapsed = _measure(func, rows, account_codes_map, args.repeat)
+        per_journal_us = elapsed / args.rows * 1_000_000
+        print(f"{name:<32} total={elapsed:8.3f}s per_journal={per_journal_us:7.2f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,324 @@
+"""読み取り・同期を混ぜた負荷試験
+
+選挙の開票日を想定した利用の比率（--mix）で、選挙一覧・候補者一覧・
+選挙別の仕訳・台帳別の仕訳・政治資金・同期（仕訳のまとめ送信）を
+--concurrency 本の並行クライアントから送り続け、スループットと
+レイテンシのパーセンタイルを表示する。
+
+データは合成データ（benchmarks.synthetic）をインメモリの Supabase
+クライアントに載せたもので、呼び出しごとに --latency-ms だけ同期的に待つ
+（supabase-py と同じくイベントループを止める）。同期を混ぜるとスナップ
+ショットキャッシュが破棄され、直後の読み取りは組み立て直しになる。
+
+--server asgi（既定）はアプリを直接呼び出し、--server uvicorn は同じ
+プロセス内で uvicorn を起動して HTTP 経由で呼び出す。
+
+実行方法（backend ディレクトリで）:
+    python -m benchmarks.bench_load --concurrency 32 --duration 10
+    python -m benchmarks.bench_load --server uvicorn \\
+        --mix elections=30,candidates=30,election_journals=20,sync=20
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import statistics
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass
+from uuid import uuid4
+
+import httpx
+import uvicorn
+
+from app.core.snapshot_cache import snapshot_cache
+from app.database.instrumentation import InstrumentedClient
+from app.database.memory import InMemorySupabase
+from app.database.supabase import (
+    get_admin_supabase_client_dep,
+    get_supabase_client_dep,
+)
+from app.main import app
+from benchmarks.synthetic import (
+    add_political_fund_ledger,
+    build_synthetic_election,
+    generate_journal_rows,
+)
+
+DEFAULT_MIX = (
+    "elections=25,candidates=20,election_journals=20,"
+    "ledger_journals=15,political_funds=10,sync=10"
+)
+
+
+@dataclass
+class Target:
+    """リクエスト先のID
+
+    Attributes:
+        election_ids: 全選挙のID
+        election_id: 仕訳を持つ選挙のID
+        politician_ids: election_id の候補者の政治家ID
+        ledger_ids: election_id の候補者の台帳ID
+        political_ledger_id: 政治資金の台帳ID
+        sync_ledger_source_id: 同期で仕訳を追加する台帳の Ledger 側ID
+    """
+
+    election_ids: list[str]
+    election_id: str
+    politician_ids: list[str]
+    ledger_ids: list[str]
+    political_ledger_id: str
+    sync_ledger_source_id: str
+
+
+Request = tuple[str, str, dict | None]
+
+
+def _sync_payload(rng: random.Random, target: Target, size: int) -> dict:
+    journals = []
+    for row in generate_journal_rows(rng, target.sync_ledger_source_id, size):
+        journals.append(
+            {
+                "journal_source_id": str(uuid4()),
+                "ledger_source_id": target.sync_ledger_source_id,
+                "date": row["date"],
+                "description": row["description"],
+                "amount": row["amount"],
+                "account_code": row["account_code"],
+                "classification": row["classification"],
+                "public_expense_amount": row["public_expense_amount"],
+                "content_hash": uuid4().hex,
+            }
+        )
+    return {"journals": journals}
+
+
+def _scenarios(
+    target: Target, sync_size: int
+) -> dict[str, Callable[[random.Random], Request]]:
+    base = "/api/v1/polimoney"
+    return {
+        "elections": lambda rng: ("GET", f"{base}/elections", None),
+        "candidates": lambda rng: (
+            "GET",
+            f"{base}/elections/{rng.choice(target.election_ids)}/candidates",
+            None,
+        ),
+        "election_journals": lambda rng: (
+            "GET",
+            f"{base}/elections/{target.election_id}/journals"
+            f"?politician_id={rng.choice(target.politician_ids)}",
+            None,
+        ),
+        "ledger_journals": lambda rng: (
+            "GET",
+            f"{base}/ledgers/{rng.choice(target.ledger_ids)}/journals",
+            None,
+        ),
+        "political_funds": lambda rng: (
+            "GET",
+            f"/api/v1/political-funds/{target.political_ledger_id}",
+            None,
+        ),
+        "sync": lambda rng: (
+            "POST",
+            "/api/v1/sync/journals",
+            _sync_payload(rng, target, sync_size),
+        ),
+    }
+
+
+def _parse_mix(text: str) -> dict[str, float]:
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = float(weight)
+    return mix
+
+
+def _build_backend(args: argparse.Namespace) -> Target:
+    dataset = build_synthetic_election(args.journals, seed=args.seed)
+    political_ledger_id = add_political_fund_ledger(
+        dataset.tables, args.journals // 10, seed=args.seed
+    )
+    tables = dataset.tables
+    election_id = str(dataset.election_id)
+    pe_ids = {
+        pe["id"]: pe["politician_id"]
+        for pe in tables["politician_elections"]
+        if pe["election_id"] == election_id
+    }
+    ledgers = [
+        ledger
+        for ledger in tables["public_ledgers"]
+        if ledger["politician_election_id"] in pe_ids
+    ]
+    supabase = InstrumentedClient(
+        InMemorySupabase(tables, latency_seconds=args.latency_ms / 1000)
+    )
+    app.dependency_overrides[get_supabase_client_dep] = lambda: supabase
+    app.dependency_overrides[get_admin_supabase_client_dep] = lambda: supabase
+    return Target(
+        election_ids=[election["id"] for election in tables["elections"]],
+        election_id=election_id,
+        politician_ids=list(pe_ids.values()),
+        ledger_ids=[ledger["id"] for ledger in ledgers],
+        political_ledger_id=political_ledger_id,
+        # 計測対象（仕訳の多い台帳）以外の候補者の台帳に追加する
+        sync_ledger_source_id=ledgers[-1]["ledger_source_id"],
+    )
+
+
+async def _worker(
+    client: httpx.AsyncClient,
+    rng: random.Random,
+    scenarios: dict[str, Callable[[random.Random], Request]],
+    mix: dict[str, float],
+    deadline: float,
+    latencies: dict[str, list[float]],
+    errors: dict[str, int],
+) -> None:
+    names = list(mix)
+    weights = list(mix.values())
+    while time.perf_counter() < deadline:
+        name = rng.choices(names, weights=weights)[0]
+        method, path, body = scenarios[name](rng)
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, path, json=body)
+            failed = response.status_code >= 400
+        except httpx.HTTPError:
+            failed = True
+        latencies[name].append(time.perf_counter() - started)
+        if failed:
+            errors[name] += 1
+
+
+def _percentiles(values: list[float]) -> tuple[float, float, float]:
+    if len(values) < 2:
+        value = values[0] if values else 0.0
+        return value, value, value
+    cuts = statistics.quantiles(values, n=100, method="inclusive")
+    return cuts[49], cuts[94], cuts[98]
+
+
+def _report(
+    latencies: dict[str, list[float]], errors: dict[str, int], elapsed: float
+) -> None:
+    total = sum(len(values) for values in latencies.values())
+    print(
+        f"total requests={total} {total / elapsed:8.1f} req/s "
+        f"errors={sum(errors.values())} elapsed={elapsed:.1f}s"
+    )
+    print(
+        f"{'scenario':<18} {'count':>7} {'req/s':>8} {'p50':>9} {'p95':>9} "
+        f"{'p99':>9} {'max':>9} {'errors':>6}"
+    )
+    for name, values in sorted(latencies.items()):
+        p50, p95, p99 = _percentiles(values)
+        print(
+            f"{name:<18} {len(values):>7} {len(values) / elapsed:>8.1f} "
+            f"{p50 * 1000:>7.1f}ms {p95 * 1000:>7.1f}ms {p99 * 1000:>7.1f}ms "
+            f"{max(values) * 1000:>7.1f}ms {errors[name]:>6}"
+        )
+
+
+async def run_load(args: argparse.Namespace) -> None:
+    """負荷をかけて結果を表示する
+
+    Args:
+        args: コマンドライン引数
+    """
+    mix = _parse_mix(args.mix)
+    target = _build_backend(args)
+    scenarios = _scenarios(target, args.sync_size)
+    unknown = set(mix) - set(scenarios)
+    if unknown:
+        raise SystemExit(f"不明なシナリオです: {', '.join(sorted(unknown))}")
+    if args.snapshot_ttl is not None:
+        snapshot_cache.ttl_seconds = args.snapshot_ttl
+
+    server = None
+    if args.server == "uvicorn":
+        server = uvicorn.Server(
+            uvicorn.Config(
+                app, host="127.0.0.1", port=args.port, lifespan="off", log_level="error"
+            )
+        )
+        serve_task = asyncio.create_task(server.serve())
+        while not server.started:
+            await asyncio.sleep(0.01)
+        client = httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{args.port}",
+            timeout=60,
+            limits=httpx.Limits(max_connections=args.concurrency),
+        )
+    else:
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://load", timeout=60
+        )
+
+    latencies: dict[str, list[float]] = defaultdict(list)
+    errors: dict[str, int] = defaultdict(int)
+    print(
+        f"server={args.server} concurrency={args.concurrency} "
+        f"journals={args.journals} latency={args.latency_ms}ms "
+        f"snapshot_ttl={snapshot_cache.ttl_seconds}s mix={args.mix}"
+    )
+    async with client:
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(
+            *(
+                _worker(
+                    client,
+                    random.Random(args.seed + index),
+                    scenarios,
+                    mix,
+                    deadline,
+                    latencies,
+                    errors,
+                )
+                for index in range(args.concurrency)
+            )
+        )
+        elapsed = time.perf_counter() - started
+
+    if server is not None:
+        server.should_exit = True
+        await serve_task
+    app.dependency_overrides.clear()
+    _report(latencies, errors, elapsed)
+
+
+def main() -> None:
+    """負荷試験を実行して結果を表示する"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--server", choices=("asgi", "uvicorn"), default="asgi")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0, help="秒")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="シナリオ=重みの並び")
+    parser.add_argument(
+        "--journals", type=int, default=10_000, help="選挙の台帳の仕訳件数"
+    )
+    parser.add_argument("--sync-size", type=int, default=100, help="同期1回の仕訳数")
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument(
+        "--snapshot-ttl",
+        type=float,
+        default=None,
+        help="スナップショットキャッシュの有効期間（秒）。0 で無効",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    # アクセスログ・N+1 の警告で結果の表示が埋もれないようにする
+    logging.disable(logging.WARNING)
+    asyncio.run(run_load(args))
+
+
+if __name__ == "__main__":
+    main()
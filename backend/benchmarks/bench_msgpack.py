@@ -0,0 +1,70 @@
+"""JSON / MessagePack の直列化ベンチマーク
+
+大規模台帳の ElectionFundsResponse を JSON（orjson）と MessagePack で
+直列化・展開し、所要時間とペイロードサイズ（非圧縮・gzip）を比較する。
+
+実行方法（backend ディレクトリで）:
+    python -m benchmarks.bench_msgpack --rows 100000
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from uuid import uuid4
+
+import msgpack
+import orjson
+
+from app import schemas
+from app.core.compression import compress
+from app.core.content_negotiation import encode_msgpack
+from app.utils.election_funds_response import build_election_funds_data_item
+from app.utils.json_stream import encode_json
+from benchmarks.bench_journal_transform import _meta, generate_journal_rows
+
+
+def _best_of(func: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    """ベンチマークを実行して結果を表示する"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rows = generate_journal_rows(args.rows, str(uuid4()))
+    response = schemas.ElectionFundsResponse.model_construct(
+        meta=_meta(),
+        data=[build_election_funds_data_item(row, {}) for row in rows],
+    )
+
+    json_body = encode_json(response)
+    msgpack_body = encode_msgpack(response)
+    assert msgpack.unpackb(msgpack_body) == orjson.loads(json_body)
+
+    cases = [
+        ("json", json_body, lambda: encode_json(response), orjson.loads),
+        ("msgpack", msgpack_body, lambda: encode_msgpack(response), msgpack.unpackb),
+    ]
+
+    print(f"rows={args.rows} repeat={args.repeat} (best of)")
+    for name, body, encode, decode in cases:
+        encode_seconds = _best_of(encode, args.repeat)
+        decode_seconds = _best_of(lambda: decode(body), args.repeat)
+        gzip_size = len(compress(body, "gzip"))
+        print(
+            f"{name:<8} encode={encode_seconds:7.3f}s decode={decode_seconds:7.3f}s "
+            f"size={len(body) / 1024 / 1024:7.2f}MiB "
+            f"gzip={gzip_size / 1024 / 1024:6.2f}MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
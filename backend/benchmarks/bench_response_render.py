@@ -0,0 +1,68 @@
+"""レスポンス直列化のベンチマーク
+
+大規模台帳の ElectionFundsResponse を、FastAPI 標準の経路
+（jsonable な値への変換＋標準 json の JSONResponse）と
+orjson ベースの PydanticJSONResponse で直列化し、所要時間を比較する。
+
+実行方法（backend ディレクトリで）:
+    python -m benchmarks.bench_response_render --rows 100000
+"""
+
+import argparse
+import time
+from uuid import uuid4
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app import schemas
+from app.core.responses import PydanticJSONResponse
+from app.utils.election_funds_response import build_election_funds_data_item
+from benchmarks.bench_journal_transform import _meta, generate_journal_rows
+
+
+def main() -> None:
+    """ベンチマークを実行して結果を表示する"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rows = generate_journal_rows(args.rows, str(uuid4()))
+    response = schemas.ElectionFundsResponse.model_construct(
+        meta=_meta(),
+        data=[build_election_funds_data_item(row, {}) for row in rows],
+    )
+    jsonable = TypeAdapter(schemas.ElectionFundsResponse).dump_python(
+        schemas.ElectionFundsResponse.model_validate(
+            {"meta": response.meta, "data": response.data}
+        ),
+        mode="json",
+        by_alias=True,
+    )
+
+    cases = [
+        ("stdlib JSONResponse (jsonable)", lambda: JSONResponse(jsonable).body),
+        (
+            "PydanticJSONResponse (jsonable)",
+            lambda: PydanticJSONResponse(jsonable).body,
+        ),
+        ("PydanticJSONResponse (model)", lambda: PydanticJSONResponse(response).body),
+    ]
+
+    bodies = set()
+    print(f"rows={args.rows} repeat={args.repeat} (best of)")
+    for name, render in cases:
+        best = float("inf")
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            body = render()
+            best = min(best, time.perf_counter() - started)
+        bodies.add(body)
+        print(f"{name:<34} total={best:8.3f}s size={len(body):,}B")
+
+    print(f"identical output: {len(bodies) == 1}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+"""同期API（/sync/ledger・/sync/contacts・/sync/journals）のスループット計測
+
+生成したペイロードを ASGI アプリへ直接送り、取り込みの速さを測る。
+台帳 → 関係者 → 仕訳の順に、次の3通りの内容で同じデータを送る。
+
+    - new: すべて新規
+    - unchanged: 前回と同じ内容（仕訳は content_hash が一致してスキップ）
+    - changed10: 10% の行の内容（仕訳は content_hash）を変更
+
+エンドポイント・内容ごとに、行/秒、1行あたりの Supabase 呼び出し回数
+（往復）、チャンク（1リクエスト）ごとの所要時間の p95 を表示する。
+
+バックエンドは既定でインメモリの Supabase クライアント（呼び出しごとに
+--latency-ms だけ待つ）を使う。--backend supabase では設定
+（SUPABASE_URL など）のクライアントを使うため、ローカルの Supabase に
+向けて実行すること（is_test=true のデータが書き込まれる）。
+
+実行方法（backend ディレクトリで）:
+    python -m benchmarks.bench_sync --rows 10000 --latency-ms 2
+    python -m benchmarks.bench_sync --backend supabase \\
+        --politician-election-id <politician_elections.id>
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import statistics
+import time
+from collections.abc import Callable
+from uuid import uuid4
+
+import httpx
+
+from app.core.query_stats import capture_queries
+from app.database.instrumentation import InstrumentedClient
+from app.database.memory import InMemorySupabase
+from app.database.supabase import get_admin_supabase_client_dep
+from app.main import app
+from benchmarks.synthetic import generate_journal_rows
+
+MIXES = ("new", "unchanged", "changed10")
+CHANGED_RATIO = 0.1
+
+
+def _p95(values: list[float]) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=20, method="inclusive")[-1]
+
+
+def _ledger_payloads(count: int, politician_election_id: str) -> list[dict]:
+    return [
+        {
+            "ledger_source_id": str(uuid4()),
+            "ledger_type": "election_fund",
+            "politician_election_id": politician_election_id,
+            "fiscal_year": 2026,
+            "total_income": 0,
+            "total_expense": 0,
+            "journal_count": 0,
+            "is_test": True,
+        }
+        for _ in range(count)
+    ]
+
+
+def _contact_payloads(count: int, hub_ledger_ids: list[str]) -> list[dict]:
+    return [
+        {
+            "contact_source_id": str(uuid4()),
+            "ledger_id": hub_ledger_ids[index % len(hub_ledger_ids)],
+            "contact_type": "person",
+            "name": f"関係者{index}",
+            "address": "東京都千代田区",
+            "occupation": "会社員",
+        }
+        for index in range(count)
+    ]
+
+
+def _journal_payloads(
+    rng: random.Random, count: int, ledger_source_ids: list[str]
+) -> list[dict]:
+    per_ledger = -(-count // len(ledger_source_ids))
+    payloads = []
+    for ledger_source_id in ledger_source_ids:
+        size = min(per_ledger, count - len(payloads))
+        for row in generate_journal_rows(rng, ledger_source_id, size):
+            payloads.append(
+                {
+                    "journal_source_id": row["journal_source_id"],
+                    "ledger_source_id": ledger_source_id,
+                    "date": row["date"],
+                    "description": row["description"],
+                    "amount": row["amount"],
+                    "account_code": row["account_code"],
+                    "classification": row["classification"],
+                    "public_expense_amount": row["public_expense_amount"],
+                    "content_hash": uuid4().hex,
+                    "is_test": True,
+                }
+            )
+    return payloads
+
+
+def _change_journal(payload: dict) -> None:
+    payload["amount"] += 1
+    payload["content_hash"] = uuid4().hex
+
+
+def _change_contact(payload: dict) -> None:
+    payload["name"] = f"{payload['name']}（変更）"
+
+
+def _change_ledger(payload: dict) -> None:
+    payload["total_income"] += 1
+
+
+def _change(
+    rng: random.Random, payloads: list[dict], mutate: Callable[[dict], None]
+) -> list[dict]:
+    changed = []
+    for payload in payloads:
+        payload = dict(payload)
+        if rng.random() < CHANGED_RATIO:
+            mutate(payload)
+        changed.append(payload)
+    return changed
+
+
+async def _run(
+    client: httpx.AsyncClient,
+    path: str,
+    chunks: list[list[dict]],
+    wrap: Callable[[list[dict]], object],
+) -> tuple[float, int, list[float], list]:
+    chunk_seconds = []
+    bodies = []
+    with capture_queries() as stats:
+        started = time.perf_counter()
+        for chunk in chunks:
+            chunk_started = time.perf_counter()
+            response = await client.post(path, json=wrap(chunk))
+            chunk_seconds.append(time.perf_counter() - chunk_started)
+            response.raise_for_status()
+            bodies.append(response.json())
+        elapsed = time.perf_counter() - started
+    return elapsed, stats.count, chunk_seconds, bodies
+
+
+def _report(mix: str, name: str, rows: int, result: tuple) -> None:
+    elapsed, round_trips, chunk_seconds, _ = result
+    print(
+        f"{mix:<10} {name:<9} rows={rows:>7} {rows / elapsed:>9.0f} rows/s "
+        f"round_trips/row={round_trips / rows:5.2f} "
+        f"p95_chunk={_p95(chunk_seconds) * 1000:8.1f}ms"
+    )
+
+
+def _chunked(payloads: list[dict], size: int) -> list[list[dict]]:
+    return [payloads[start : start + size] for start in range(0, len(payloads), size)]
+
+
+async def benchmark(args: argparse.Namespace) -> None:
+    """3通りの内容で同期APIを順に呼び出し、結果を表示する
+
+    Args:
+        args: コマンドライン引数
+    """
+    rng = random.Random(args.seed)
+    if args.backend == "memory":
+        supabase = InstrumentedClient(
+            InMemorySupabase(latency_seconds=args.latency_ms / 1000)
+        )
+        app.dependency_overrides[get_admin_supabase_client_dep] = lambda: supabase
+
+    ledgers = _ledger_payloads(args.ledgers, args.politician_election_id)
+    contacts: list[dict] = []
+    journals = _journal_payloads(
+        rng, args.rows, [ledger["ledger_source_id"] for ledger in ledgers]
+    )
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        print(
+            f"backend={args.backend} latency={args.latency_ms}ms "
+            f"chunk_size={args.chunk_size}"
+        )
+        for mix in MIXES:
+            if mix == "changed10":
+                ledgers = _change(rng, ledgers, _change_ledger)
+                contacts = _change(rng, contacts, _change_contact)
+                journals = _change(rng, journals, _change_journal)
+
+            result = await _run(
+                client,
+                "/api/v1/sync/ledger",
+                [[ledger] for ledger in ledgers],
+                lambda chunk: {"ledger": chunk[0]},
+            )
+            _report(mix, "ledger", len(ledgers), result)
+
+            if not contacts:
+                hub_ledger_ids = [body["data"]["id"] for body in result[3]]
+                contacts = _contact_payloads(args.contacts, hub_ledger_ids)
+            result = await _run(
+                client,
+                "/api/v1/sync/contacts",
+                _chunked(contacts, args.chunk_size),
+                lambda chunk: chunk,
+            )
+            _report(mix, "contacts", len(contacts), result)
+
+            result = await _run(
+                client,
+                "/api/v1/sync/journals",
+                _chunked(journals, args.chunk_size),
+                lambda chunk: {"journals": chunk},
+            )
+            _report(mix, "journals", len(journals), result)
+
+    app.dependency_overrides.clear()
+
+
+def main() -> None:
+    """ベンチマークを実行して結果を表示する"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000, help="仕訳の件数")
+    parser.add_argument("--contacts", type=int, default=1_000)
+    parser.add_argument("--ledgers", type=int, default=10)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    parser.add_argument("--backend", choices=("memory", "supabase"), default="memory")
+    parser.add_argument("--politician-election-id")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    if args.politician_election_id is None:
+        if args.backend == "supabase":
+            parser.error("--backend supabase には --politician-election-id が必要です")
+        args.politician_election_id = str(uuid4())
+    # アクセスログ・N+1 の警告で結果の表示が埋もれないようにする
+    logging.disable(logging.WARNING)
+    asyncio.run(benchmark(args))
+
+
+if __name__ == "__main__":
+    main()
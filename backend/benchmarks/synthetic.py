@@ -0,0 +1,321 @@
+"""ベンチマーク用の合成データ
+
+選挙・候補者・台帳・仕訳とマスタを、インメモリの Supabase クライアント
+（app.database.memory.InMemorySupabase）に渡せるテーブルとして生成する。
+行は db/schema-normalized.sql の NOT NULL 列をすべて埋めるため、そのまま
+PostgreSQL にも投入できる。
+仕訳の勘定科目は選挙運動費用収支報告書の典型的な構成比（人件費・食糧費・
+印刷費が多く、収入は自己資金と寄附が中心）に合わせて重み付けする。
+"""
+
+import random
+from dataclasses import dataclass
+from uuid import UUID
+
+from app.models.public_ledgers import PublicLedger
+from app.utils.category import (
+    ACCOUNT_CODE_TO_CATEGORY,
+    CATEGORY_NAMES,
+    ELECTION_TYPE_NAMES,
+)
+
+# 勘定科目の出現比率（合計 100）
+ACCOUNT_CODE_WEIGHTS: dict[str, float] = {
+    "EXP_PERSONNEL_ELEC": 22,
+    "EXP_FOOD_ELEC": 12,
+    "EXP_PRINTING_ELEC": 10,
+    "EXP_ADVERTISING_ELEC": 8,
+    "EXP_TRANSPORT_ELEC": 8,
+    "EXP_MISC_ELEC": 8,
+    "EXP_BUILDING_ELEC": 6,
+    "EXP_STATIONERY_ELEC": 6,
+    "EXP_COMMUNICATION_ELEC": 5,
+    "EXP_LODGING_ELEC": 2,
+    "REV_SELF_FINANCING": 5,
+    "REV_DONATION_INDIVIDUAL_ELEC": 5,
+    "REV_DONATION_POLITICAL_ELEC": 2,
+    "REV_LOAN_ELEC": 0.5,
+    "REV_MISC_ELEC": 0.5,
+}
+
+# 公費負担の対象になりうる科目（ポスター・ビラ・選挙運動用自動車・運転手）と
+# そのうち公費負担がある仕訳の割合
+PUBLIC_EXPENSE_CODES = frozenset(
+    {
+        "EXP_PRINTING_ELEC",
+        "EXP_ADVERTISING_ELEC",
+        "EXP_TRANSPORT_ELEC",
+        "EXP_PERSONNEL_ELEC",
+    }
+)
+PUBLIC_EXPENSE_RATIO = 0.4
+
+DESCRIPTIONS: dict[str, tuple[str, ...]] = {
+    "personnel": ("車上運動員報酬", "事務員報酬", "手話通訳者報酬"),
+    "food": ("弁当代", "茶菓子代"),
+    "printing": ("選挙運動用ポスター作成", "選挙運動用ビラ作成"),
+    "advertising": ("選挙事務所看板", "たすき・腕章"),
+    "transportation": ("選挙運動用自動車借上", "燃料代"),
+    "miscellaneous": ("振込手数料", "消耗品"),
+    "building": ("選挙事務所賃借料", "個人演説会会場使用料"),
+    "stationery": ("コピー用紙", "封筒"),
+    "communication": ("電話代", "郵送料"),
+    "lodging": ("宿泊費",),
+    "other_income": ("自己資金",),
+    "donation": ("寄附",),
+}
+
+SYNTHETIC_TIMESTAMP = "2026-01-30T00:00:00+00:00"
+
+
+@dataclass
+class SyntheticElection:
+    """合成データ
+
+    Attributes:
+        tables: テーブル名 → 行のリスト
+        election_id: 計測対象の選挙ID
+        ledger_id: 計測対象の台帳ID（journal_count 件の仕訳を持つ）
+        ledger: 計測対象の台帳
+        journal_rows: 計測対象の台帳の仕訳
+    """
+
+    tables: dict[str, list[dict]]
+    election_id: UUID
+    ledger_id: UUID
+    ledger: PublicLedger
+    journal_rows: list[dict]
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(UUID(int=rng.getrandbits(128), version=4))
+
+
+def generate_journal_rows(
+    rng: random.Random,
+    ledger_id: str,
+    count: int,
+) -> list[dict]:
+    """勘定科目の構成比に沿った public_journals の行を生成する
+
+    Args:
+        rng: 乱数生成器
+        ledger_id: 台帳ID
+        count: 生成件数
+
+    Returns:
+        list[dict]: public_journals の行
+    """
+    codes = rng.choices(
+        list(ACCOUNT_CODE_WEIGHTS), weights=list(ACCOUNT_CODE_WEIGHTS.values()), k=count
+    )
+    rows = []
+    for index, account_code in enumerate(codes):
+        amount = rng.randint(100, 300_000)
+        public_expense_amount = None
+        if account_code in PUBLIC_EXPENSE_CODES and rng.random() < PUBLIC_EXPENSE_RATIO:
+            public_expense_amount = amount
+        category = ACCOUNT_CODE_TO_CATEGORY[account_code]
+        rows.append(
+            {
+                "id": _uuid(rng),
+                "ledger_id": ledger_id,
+                "journal_source_id": _uuid(rng),
+                "date": f"2026-01-{index % 28 + 1:02d}",
+                "description": rng.choice(DESCRIPTIONS[category]),
+                "amount": amount,
+                "contact_id": None,
+                "account_code": account_code,
+                "classification": (
+                    "pre-campaign" if rng.random() < 0.2 else "campaign"
+                ),
+                "non_monetary_basis": None,
+                "note": None,
+                "public_expense_amount": public_expense_amount,
+                "content_hash": f"{index:064x}",
+                "synced_at": SYNTHETIC_TIMESTAMP,
+                "created_at": SYNTHETIC_TIMESTAMP,
+                "is_test": False,
+            }
+        )
+    return rows
+
+
+def build_synthetic_election(
+    journal_count: int,
+    candidate_count: int = 3,
+    other_journal_count: int = 100,
+    seed: int = 0,
+) -> SyntheticElection:
+    """計測対象の選挙と、規模に応じた数の他の選挙を生成する
+
+    計測対象の選挙には candidate_count 人の候補者がおり、1人目の台帳が
+    journal_count 件、他の候補者の台帳が other_journal_count 件の仕訳を持つ。
+    選挙一覧の規模を揃えるため、仕訳 1,000 件ごとに仕訳の無い選挙
+    （候補者 candidate_count 人）を1件追加する。
+
+    Args:
+        journal_count: 計測対象の台帳の仕訳件数
+        candidate_count: 1選挙あたりの候補者数
+        other_journal_count: 他の候補者の台帳の仕訳件数
+        seed: 乱数シード
+
+    Returns:
+        SyntheticElection: 合成データ
+    """
+    rng = random.Random(seed)
+    tables: dict[str, list[dict]] = {
+        "account_codes": [
+            {
+                "code": code,
+                "name": CATEGORY_NAMES[category],
+                "type": "revenue" if code.startswith("REV_") else "expense",
+                "report_category": CATEGORY_NAMES[category],
+                "display_order": order,
+            }
+            for order, (code, category) in enumerate(ACCOUNT_CODE_TO_CATEGORY.items())
+        ],
+        "election_types": [
+            {"code": code, "name": name, "display_order": order}
+            for order, (code, name) in enumerate(ELECTION_TYPE_NAMES.items())
+        ],
+        "districts": [],
+        "elections": [],
+        "politicians": [],
+        "politician_elections": [],
+        "public_ledgers": [],
+        "public_journals": [],
+    }
+
+    target_ledger: dict | None = None
+    target_journals: list[dict] = []
+    target_election_id = ""
+    for election_index in range(1 + journal_count // 1000):
+        district_id = _uuid(rng)
+        election_id = _uuid(rng)
+        tables["districts"].append(
+            {"id": district_id, "name": f"第{election_index}区", "type": "GM"}
+        )
+        tables["elections"].append(
+            {
+                "id": election_id,
+                "name": f"合成選挙{election_index}",
+                "type": "GM",
+                "district_id": district_id,
+                "election_date": f"20{10 + election_index % 16}-04-{election_index % 28 + 1:02d}",
+            }
+        )
+        for candidate_index in range(candidate_count):
+            politician_id = _uuid(rng)
+            politician_election_id = _uuid(rng)
+            ledger_id = _uuid(rng)
+            tables["politicians"].append(
+                {
+                    "id": politician_id,
+                    "name": f"候補者{election_index}-{candidate_index}",
+                    "name_kana": None,
+                }
+            )
+            tables["politician_elections"].append(
+                {
+                    "id": politician_election_id,
+                    "politician_id": politician_id,
+                    "election_id": election_id,
+                }
+            )
+            journals: list[dict] = []
+            if election_index == 0:
+                journals = generate_journal_rows(
+                    rng,
+                    ledger_id,
+                    journal_count if candidate_index == 0 else other_journal_count,
+                )
+            ledger = {
+                "id": ledger_id,
+                "ledger_type": "election_fund",
+                "politician_organization_id": None,
+                "politician_election_id": politician_election_id,
+                "fiscal_year": 2026,
+                "total_income": sum(
+                    row["amount"]
+                    for row in journals
+                    if row["account_code"].startswith("REV_")
+                ),
+                "total_expense": sum(
+                    row["amount"]
+                    for row in journals
+                    if row["account_code"].startswith("EXP_")
+                ),
+                "journal_count": len(journals),
+                "ledger_source_id": _uuid(rng),
+                "last_updated_at": SYNTHETIC_TIMESTAMP,
+                "first_synced_at": SYNTHETIC_TIMESTAMP,
+                "created_at": SYNTHETIC_TIMESTAMP,
+                "is_test": False,
+            }
+            tables["public_ledgers"].append(ledger)
+            tables["public_journals"].extend(journals)
+            if election_index == 0 and candidate_index == 0:
+                target_ledger, target_journals = ledger, journals
+                target_election_id = election_id
+
+    return SyntheticElection(
+        tables=tables,
+        election_id=UUID(target_election_id),
+        ledger_id=UUID(target_ledger["id"]),
+        ledger=PublicLedger(**target_ledger),
+        journal_rows=target_journals,
+    )
+
+
+def add_political_fund_ledger(
+    tables: dict[str, list[dict]],
+    journal_count: int,
+    seed: int = 0,
+) -> str:
+    """先頭の政治家の政治団体と、その政治資金の台帳・仕訳を tables に追加する
+
+    仕訳の勘定科目は選挙運動費用と同じ構成比で生成する（負荷計測用）。
+
+    Args:
+        tables: build_synthetic_election で生成したテーブル
+        journal_count: 仕訳件数
+        seed: 乱数シード
+
+    Returns:
+        str: 追加した台帳ID
+    """
+    rng = random.Random(seed)
+    organization_id = _uuid(rng)
+    politician_organization_id = _uuid(rng)
+    ledger_id = _uuid(rng)
+    tables.setdefault("organizations", []).append(
+        {"id": organization_id, "name": "合成後援会", "type": "support_group"}
+    )
+    tables.setdefault("politician_organizations", []).append(
+        {
+            "id": politician_organization_id,
+            "politician_id": tables["politicians"][0]["id"],
+            "organization_id": organization_id,
+        }
+    )
+    journals = generate_journal_rows(rng, ledger_id, journal_count)
+    tables["public_ledgers"].append(
+        {
+            "id": ledger_id,
+            "ledger_type": "political_fund",
+            "politician_organization_id": politician_organization_id,
+            "politician_election_id": None,
+            "fiscal_year": 2025,
+            "total_income": 0,
+            "total_expense": 0,
+            "journal_count": len(journals),
+            "ledger_source_id": _uuid(rng),
+            "last_updated_at": SYNTHETIC_TIMESTAMP,
+            "first_synced_at": SYNTHETIC_TIMESTAMP,
+            "created_at": SYNTHETIC_TIMESTAMP,
+            "is_test": False,
+        }
+    )
+    tables["public_journals"].extend(journals)
+    return ledger_id
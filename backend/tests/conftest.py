@@ -1,3 +1,11 @@
+import asyncio
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from uuid import uuid4
+
+import asyncpg
+import orjson
 import pytest
 from fastapi.testclient import TestClient
 
@@ -10,9 +18,146 @@ from pytest_asyncio import fixture as async_fixture
 
 # from app.database import Base
 from app.config import Settings
+from app.core.query_stats import capture_queries
+from app.core.snapshot_cache import snapshot_cache
 from app.main import app
 
 
+@pytest.fixture(autouse=True)
+def clear_snapshot_cache():
+    """テスト間でレスポンスのスナップショットを共有しない"""
+    snapshot_cache.invalidate()
+    yield
+    snapshot_cache.invalidate()
+
+
+@pytest.fixture
+def query_budget():
+    """ブロック内の Supabase クエリ回数が上限以下であることを検証する
+
+    クエリは InstrumentedClient を経由したものを数える（MagicMock の
+    クライアントは InstrumentedClient で包んで依存関係を上書きする）。
+
+        with query_budget(3):
+            client.get("/api/v1/...")
+    """
+
+    @contextmanager
+    def budget(max_queries: int):
+        with capture_queries() as stats:
+            yield stats
+        assert stats.count <= max_queries, (
+            f"クエリ回数が上限を超えました: {stats.count} > {max_queries} "
+            f"{dict(stats.per_query)}"
+        )
+
+    return budget
+
+
+SCHEMA_SQL_PATH = Path(__file__).resolve().parents[2] / "db" / "schema-normalized.sql"
+
+# Supabase 以外の PostgreSQL にはスキーマが参照する auth.users と RLS ポリシーの
+# auth.uid() / auth.role() が無いため、無い場合のみ用意する
+_AUTH_SCHEMA_SQL = """
+CREATE SCHEMA IF NOT EXISTS auth;
+CREATE TABLE IF NOT EXISTS auth.users (id UUID PRIMARY KEY);
+DO $$
+BEGIN
+    IF to_regproc('auth.uid') IS NULL THEN
+        CREATE FUNCTION auth.uid() RETURNS uuid LANGUAGE sql STABLE AS 'SELECT NULL::uuid';
+    END IF;
+    IF to_regproc('auth.role') IS NULL THEN
+        CREATE FUNCTION auth.role() RETURNS text LANGUAGE sql STABLE AS 'SELECT NULL::text';
+    END IF;
+END
+$$;
+"""
+
+# 外部キーの参照先から順に投入する
+_SEED_TABLE_ORDER = (
+    "account_codes",
+    "election_types",
+    "districts",
+    "elections",
+    "politicians",
+    "organizations",
+    "politician_elections",
+    "politician_organizations",
+    "public_ledgers",
+    "public_contacts",
+    "public_journals",
+)
+
+
+async def _execute(dsn: str, *statements: str) -> None:
+    connection = await asyncpg.connect(dsn)
+    try:
+        for statement in statements:
+            await connection.execute(statement)
+    finally:
+        await connection.close()
+
+
+async def _seed_tables(dsn: str, schema: str, tables: dict[str, list[dict]]) -> None:
+    connection = await asyncpg.connect(dsn, server_settings={"search_path": schema})
+    try:
+        for table in _SEED_TABLE_ORDER:
+            rows = tables.get(table)
+            if not rows:
+                continue
+            columns = ", ".join(f'"{column}"' for column in rows[0])
+            await connection.execute(
+                f"INSERT INTO {table} ({columns}) SELECT {columns} "
+                f"FROM json_populate_recordset(NULL::{table}, $1::json)",
+                orjson.dumps(rows).decode(),
+            )
+        await connection.execute("ANALYZE")
+    finally:
+        await connection.close()
+
+
+@pytest.fixture(scope="session")
+def postgres_dsn():
+    """ローカルの PostgreSQL の接続文字列（TEST_DATABASE_URL）
+
+    未設定の場合は PostgreSQL を使うテストをスキップする。
+    """
+    dsn = os.environ.get("TEST_DATABASE_URL")
+    if not dsn:
+        pytest.skip("TEST_DATABASE_URL が未設定のため PostgreSQL のテストをスキップします")
+    return dsn
+
+
+@pytest.fixture(scope="module")
+def postgres_schema(postgres_dsn):
+    """db/schema-normalized.sql を読み込んだ使い捨てのスキーマ名
+
+    テストモジュールごとに作成し、終了時に削除する。接続時は
+    server_settings={"search_path": スキーマ名} で参照する。
+    """
+    schema = f"polimoney_test_{uuid4().hex[:12]}"
+    asyncio.run(
+        _execute(
+            postgres_dsn,
+            _AUTH_SCHEMA_SQL,
+            f'CREATE SCHEMA "{schema}"',
+            f'SET search_path TO "{schema}"; {SCHEMA_SQL_PATH.read_text()}',
+        )
+    )
+    yield schema
+    asyncio.run(_execute(postgres_dsn, f'DROP SCHEMA "{schema}" CASCADE'))
+
+
+@pytest.fixture(scope="module")
+def seed_postgres(postgres_dsn, postgres_schema):
+    """テーブル名 → 行のリスト（InMemorySupabase と同じ形式）を投入する関数"""
+
+    def seed(tables: dict[str, list[dict]]) -> None:
+        asyncio.run(_seed_tables(postgres_dsn, postgres_schema, tables))
+
+    return seed
+
+
 @pytest.fixture(scope="session")
 def test_settings():
     """Test settings"""
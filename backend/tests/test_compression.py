@@ -0,0 +1,259 @@
+"""レスポンス圧縮・スナップショットキャッシュのテスト"""
+
+import gzip
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import brotli
+import pytest
+import zstandard
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+
+from app.core.compression import compress, negotiate_encoding
+from app.core.snapshot_cache import SnapshotCache, snapshot_cache, snapshot_response
+from app.middleware.compression import CompressionMiddleware
+
+LARGE_PAYLOAD = {"data": [{"category_name": "印刷費", "type": "選挙運動"}] * 200}
+
+
+def _decode(content: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.decompress(content)
+    if encoding == "zstd":
+        return zstandard.ZstdDecompressor().decompressobj().decompress(content)
+    return gzip.decompress(content)
+
+
+def _create_test_app(build_calls: list | None = None) -> FastAPI:
+    test_app = FastAPI()
+    test_app.add_middleware(CompressionMiddleware)
+
+    @test_app.get("/large")
+    async def large():
+        return LARGE_PAYLOAD
+
+    @test_app.get("/small")
+    async def small():
+        return {"status": "ok"}
+
+    @test_app.get("/stream")
+    async def stream():
+        def chunks():
+            for index in range(3):
+                yield json.dumps({"index": index}).encode() + b"\n"
+
+        return StreamingResponse(chunks(), media_type="application/x-ndjson")
+
+    @test_app.get("/events")
+    async def events():
+        return StreamingResponse(
+            iter([b"data: {}\n\n"] * 100), media_type="text/event-stream"
+        )
+
+    @test_app.get("/snapshot")
+    def snapshot(request: Request):
+        def build():
+            build_calls.append(1)
+            return LARGE_PAYLOAD
+
+        return snapshot_response(request, build)
+
+    return test_app
+
+
+class TestNegotiateEncoding:
+    """Accept-Encoding ネゴシエーションのテスト"""
+
+    @pytest.mark.parametrize(
+        ("accept_encoding", "expected"),
+        [
+            (None, None),
+            ("identity", None),
+            ("gzip, deflate", "gzip"),
+            ("gzip, br, zstd", "br"),
+            ("gzip;q=1.0, zstd;q=0.9, br;q=0.5", "gzip"),
+            ("br;q=0, *", "zstd"),
+            ("*;q=0", None),
+        ],
+    )
+    def test_selects_highest_quality_supported_encoding(
+        self, accept_encoding, expected
+    ):
+        assert negotiate_encoding(accept_encoding) == expected
+
+
+class TestCompressionMiddleware:
+    """圧縮ミドルウェアのテスト"""
+
+    @pytest.mark.parametrize("encoding", ["br", "zstd", "gzip"])
+    def test_compresses_large_response(self, encoding):
+        client = TestClient(_create_test_app())
+        # TestClient（httpx）は gzip / br / zstd を自動展開するため、生のボディを読む
+        with client.stream(
+            "GET", "/large", headers={"Accept-Encoding": encoding}
+        ) as response:
+            raw = b"".join(response.iter_raw())
+
+        assert response.headers["content-encoding"] == encoding
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert int(response.headers["content-length"]) == len(raw)
+        assert json.loads(_decode(raw, encoding)) == LARGE_PAYLOAD
+
+    def test_skips_small_response(self):
+        client = TestClient(_create_test_app())
+        response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+        assert response.json() == {"status": "ok"}
+
+    def test_compresses_streaming_response_per_chunk(self):
+        client = TestClient(_create_test_app())
+        with client.stream(
+            "GET", "/stream", headers={"Accept-Encoding": "gzip"}
+        ) as response:
+            raw = b"".join(response.iter_raw())
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert gzip.decompress(raw).decode().splitlines() == [
+            '{"index": 0}',
+            '{"index": 1}',
+            '{"index": 2}',
+        ]
+
+    def test_skips_event_stream(self):
+        client = TestClient(_create_test_app())
+        response = client.get("/events", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+        assert response.content == b"data: {}\n\n" * 100
+
+
+class TestSnapshotCache:
+    """スナップショットキャッシュのテスト"""
+
+    def test_serves_precompressed_snapshot_on_cache_hit(self):
+        build_calls: list = []
+        client = TestClient(_create_test_app(build_calls))
+
+        with client.stream(
+            "GET", "/snapshot", headers={"Accept-Encoding": "br"}
+        ) as first:
+            first_raw = b"".join(first.iter_raw())
+        with client.stream(
+            "GET", "/snapshot", headers={"Accept-Encoding": "br"}
+        ) as second:
+            second_raw = b"".join(second.iter_raw())
+        identity = client.get("/snapshot", headers={"Accept-Encoding": "identity"})
+
+        assert len(build_calls) == 1
+        assert second.headers["content-encoding"] == "br"
+        assert second_raw == first_raw
+        assert json.loads(brotli.decompress(second_raw)) == LARGE_PAYLOAD
+        assert identity.json() == LARGE_PAYLOAD
+
+    @pytest.mark.asyncio
+    async def test_compresses_snapshot_outside_event_loop(self, monkeypatch):
+        threads = []
+
+        def recording_compress(body, encoding, precompress=False):
+            threads.append(threading.get_ident())
+            return compress(body, encoding, precompress=precompress)
+
+        monkeypatch.setattr("app.core.snapshot_cache.compress", recording_compress)
+        async with AsyncClient(
+            transport=ASGITransport(app=_create_test_app([])),
+            base_url="http://testserver",
+        ) as client:
+            # スナップショットに当たらないようクエリ文字列を変える
+            response = await client.get(
+                "/snapshot?thread=1", headers={"Accept-Encoding": "br"}
+            )
+
+        assert response.headers["content-encoding"] == "br"
+        assert threads
+        assert threading.get_ident() not in threads
+
+    def test_compresses_each_encoding_once_under_concurrency(self, monkeypatch):
+        calls = []
+        started = threading.Event()
+
+        def slow_compress(body, encoding, precompress=False):
+            calls.append(encoding)
+            started.set()
+            time.sleep(0.05)
+            return compress(body, encoding, precompress=precompress)
+
+        monkeypatch.setattr("app.core.snapshot_cache.compress", slow_compress)
+        snapshot = SnapshotCache(ttl_seconds=10).put("key", b"x" * 4096)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(snapshot.encoded, ["gzip"] * 4))
+
+        assert calls == ["gzip"]
+        assert len(set(results)) == 1
+
+    def test_invalidate_rebuilds_snapshot(self):
+        build_calls: list = []
+        client = TestClient(_create_test_app(build_calls))
+
+        client.get("/snapshot")
+        snapshot_cache.invalidate()
+        client.get("/snapshot")
+
+        assert len(build_calls) == 2
+
+    def test_evicts_expired_and_least_recently_used_entries(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr("app.core.snapshot_cache.time.monotonic", lambda: now[0])
+        cache = SnapshotCache(ttl_seconds=10, max_entries=2)
+
+        cache.put("a", b"1")
+        cache.put("b", b"2")
+        assert cache.get("a") is not None
+        cache.put("c", b"3")
+
+        assert cache.get("b") is None
+        now[0] += 10
+        assert cache.get("a") is None
+        assert cache.get("c") is None
+
+    def test_evicts_least_recently_used_entries_over_byte_budget(self):
+        cache = SnapshotCache(ttl_seconds=10, max_bytes=10)
+
+        cache.put("a", b"1234")
+        cache.put("b", b"1234")
+        assert cache.get("a") is not None
+        cache.put("c", b"1234")
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.total_bytes == 8
+
+    def test_counts_compressed_variants_in_byte_budget(self):
+        cache = SnapshotCache(ttl_seconds=10, max_bytes=2500)
+        cache.put("a", os.urandom(1000))
+        snapshot = cache.put("b", os.urandom(1000))
+
+        # 圧縮しにくいボディのため、圧縮済みボディでほぼ倍になる
+        snapshot.encoded("gzip")
+
+        assert cache.get("a") is None
+        assert cache.get("b") is snapshot
+        assert cache.total_bytes == snapshot.size > 2000
+
+    def test_does_not_store_body_over_byte_budget(self):
+        cache = SnapshotCache(ttl_seconds=10, max_bytes=10)
+        cache.put("a", b"1234")
+
+        snapshot = cache.put("b", b"x" * 11)
+
+        assert snapshot.body == b"x" * 11
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
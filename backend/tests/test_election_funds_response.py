@@ -0,0 +1,106 @@
+"""仕訳変換ユーティリティのテスト"""
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from app.core.responses import PydanticJSONResponse
+from app.schemas.election_funds import ElectionFundsDataItem
+from app.schemas.political_funds import PoliticalFundsDataItem
+from app.utils.election_funds_response import build_election_funds_data_item
+from app.utils.political_funds_response import build_political_funds_data_item
+
+
+def _journal_row(**overrides):
+    row = {
+        "id": str(uuid4()),
+        "ledger_id": str(uuid4()),
+        "journal_source_id": str(uuid4()),
+        "date": "2026-01-29",
+        "description": "車上運動員報酬",
+        "amount": 30605,
+        "contact_id": None,
+        "account_code": "EXP_PERSONNEL_ELEC",
+        "classification": "pre-campaign",
+        "non_monetary_basis": None,
+        "note": "備考",
+        "public_expense_amount": 0,
+        "content_hash": "hash",
+        "synced_at": "2026-01-30T00:00:00+00:00",
+        "created_at": "2026-01-30T00:00:00+00:00",
+        "is_test": False,
+    }
+    row.update(overrides)
+    return row
+
+
+class TestBuildElectionFundsDataItem:
+    """選挙資金データ変換（高速パス）のテスト"""
+
+    def test_matches_validated_schema_output(self):
+        row = _journal_row()
+        item = build_election_funds_data_item(row, {})
+
+        validated = ElectionFundsDataItem.model_validate(item)
+        assert item == validated.model_dump(mode="json", by_alias=True)
+        assert item["category"] == "personnel"
+        assert item["category_name"] == "人件費"
+        assert item["type"] == "立候補準備"
+        assert item["public_expense_amount"] is None
+
+    def test_prefers_account_code_master_name(self):
+        row = _journal_row(public_expense_amount=500)
+        item = build_election_funds_data_item(
+            row, {"EXP_PERSONNEL_ELEC": "人件費（マスタ）"}
+        )
+
+        assert item["category_name"] == "人件費（マスタ）"
+        assert item["public_expense_amount"] == 500
+
+
+class TestBuildPoliticalFundsDataItem:
+    """政治資金データ変換（高速パス）のテスト"""
+
+    def test_matches_validated_schema_output(self):
+        row = _journal_row(account_code="REV_DONATION_INDIVIDUAL_ELEC")
+        item = build_political_funds_data_item(row, {})
+
+        validated = PoliticalFundsDataItem.model_validate(item)
+        assert item == validated.model_dump(mode="json", by_alias=True)
+        assert item["category"] == "donation"
+        assert item["type"] == "政治活動"
+
+
+class TestPydanticJSONResponse:
+    """モデル直列化レスポンスのテスト"""
+
+    def test_renders_constructed_model_with_dict_items_by_alias(self):
+        item = build_election_funds_data_item(_journal_row(), {})
+        validated = ElectionFundsDataItem.model_validate(item)
+
+        response = PydanticJSONResponse(validated)
+
+        assert response.body == PydanticJSONResponse(item).body
+        assert b'"id":' in response.body
+        assert b'"data_id"' not in response.body
+
+    def test_matches_stdlib_json_for_jsonable_content(self):
+        content = {"name": "候補者A", "amount": 1, "note": None, "items": [1, "二"]}
+
+        assert PydanticJSONResponse(content).body == JSONResponse(content).body
+
+    def test_matches_pydantic_json_for_datetimes_and_uuids(self):
+        class Sample(BaseModel):
+            id: object
+            generated_at: datetime
+            synced_at: datetime
+
+        sample = Sample(
+            id=uuid4(),
+            generated_at=datetime(2026, 1, 30, 12, 0, 0, 123456),
+            synced_at=datetime(2026, 1, 30, tzinfo=timezone.utc),
+        )
+
+        assert PydanticJSONResponse(sample).body == sample.model_dump_json().encode()
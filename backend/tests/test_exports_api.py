@@ -0,0 +1,277 @@
+"""一括エクスポートAPIのテスト"""
+
+import csv
+import io
+import json
+import threading
+from datetime import date
+from unittest.mock import MagicMock
+from uuid import UUID
+
+import pyarrow as pa
+import pyarrow.ipc
+import pyarrow.parquet as pq
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+
+from app.database.supabase import get_supabase_client_dep
+from app.routers import exports
+from app.utils.journal_export import EXPORT_COLUMNS
+from app.utils.master_data import clear_master_data_cache
+
+ELECTION_ID = UUID("11111111-1111-1111-1111-111111111111")
+POLITICIAN_ID = UUID("aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa")
+ORGANIZATION_ID = UUID("bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbbbb")
+ELECTION_LEDGER_ID = UUID("cccccccc-cccc-cccc-cccc-cccccccccccc")
+POLITICAL_LEDGER_ID = UUID("dddddddd-dddd-dddd-dddd-dddddddddddd")
+
+LEDGERS = [
+    {
+        "id": str(ELECTION_LEDGER_ID),
+        "ledger_type": "election_fund",
+        "fiscal_year": 2026,
+        "politician_elections": {
+            "election_id": str(ELECTION_ID),
+            "politician_id": str(POLITICIAN_ID),
+            "elections": {"type": "HR"},
+        },
+        "politician_organizations": None,
+    },
+    {
+        "id": str(POLITICAL_LEDGER_ID),
+        "ledger_type": "political_fund",
+        "fiscal_year": 2025,
+        "politician_elections": None,
+        "politician_organizations": {
+            "politician_id": str(POLITICIAN_ID),
+            "organization_id": str(ORGANIZATION_ID),
+        },
+    },
+]
+
+JOURNALS = [
+    {
+        "id": "00000000-0000-0000-0000-000000000001",
+        "ledger_id": str(ELECTION_LEDGER_ID),
+        "date": "2026-01-29",
+        "description": "ポスター印刷",
+        "amount": 300,
+        "account_code": "EXP_PRINTING_ELEC",
+        "classification": "pre-campaign",
+        "non_monetary_basis": None,
+        "note": "備考, カンマ入り",
+        "public_expense_amount": 100,
+    },
+    {
+        "id": "00000000-0000-0000-0000-000000000002",
+        "ledger_id": str(POLITICAL_LEDGER_ID),
+        "date": "2025-04-01",
+        "description": "個人からの寄附",
+        "amount": 5000,
+        "account_code": "REV_DONATION_INDIVIDUAL",
+        "classification": None,
+        "non_monetary_basis": None,
+        "note": None,
+        "public_expense_amount": 0,
+    },
+]
+
+
+class _RecordingQuery:
+    """呼び出されたフィルタを記録するクエリビルダーのモック"""
+
+    def __init__(self, data, calls: list):
+        self._data = data
+        self._calls = calls
+
+    def __getattr__(self, name):
+        def chained(*args, **_kwargs):
+            self._calls.append((name, args))
+            return self
+
+        return chained
+
+    def execute(self):
+        response = MagicMock()
+        response.data = self._data
+        return response
+
+
+def _export_supabase():
+    mock_supabase = MagicMock()
+    calls: dict[str, list] = {}
+    table_data = {
+        "public_ledgers": LEDGERS,
+        "public_journals": JOURNALS,
+        "account_codes": [{"code": "EXP_PRINTING_ELEC", "name": "印刷費（マスタ）"}],
+        "election_types": [{"code": "HR", "name": "衆議院（マスタ）"}],
+    }
+
+    def table_side_effect(name):
+        return _RecordingQuery(table_data[name], calls.setdefault(name, []))
+
+    mock_supabase.table.side_effect = table_side_effect
+    return mock_supabase, calls
+
+
+def _create_test_app(mock_supabase: MagicMock) -> FastAPI:
+    test_app = FastAPI()
+    test_app.include_router(exports.router, prefix="/api/v1")
+    test_app.dependency_overrides[get_supabase_client_dep] = lambda: mock_supabase
+    return test_app
+
+
+@pytest.fixture(autouse=True)
+def _clear_master_data_cache():
+    clear_master_data_cache()
+    yield
+    clear_master_data_cache()
+
+
+class TestJournalExportAPI:
+    """仕訳一括エクスポートAPIのテスト"""
+
+    def test_exports_ndjson_joined_with_master_data(self):
+        mock_supabase, _ = _export_supabase()
+
+        client = TestClient(_create_test_app(mock_supabase))
+        response = client.get("/api/v1/exports/journals")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = response.content.decode("utf-8").splitlines()
+        election_row, political_row = (json.loads(line) for line in lines)
+        assert list(election_row) == list(EXPORT_COLUMNS)
+        assert election_row["election_id"] == str(ELECTION_ID)
+        assert election_row["election_type_name"] == "衆議院（マスタ）"
+        assert election_row["category_name"] == "印刷費（マスタ）"
+        assert election_row["type"] == "立候補準備"
+        assert election_row["public_expense_amount"] == 100
+        assert political_row["organization_id"] == str(ORGANIZATION_ID)
+        assert political_row["election_type_name"] is None
+        assert political_row["type"] == "政治活動"
+        assert political_row["public_expense_amount"] is None
+
+    def test_exports_csv_with_header(self):
+        mock_supabase, _ = _export_supabase()
+
+        client = TestClient(_create_test_app(mock_supabase))
+        response = client.get("/api/v1/exports/journals", params={"format": "csv"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "text/csv; charset=utf-8"
+        assert 'filename="journals.csv"' in response.headers["content-disposition"]
+        rows = list(csv.reader(io.StringIO(response.content.decode("utf-8"))))
+        assert tuple(rows[0]) == EXPORT_COLUMNS
+        assert len(rows) == 3
+        record = dict(zip(rows[0], rows[1]))
+        assert record["note"] == "備考, カンマ入り"
+        assert record["non_monetary_basis"] == ""
+
+    def test_applies_filters_to_ledger_query(self):
+        mock_supabase, calls = _export_supabase()
+
+        client = TestClient(_create_test_app(mock_supabase))
+        response = client.get(
+            "/api/v1/exports/journals",
+            params={
+                "election_id": str(ELECTION_ID),
+                "fiscal_year": 2026,
+                "ledger_type": "election_fund",
+            },
+        )
+
+        assert response.status_code == 200
+        ledger_calls = calls["public_ledgers"]
+        select_args = next(args for name, args in ledger_calls if name == "select")
+        assert "politician_election_id!inner" in select_args[0]
+        assert ("eq", ("politician_elections.election_id", str(ELECTION_ID))) in (
+            ledger_calls
+        )
+        assert ("eq", ("fiscal_year", 2026)) in ledger_calls
+        assert ("eq", ("ledger_type", "election_fund")) in ledger_calls
+
+    def test_caches_master_data_between_requests(self):
+        mock_supabase, _ = _export_supabase()
+
+        client = TestClient(_create_test_app(mock_supabase))
+        client.get("/api/v1/exports/journals")
+        client.get("/api/v1/exports/journals")
+
+        queried_tables = [call.args[0] for call in mock_supabase.table.call_args_list]
+        assert queried_tables.count("account_codes") == 1
+        assert queried_tables.count("election_types") == 1
+        assert queried_tables.count("public_journals") == 2
+
+
+class TestColumnarJournalExportAPI:
+    """列指向形式の仕訳一括エクスポートAPIのテスト"""
+
+    def test_exports_typed_parquet(self):
+        mock_supabase, _ = _export_supabase()
+
+        client = TestClient(_create_test_app(mock_supabase))
+        response = client.get("/api/v1/exports/journals.parquet")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/vnd.apache.parquet"
+        table = pq.read_table(io.BytesIO(response.content))
+        assert tuple(table.column_names) == EXPORT_COLUMNS
+        assert table.schema.field("journal_id").type == pa.uuid()
+        assert table.schema.field("date").type == pa.date32()
+        assert pa.types.is_dictionary(table.schema.field("category_name").type)
+        assert table.column("date").to_pylist() == [date(2026, 1, 29), date(2025, 4, 1)]
+        assert table.column("category_name")[0].as_py() == "印刷費（マスタ）"
+        assert table.column("election_id").to_pylist() == [ELECTION_ID, None]
+        assert table.column("public_expense_amount").to_pylist() == [100, None]
+
+    def test_arrow_stream_matches_parquet(self):
+        mock_supabase, _ = _export_supabase()
+
+        client = TestClient(_create_test_app(mock_supabase))
+        parquet_response = client.get("/api/v1/exports/journals.parquet")
+        arrow_response = client.get("/api/v1/exports/journals.arrow")
+
+        assert arrow_response.status_code == 200
+        assert (
+            arrow_response.headers["content-type"]
+            == "application/vnd.apache.arrow.stream"
+        )
+        arrow_table = pa.ipc.open_stream(arrow_response.content).read_all()
+        parquet_table = pq.read_table(io.BytesIO(parquet_response.content))
+        assert arrow_table.equals(parquet_table)
+
+
+class TestExportThreading:
+    """一括エクスポートのブロッキング処理の実行スレッドのテスト"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "/api/v1/exports/journals",
+            "/api/v1/exports/journals.parquet",
+            "/api/v1/exports/journals.arrow",
+        ],
+    )
+    async def test_fetches_ledgers_outside_event_loop(self, path):
+        mock_supabase, _ = _export_supabase()
+        threads = []
+        table = mock_supabase.table.side_effect
+
+        def recording_table(name):
+            threads.append(threading.get_ident())
+            return table(name)
+
+        mock_supabase.table.side_effect = recording_table
+        async with AsyncClient(
+            transport=ASGITransport(app=_create_test_app(mock_supabase)),
+            base_url="http://testserver",
+        ) as client:
+            response = await client.get(path)
+
+        assert response.status_code == 200
+        assert threads
+        assert threading.get_ident() not in threads
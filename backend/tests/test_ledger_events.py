@@ -0,0 +1,204 @@
+"""台帳更新イベント（SSE）のテスト"""
+
+import asyncio
+from unittest.mock import MagicMock, call
+
+import orjson
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.core.events import Broadcaster, LedgerUpdateEvent, ledger_events
+from app.database.supabase import get_admin_supabase_client_dep
+from app.routers import sync
+from app.utils.ledger_events import iter_ledger_event_stream, publish_ledger_updates
+
+LEDGER_ID = "cccccccc-cccc-cccc-cccc-cccccccccccc"
+ELECTION_ID = "11111111-1111-1111-1111-111111111111"
+
+
+def _event(ledger_id=LEDGER_ID, election_id=ELECTION_ID, total_expense=300):
+    return LedgerUpdateEvent(
+        ledger_id=ledger_id,
+        ledger_type="election_fund",
+        election_id=election_id,
+        total_income=0,
+        total_expense=total_expense,
+        journal_count=1,
+        source="journals",
+    )
+
+
+def _query(data):
+    query = MagicMock()
+    for method_name in ("select", "eq", "in_", "maybe_single", "upsert"):
+        setattr(query, method_name, MagicMock(return_value=query))
+    query.execute.return_value = MagicMock(data=data)
+    return query
+
+
+def _ledger_row():
+    return {
+        "id": LEDGER_ID,
+        "ledger_type": "election_fund",
+        "total_income": 1000,
+        "total_expense": 300,
+        "journal_count": 2,
+        "politician_elections": {"election_id": ELECTION_ID},
+    }
+
+
+def _parse_sse(chunk: bytes) -> tuple[str, dict]:
+    event_line, data_line = chunk.decode().strip().split("\n")
+    return event_line.removeprefix("event: "), orjson.loads(data_line[6:])
+
+
+class TestBroadcaster:
+    """Broadcaster のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_delivers_event_to_all_subscribers(self):
+        broadcaster = Broadcaster()
+        async with broadcaster.subscribe() as first:
+            async with broadcaster.subscribe() as second:
+                broadcaster.publish(_event())
+
+                assert await first.get() == _event()
+                assert await second.get() == _event()
+
+        assert not broadcaster.has_subscribers
+
+    @pytest.mark.asyncio
+    async def test_closes_overflowed_subscriber_without_blocking_others(self):
+        broadcaster = Broadcaster(queue_size=2)
+        async with broadcaster.subscribe() as slow:
+            async with broadcaster.subscribe() as fast:
+                for total_expense in range(3):
+                    broadcaster.publish(_event(total_expense=total_expense))
+                    assert (await fast.get()).total_expense == total_expense
+
+                assert slow.overflowed
+                assert await slow.get() is None
+
+                # 溢れた購読者には以降配信しない
+                broadcaster.publish(_event())
+                assert await fast.get() == _event()
+
+
+class TestLedgerEventStream:
+    """SSE 出力のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_streams_events_filtered_by_election(self):
+        broadcaster = Broadcaster()
+        stream = iter_ledger_event_stream(ELECTION_ID, broadcaster=broadcaster)
+
+        assert await anext(stream) == b"retry: 3000\n\n"
+        broadcaster.publish(_event(election_id="other"))
+        broadcaster.publish(_event())
+
+        event_name, data = _parse_sse(await anext(stream))
+        assert event_name == "ledger_updated"
+        assert data["ledger_id"] == LEDGER_ID
+        assert data["election_id"] == ELECTION_ID
+        await stream.aclose()
+        assert not broadcaster.has_subscribers
+
+    @pytest.mark.asyncio
+    async def test_sends_keepalive_and_reset_on_overflow(self):
+        broadcaster = Broadcaster(queue_size=1)
+        stream = iter_ledger_event_stream(
+            broadcaster=broadcaster, keepalive_seconds=0.01
+        )
+
+        await anext(stream)
+        assert await anext(stream) == b": keepalive\n\n"
+
+        broadcaster.publish(_event())
+        broadcaster.publish(_event())
+
+        event_name, data = _parse_sse(await anext(stream))
+        assert event_name == "reset"
+        assert data == {"reason": "overflow"}
+        with pytest.raises(StopAsyncIteration):
+            await anext(stream)
+
+
+class TestPublishLedgerUpdates:
+    """同期APIからのイベント発行のテスト"""
+
+    def test_skips_query_without_subscribers(self):
+        mock_supabase = MagicMock()
+
+        publish_ledger_updates(
+            mock_supabase, [LEDGER_ID], source="ledger", broadcaster=Broadcaster()
+        )
+
+        mock_supabase.table.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_skips_query_when_only_idle_subscribers(self):
+        broadcaster = Broadcaster()
+        mock_supabase = MagicMock()
+        wants_events = False
+
+        async with broadcaster.subscribe(wants_events=lambda: wants_events):
+            publish_ledger_updates(
+                mock_supabase, [LEDGER_ID], source="ledger", broadcaster=broadcaster
+            )
+            mock_supabase.table.assert_not_called()
+
+            wants_events = True
+            assert broadcaster.has_subscribers
+
+    @pytest.mark.asyncio
+    async def test_sync_journals_publishes_ledger_totals(self):
+        # ledger_source_id からの台帳IDの解決と集計値の読み出しに使う
+        ledger_query = _query([{**_ledger_row(), "ledger_source_id": "ledger-1"}])
+        mock_supabase = MagicMock()
+        mock_supabase.table.side_effect = lambda name: (
+            ledger_query if name == "public_ledgers" else _query([])
+        )
+        test_app = FastAPI()
+        test_app.include_router(sync.router, prefix="/api/v1")
+        test_app.dependency_overrides[get_admin_supabase_client_dep] = (
+            lambda: mock_supabase
+        )
+        body = {
+            "journals": [
+                {
+                    "journal_source_id": f"journal-{index}",
+                    "ledger_source_id": "ledger-1",
+                    "amount": 300,
+                    "account_code": "EXP_PRINTING_ELEC",
+                    "content_hash": "hash",
+                }
+                for index in range(2)
+            ]
+        }
+
+        async with ledger_events.subscribe() as subscription:
+            async with AsyncClient(
+                transport=ASGITransport(app=test_app),
+                base_url="http://testserver",
+            ) as client:
+                response = await client.post("/api/v1/sync/journals", json=body)
+
+            assert response.status_code == 200
+            assert response.json()["data"]["created"] == 2
+            event = await asyncio.wait_for(subscription.get(), timeout=1)
+
+        assert event == LedgerUpdateEvent(
+            ledger_id=LEDGER_ID,
+            ledger_type="election_fund",
+            election_id=ELECTION_ID,
+            total_income=1000,
+            total_expense=300,
+            journal_count=2,
+            source="journals",
+        )
+        # 同じ台帳の仕訳が複数あっても台帳の解決・集計値の読み出しは各1回
+        assert ledger_query.in_.call_args_list == [
+            call("ledger_source_id", ["ledger-1"]),
+            call("id", [LEDGER_ID]),
+        ]
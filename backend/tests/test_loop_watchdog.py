@@ -0,0 +1,56 @@
+"""イベントループのブロック検出のテスト"""
+
+import asyncio
+import logging
+import time
+
+import pytest
+
+from app.core.loop_watchdog import LoopWatchdog
+from app.core.metrics import registry
+
+
+def _sample(name: str) -> float:
+    return registry.get_sample_value(name, {}) or 0.0
+
+
+def _blocking_supabase_call():
+    time.sleep(0.3)
+
+
+class TestLoopWatchdog:
+    """遅延の計測とブロック時のスタック出力のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_logs_stack_of_blocking_call(self, caplog):
+        blocks_before = _sample("event_loop_blocks_total")
+        lag_sum_before = _sample("event_loop_lag_seconds_sum")
+        watchdog = LoopWatchdog(threshold_seconds=0.1, interval_seconds=0.02)
+        watchdog.start()
+        try:
+            await asyncio.sleep(0.05)
+            with caplog.at_level(logging.WARNING, logger="app.core.loop_watchdog"):
+                _blocking_supabase_call()
+                await asyncio.sleep(0.05)
+        finally:
+            await watchdog.stop()
+
+        assert _sample("event_loop_blocks_total") == blocks_before + 1
+        assert _sample("event_loop_lag_seconds_sum") - lag_sum_before >= 0.25
+        [record] = caplog.records
+        assert "_blocking_supabase_call" in record.getMessage()
+        assert record.blocked_seconds > 0.1
+
+    @pytest.mark.asyncio
+    async def test_records_lag_without_warning_when_not_blocked(self, caplog):
+        count_before = _sample("event_loop_lag_seconds_count")
+        watchdog = LoopWatchdog(threshold_seconds=0.1, interval_seconds=0.01)
+        watchdog.start()
+        try:
+            with caplog.at_level(logging.WARNING, logger="app.core.loop_watchdog"):
+                await asyncio.sleep(0.1)
+        finally:
+            await watchdog.stop()
+
+        assert _sample("event_loop_lag_seconds_count") > count_before
+        assert caplog.records == []
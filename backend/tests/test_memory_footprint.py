@@ -0,0 +1,146 @@
+"""大きなレスポンスのメモリ使用量の回帰テスト
+
+仕訳 10,000 件の台帳について、読み取りエンドポイントと同期ペイロードの
+解析のピークメモリ（tracemalloc）を仕訳1件あたりで測り、上限を超えたら
+失敗させる。上限は現状の計測値の約 1.3 倍。ストリーミング出力やコンパクトな
+表現への変更で下がった場合は、上限も下げて値を維持する。
+
+データはインメモリの Supabase クライアントに載せるため、計測値には
+クライアントが返す行の辞書（PostgREST の応答を展開したものに相当）も含む。
+"""
+
+import json
+import tracemalloc
+from collections.abc import Callable
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.snapshot_cache import snapshot_cache
+from app.database.memory import InMemorySupabase
+from app.database.supabase import get_supabase_client_dep
+from app.main import app
+from app.routers.sync import SyncJournalsRequest
+from benchmarks.synthetic import add_political_fund_ledger, build_synthetic_election
+
+JOURNAL_COUNT = 10_000
+
+# 仕訳1件あたりのピークメモリの上限（バイト）
+MAX_BYTES_PER_JOURNAL = {
+    "election_journals": 1000,
+    "election_journals_stream": 700,
+    "ledger_journals": 1000,
+    "election_funds": 1000,
+    "election_bundle": 1000,
+    "political_funds": 950,
+    "election_candidates": 300,
+    "sync_journals_payload": 2800,
+}
+
+
+def _peak_bytes(func: Callable[[], object]) -> int:
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        result = func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak - baseline
+
+
+@pytest.fixture(scope="module")
+def dataset():
+    dataset = build_synthetic_election(JOURNAL_COUNT, other_journal_count=0)
+    political_ledger_id = add_political_fund_ledger(dataset.tables, JOURNAL_COUNT)
+    politician_id = next(
+        pe["politician_id"]
+        for pe in dataset.tables["politician_elections"]
+        if pe["id"] == str(dataset.ledger.politician_election_id)
+    )
+    return dataset, political_ledger_id, politician_id
+
+
+@pytest.fixture
+def client(dataset, monkeypatch):
+    supabase = InMemorySupabase(dataset[0].tables)
+    app.dependency_overrides[get_supabase_client_dep] = lambda: supabase
+    # キャッシュ済みのボディを返さず、毎回組み立てる
+    monkeypatch.setattr(snapshot_cache, "ttl_seconds", 0)
+    yield TestClient(app, headers={"Accept-Encoding": "identity"})
+    app.dependency_overrides.clear()
+
+
+def _paths(dataset) -> dict[str, str]:
+    election, political_ledger_id, politician_id = dataset
+    polimoney = "/api/v1/polimoney"
+    election_journals = (
+        f"{polimoney}/elections/{election.election_id}/journals"
+        f"?politician_id={politician_id}"
+    )
+    return {
+        "election_journals": election_journals,
+        "election_journals_stream": f"{election_journals}&stream=true",
+        "ledger_journals": f"{polimoney}/ledgers/{election.ledger_id}/journals",
+        "election_funds": f"/api/v1/election-funds/{election.ledger_id}",
+        "election_bundle": f"{polimoney}/elections/{election.election_id}/bundle",
+        "political_funds": f"/api/v1/political-funds/{political_ledger_id}",
+        "election_candidates": (
+            f"{polimoney}/elections/{election.election_id}/candidates"
+        ),
+    }
+
+
+class TestMemoryFootprint:
+    """仕訳1件あたりのピークメモリのテスト"""
+
+    @pytest.mark.parametrize(
+        "name",
+        [name for name in MAX_BYTES_PER_JOURNAL if name != "sync_journals_payload"],
+    )
+    def test_read_endpoint_peak_per_journal(self, client, dataset, name):
+        path = _paths(dataset)[name]
+        # クライアント側の索引・フィルター結果を先に作り、計測から外す
+        assert client.get(path).status_code == 200
+
+        peak = _peak_bytes(lambda: client.get(path))
+
+        per_journal = peak / JOURNAL_COUNT
+        assert per_journal <= MAX_BYTES_PER_JOURNAL[name], (
+            f"{name}: 仕訳1件あたり {per_journal:.0f} バイト"
+            f"（上限 {MAX_BYTES_PER_JOURNAL[name]}）"
+        )
+
+    def test_sync_journals_payload_peak_per_journal(self, dataset):
+        election = dataset[0]
+        body = json.dumps(
+            {
+                "journals": [
+                    {
+                        "journal_source_id": row["journal_source_id"],
+                        "ledger_source_id": str(election.ledger.ledger_source_id),
+                        "date": row["date"],
+                        "description": row["description"],
+                        "amount": row["amount"],
+                        "account_code": row["account_code"],
+                        "classification": row["classification"],
+                        "public_expense_amount": row["public_expense_amount"],
+                        "content_hash": row["content_hash"],
+                    }
+                    for row in election.journal_rows
+                ]
+            },
+            ensure_ascii=False,
+        ).encode()
+
+        # FastAPI と同じく JSON を展開してからモデルを検証する
+        peak = _peak_bytes(lambda: SyncJournalsRequest.model_validate(json.loads(body)))
+
+        per_journal = peak / JOURNAL_COUNT
+        limit = MAX_BYTES_PER_JOURNAL["sync_journals_payload"]
+        assert per_journal <= limit, (
+            f"sync_journals_payload: 仕訳1件あたり {per_journal:.0f} バイト"
+            f"（上限 {limit}）"
+        )
@@ -0,0 +1,296 @@
+"""インメモリの Supabase クライアントのテスト"""
+
+import pytest
+from postgrest.exceptions import APIError
+
+from app.database.memory import InMemorySupabase
+
+
+@pytest.fixture
+def supabase():
+    return InMemorySupabase(
+        {
+            "districts": [{"id": "d1", "name": "第1区"}],
+            "elections": [
+                {"id": "e1", "name": "A選挙", "district_id": "d1"},
+                {"id": "e2", "name": "B選挙", "district_id": None},
+            ],
+            "politician_elections": [
+                {"id": "pe1", "election_id": "e1"},
+                {"id": "pe2", "election_id": "e2"},
+            ],
+            "public_journals": [
+                {"id": "j1", "ledger_id": "l1", "date": "2026-01-02", "amount": 300},
+                {"id": "j2", "ledger_id": "l1", "date": None, "amount": 100},
+                {"id": "j3", "ledger_id": "l1", "date": "2026-01-01", "amount": 200},
+                {"id": "j4", "ledger_id": "l2", "date": "2026-01-01", "amount": 400},
+            ],
+        }
+    )
+
+
+class TestInMemorySupabase:
+    """PostgREST の構文に沿ったクエリ結果のテスト"""
+
+    def test_filters_orders_and_projects_columns(self, supabase):
+        response = (
+            supabase.table("public_journals")
+            .select("id, amount")
+            .eq("ledger_id", "l1")
+            .gte("amount", 150)
+            .order("amount", desc=True)
+            .execute()
+        )
+
+        assert response.data == [
+            {"id": "j1", "amount": 300},
+            {"id": "j3", "amount": 200},
+        ]
+
+    def test_orders_nulls_like_postgres_and_pages_with_range(self, supabase):
+        query = supabase.table("public_journals").select("id").eq("ledger_id", "l1")
+
+        ascending = query.order("date").order("id").range(0, 1).execute()
+        descending = (
+            supabase.table("public_journals")
+            .select("id")
+            .eq("ledger_id", "l1")
+            .order("date", desc=True)
+            .execute()
+        )
+
+        assert [row["id"] for row in ascending.data] == ["j3", "j1"]
+        assert [row["id"] for row in descending.data] == ["j2", "j1", "j3"]
+
+    def test_embeds_many_to_one_relations(self, supabase):
+        response = (
+            supabase.table("politician_elections")
+            .select("id, elections:election_id(name, district:districts(name))")
+            .in_("id", ["pe1", "pe2"])
+            .order("id")
+            .execute()
+        )
+
+        assert response.data == [
+            {
+                "id": "pe1",
+                "elections": {"name": "A選挙", "district": {"name": "第1区"}},
+            },
+            {"id": "pe2", "elections": {"name": "B選挙", "district": None}},
+        ]
+
+    def test_inner_embed_filter_drops_rows(self, supabase):
+        response = (
+            supabase.table("politician_elections")
+            .select("id, elections!inner(id)")
+            .eq("elections.name", "B選挙")
+            .execute()
+        )
+
+        assert response.data == [{"id": "pe2", "elections": {"id": "e2"}}]
+
+    def test_single_and_maybe_single(self, supabase):
+        found = supabase.table("elections").select("name").eq("id", "e1")
+        missing = supabase.table("elections").select("name").eq("id", "none")
+
+        assert found.single().execute().data == {"name": "A選挙"}
+        # postgrest と同じく、該当行が無い場合はレスポンスではなく None を返す
+        assert missing.maybe_single().execute() is None
+        with pytest.raises(APIError):
+            missing.single().execute()
+        with pytest.raises(APIError):
+            supabase.table("elections").select("id").maybe_single().execute()
+
+    def test_writes_are_visible_to_cached_queries(self, supabase):
+        def journal_ids(ledger_id):
+            return [
+                row["id"]
+                for row in supabase.table("public_journals")
+                .select("id")
+                .eq("ledger_id", ledger_id)
+                .order("id")
+                .execute()
+                .data
+            ]
+
+        assert journal_ids("l2") == ["j4"]
+
+        inserted = (
+            supabase.table("public_journals")
+            .insert(
+                {
+                    "ledger_id": "l2",
+                    "journal_source_id": "s5",
+                    "amount": 500,
+                    "content_hash": "h5",
+                    "synced_at": "2026-01-30T00:00:00+00:00",
+                }
+            )
+            .execute()
+        )
+        updated = (
+            supabase.table("public_journals")
+            .update({"ledger_id": "l2"})
+            .eq("id", "j1")
+            .execute()
+        )
+
+        new_id = inserted.data[0]["id"]
+        assert updated.data[0]["ledger_id"] == "l2"
+        assert journal_ids("l2") == sorted(["j1", "j4", new_id])
+        assert journal_ids("l1") == ["j2", "j3"]
+
+
+class TestInMemorySupabaseSchema:
+    """db/schema-normalized.sql に合わせた既定値・制約・書き込みのテスト"""
+
+    @staticmethod
+    def _journal(journal_source_id, **values):
+        return {
+            "ledger_id": "l1",
+            "journal_source_id": journal_source_id,
+            "amount": 100,
+            "content_hash": "hash",
+            "synced_at": "2026-01-30T00:00:00+00:00",
+            **values,
+        }
+
+    def test_insert_applies_defaults_and_checks_not_null(self, supabase):
+        inserted = (
+            supabase.table("public_journals").insert(self._journal("s1")).execute()
+        )
+
+        row = inserted.data[0]
+        assert row["is_test"] is False
+        assert row["public_expense_amount"] is None
+        assert row["id"] and row["created_at"]
+        with pytest.raises(APIError) as error:
+            supabase.table("public_journals").insert({"ledger_id": "l1"}).execute()
+        assert error.value.code == "23502"
+
+    def test_rejects_unknown_columns(self, supabase):
+        with pytest.raises(APIError) as select_error:
+            supabase.table("public_journals").select("id, politician_id").execute()
+        with pytest.raises(APIError) as filter_error:
+            supabase.table("elections").select("id").eq("ledger_id", "l1").execute()
+        with pytest.raises(APIError) as write_error:
+            supabase.table("public_journals").update({"total": 1}).eq(
+                "id", "j1"
+            ).execute()
+        with pytest.raises(ValueError):
+            InMemorySupabase({"elections": [{"id": "e1", "ledger_id": "l1"}]})
+
+        assert select_error.value.code == "42703"
+        assert filter_error.value.code == "42703"
+        assert write_error.value.code == "PGRST204"
+
+    def test_unique_violation_rolls_back_the_statement(self, supabase):
+        supabase.table("public_journals").insert(self._journal("s1")).execute()
+
+        with pytest.raises(APIError) as error:
+            supabase.table("public_journals").insert(
+                [self._journal("s2"), self._journal("s1")]
+            ).execute()
+
+        assert error.value.code == "23505"
+        assert (
+            supabase.table("public_journals")
+            .select("id")
+            .eq("journal_source_id", "s2")
+            .execute()
+            .data
+            == []
+        )
+
+    def test_upsert_updates_on_conflict_and_inserts_new_rows(self, supabase):
+        supabase.table("public_journals").insert(self._journal("s1")).execute()
+
+        upserted = (
+            supabase.table("public_journals")
+            .upsert(
+                [self._journal("s1", amount=150), self._journal("s2")],
+                on_conflict="journal_source_id",
+            )
+            .execute()
+        )
+        ignored = (
+            supabase.table("public_journals")
+            .upsert(
+                self._journal("s1", amount=999),
+                on_conflict="journal_source_id",
+                ignore_duplicates=True,
+            )
+            .execute()
+        )
+
+        assert [row["amount"] for row in upserted.data] == [150, 100]
+        assert ignored.data == []
+        amounts = (
+            supabase.table("public_journals")
+            .select("journal_source_id, amount")
+            .in_("journal_source_id", ["s1", "s2"])
+            .order("journal_source_id")
+            .execute()
+            .data
+        )
+        assert amounts == [
+            {"journal_source_id": "s1", "amount": 150},
+            {"journal_source_id": "s2", "amount": 100},
+        ]
+        with pytest.raises(APIError) as error:
+            supabase.table("public_journals").upsert(
+                self._journal("s3"), on_conflict="amount"
+            ).execute()
+        assert error.value.code == "42P10"
+
+    def test_count_exact_ignores_range(self, supabase):
+        response = (
+            supabase.table("public_journals")
+            .select("id", count="exact")
+            .eq("ledger_id", "l1")
+            .order("id")
+            .range(0, 0)
+            .execute()
+        )
+        head = (
+            supabase.table("public_journals")
+            .select("id", count="exact", head=True)
+            .execute()
+        )
+
+        assert response.data == [{"id": "j1"}]
+        assert response.count == 3
+        assert head.data == []
+        assert head.count == 4
+
+    def test_or_filter_with_nested_and_quoted_values(self, supabase):
+        response = (
+            supabase.table("public_journals")
+            .select("id")
+            .or_('date.gt."2026-01-01",and(date.eq."2026-01-01",id.gt.j3)')
+            .order("id")
+            .execute()
+        )
+        in_response = (
+            supabase.table("public_journals")
+            .select("id")
+            .or_("amount.in.(100,400),date.is.null")
+            .order("id")
+            .execute()
+        )
+
+        assert [row["id"] for row in response.data] == ["j1", "j4"]
+        assert [row["id"] for row in in_response.data] == ["j2", "j4"]
+
+    def test_delete_removes_rows_from_cached_queries(self, supabase):
+        query = supabase.table("public_journals").select("id").eq("ledger_id", "l1")
+        assert len(query.execute().data) == 3
+
+        deleted = supabase.table("public_journals").delete().eq("id", "j1").execute()
+
+        assert deleted.data[0]["id"] == "j1"
+        assert [row["id"] for row in query.execute().data] == ["j2", "j3"]
+        assert (
+            supabase.table("public_journals").select("id").eq("id", "j1").execute().data
+            == []
+        )
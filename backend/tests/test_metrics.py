@@ -0,0 +1,120 @@
+"""Prometheus メトリクスのテスト"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.metrics import UNMATCHED_ROUTE, registry
+from app.database.instrumentation import InstrumentedClient
+from app.middleware.metrics import MetricsMiddleware
+from app.routers import metrics
+
+
+def _sample(name: str, labels: dict) -> float:
+    return registry.get_sample_value(name, labels) or 0.0
+
+
+def _create_test_app() -> FastAPI:
+    test_app = FastAPI()
+    test_app.add_middleware(MetricsMiddleware)
+    test_app.include_router(metrics.router)
+
+    @test_app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"item_id": item_id, "padding": "x" * 100}
+
+    return test_app
+
+
+def _query_mock(result=None, error: Exception | None = None):
+    query = MagicMock()
+    for method_name in ("select", "insert", "eq", "order"):
+        setattr(query, method_name, MagicMock(return_value=query))
+    if error is not None:
+        query.execute.side_effect = error
+    else:
+        query.execute.return_value = result
+    return query
+
+
+class TestMetricsMiddleware:
+    """ルート別メトリクスのテスト"""
+
+    def test_records_latency_size_and_status_per_route_template(self):
+        labels = {"method": "GET", "route": "/items/{item_id}"}
+        count_before = _sample("http_request_duration_seconds_count", labels)
+        size_before = _sample("http_response_size_bytes_sum", labels)
+        status_before = _sample("http_requests_total", {**labels, "status": "200"})
+
+        client = TestClient(_create_test_app())
+        first = client.get("/items/1")
+        client.get("/items/2")
+
+        assert _sample("http_request_duration_seconds_count", labels) == (
+            count_before + 2
+        )
+        assert _sample("http_response_size_bytes_sum", labels) == (
+            size_before + 2 * len(first.content)
+        )
+        assert _sample("http_requests_total", {**labels, "status": "200"}) == (
+            status_before + 2
+        )
+        assert _sample("http_requests_in_progress", {}) == 0
+
+    def test_groups_unknown_paths_as_unmatched(self):
+        labels = {"method": "GET", "route": UNMATCHED_ROUTE, "status": "404"}
+        before = _sample("http_requests_total", labels)
+
+        TestClient(_create_test_app()).get("/missing/path")
+
+        assert _sample("http_requests_total", labels) == before + 1
+
+    def test_metrics_endpoint_exposes_prometheus_text(self):
+        client = TestClient(_create_test_app())
+        client.get("/items/1")
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "http_request_duration_seconds_bucket" in response.text
+        assert "http_requests_in_progress" in response.text
+
+
+class TestInstrumentedClient:
+    """Supabase クエリのメトリクスのテスト"""
+
+    def test_records_query_latency_by_table_and_operation(self):
+        select_labels = {"table": "public_journals", "operation": "select"}
+        insert_labels = {"table": "public_journals", "operation": "insert"}
+        select_before = _sample("supabase_query_duration_seconds_count", select_labels)
+        insert_before = _sample("supabase_query_duration_seconds_count", insert_labels)
+        query = _query_mock(result="response")
+        raw_client = MagicMock()
+        raw_client.table.return_value = query
+        client = InstrumentedClient(raw_client)
+
+        response = client.table("public_journals").select("*").eq("id", 1).execute()
+        client.table("public_journals").insert({"id": 1}).execute()
+
+        assert response == "response"
+        query.eq.assert_called_once_with("id", 1)
+        assert _sample("supabase_query_duration_seconds_count", select_labels) == (
+            select_before + 1
+        )
+        assert _sample("supabase_query_duration_seconds_count", insert_labels) == (
+            insert_before + 1
+        )
+
+    def test_counts_failed_queries(self):
+        labels = {"table": "public_ledgers", "operation": "select"}
+        before = _sample("supabase_query_errors_total", labels)
+        raw_client = MagicMock()
+        raw_client.table.return_value = _query_mock(error=RuntimeError("boom"))
+
+        with pytest.raises(RuntimeError):
+            InstrumentedClient(raw_client).table("public_ledgers").select("*").execute()
+
+        assert _sample("supabase_query_errors_total", labels) == before + 1
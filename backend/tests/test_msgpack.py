@@ -0,0 +1,181 @@
+"""MessagePack コンテントネゴシエーションのテスト"""
+
+import json
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+from uuid import UUID
+
+import msgpack
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.content_negotiation import prefers_msgpack
+from app.core.responses import PydanticJSONResponse
+from app.database.supabase import (
+    get_admin_supabase_client_dep,
+    get_supabase_client_dep,
+)
+from app.routers import political_funds, sync
+
+LEDGER_ID = UUID("cccccccc-cccc-cccc-cccc-cccccccccccc")
+
+
+def _query(data):
+    query = MagicMock()
+    for method_name in (
+        "select",
+        "eq",
+        "in_",
+        "order",
+        "range",
+        "maybe_single",
+        "insert",
+        "upsert",
+    ):
+        setattr(query, method_name, MagicMock(return_value=query))
+    query.execute.return_value = MagicMock(data=data)
+    return query
+
+
+def _political_funds_supabase():
+    table_data = {
+        "public_ledgers": {
+            "id": str(LEDGER_ID),
+            "ledger_type": "political_fund",
+            "politician_organization_id": "dddddddd-dddd-dddd-dddd-dddddddddddd",
+            "fiscal_year": 2025,
+            "total_income": 5000,
+            "total_expense": 0,
+            "journal_count": 1,
+            "ledger_source_id": "eeeeeeee-eeee-eeee-eeee-eeeeeeeeeeee",
+            "last_updated_at": "2026-01-01",
+            "first_synced_at": "2026-01-01",
+            "created_at": "2026-01-01",
+        },
+        "politician_organizations": {
+            "id": "dddddddd-dddd-dddd-dddd-dddddddddddd",
+            "politicians": {
+                "id": "aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa",
+                "name": "政治家A",
+                "name_kana": None,
+            },
+            "organizations": {
+                "id": "bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbbbb",
+                "name": "政治団体A",
+                "type": "political_party",
+            },
+        },
+        "account_codes": [],
+        "public_journals": [
+            {
+                "id": "00000000-0000-0000-0000-000000000001",
+                "ledger_id": str(LEDGER_ID),
+                "date": "2025-04-01",
+                "description": "個人からの寄附",
+                "amount": 5000,
+                "account_code": "REV_DONATION_INDIVIDUAL",
+                "non_monetary_basis": None,
+                "note": None,
+                "public_expense_amount": None,
+            }
+        ],
+    }
+    mock_supabase = MagicMock()
+    mock_supabase.table.side_effect = lambda name: _query(table_data[name])
+    return mock_supabase
+
+
+def _create_test_app(mock_supabase: MagicMock) -> FastAPI:
+    test_app = FastAPI(default_response_class=PydanticJSONResponse)
+    test_app.include_router(political_funds.router, prefix="/api/v1")
+    test_app.include_router(sync.router, prefix="/api/v1")
+    test_app.dependency_overrides[get_supabase_client_dep] = lambda: mock_supabase
+    test_app.dependency_overrides[get_admin_supabase_client_dep] = lambda: mock_supabase
+    return test_app
+
+
+class TestPrefersMsgpack:
+    """Accept ヘッダー判定のテスト"""
+
+    @pytest.mark.parametrize(
+        ("accept", "expected"),
+        [
+            (None, False),
+            ("*/*", False),
+            ("application/json", False),
+            ("application/msgpack", True),
+            ("application/x-msgpack", True),
+            ("application/msgpack, */*;q=0.8", True),
+            ("application/json, application/msgpack", False),
+            ("application/json;q=0.5, application/msgpack", True),
+            ("application/msgpack;q=0", False),
+        ],
+    )
+    def test_prefers_msgpack(self, accept, expected):
+        assert prefers_msgpack(accept) is expected
+
+
+class TestMsgpackNegotiation:
+    """MessagePack のレスポンス・リクエストボディのテスト"""
+
+    def test_read_endpoint_returns_same_structure_as_json(self):
+        client = TestClient(_create_test_app(_political_funds_supabase()))
+        url = f"/api/v1/political-funds/{LEDGER_ID}"
+        frozen_datetime = MagicMock(wraps=datetime)
+        frozen_datetime.now.return_value = datetime(2026, 2, 2, 12, 0, 0)
+        with patch("app.utils.political_funds_response.datetime", frozen_datetime):
+            json_response = client.get(url)
+            msgpack_response = client.get(
+                url, headers={"Accept": "application/msgpack"}
+            )
+
+        assert msgpack_response.status_code == 200
+        assert msgpack_response.headers["content-type"] == "application/msgpack"
+        assert "Accept" in msgpack_response.headers["vary"]
+        assert msgpack.unpackb(msgpack_response.content) == json_response.json()
+
+    def test_sync_accepts_msgpack_request_body(self):
+        mock_supabase = MagicMock()
+        mock_supabase.table.side_effect = lambda name: _query(
+            [{"id": str(LEDGER_ID), "ledger_source_id": "ledger-1"}]
+            if name == "public_ledgers"
+            else []
+        )
+        body = {
+            "journals": [
+                {
+                    "journal_source_id": "journal-1",
+                    "ledger_source_id": "ledger-1",
+                    "date": "2026-01-29",
+                    "amount": 300,
+                    "account_code": "EXP_PRINTING_ELEC",
+                    "content_hash": "hash",
+                }
+            ]
+        }
+
+        client = TestClient(_create_test_app(mock_supabase))
+        response = client.post(
+            "/api/v1/sync/journals",
+            content=msgpack.packb(body),
+            headers={
+                "Content-Type": "application/msgpack",
+                "Accept": "application/msgpack",
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/msgpack"
+        assert msgpack.unpackb(response.content)["data"]["created"] == 1
+
+    def test_rejects_malformed_msgpack_body(self):
+        client = TestClient(_create_test_app(MagicMock()))
+        response = client.post(
+            "/api/v1/sync/journals",
+            content=b"\xc1",
+            headers={"Content-Type": "application/msgpack"},
+        )
+
+        assert response.status_code == 400
+        assert json.loads(response.content)["detail"]
@@ -1,6 +1,12 @@
-"""Polimoney APIのテスト"""
+"""Polimoney APIのテスト
 
-from unittest.mock import MagicMock
+Supabase はインメモリのクライアント（app.database.memory.InMemorySupabase）に
+テーブルを載せて差し替え、フィルター・埋め込みを実際に評価させる。
+"""
+
+import threading
+from datetime import datetime
+from unittest.mock import MagicMock, patch
 from uuid import UUID, uuid4
 
 import pytest
@@ -9,9 +15,14 @@ from fastapi.responses import JSONResponse
 from fastapi.testclient import TestClient
 from httpx import ASGITransport, AsyncClient
 
+from app.core.query_stats import capture_queries
+from app.database.instrumentation import InstrumentedClient
+from app.database.memory import InMemorySupabase
 from app.database.supabase import get_supabase_client_dep
 from app.routers import polimoney
+from app.utils.change_feed import decode_cursor, encode_cursor
 from app.utils.election_funds_response import sum_public_expense_by_ledger
+from app.utils.master_data import clear_master_data_cache
 from app.utils.polimoney_response import MultipleCandidatesException
 
 ELECTION_ID = UUID("11111111-1111-1111-1111-111111111111")
@@ -20,43 +31,140 @@ POLITICIAN_ID_1 = UUID("aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa")
 POLITICIAN_ID_2 = UUID("bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbbbb")
 LEDGER_ID_1 = UUID("cccccccc-cccc-cccc-cccc-cccccccccccc")
 LEDGER_ID_2 = UUID("dddddddd-dddd-dddd-dddd-dddddddddddd")
+LEDGER_ID_3 = UUID("cdcdcdcd-cdcd-cdcd-cdcd-cdcdcdcdcdcd")
 NON_ELECTION_LEDGER_ID = UUID("eeeeeeee-eeee-eeee-eeee-eeeeeeeeeeee")
 MISSING_ELECTION_ID = UUID("ffffffff-ffff-ffff-ffff-ffffffffffff")
-
-
-def _make_execute_response(data):
-    response = MagicMock()
-    response.data = data
-    return response
-
-
-def _chainable_query(final_data):
-    query = MagicMock()
-
-    def configure(method_name):
-        def chained(*_args, **_kwargs):
-            return query
-
-        setattr(query, method_name, chained)
-
-    for method_name in (
-        "select",
-        "eq",
-        "not_",
-        "is_",
-        "in_",
-        "order",
-        "maybe_single",
-        "single",
-    ):
-        configure(method_name)
-
-    query.not_.is_ = MagicMock(return_value=query)
-    query.execute.return_value = _make_execute_response(final_data)
-    return query
-
-
-def _create_test_app(mock_supabase: MagicMock) -> FastAPI:
+PE_ID_1 = UUID("a1a1a1a1-a1a1-a1a1-a1a1-a1a1a1a1a1a1")
+PE_ID_2 = UUID("b1b1b1b1-b1b1-b1b1-b1b1-b1b1b1b1b1b1")
+PE_ID_3 = UUID("a2a2a2a2-a2a2-a2a2-a2a2-a2a2a2a2a2a2")
+DISTRICT_ID_1 = UUID("d1d1d1d1-d1d1-d1d1-d1d1-d1d1d1d1d1d1")
+DISTRICT_ID_2 = UUID("d2d2d2d2-d2d2-d2d2-d2d2-d2d2d2d2d2d2")
+
+SYNCED_AT = "2026-01-30T00:00:00+00:00"
+
+
+def _journal_row(
+    ledger_id, account_code, amount, public_expense_amount, date="2026-01-29"
+):
+    return {
+        "id": str(uuid4()),
+        "ledger_id": str(ledger_id),
+        "journal_source_id": str(uuid4()),
+        "date": date,
+        "description": "テスト摘要",
+        "amount": amount,
+        "contact_id": None,
+        "account_code": account_code,
+        "classification": "campaign",
+        "non_monetary_basis": None,
+        "note": None,
+        "public_expense_amount": public_expense_amount,
+        "content_hash": "hash",
+        "synced_at": SYNCED_AT,
+        "created_at": SYNCED_AT,
+        "is_test": False,
+    }
+
+
+def _ledger_row(ledger_id, pe_id, total_income, total_expense, journal_count):
+    return {
+        "id": str(ledger_id),
+        "ledger_type": "election_fund",
+        "politician_election_id": str(pe_id),
+        "fiscal_year": 2026,
+        "total_income": total_income,
+        "total_expense": total_expense,
+        "journal_count": journal_count,
+        "ledger_source_id": str(uuid4()),
+        "last_updated_at": SYNCED_AT,
+        "first_synced_at": SYNCED_AT,
+        "created_at": SYNCED_AT,
+    }
+
+
+def _election_tables() -> dict[str, list[dict]]:
+    """2選挙・2候補者の公開データ
+
+    ELECTION_ID（古い選挙）には候補者A（LEDGER_ID_1・仕訳2件）と
+    候補者B（LEDGER_ID_2・仕訳なし）、ELECTION_ID_2（新しい選挙）には
+    候補者A（LEDGER_ID_3・仕訳3件）が立候補している。
+    """
+    return {
+        "districts": [
+            {"id": str(DISTRICT_ID_1), "name": "第1区", "type": "HR"},
+            {"id": str(DISTRICT_ID_2), "name": "第2区", "type": "HR"},
+        ],
+        "elections": [
+            {
+                "id": str(ELECTION_ID),
+                "name": "古い選挙",
+                "type": "general",
+                "district_id": str(DISTRICT_ID_1),
+                "election_date": "2024-01-01",
+            },
+            {
+                "id": str(ELECTION_ID_2),
+                "name": "新しい選挙",
+                "type": "general",
+                "district_id": str(DISTRICT_ID_2),
+                "election_date": "2026-01-01",
+            },
+        ],
+        "politicians": [
+            {
+                "id": str(POLITICIAN_ID_1),
+                "name": "候補者A",
+                "name_kana": "コウホシャエー",
+            },
+            {
+                "id": str(POLITICIAN_ID_2),
+                "name": "候補者B",
+                "name_kana": "コウホシャビー",
+            },
+        ],
+        "politician_elections": [
+            {
+                "id": str(PE_ID_1),
+                "politician_id": str(POLITICIAN_ID_1),
+                "election_id": str(ELECTION_ID),
+            },
+            {
+                "id": str(PE_ID_2),
+                "politician_id": str(POLITICIAN_ID_2),
+                "election_id": str(ELECTION_ID),
+            },
+            {
+                "id": str(PE_ID_3),
+                "politician_id": str(POLITICIAN_ID_1),
+                "election_id": str(ELECTION_ID_2),
+            },
+        ],
+        "public_ledgers": [
+            _ledger_row(LEDGER_ID_1, PE_ID_1, 1000, 300, 2),
+            _ledger_row(LEDGER_ID_2, PE_ID_2, 0, 0, 0),
+            _ledger_row(LEDGER_ID_3, PE_ID_3, 1000, 400, 3),
+            {
+                **_ledger_row(NON_ELECTION_LEDGER_ID, PE_ID_1, 0, 0, 0),
+                "ledger_type": "political_fund",
+                "politician_election_id": None,
+                "politician_organization_id": str(uuid4()),
+                "fiscal_year": 2024,
+            },
+        ],
+        "account_codes": [{"code": "EXP_PRINTING_ELEC", "name": "印刷費（マスタ）"}],
+        "public_journals": [
+            _journal_row(LEDGER_ID_1, "EXP_PRINTING_ELEC", 300, 100),
+            _journal_row(
+                LEDGER_ID_1, "REV_SELF_FINANCING", 1000, None, date="2026-01-30"
+            ),
+            _journal_row(LEDGER_ID_3, "EXP_PRINTING_ELEC", 200, 100),
+            _journal_row(LEDGER_ID_3, "EXP_PRINTING_ELEC", 100, 0),
+            _journal_row(LEDGER_ID_3, "EXP_TRANSPORT_ELEC", 100, 50),
+        ],
+    }
+
+
+def _create_test_app(supabase) -> FastAPI:
     test_app = FastAPI()
 
     @test_app.exception_handler(MultipleCandidatesException)
@@ -67,10 +175,15 @@ def _create_test_app(mock_supabase: MagicMock) -> FastAPI:
         )
 
     test_app.include_router(polimoney.router, prefix="/api/v1")
-    test_app.dependency_overrides[get_supabase_client_dep] = lambda: mock_supabase
+    test_app.dependency_overrides[get_supabase_client_dep] = lambda: supabase
     return test_app
 
 
+@pytest.fixture
+def election_app() -> FastAPI:
+    return _create_test_app(InMemorySupabase(_election_tables()))
+
+
 class TestSumPublicExpenseByLedger:
     """公費負担集計ユーティリティのテスト"""
 
@@ -98,67 +211,62 @@ class TestSumPublicExpenseByLedger:
 class TestPolimoneyElectionsAPI:
     """公開選挙一覧APIのテスト"""
 
-    def test_deduplicates_and_sorts_elections(self):
-        mock_supabase = MagicMock()
-        mock_supabase.table.return_value = _chainable_query(
-            [
-                {
-                    "election_id": str(ELECTION_ID),
-                    "elections": {
-                        "id": str(ELECTION_ID),
-                        "name": "古い選挙",
-                        "type": "general",
-                        "election_date": "2024-01-01",
-                        "district": {"id": str(uuid4()), "name": "第1区"},
-                    },
-                },
-                {
-                    "election_id": str(ELECTION_ID),
-                    "elections": {
-                        "id": str(ELECTION_ID),
-                        "name": "古い選挙",
-                        "type": "general",
-                        "election_date": "2024-01-01",
-                        "district": {"id": str(uuid4()), "name": "第1区"},
-                    },
-                },
-                {
-                    "election_id": str(ELECTION_ID_2),
-                    "elections": {
-                        "id": str(ELECTION_ID_2),
-                        "name": "新しい選挙",
-                        "type": "general",
-                        "election_date": "2026-01-01",
-                        "district": {"id": str(uuid4()), "name": "第2区"},
-                    },
-                },
-            ]
-        )
-
-        client = TestClient(_create_test_app(mock_supabase))
+    def test_deduplicates_and_sorts_elections(self, election_app):
+        client = TestClient(election_app)
         response = client.get("/api/v1/polimoney/elections")
 
         assert response.status_code == 200
         body = response.json()
         assert body["total_count"] == 2
         assert body["data"][0]["name"] == "新しい選挙"
+        assert body["data"][0]["district_name"] == "第2区"
         assert body["data"][1]["name"] == "古い選挙"
 
+    def test_excludes_elections_without_election_ledgers(self):
+        tables = _election_tables()
+        tables["public_ledgers"] = [
+            ledger
+            for ledger in tables["public_ledgers"]
+            if ledger["id"] != str(LEDGER_ID_3)
+        ]
+
+        client = TestClient(_create_test_app(InMemorySupabase(tables)))
+        response = client.get("/api/v1/polimoney/elections")
+
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()["data"]] == [str(ELECTION_ID)]
+
+    @pytest.mark.asyncio
+    async def test_reads_repository_outside_event_loop(self):
+        supabase = InMemorySupabase(_election_tables())
+        table = supabase.table
+        threads = []
+
+        def recording_table(name):
+            threads.append(threading.get_ident())
+            return table(name)
+
+        supabase.table = recording_table
+        async with AsyncClient(
+            transport=ASGITransport(app=_create_test_app(supabase)),
+            base_url="http://testserver",
+        ) as client:
+            # スナップショットに当たらないようクエリ文字列を変える
+            response = await client.get("/api/v1/polimoney/elections?thread=1")
+
+        assert response.status_code == 200
+        # リポジトリの読み出しはブロッキングのため、イベントループのスレッドでは行わない
+        assert threads
+        assert threading.get_ident() not in threads
+
 
 class TestPolimoneyElectionJournalsAPI:
     """選挙別仕訳APIのテスト"""
 
     @pytest.mark.asyncio
-    async def test_returns_404_when_election_not_found(self):
-        mock_supabase = MagicMock()
-        elections_query = _chainable_query(None)
-        mock_supabase.table.side_effect = (
-            lambda name: elections_query if name == "elections" else MagicMock()
-        )
-
-        test_app = _create_test_app(mock_supabase)
+    async def test_returns_404_when_election_not_found(self, election_app):
         async with AsyncClient(
-            transport=ASGITransport(app=test_app),
+            transport=ASGITransport(app=election_app),
             base_url="http://testserver",
         ) as client:
             response = await client.get(
@@ -169,32 +277,11 @@ class TestPolimoneyElectionJournalsAPI:
         assert response.json()["detail"] == "選挙情報が見つかりません"
 
     @pytest.mark.asyncio
-    async def test_returns_400_when_multiple_candidates_without_politician_id(self):
-        mock_supabase = MagicMock()
-
-        def table_side_effect(name):
-            if name == "elections":
-                return _chainable_query({"id": str(ELECTION_ID)})
-            if name == "public_ledgers":
-                return _chainable_query(
-                    [
-                        {
-                            "id": str(LEDGER_ID_1),
-                            "politician_id": str(POLITICIAN_ID_1),
-                        },
-                        {
-                            "id": str(LEDGER_ID_2),
-                            "politician_id": str(POLITICIAN_ID_2),
-                        },
-                    ]
-                )
-            return MagicMock()
-
-        mock_supabase.table.side_effect = table_side_effect
-
-        test_app = _create_test_app(mock_supabase)
+    async def test_returns_400_when_multiple_candidates_without_politician_id(
+        self, election_app
+    ):
         async with AsyncClient(
-            transport=ASGITransport(app=test_app),
+            transport=ASGITransport(app=election_app),
             base_url="http://testserver",
         ) as client:
             response = await client.get(
@@ -205,19 +292,39 @@ class TestPolimoneyElectionJournalsAPI:
         body = response.json()
         assert "error" in body
         assert len(body["candidates"]) == 2
+        assert {
+            (candidate["politician_id"], candidate["ledger_id"])
+            for candidate in body["candidates"]
+        } == {
+            (str(POLITICIAN_ID_1), str(LEDGER_ID_1)),
+            (str(POLITICIAN_ID_2), str(LEDGER_ID_2)),
+        }
+
+    @pytest.mark.asyncio
+    async def test_returns_journals_of_specified_candidate(self, election_app):
+        async with AsyncClient(
+            transport=ASGITransport(app=election_app),
+            base_url="http://testserver",
+        ) as client:
+            response = await client.get(
+                f"/api/v1/polimoney/elections/{ELECTION_ID}/journals",
+                params={"politician_id": str(POLITICIAN_ID_1)},
+            )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert len(body["data"]) == 2
+        assert body["meta"]["politician"]["name"] == "候補者A"
+        assert body["meta"]["election"]["district_name"] == "第1区"
 
 
 class TestPolimoneyElectionCandidatesAPI:
     """候補者一覧APIのテスト"""
 
     @pytest.mark.asyncio
-    async def test_returns_404_when_election_not_found(self):
-        mock_supabase = MagicMock()
-        mock_supabase.table.return_value = _chainable_query(None)
-
-        test_app = _create_test_app(mock_supabase)
+    async def test_returns_404_when_election_not_found(self, election_app):
         async with AsyncClient(
-            transport=ASGITransport(app=test_app),
+            transport=ASGITransport(app=election_app),
             base_url="http://testserver",
         ) as client:
             response = await client.get(
@@ -228,61 +335,20 @@ class TestPolimoneyElectionCandidatesAPI:
         assert response.json()["detail"] == "選挙情報が見つかりません"
 
     @pytest.mark.asyncio
-    async def test_aggregates_public_expense_total(self):
-        mock_supabase = MagicMock()
-
-        def table_side_effect(name):
-            if name == "elections":
-                return _chainable_query({"id": str(ELECTION_ID)})
-            if name == "public_ledgers":
-                return _chainable_query(
-                    [
-                        {
-                            "id": str(LEDGER_ID_1),
-                            "politician_id": str(POLITICIAN_ID_1),
-                            "total_income": 1000,
-                            "total_expense": 400,
-                            "journal_count": 2,
-                            "politicians": {
-                                "id": str(POLITICIAN_ID_1),
-                                "name": "候補者A",
-                                "name_kana": "コウホシャエー",
-                            },
-                        }
-                    ]
-                )
-            if name == "public_journals":
-                return _chainable_query(
-                    [
-                        {
-                            "ledger_id": str(LEDGER_ID_1),
-                            "public_expense_amount": 100,
-                        },
-                        {
-                            "ledger_id": str(LEDGER_ID_1),
-                            "public_expense_amount": 0,
-                        },
-                        {
-                            "ledger_id": str(LEDGER_ID_1),
-                            "public_expense_amount": 50,
-                        },
-                    ]
-                )
-            return MagicMock()
-
-        mock_supabase.table.side_effect = table_side_effect
-
-        test_app = _create_test_app(mock_supabase)
+    async def test_aggregates_public_expense_total(self, election_app):
         async with AsyncClient(
-            transport=ASGITransport(app=test_app),
+            transport=ASGITransport(app=election_app),
             base_url="http://testserver",
         ) as client:
             response = await client.get(
-                f"/api/v1/polimoney/elections/{ELECTION_ID}/candidates"
+                f"/api/v1/polimoney/elections/{ELECTION_ID_2}/candidates"
             )
 
         assert response.status_code == 200
-        candidate = response.json()["data"][0]
+        body = response.json()
+        assert body["total_count"] == 1
+        candidate = body["data"][0]
+        assert candidate["politician"]["name"] == "候補者A"
         assert candidate["summary"]["public_expense_total"] == 150
         assert candidate["summary"]["balance"] == 600
 
@@ -291,29 +357,9 @@ class TestPolimoneyLedgerJournalsAPI:
     """台帳別仕訳APIのテスト"""
 
     @pytest.mark.asyncio
-    async def test_returns_400_for_non_election_ledger(self):
-        mock_supabase = MagicMock()
-        mock_supabase.table.return_value = _chainable_query(
-            {
-                "id": str(NON_ELECTION_LEDGER_ID),
-                "election_id": None,
-                "politician_id": str(POLITICIAN_ID_1),
-                "organization_id": str(uuid4()),
-                "fiscal_year": 2024,
-                "total_income": 0,
-                "total_expense": 0,
-                "journal_count": 0,
-                "ledger_source_id": str(uuid4()),
-                "last_updated_at": "2026-01-01",
-                "first_synced_at": "2026-01-01",
-                "created_at": "2026-01-01",
-                "is_test": False,
-            }
-        )
-
-        test_app = _create_test_app(mock_supabase)
+    async def test_returns_400_for_non_election_ledger(self, election_app):
         async with AsyncClient(
-            transport=ASGITransport(app=test_app),
+            transport=ASGITransport(app=election_app),
             base_url="http://testserver",
         ) as client:
             response = await client.get(
@@ -324,16 +370,211 @@ class TestPolimoneyLedgerJournalsAPI:
         assert response.json()["detail"] == "選挙台帳以外は非対応です"
 
     @pytest.mark.asyncio
-    async def test_returns_404_when_ledger_not_found(self):
-        mock_supabase = MagicMock()
-        mock_supabase.table.return_value = _chainable_query(None)
-
-        test_app = _create_test_app(mock_supabase)
+    async def test_returns_404_when_ledger_not_found(self, election_app):
         async with AsyncClient(
-            transport=ASGITransport(app=test_app),
+            transport=ASGITransport(app=election_app),
             base_url="http://testserver",
         ) as client:
             response = await client.get(f"/api/v1/polimoney/ledgers/{uuid4()}/journals")
 
         assert response.status_code == 404
         assert response.json()["detail"] == "台帳が見つかりません"
+
+    def test_stream_output_matches_buffered_response(self, election_app):
+        client = TestClient(election_app)
+        url = f"/api/v1/polimoney/ledgers/{LEDGER_ID_1}/journals"
+        frozen_datetime = MagicMock(wraps=datetime)
+        frozen_datetime.now.return_value = datetime(2026, 2, 2, 12, 0, 0)
+        with patch("app.utils.election_funds_response.datetime", frozen_datetime):
+            buffered = client.get(url)
+            streamed = client.get(url, params={"stream": "true"})
+
+        assert buffered.status_code == 200
+        assert streamed.status_code == 200
+        assert streamed.headers["content-type"] == "application/json"
+        assert streamed.content == buffered.content
+        assert buffered.json()["meta"]["summary"]["public_expense_total"] == 100
+
+
+class TestPolimoneyElectionBundleAPI:
+    """選挙バンドルAPIのテスト"""
+
+    def test_groups_journals_by_candidate_with_single_journals_query(self):
+        supabase = InstrumentedClient(InMemorySupabase(_election_tables()))
+
+        client = TestClient(_create_test_app(supabase))
+        with capture_queries() as stats:
+            response = client.get(f"/api/v1/polimoney/elections/{ELECTION_ID}/bundle")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["total_count"] == 2
+        first, second = body["data"]
+        assert first["ledger_id"] == str(LEDGER_ID_1)
+        assert len(first["journals"]) == 2
+        assert first["journals"][0]["category_name"] == "印刷費（マスタ）"
+        assert first["summary"]["public_expense_total"] == 100
+        assert second["politician"]["name"] == "候補者B"
+        assert second["journals"] == []
+        assert stats.per_query[("public_ledgers", "select")] == 1
+        assert stats.per_query[("public_journals", "select")] == 1
+
+    def test_stays_within_query_budget(self, query_budget):
+        supabase = InstrumentedClient(InMemorySupabase(_election_tables()))
+
+        client = TestClient(_create_test_app(supabase))
+        # 台帳・勘定科目・仕訳の3クエリ（候補者数に依存しない）
+        with query_budget(3):
+            response = client.get(f"/api/v1/polimoney/elections/{ELECTION_ID}/bundle")
+
+        assert response.status_code == 200
+
+    def test_stream_output_matches_buffered_response(self, election_app):
+        client = TestClient(election_app)
+        buffered = client.get(f"/api/v1/polimoney/elections/{ELECTION_ID}/bundle")
+        streamed = client.get(
+            f"/api/v1/polimoney/elections/{ELECTION_ID}/bundle",
+            params={"stream": "true"},
+        )
+
+        assert streamed.status_code == 200
+        assert streamed.content == buffered.content
+
+    def test_returns_404_when_election_not_found(self, election_app):
+        client = TestClient(election_app)
+        response = client.get(
+            f"/api/v1/polimoney/elections/{MISSING_ELECTION_ID}/bundle",
+            params={"stream": "true"},
+        )
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == "選挙情報が見つかりません"
+
+    @pytest.mark.parametrize("stream", ["false", "true"])
+    def test_returns_404_when_all_candidates_lack_politician(self, stream):
+        tables = _election_tables()
+        tables["politicians"] = []
+        supabase = InstrumentedClient(InMemorySupabase(tables))
+
+        client = TestClient(_create_test_app(supabase))
+        with capture_queries() as stats:
+            response = client.get(
+                f"/api/v1/polimoney/elections/{ELECTION_ID}/bundle",
+                params={"stream": stream},
+            )
+
+        # 台帳がすべて除かれる場合も、ストリーミングで空の data を返さない
+        assert response.status_code == 404
+        assert response.json()["detail"] == "該当選挙の候補者が見つかりません"
+        assert ("public_journals", "select") not in stats.per_query
+
+
+class TestPolimoneyChangesAPI:
+    """変更フィードAPIのテスト"""
+
+    @pytest.fixture(autouse=True)
+    def _clear_master_data(self):
+        clear_master_data_cache()
+        yield
+        clear_master_data_cache()
+
+    @staticmethod
+    def _changes_app(ledgers, journals) -> FastAPI:
+        return _create_test_app(
+            InMemorySupabase(
+                {
+                    "politician_elections": [
+                        {
+                            "id": str(PE_ID_1),
+                            "politician_id": str(POLITICIAN_ID_1),
+                            "election_id": str(ELECTION_ID),
+                        }
+                    ],
+                    "public_ledgers": ledgers,
+                    "elections": [],
+                    "public_journals": journals,
+                    "account_codes": [{"code": "EXP_PRINTING_ELEC", "name": "印刷費"}],
+                }
+            )
+        )
+
+    def test_returns_changes_and_cursor_at_last_rows(self):
+        journal = _journal_row(LEDGER_ID_1, "EXP_PRINTING_ELEC", 300, 100)
+        ledger = _ledger_row(LEDGER_ID_1, PE_ID_1, 0, 300, 1)
+
+        client = TestClient(self._changes_app([ledger], [journal]))
+        response = client.get("/api/v1/polimoney/changes")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["has_more"] is False
+        assert body["elections"] == []
+        assert body["ledgers"][0]["election_id"] == str(ELECTION_ID)
+        assert body["ledgers"][0]["politician_id"] == str(POLITICIAN_ID_1)
+        assert body["journals"][0]["ledger_id"] == str(LEDGER_ID_1)
+        assert body["journals"][0]["category_name"] == "印刷費"
+        assert body["journals"][0]["type"] == "選挙運動"
+
+        # 変更の無かった選挙は取得位置を持たない
+        assert decode_cursor(body["next_cursor"]) == {
+            "ledgers": (SYNCED_AT, str(LEDGER_ID_1)),
+            "journals": (journal["synced_at"], journal["id"]),
+        }
+
+    def test_filters_after_cursor_position_and_reports_has_more(self):
+        since = "2026-01-29T00:00:00+00:00"
+        cursor_id = "55555555-5555-5555-5555-555555555555"
+        before, after, later = (
+            {
+                **_journal_row(uuid4(), "EXP_PRINTING_ELEC", amount, None),
+                "id": journal_id,
+                "synced_at": synced_at,
+            }
+            for amount, journal_id, synced_at in (
+                (100, "11111111-5555-5555-5555-555555555555", since),
+                (200, "99999999-5555-5555-5555-555555555555", since),
+                (300, "33333333-5555-5555-5555-555555555555", SYNCED_AT),
+            )
+        )
+        cursor = encode_cursor({"journals": (since, cursor_id)})
+
+        client = TestClient(self._changes_app([], [later, after, before]))
+        response = client.get(
+            "/api/v1/polimoney/changes", params={"since": cursor, "limit": 1}
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["has_more"] is True
+        assert len(body["journals"]) == 1
+        assert body["journals"][0]["amount"] == 200
+        assert body["journals"][0]["type"] == "政治活動"
+        assert decode_cursor(body["next_cursor"])["journals"] == (since, after["id"])
+
+        response = client.get(
+            "/api/v1/polimoney/changes",
+            params={"since": body["next_cursor"], "limit": 1},
+        )
+
+        body = response.json()
+        assert body["has_more"] is False
+        assert [journal["amount"] for journal in body["journals"]] == [300]
+
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            "not-a-cursor",
+            "e30x",
+            "eyJmb28iOlsiYSIsImIiXX0",
+            # ID にフィルタ条件を埋め込んだカーソル
+            "eyJsZWRnZXJzIjpbIjIwMjYtMDEtMDFUMDA6MDA6MDArMDA6MDAiLCIwKSxsZWRnZXJfdHlwZS5lcS54LGFuZChpZC5ndC4wIl19",
+            # ID が文字列でないカーソル
+            "eyJsZWRnZXJzIjpbIjIwMjYtMDEtMDFUMDA6MDA6MDArMDA6MDAiLDEyM119",
+        ],
+    )
+    def test_returns_400_for_invalid_cursor(self, cursor):
+        client = TestClient(self._changes_app([], []))
+        response = client.get("/api/v1/polimoney/changes", params={"since": cursor})
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "カーソルが不正です"
@@ -0,0 +1,201 @@
+"""X-Profile によるリクエスト単位のプロファイルのテスト"""
+
+import asyncio
+import contextvars
+import sys
+import threading
+from uuid import uuid4
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+
+from app.config import settings
+from app.core.profiling import ProfiledRoute, StackProfiler, profile_in_thread
+from app.middleware.profiling import ProfilingMiddleware
+from app.utils.election_funds_response import build_election_funds_data_item
+
+
+def _journal_row():
+    return {
+        "id": str(uuid4()),
+        "date": "2026-01-29",
+        "description": "ポスター印刷",
+        "amount": 1000,
+        "contact_id": None,
+        "account_code": "EXP_PRINTING_ELEC",
+        "classification": "campaign",
+        "non_monetary_basis": None,
+        "note": None,
+        "public_expense_amount": 0,
+    }
+
+
+def _build_journals():
+    return [build_election_funds_data_item(_journal_row(), {}) for _ in range(50)]
+
+
+def _create_test_app() -> FastAPI:
+    test_app = FastAPI()
+    test_app.add_middleware(ProfilingMiddleware)
+    router = APIRouter(route_class=ProfiledRoute)
+
+    @router.get("/journals")
+    def get_journals():
+        # 本番のエンドポイントと同じくスレッドプールで動く同期関数
+        return _build_journals()
+
+    @router.get("/async-journals")
+    async def get_async_journals():
+        return _build_journals()
+
+    test_app.include_router(router)
+    return test_app
+
+
+PROFILE_HEADERS = {"X-Profile": "1", "X-Profile-Token": "secret-token"}
+
+
+@pytest.fixture(autouse=True)
+def profiling_token(monkeypatch):
+    monkeypatch.setattr(settings, "profiling_token", "secret-token")
+
+
+class TestProfilingMiddleware:
+    """プロファイルの返却と実行条件のテスト"""
+
+    def test_returns_folded_profile_covering_builders(self):
+
+        response = TestClient(_create_test_app()).get(
+            "/journals", headers=PROFILE_HEADERS
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert response.headers["x-profile-status"] == "200"
+        lines = response.text.splitlines()
+        assert any("build_election_funds_data_item" in line for line in lines)
+        stack, microseconds = lines[0].rsplit(" ", 1)
+        assert ";" in stack
+        assert int(microseconds) > 0
+
+    def test_profiles_async_endpoint_on_event_loop(self):
+
+        response = TestClient(_create_test_app()).get(
+            "/async-journals", headers=PROFILE_HEADERS
+        )
+
+        assert response.headers["x-profile-status"] == "200"
+        assert "build_election_funds_data_item" in response.text
+
+    def test_passes_through_without_header(self):
+
+        response = TestClient(_create_test_app()).get("/journals")
+
+        assert response.headers["content-type"] == "application/json"
+        assert "x-profile-status" not in response.headers
+
+    def test_ignores_header_without_matching_token(self):
+        client = TestClient(_create_test_app())
+
+        response = client.get("/journals", headers={"X-Profile": "1"})
+        wrong_token = client.get(
+            "/journals", headers={"X-Profile": "1", "X-Profile-Token": "wrong"}
+        )
+
+        assert response.headers["content-type"] == "application/json"
+        assert wrong_token.headers["content-type"] == "application/json"
+
+    def test_allows_matching_token(self):
+        response = TestClient(_create_test_app()).get(
+            "/journals", headers=PROFILE_HEADERS
+        )
+
+        assert response.headers["x-profile-status"] == "200"
+
+    def test_debug_mode_does_not_enable_profiling_without_token(self, monkeypatch):
+        monkeypatch.setattr(settings, "debug", True)
+        monkeypatch.setattr(settings, "profiling_token", None)
+
+        response = TestClient(_create_test_app()).get(
+            "/journals", headers={"X-Profile": "1"}
+        )
+
+        assert response.headers["content-type"] == "application/json"
+
+    @pytest.mark.asyncio
+    async def test_rejects_overlapping_profile_and_restores_profiler(self):
+        started = asyncio.Event()
+        release = asyncio.Event()
+        test_app = FastAPI()
+        test_app.add_middleware(ProfilingMiddleware)
+
+        @test_app.get("/slow")
+        async def get_slow():
+            started.set()
+            await release.wait()
+            return {}
+
+        profile_before = sys.getprofile()
+        async with AsyncClient(
+            transport=ASGITransport(app=test_app), base_url="http://testserver"
+        ) as client:
+            first = asyncio.create_task(client.get("/slow", headers=PROFILE_HEADERS))
+            await started.wait()
+            # 2件目が拒否されない場合は release を待ち続けるため時間を区切る
+            second = await asyncio.wait_for(
+                client.get("/slow", headers=PROFILE_HEADERS), timeout=5
+            )
+            release.set()
+            first_response = await first
+            third = await client.get("/slow", headers=PROFILE_HEADERS)
+
+        assert second.status_code == 409
+        assert first_response.headers["x-profile-status"] == "200"
+        assert third.headers["x-profile-status"] == "200"
+        assert sys.getprofile() is profile_before
+
+
+class TestStackProfiler:
+    """スタック単位の自己時間の集計のテスト"""
+
+    def test_attributes_self_time_to_nested_stack(self):
+        def inner():
+            return sum(range(20000))
+
+        def outer():
+            return inner()
+
+        with StackProfiler() as profiler:
+            outer()
+
+        inner_path = next(
+            path for path in profiler.stacks if "<locals>.inner " in path[-1]
+        )
+        assert "<locals>.outer " in inner_path[-2]
+        assert profiler.stacks[inner_path] > 0
+
+    def test_ignores_calls_from_other_contexts(self):
+        def other_request():
+            return sum(range(20000))
+
+        with StackProfiler() as profiler:
+            # 同じスレッドで動く他のリクエスト（別のコンテキスト）に相当
+            contextvars.Context().run(other_request)
+
+        assert not any("other_request" in path[-1] for path in profiler.stacks)
+
+    def test_profile_thread_records_worker_thread(self):
+        def in_worker():
+            return sum(range(20000))
+
+        with StackProfiler() as profiler:
+            worker = threading.Thread(
+                target=contextvars.copy_context().run,
+                args=(profile_in_thread(in_worker),),
+            )
+            worker.start()
+            worker.join()
+
+        assert any("<locals>.in_worker " in path[-1] for path in profiler.stacks)
@@ -0,0 +1,220 @@
+"""クエリ集計（Server-Timing・N+1 検出・クエリ数の上限）のテスト"""
+
+import logging
+import math
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.snapshot_cache import snapshot_cache
+from app.database.instrumentation import InstrumentedClient
+from app.database.memory import InMemorySupabase
+from app.database.pagination import DEFAULT_PAGE_SIZE
+from app.database.supabase import (
+    get_admin_supabase_client_dep,
+    get_supabase_client_dep,
+)
+from app.main import app
+from app.middleware.server_timing import ServerTimingMiddleware
+from app.routers import sync
+from app.utils.master_data import clear_master_data_cache
+from benchmarks.synthetic import add_political_fund_ledger, build_synthetic_election
+
+LEDGER_ID = "cccccccc-cccc-cccc-cccc-cccccccccccc"
+
+# 仕訳を複数ページ（DEFAULT_PAGE_SIZE 件ごと）に分けて読む件数
+READ_JOURNAL_COUNT = 2500
+
+# 読み取りエンドポイントの仕訳のページ以外のクエリ数（台帳・選挙・マスタ等）と、
+# 仕訳をページ単位で読むかどうか
+READ_QUERY_BUDGETS = {
+    "elections": (1, False),
+    "election_journals": (7, True),
+    "election_candidates": (3, False),
+    "election_bundle": (2, True),
+    "ledger_journals": (5, True),
+    "election_funds": (5, True),
+    "political_funds": (3, True),
+}
+
+
+def _query(data):
+    query = MagicMock()
+    for method_name in ("select", "eq", "maybe_single", "insert", "update"):
+        setattr(query, method_name, MagicMock(return_value=query))
+    query.execute.return_value = MagicMock(data=data)
+    return query
+
+
+def _instrumented_supabase(table_data: dict) -> InstrumentedClient:
+    mock_supabase = MagicMock()
+    mock_supabase.table.side_effect = lambda name: _query(table_data.get(name))
+    return InstrumentedClient(mock_supabase)
+
+
+def _create_test_app(n_plus_one_threshold: int = 20) -> FastAPI:
+    supabase = _instrumented_supabase({"public_ledgers": [{"id": LEDGER_ID}]})
+    test_app = FastAPI()
+    test_app.add_middleware(
+        ServerTimingMiddleware, n_plus_one_threshold=n_plus_one_threshold
+    )
+
+    @test_app.get("/ledgers")
+    def get_ledgers():
+        for _ in range(3):
+            supabase.table("public_ledgers").select("id").execute()
+        return {"status": "ok"}
+
+    return test_app
+
+
+class TestServerTiming:
+    """Server-Timing ヘッダーと N+1 検出のテスト"""
+
+    def test_reports_query_count_and_time(self):
+        response = TestClient(_create_test_app()).get("/ledgers")
+
+        server_timing = response.headers["server-timing"]
+        assert server_timing.startswith("db;dur=")
+        assert 'desc="3 queries"' in server_timing
+        assert ", app;dur=" in server_timing
+
+    def test_warns_repeated_queries(self, caplog):
+        with caplog.at_level(logging.WARNING):
+            TestClient(_create_test_app(n_plus_one_threshold=2)).get("/ledgers")
+
+        assert "N+1" in caplog.text
+        assert "public_ledgers.selectx3" in caplog.text
+
+
+class TestSyncQueryBudget:
+    """同期APIのクエリ数の上限"""
+
+    @staticmethod
+    def _sync_app() -> tuple[FastAPI, InMemorySupabase]:
+        memory = InMemorySupabase(
+            {
+                "public_ledgers": [
+                    {
+                        "id": LEDGER_ID,
+                        "ledger_type": "election_fund",
+                        "fiscal_year": 2026,
+                        "ledger_source_id": "ledger-1",
+                        "last_updated_at": "2026-01-30T00:00:00+00:00",
+                        "first_synced_at": "2026-01-30T00:00:00+00:00",
+                    }
+                ]
+            }
+        )
+        supabase = InstrumentedClient(memory)
+        test_app = FastAPI()
+        test_app.include_router(sync.router, prefix="/api/v1")
+        test_app.dependency_overrides[get_admin_supabase_client_dep] = lambda: supabase
+        return test_app, memory
+
+    @staticmethod
+    def _journals_body(journal_count: int, content_hash: str = "hash") -> dict:
+        return {
+            "journals": [
+                {
+                    "journal_source_id": f"journal-{index}",
+                    "ledger_source_id": "ledger-1",
+                    "amount": 300,
+                    "account_code": "EXP_PRINTING_ELEC",
+                    "content_hash": content_hash,
+                }
+                for index in range(journal_count)
+            ]
+        }
+
+    def test_sync_journals_query_count_is_constant_per_chunk(
+        self, query_budget, monkeypatch
+    ):
+        monkeypatch.setattr(sync, "SYNC_JOURNAL_CHUNK_SIZE", 2)
+        test_app, memory = self._sync_app()
+        body = self._journals_body(5)
+
+        # チャンク（2件ずつ3チャンク）ごとに既存検索・書き込みの各1往復と、
+        # リクエスト内で1回の台帳解決
+        with query_budget(2 * 3 + 1) as stats:
+            response = TestClient(test_app).post("/api/v1/sync/journals", json=body)
+
+        assert response.status_code == 200
+        assert response.json()["data"]["created"] == 5
+        assert stats.per_query[("public_journals", "upsert")] == 3
+        assert stats.per_query[("public_ledgers", "select")] == 1
+        assert len(memory.tables["public_journals"]) == 5
+
+        # 内容が変わらない仕訳は既存検索・台帳解決のみで書き込まない
+        with query_budget(3 + 1) as stats:
+            response = TestClient(test_app).post("/api/v1/sync/journals", json=body)
+
+        assert response.json()["data"]["skipped"] == 5
+        assert stats.per_query[("public_journals", "upsert")] == 0
+
+    def test_sync_journals_query_count_does_not_grow_with_journals(self, query_budget):
+        test_app, memory = self._sync_app()
+        client = TestClient(test_app)
+        client.post("/api/v1/sync/journals", json=self._journals_body(50))
+
+        with query_budget(3) as stats:
+            response = client.post(
+                "/api/v1/sync/journals",
+                json=self._journals_body(50, content_hash="changed"),
+            )
+
+        assert response.json()["data"]["updated"] == 50
+        assert stats.per_query[("public_journals", "upsert")] == 1
+        assert {row["content_hash"] for row in memory.tables["public_journals"]} == {
+            "changed"
+        }
+
+
+@pytest.fixture(scope="module")
+def read_dataset():
+    dataset = build_synthetic_election(READ_JOURNAL_COUNT, other_journal_count=0)
+    political_ledger_id = add_political_fund_ledger(dataset.tables, READ_JOURNAL_COUNT)
+    politician_id = next(
+        pe["politician_id"]
+        for pe in dataset.tables["politician_elections"]
+        if pe["id"] == str(dataset.ledger.politician_election_id)
+    )
+    polimoney = "/api/v1/polimoney"
+    election = f"{polimoney}/elections/{dataset.election_id}"
+    paths = {
+        "elections": f"{polimoney}/elections",
+        "election_journals": f"{election}/journals?politician_id={politician_id}",
+        "election_candidates": f"{election}/candidates",
+        "election_bundle": f"{election}/bundle",
+        "ledger_journals": f"{polimoney}/ledgers/{dataset.ledger_id}/journals",
+        "election_funds": f"/api/v1/election-funds/{dataset.ledger_id}",
+        "political_funds": f"/api/v1/political-funds/{political_ledger_id}",
+    }
+    return dataset, paths
+
+
+class TestReadQueryBudget:
+    """読み取りAPIのクエリ数の上限（候補者数・仕訳件数で N+1 にならない）"""
+
+    @pytest.fixture
+    def client(self, read_dataset, monkeypatch):
+        supabase = InstrumentedClient(InMemorySupabase(read_dataset[0].tables))
+        app.dependency_overrides[get_supabase_client_dep] = lambda: supabase
+        # キャッシュ済みのボディ・マスタを使わず、毎回すべて読み出す
+        monkeypatch.setattr(snapshot_cache, "ttl_seconds", 0)
+        clear_master_data_cache()
+        yield TestClient(app)
+        app.dependency_overrides.clear()
+        clear_master_data_cache()
+
+    @pytest.mark.parametrize("name", list(READ_QUERY_BUDGETS))
+    def test_stays_within_query_budget(self, client, read_dataset, query_budget, name):
+        fixed_queries, paged = READ_QUERY_BUDGETS[name]
+        pages = math.ceil(READ_JOURNAL_COUNT / DEFAULT_PAGE_SIZE) if paged else 0
+
+        with query_budget(fixed_queries + pages):
+            response = client.get(read_dataset[1][name])
+
+        assert response.status_code == 200
@@ -0,0 +1,293 @@
+"""読み取りリポジトリのテスト"""
+
+import asyncio
+import threading
+from datetime import date
+from uuid import UUID, uuid4
+
+import httpx
+import orjson
+import pytest
+from postgrest import SyncPostgrestClient
+
+from app.core.query_stats import capture_queries
+from app.repositories import (
+    InMemoryReadRepository,
+    PostgresReadRepository,
+    PostgrestReadRepository,
+)
+from app.repositories.postgres import (
+    JOURNALS_FOR_LEDGERS_SQL,
+    LEDGER_JOURNALS_AFTER_SQL,
+    LEDGER_JOURNALS_SQL,
+    PUBLIC_EXPENSE_TOTALS_SQL,
+    UNDATED_LEDGER_JOURNALS_AFTER_SQL,
+    UNDATED_LEDGER_JOURNALS_SQL,
+)
+from app.utils.election_funds_response import sum_public_expense_by_ledger
+from benchmarks.synthetic import build_synthetic_election
+
+
+@pytest.fixture(scope="module")
+def dataset():
+    return build_synthetic_election(50, other_journal_count=10)
+
+
+class TestInMemoryReadRepository:
+    """インメモリのリポジトリ（PostgREST バックエンドのクエリ）のテスト"""
+
+    def test_list_candidate_ledgers_orders_by_id_with_politicians(self, dataset):
+        repository = InMemoryReadRepository(dataset.tables)
+
+        ledgers = repository.list_candidate_ledgers(dataset.election_id)
+
+        assert len(ledgers) == 3
+        assert [ledger["id"] for ledger in ledgers] == sorted(
+            ledger["id"] for ledger in ledgers
+        )
+        for ledger in ledgers:
+            pol_elec = ledger["politician_elections"]
+            assert pol_elec["election_id"] == str(dataset.election_id)
+            assert pol_elec["politicians"]["name"].startswith("候補者")
+
+    def test_iter_ledger_journals_pages_in_date_order(self, dataset):
+        repository = InMemoryReadRepository(dataset.tables, page_size=7)
+
+        rows = list(repository.iter_ledger_journals(dataset.ledger_id))
+
+        expected = sorted(
+            dataset.journal_rows, key=lambda row: (row["date"], row["id"])
+        )
+        assert [row["id"] for row in rows] == [row["id"] for row in expected]
+
+    def test_public_expense_totals_sums_positive_amounts(self, dataset):
+        repository = InMemoryReadRepository(dataset.tables)
+        ledger_ids = [
+            ledger["id"]
+            for ledger in repository.list_candidate_ledgers(dataset.election_id)
+        ]
+
+        totals = repository.public_expense_totals(ledger_ids)
+
+        journals = [
+            row
+            for row in dataset.tables["public_journals"]
+            if row["ledger_id"] in ledger_ids
+        ]
+        assert totals == sum_public_expense_by_ledger(journals)
+
+    def test_list_published_elections_returns_each_election_once(self, dataset):
+        repository = InMemoryReadRepository(dataset.tables)
+
+        elections = repository.list_published_elections()
+
+        assert sorted(election["id"] for election in elections) == sorted(
+            election["id"] for election in dataset.tables["elections"]
+        )
+        assert all(election["district"]["name"] for election in elections)
+
+    def test_missing_rows(self, dataset):
+        repository = InMemoryReadRepository(dataset.tables)
+
+        assert repository.get_ledger(uuid4()) is None
+        assert repository.get_district(uuid4()) is None
+        assert repository.election_exists(uuid4()) is False
+        assert repository.election_exists(dataset.election_id) is True
+
+
+class TestPostgrestReadRepository:
+    """PostgREST のリポジトリのテスト（実際の postgrest クライアントを使う）"""
+
+    @staticmethod
+    def _repository(handler) -> PostgrestReadRepository:
+        client = SyncPostgrestClient(
+            "http://postgrest.test",
+            http_client=httpx.Client(
+                base_url="http://postgrest.test",
+                transport=httpx.MockTransport(handler),
+            ),
+        )
+        return PostgrestReadRepository(client)
+
+    def test_missing_rows_return_none(self):
+        # maybe_single で該当行が無い場合の PostgREST の応答（406 / PGRST116）
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                406,
+                json={
+                    "code": "PGRST116",
+                    "details": "The result contains 0 rows",
+                    "hint": None,
+                    "message": "JSON object requested, multiple (or no) rows returned",
+                },
+            )
+
+        repository = self._repository(handler)
+
+        assert repository.get_ledger(uuid4()) is None
+        assert repository.election_exists(uuid4()) is False
+        assert repository.get_politician_election(uuid4()) is None
+        assert repository.get_politician_organization(uuid4()) is None
+        assert repository.get_district(uuid4()) is None
+        assert repository.get_election_type("XX") is None
+
+    def test_existing_row_returns_data(self):
+        district_id = str(uuid4())
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"id": district_id, "name": "第1区"})
+
+        repository = self._repository(handler)
+
+        assert repository.get_district(UUID(district_id)) == {
+            "id": district_id,
+            "name": "第1区",
+        }
+
+
+class _FakePool:
+    """SQL ごとに用意した行を返すコネクションプール"""
+
+    def __init__(self, results):
+        self.results = results
+        self.calls = []
+
+    async def fetch(self, sql, *args):
+        self.calls.append((sql, args))
+        return self.results(sql, args)
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield loop
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+class TestPostgresReadRepository:
+    """PostgreSQL 直結のリポジトリ（DB を使わない部分）のテスト"""
+
+    @staticmethod
+    def _journal_pool(journals):
+        """仕訳の SQL を条件・並び順・件数まで再現するコネクションプール"""
+
+        def sort_key(row):
+            return (row["ledger_id"], row["date"] is None, row["date"] or "", row["id"])
+
+        def results(sql, args):
+            if sql == JOURNALS_FOR_LEDGERS_SQL:
+                ledger_ids, limit = args
+                rows = [row for row in journals if row["ledger_id"] in ledger_ids]
+            else:
+                ledger_id, limit, *key = args
+                rows = [row for row in journals if row["ledger_id"] == ledger_id]
+                if sql == LEDGER_JOURNALS_AFTER_SQL:
+                    after = (key[0].isoformat(), key[1])
+                    rows = [
+                        row
+                        for row in rows
+                        if row["date"] is not None and (row["date"], row["id"]) > after
+                    ]
+                elif sql == UNDATED_LEDGER_JOURNALS_SQL:
+                    rows = [row for row in rows if row["date"] is None]
+                elif sql == UNDATED_LEDGER_JOURNALS_AFTER_SQL:
+                    rows = [
+                        row
+                        for row in rows
+                        if row["date"] is None and row["id"] > key[0]
+                    ]
+                else:
+                    assert sql == LEDGER_JOURNALS_SQL
+            rows = sorted(rows, key=sort_key)[:limit]
+            return [(orjson.dumps(row).decode(),) for row in rows]
+
+        return _FakePool(results)
+
+    @staticmethod
+    def _journals(ledger_id, dated, undated):
+        rows = [
+            {"id": str(uuid4()), "ledger_id": ledger_id, "date": f"2026-01-0{day}"}
+            for day in range(1, dated + 1)
+        ]
+        rows += [
+            {"id": str(uuid4()), "ledger_id": ledger_id, "date": None}
+            for _ in range(undated)
+        ]
+        return rows
+
+    def test_iter_ledger_journals_pages_by_date_and_id_key(self, loop):
+        ledger_id = uuid4()
+        journals = self._journals(str(ledger_id), dated=5, undated=3)
+        pool = self._journal_pool(journals)
+        repository = PostgresReadRepository(pool, loop, page_size=2)
+
+        with capture_queries() as stats:
+            rows = list(repository.iter_ledger_journals(ledger_id))
+
+        dated, undated = journals[:5], sorted(journals[5:], key=lambda row: row["id"])
+        assert rows == dated + undated
+        # OFFSET を使わず、前ページの最後の行のキーの次から読む
+        assert [(sql, args[2:]) for sql, args in pool.calls] == [
+            (LEDGER_JOURNALS_SQL, ()),
+            (LEDGER_JOURNALS_AFTER_SQL, (date(2026, 1, 2), dated[1]["id"])),
+            (LEDGER_JOURNALS_AFTER_SQL, (date(2026, 1, 4), dated[3]["id"])),
+            (UNDATED_LEDGER_JOURNALS_SQL, ()),
+            (UNDATED_LEDGER_JOURNALS_AFTER_SQL, (undated[1]["id"],)),
+        ]
+        assert stats.per_query[("public_journals", "select")] == 5
+
+    def test_iter_journals_for_ledgers_continues_per_ledger(self, loop):
+        ledger_ids = sorted(str(uuid4()) for _ in range(3))
+        journals = [
+            *self._journals(ledger_ids[0], dated=1, undated=0),
+            *self._journals(ledger_ids[1], dated=1, undated=2),
+            *self._journals(ledger_ids[2], dated=2, undated=0),
+        ]
+        pool = self._journal_pool(journals)
+        repository = PostgresReadRepository(pool, loop, page_size=2)
+
+        rows = list(repository.iter_journals_for_ledgers(ledger_ids[::-1]))
+
+        assert [(row["ledger_id"], row["date"]) for row in rows] == [
+            (row["ledger_id"], row["date"]) for row in journals
+        ]
+        assert [sql for sql, _ in pool.calls] == [
+            JOURNALS_FOR_LEDGERS_SQL,
+            LEDGER_JOURNALS_AFTER_SQL,
+            UNDATED_LEDGER_JOURNALS_SQL,
+            UNDATED_LEDGER_JOURNALS_AFTER_SQL,
+            LEDGER_JOURNALS_SQL,
+            LEDGER_JOURNALS_AFTER_SQL,
+            UNDATED_LEDGER_JOURNALS_SQL,
+        ]
+
+    def test_single_page_is_read_with_one_query(self, loop):
+        ledger_ids = [str(uuid4()), str(uuid4())]
+        pool = self._journal_pool(
+            [self._journals(ledger_id, 1, 0)[0] for ledger_id in ledger_ids]
+        )
+        repository = PostgresReadRepository(pool, loop, page_size=3)
+
+        assert len(list(repository.iter_journals_for_ledgers(ledger_ids))) == 2
+        assert len(list(repository.iter_ledger_journals(ledger_ids[0]))) == 1
+        assert [sql for sql, _ in pool.calls] == [
+            JOURNALS_FOR_LEDGERS_SQL,
+            LEDGER_JOURNALS_SQL,
+        ]
+
+    def test_public_expense_totals_converts_rows(self, loop):
+        ledger_id = str(uuid4())
+        pool = _FakePool(lambda sql, args: [(ledger_id, 1500)])
+        repository = PostgresReadRepository(pool, loop)
+
+        assert repository.public_expense_totals([ledger_id]) == {ledger_id: 1500}
+        assert pool.calls == [(PUBLIC_EXPENSE_TOTALS_SQL, ([ledger_id],))]
+
+    def test_missing_row_returns_none(self, loop):
+        repository = PostgresReadRepository(_FakePool(lambda sql, args: []), loop)
+
+        assert repository.get_ledger(uuid4()) is None
@@ -0,0 +1,135 @@
+"""リクエストID・構造化ログのテスト"""
+
+import json
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.structured_logging import JsonFormatter, RequestIdFilter
+from app.database.supabase import get_admin_supabase_client_dep
+from app.middleware.request_id import RequestIdMiddleware
+from app.routers import sync
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.lines = []
+        self.addFilter(RequestIdFilter())
+        self.setFormatter(JsonFormatter())
+
+    def emit(self, record):
+        self.lines.append(json.loads(self.format(record)))
+
+
+@pytest.fixture
+def json_logs():
+    """app 配下のロガーの出力を JSON として集める"""
+    handler = _ListHandler()
+    logger = logging.getLogger("app")
+    previous_level = logger.level
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    yield handler.lines
+    logger.removeHandler(handler)
+    logger.setLevel(previous_level)
+
+
+def _create_test_app() -> FastAPI:
+    test_app = FastAPI()
+    test_app.add_middleware(RequestIdMiddleware)
+
+    @test_app.get("/items")
+    def get_items():
+        logging.getLogger("app.test").info("処理中", extra={"item_count": 2})
+        return {"status": "ok"}
+
+    @test_app.get("/stream")
+    def get_stream():
+        return StreamingResponse(iter([b"a", b"b"]), media_type="text/plain")
+
+    return test_app
+
+
+class TestRequestIdMiddleware:
+    """リクエストIDの付与・引き継ぎのテスト"""
+
+    def test_generates_request_id(self):
+        response = TestClient(_create_test_app()).get("/items")
+
+        assert len(response.headers["x-request-id"]) == 36
+
+    def test_propagates_incoming_request_id(self):
+        response = TestClient(_create_test_app()).get(
+            "/items", headers={"X-Request-ID": "upstream-123"}
+        )
+
+        assert response.headers["x-request-id"] == "upstream-123"
+
+    def test_replaces_invalid_incoming_request_id(self):
+        response = TestClient(_create_test_app()).get(
+            "/items", headers={"X-Request-ID": "bad id {}"}
+        )
+
+        assert response.headers["x-request-id"] != "bad id {}"
+
+    def test_keeps_streaming_response(self):
+        response = TestClient(_create_test_app()).get("/stream")
+
+        assert response.text == "ab"
+        assert "x-request-id" in response.headers
+
+    def test_logs_request_id_and_timing_as_json(self, json_logs):
+        TestClient(_create_test_app()).get(
+            "/items", headers={"X-Request-ID": "upstream-123"}
+        )
+
+        app_log, access_log = json_logs
+        assert app_log["message"] == "処理中"
+        assert app_log["request_id"] == "upstream-123"
+        assert app_log["item_count"] == 2
+        assert access_log["logger"] == "app.access"
+        assert access_log["request_id"] == "upstream-123"
+        assert access_log["status"] == 200
+        assert access_log["path"] == "/items"
+        assert access_log["duration_ms"] >= 0
+
+
+class TestSyncLogging:
+    """同期APIのエラーログのテスト"""
+
+    def test_logs_missing_ledger_with_source_ids(self, json_logs):
+        query = MagicMock()
+        for method_name in ("select", "in_"):
+            setattr(query, method_name, MagicMock(return_value=query))
+        query.execute.return_value = MagicMock(data=[])
+        supabase = MagicMock()
+        supabase.table.return_value = query
+        test_app = FastAPI()
+        test_app.add_middleware(RequestIdMiddleware)
+        test_app.include_router(sync.router, prefix="/api/v1")
+        test_app.dependency_overrides[get_admin_supabase_client_dep] = lambda: supabase
+        body = {
+            "journals": [
+                {
+                    "journal_source_id": "journal-1",
+                    "ledger_source_id": "ledger-1",
+                    "amount": 300,
+                    "account_code": "EXP_PRINTING_ELEC",
+                    "content_hash": "hash",
+                }
+            ]
+        }
+
+        response = TestClient(test_app).post("/api/v1/sync/journals", json=body)
+
+        assert response.json()["data"]["errors"] == 1
+        warning = next(log for log in json_logs if log["level"] == "WARNING")
+        assert warning["logger"] == "app.routers.sync"
+        assert warning["journal_source_id"] == "journal-1"
+        assert warning["ledger_source_id"] == "ledger-1"
+        assert warning["request_id"] == response.headers["x-request-id"]
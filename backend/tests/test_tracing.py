@@ -0,0 +1,216 @@
+"""トレーシング（スパンの記録と出力）のテスト"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
+    ExportTraceServiceRequest,
+)
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+from opentelemetry.trace import SpanKind, StatusCode
+
+from app.core.tracing import configure_tracing, set_tracer_provider, start_span
+from app.database.instrumentation import InstrumentedClient
+from app.middleware.tracing import TracingMiddleware
+from app.models.public_ledgers import PublicLedger
+from app.utils import election_funds_response
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+PARENT_SPAN_ID = "00f067aa0ba902b7"
+
+
+@pytest.fixture
+def finished_spans():
+    """スパンをメモリに記録し、終了したスパンを名前で引ける辞書を返す関数を渡す"""
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    set_tracer_provider(provider)
+
+    def collect():
+        return {span.name: span for span in exporter.get_finished_spans()}
+
+    yield collect
+    set_tracer_provider(None)
+
+
+def _query_mock(data):
+    query = MagicMock()
+    for method_name in ("select", "eq", "order", "maybe_single"):
+        setattr(query, method_name, MagicMock(return_value=query))
+    query.execute.return_value = MagicMock(data=data)
+    return query
+
+
+def _create_test_app() -> FastAPI:
+    raw_client = MagicMock()
+    raw_client.table.return_value = _query_mock([])
+    supabase = InstrumentedClient(raw_client)
+    test_app = FastAPI()
+    test_app.add_middleware(TracingMiddleware)
+
+    @test_app.get("/ledgers/{ledger_id}/journals")
+    def get_journals(ledger_id: str):
+        supabase.table("public_journals").select("*").eq("ledger_id", ledger_id).order(
+            "date"
+        ).execute()
+        return {"status": "ok"}
+
+    return test_app
+
+
+class TestTracingMiddleware:
+    """リクエスト・Supabase 呼び出しのスパンのテスト"""
+
+    def test_records_request_span_with_query_child_span(self, finished_spans):
+        TestClient(_create_test_app()).get("/ledgers/secret-ledger/journals")
+
+        spans = finished_spans()
+        request_span = spans["GET /ledgers/{ledger_id}/journals"]
+        query_span = spans["select public_journals"]
+        assert request_span.kind == SpanKind.SERVER
+        assert request_span.parent is None
+        assert request_span.attributes["http.response.status_code"] == 200
+        assert request_span.attributes["http.route"] == "/ledgers/{ledger_id}/journals"
+        assert query_span.kind == SpanKind.CLIENT
+        assert query_span.context.trace_id == request_span.context.trace_id
+        assert query_span.parent.span_id == request_span.context.span_id
+        assert query_span.attributes["db.sql.table"] == "public_journals"
+        # フィルターの値（ledger_id）は記録しない
+        assert query_span.attributes["db.filter_shape"] == (
+            "select.eq(ledger_id).order(date)"
+        )
+
+    def test_continues_incoming_traceparent(self, finished_spans):
+        TestClient(_create_test_app()).get(
+            "/ledgers/1/journals",
+            headers={"traceparent": f"00-{TRACE_ID}-{PARENT_SPAN_ID}-01"},
+        )
+
+        request_span = finished_spans()["GET /ledgers/{ledger_id}/journals"]
+        assert request_span.context.trace_id == int(TRACE_ID, 16)
+        assert request_span.parent.span_id == int(PARENT_SPAN_ID, 16)
+
+    @pytest.mark.parametrize(
+        "traceparent", ["00-xyz-abc-01", f"00-{'0' * 32}-{PARENT_SPAN_ID}-01"]
+    )
+    def test_starts_new_trace_for_invalid_traceparent(
+        self, finished_spans, traceparent
+    ):
+        TestClient(_create_test_app()).get(
+            "/ledgers/1/journals", headers={"traceparent": traceparent}
+        )
+
+        request_span = finished_spans()["GET /ledgers/{ledger_id}/journals"]
+        assert request_span.parent is None
+        assert request_span.context.trace_id != 0
+
+    def test_records_nothing_when_disabled(self):
+        with start_span("noop") as span:
+            assert span is None
+
+
+class TestBuilderStageSpans:
+    """選挙資金レスポンスの処理段階のスパンのテスト"""
+
+    def test_records_stage_spans_under_parent(self, finished_spans, monkeypatch):
+        ledger_id = uuid4()
+        ledger = PublicLedger(
+            id=ledger_id,
+            politician_election_id=uuid4(),
+            ledger_type="election_fund",
+            fiscal_year=2026,
+            total_income=0,
+            total_expense=0,
+            journal_count=0,
+            ledger_source_id=uuid4(),
+            last_updated_at="2026-01-30T00:00:00+00:00",
+            first_synced_at="2026-01-30T00:00:00+00:00",
+            created_at="2026-01-30T00:00:00+00:00",
+        )
+        repository = MagicMock()
+        repository.iter_ledger_journals.return_value = iter([])
+        repository.get_account_code_names.return_value = {}
+        monkeypatch.setattr(
+            election_funds_response, "build_election_funds_meta", MagicMock()
+        )
+
+        with start_span("request"):
+            election_funds_response.build_election_funds_response_for_ledger(
+                repository, ledger_id, ledger
+            )
+
+        spans = finished_spans()
+        for name in ("fetch_journals", "join_metadata", "transform"):
+            assert spans[name].parent.span_id == spans["request"].context.span_id
+            assert spans[name].attributes["ledger_id"] == str(ledger_id)
+
+    def test_records_exception_and_error_status(self, finished_spans):
+        with pytest.raises(ValueError):
+            with start_span("failing"):
+                raise ValueError("boom")
+
+        span = finished_spans()["failing"]
+        assert span.status.status_code == StatusCode.ERROR
+        assert span.events[0].attributes["exception.type"] == "ValueError"
+
+
+class TestOtlpExporter:
+    """OTLP（HTTP/protobuf）出力のテスト"""
+
+    @pytest.fixture
+    def collector(self):
+        """受け取った OTLP のリクエストを記録するローカルの HTTP サーバー"""
+        requests: list[tuple[str, bytes]] = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                requests.append((self.path, body))
+                self.send_response(200)
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_port}", requests
+        server.shutdown()
+        thread.join()
+
+    def test_exports_spans_with_service_name(self, collector):
+        base_url, requests = collector
+        configure_tracing("otlp", f"{base_url}/v1/traces")
+        try:
+            with start_span("parent", {"ledger_id": "1"}):
+                with start_span("child"):
+                    pass
+        finally:
+            # 停止時に出力待ちのスパンを送る
+            set_tracer_provider(None)
+
+        assert [path for path, _ in requests] == ["/v1/traces"]
+        export_request = ExportTraceServiceRequest.FromString(requests[0][1])
+        resource_spans = export_request.resource_spans[0]
+        assert {
+            attribute.key: attribute.value.string_value
+            for attribute in resource_spans.resource.attributes
+        }["service.name"] == "polimoney-hub"
+        spans = {span.name: span for span in resource_spans.scope_spans[0].spans}
+        assert spans["child"].parent_span_id == spans["parent"].span_id
+        assert spans["parent"].attributes[0].key == "ledger_id"
+
+    def test_rejects_unknown_exporter(self):
+        with pytest.raises(ValueError):
+            configure_tracing("file")
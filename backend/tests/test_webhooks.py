@@ -0,0 +1,403 @@
+"""Webhook 配信・購読管理のテスト"""
+
+import asyncio
+import hashlib
+import hmac
+from unittest.mock import MagicMock
+from uuid import UUID
+
+import httpx
+import orjson
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.core.events import Broadcaster, LedgerUpdateEvent
+from app.core.webhooks import (
+    DELIVERY_HEADER,
+    SIGNATURE_HEADER,
+    WebhookDispatcher,
+    WebhookSubscription,
+    is_global_address,
+    resolve_host,
+)
+from app.database.supabase import get_admin_supabase_client_dep
+from app.routers import webhooks
+from app.utils import webhooks as webhook_utils
+from app.utils.webhooks import fetch_webhook_subscriptions_for_events
+
+LEDGER_ID_1 = "cccccccc-cccc-cccc-cccc-cccccccccccc"
+LEDGER_ID_2 = "dddddddd-dddd-dddd-dddd-dddddddddddd"
+ELECTION_ID = "11111111-1111-1111-1111-111111111111"
+SUBSCRIPTION_ID = UUID("99999999-9999-9999-9999-999999999999")
+ADMIN_API_KEY = "admin-key"
+
+
+def _event(ledger_id=LEDGER_ID_1, total_expense=300):
+    return LedgerUpdateEvent(
+        ledger_id=ledger_id,
+        ledger_type="election_fund",
+        election_id=ELECTION_ID,
+        total_income=0,
+        total_expense=total_expense,
+        journal_count=1,
+        source="journals",
+    )
+
+
+# 名前解決は行わず、example ドメインをグローバルなアドレスとして扱う
+ADDRESSES = {"a.example": ["93.184.216.34"], "b.example": ["93.184.216.35"]}
+
+
+async def _resolve_host(host):
+    return ADDRESSES[host]
+
+
+def _dispatcher(subscriptions, responses, **kwargs):
+    requests: list[httpx.Request] = []
+    statuses = iter(responses)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(next(statuses, 200))
+
+    kwargs.setdefault("resolve_host", _resolve_host)
+    dispatcher = WebhookDispatcher(
+        lambda _events: subscriptions,
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        retry_base_seconds=0,
+        **kwargs,
+    )
+    return dispatcher, requests
+
+
+class TestWebhookDispatcher:
+    """WebhookDispatcher のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_batches_latest_event_per_ledger_for_each_url(self):
+        subscriptions = [
+            WebhookSubscription(
+                id="1", url="https://a.example/hook", election_id=ELECTION_ID
+            ),
+            WebhookSubscription(
+                id="2", url="https://a.example/hook", ledger_id=LEDGER_ID_1
+            ),
+            WebhookSubscription(
+                id="3", url="https://b.example/hook", ledger_id=LEDGER_ID_2
+            ),
+        ]
+        dispatcher, requests = _dispatcher(subscriptions, [])
+
+        await dispatcher.dispatch(
+            [
+                _event(LEDGER_ID_1, total_expense=100),
+                _event(LEDGER_ID_2),
+                _event(LEDGER_ID_1, total_expense=200),
+            ]
+        )
+        await dispatcher.drain()
+
+        payloads = {
+            request.headers["host"]: orjson.loads(request.content)
+            for request in requests
+        }
+        assert len(requests) == 2
+        assert [
+            (event["ledger_id"], event["total_expense"])
+            for event in payloads["a.example"]["events"]
+        ] == [(LEDGER_ID_1, 200), (LEDGER_ID_2, 300)]
+        assert [event["ledger_id"] for event in payloads["b.example"]["events"]] == [
+            LEDGER_ID_2
+        ]
+
+    @pytest.mark.asyncio
+    async def test_connects_to_resolved_address_with_original_host(self):
+        dispatcher, requests = _dispatcher([], [])
+
+        assert await dispatcher.deliver("https://a.example:8443/hook", None, [])
+
+        assert str(requests[0].url) == "https://93.184.216.34:8443/hook"
+        assert requests[0].headers["host"] == "a.example:8443"
+        assert requests[0].extensions["sni_hostname"] == "a.example"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "addresses", [["127.0.0.1"], ["93.184.216.34", "10.0.0.1"], ["fe80::1%eth0"]]
+    )
+    async def test_aborts_when_host_resolves_to_internal_address(self, addresses):
+        async def rebound(host):
+            # 登録時はグローバルだったホストが内部アドレスを返すようになった場合
+            return addresses
+
+        dispatcher, requests = _dispatcher([], [], resolve_host=rebound)
+
+        assert await dispatcher.deliver("https://a.example/hook", None, []) is False
+        assert requests == []
+
+    @pytest.mark.asyncio
+    async def test_resolves_ip_literal_host(self):
+        addresses = await resolve_host("127.0.0.1")
+
+        assert addresses == ["127.0.0.1"]
+        assert not is_global_address(addresses[0])
+
+    @pytest.mark.asyncio
+    async def test_retries_when_host_cannot_be_resolved(self):
+        results = [OSError("temporary failure"), ["93.184.216.34"]]
+
+        async def flaky(host):
+            result = results.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        dispatcher, requests = _dispatcher([], [], resolve_host=flaky)
+
+        assert await dispatcher.deliver("https://a.example/hook", None, []) is True
+        assert len(requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_retries_server_errors_with_same_delivery_id(self):
+        subscription = WebhookSubscription(
+            id="1", url="https://a.example/hook", ledger_id=LEDGER_ID_1, secret="s"
+        )
+        dispatcher, requests = _dispatcher([subscription], [503, 429, 200])
+
+        delivered = await dispatcher.deliver(
+            subscription.url, subscription.secret, [_event()]
+        )
+
+        assert delivered is True
+        assert len(requests) == 3
+        assert len({request.headers[DELIVERY_HEADER] for request in requests}) == 1
+        expected_signature = hmac.new(
+            b"s", requests[0].content, hashlib.sha256
+        ).hexdigest()
+        assert requests[0].headers[SIGNATURE_HEADER] == f"sha256={expected_signature}"
+
+    @pytest.mark.asyncio
+    async def test_gives_up_on_client_error_and_after_max_attempts(self):
+        dispatcher, requests = _dispatcher([], [400], max_attempts=3)
+        assert await dispatcher.deliver("https://a.example/hook", None, []) is False
+        assert len(requests) == 1
+        assert SIGNATURE_HEADER not in requests[0].headers
+
+        dispatcher, requests = _dispatcher([], [500] * 5, max_attempts=3)
+        assert await dispatcher.deliver("https://a.example/hook", None, []) is False
+        assert len(requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_coalesces_published_events_within_window(self):
+        broadcaster = Broadcaster()
+        subscription = WebhookSubscription(
+            id="1", url="https://a.example/hook", election_id=ELECTION_ID
+        )
+        dispatcher, requests = _dispatcher(
+            [subscription], [], broadcaster=broadcaster, coalesce_seconds=0.05
+        )
+
+        dispatcher.start()
+        while not broadcaster.has_subscribers:
+            await asyncio.sleep(0)
+        for ledger_id in (LEDGER_ID_1, LEDGER_ID_2, LEDGER_ID_1):
+            broadcaster.publish(_event(ledger_id))
+        while not requests:
+            await asyncio.sleep(0.01)
+        await dispatcher.drain()
+        await dispatcher.stop()
+
+        assert len(requests) == 1
+        assert len(orjson.loads(requests[0].content)["events"]) == 2
+        assert not broadcaster.has_subscribers
+
+    @pytest.mark.asyncio
+    async def test_stops_requesting_events_without_active_subscriptions(self):
+        broadcaster = Broadcaster()
+        active = False
+        dispatcher, _ = _dispatcher(
+            [], [], broadcaster=broadcaster, has_active_subscriptions=lambda: active
+        )
+
+        dispatcher.start()
+        await dispatcher.refresh()
+        await asyncio.sleep(0)
+        assert not broadcaster.has_subscribers
+
+        active = True
+        await dispatcher.refresh()
+        assert broadcaster.has_subscribers
+        await dispatcher.stop()
+
+
+class TestWebhookSubscriptions:
+    """Webhook 購読の管理APIのテスト"""
+
+    @pytest.fixture(autouse=True)
+    def admin_api_key(self, monkeypatch):
+        monkeypatch.setattr(settings, "admin_api_key", ADMIN_API_KEY)
+        # 名前解決は行わず、example ドメインをグローバルなアドレスとして扱う
+        monkeypatch.setattr(
+            webhook_utils,
+            "_resolve_host",
+            lambda host: {"a.example": ["93.184.216.34"]}.get(host, [host]),
+        )
+
+    @staticmethod
+    def _client(query: MagicMock, api_key: str | None = ADMIN_API_KEY) -> TestClient:
+        mock_supabase = MagicMock()
+        mock_supabase.table.return_value = query
+        test_app = FastAPI()
+        test_app.include_router(webhooks.router, prefix="/api/v1")
+        test_app.dependency_overrides[get_admin_supabase_client_dep] = (
+            lambda: mock_supabase
+        )
+        headers = {"X-Admin-Api-Key": api_key} if api_key else {}
+        return TestClient(test_app, headers=headers)
+
+    @staticmethod
+    def _query(data):
+        query = MagicMock()
+        for method_name in (
+            "select",
+            "insert",
+            "delete",
+            "eq",
+            "or_",
+            "order",
+            "single",
+        ):
+            setattr(query, method_name, MagicMock(return_value=query))
+        query.execute.return_value = MagicMock(data=data)
+        return query
+
+    def test_creates_subscription_without_returning_secret(self):
+        query = self._query(
+            {
+                "id": str(SUBSCRIPTION_ID),
+                "url": "https://a.example/hook",
+                "secret": "s",
+                "election_id": ELECTION_ID,
+                "ledger_id": None,
+                "is_active": True,
+                "created_at": "2026-01-01T00:00:00+00:00",
+            }
+        )
+
+        response = self._client(query).post(
+            "/api/v1/webhooks",
+            json={
+                "url": "https://a.example/hook",
+                "secret": "s",
+                "election_id": ELECTION_ID,
+            },
+        )
+
+        assert response.status_code == 201
+        body = response.json()
+        assert body["has_secret"] is True
+        assert "secret" not in body
+        assert query.insert.call_args.args[0]["election_id"] == ELECTION_ID
+
+    @pytest.mark.parametrize(
+        "target",
+        [{}, {"election_id": ELECTION_ID, "ledger_id": LEDGER_ID_1}],
+    )
+    def test_requires_exactly_one_target(self, target):
+        response = self._client(self._query(None)).post(
+            "/api/v1/webhooks", json={"url": "https://a.example/hook", **target}
+        )
+
+        assert response.status_code == 422
+
+    @pytest.mark.parametrize("api_key", [None, "wrong"])
+    def test_rejects_requests_without_valid_api_key(self, api_key):
+        query = self._query([])
+
+        client = self._client(query, api_key=api_key)
+        responses = [
+            client.get("/api/v1/webhooks"),
+            client.delete(f"/api/v1/webhooks/{SUBSCRIPTION_ID}"),
+            client.post(
+                "/api/v1/webhooks",
+                json={"url": "https://a.example/hook", "election_id": ELECTION_ID},
+            ),
+        ]
+
+        assert [response.status_code for response in responses] == [401] * 3
+        query.execute.assert_not_called()
+
+    def test_rejects_all_requests_when_api_key_is_not_configured(self, monkeypatch):
+        monkeypatch.setattr(settings, "admin_api_key", None)
+
+        response = self._client(self._query([])).get("/api/v1/webhooks")
+
+        assert response.status_code == 503
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "http://a.example/hook",
+            "https://169.254.169.254/latest/meta-data/",
+            "https://10.0.0.1/hook",
+            "https://127.0.0.1/hook",
+            "https://[::1]/hook",
+            "https://[fe80::1]/hook",
+        ],
+    )
+    def test_rejects_non_https_or_internal_urls(self, url):
+        query = self._query(None)
+
+        response = self._client(query).post(
+            "/api/v1/webhooks", json={"url": url, "election_id": ELECTION_ID}
+        )
+
+        assert response.status_code == 400
+        query.insert.assert_not_called()
+
+    def test_rejects_hostname_resolving_to_internal_address(self, monkeypatch):
+        monkeypatch.setattr(webhook_utils, "_resolve_host", lambda host: ["10.1.2.3"])
+        query = self._query(None)
+
+        response = self._client(query).post(
+            "/api/v1/webhooks",
+            json={"url": "https://internal.example/hook", "election_id": ELECTION_ID},
+        )
+
+        assert response.status_code == 400
+        assert "内部ネットワーク" in response.json()["detail"]
+
+    def test_returns_404_when_deleting_missing_subscription(self):
+        response = self._client(self._query([])).delete(
+            f"/api/v1/webhooks/{SUBSCRIPTION_ID}"
+        )
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Webhook の購読が見つかりません"
+
+    def test_fetches_subscriptions_matching_ledger_or_election(self):
+        query = self._query(
+            [
+                {
+                    "id": str(SUBSCRIPTION_ID),
+                    "url": "https://a.example/hook",
+                    "secret": None,
+                    "election_id": None,
+                    "ledger_id": LEDGER_ID_2,
+                }
+            ]
+        )
+        mock_supabase = MagicMock()
+        mock_supabase.table.return_value = query
+
+        subscriptions = fetch_webhook_subscriptions_for_events(
+            mock_supabase, [_event(LEDGER_ID_2), _event(LEDGER_ID_1)]
+        )
+
+        query.or_.assert_called_once_with(
+            f"ledger_id.in.({LEDGER_ID_1},{LEDGER_ID_2}),"
+            f"election_id.in.({ELECTION_ID})"
+        )
+        assert subscriptions[0].matches(_event(LEDGER_ID_2))
+        assert not subscriptions[0].matches(_event(LEDGER_ID_1))
@@ -0,0 +1,24 @@
+-- ============================================
+-- 変更フィード（/api/v1/polimoney/changes）用のインデックス
+-- Supabase SQL Editor で実行してください
+-- ============================================
+
+-- 更新日時・ID 順のキーセット読み出し用
+CREATE INDEX IF NOT EXISTS idx_public_ledgers_last_updated ON public_ledgers(last_updated_at, id);
+CREATE INDEX IF NOT EXISTS idx_public_journals_synced ON public_journals(synced_at, id);
+CREATE INDEX IF NOT EXISTS idx_elections_updated ON elections(updated_at, id);
+
+-- elections.updated_at を更新時に自動で設定する
+CREATE OR REPLACE FUNCTION set_elections_updated_at()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.updated_at = NOW();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_elections_updated_at ON elections;
+CREATE TRIGGER trg_elections_updated_at
+    BEFORE UPDATE ON elections
+    FOR EACH ROW
+    EXECUTE FUNCTION set_elections_updated_at();
@@ -0,0 +1,37 @@
+-- ============================================
+-- 読み取り・同期の主要クエリ用の複合・カバリングインデックス
+-- Supabase SQL Editor で実行してください
+-- （仕訳が多い環境では psql から CREATE INDEX CONCURRENTLY で作成すると
+--   書き込みを止めずに済みます。SQL Editor はトランザクション内で実行するため
+--   CONCURRENTLY は使えません）
+-- ============================================
+
+-- 台帳の仕訳を日付・ID順にページングする（WHERE ledger_id = ? ORDER BY date, id）
+-- 並べ替えなしでインデックス順に読み出せる
+CREATE INDEX IF NOT EXISTS idx_public_journals_ledger_date ON public_journals(ledger_id, date, id);
+
+-- 台帳ごとの公費負担合計（WHERE ledger_id IN (...) AND public_expense_amount > 0）
+-- 公費負担のある仕訳のみを持つ部分インデックスで、テーブルを読まずに集計する
+CREATE INDEX IF NOT EXISTS idx_public_journals_public_expense ON public_journals(ledger_id)
+    INCLUDE (public_expense_amount)
+    WHERE public_expense_amount > 0;
+
+-- 選挙の候補者台帳（WHERE politician_election_id = ? AND ledger_type = 'election_fund'）
+-- 絞り込みの効く politician_election_id を先頭にする
+CREATE INDEX IF NOT EXISTS idx_public_ledgers_pol_elec_type ON public_ledgers(politician_election_id, ledger_type);
+
+-- 選挙の候補者（WHERE election_id = ?）。中間テーブルの ID も持たせ、
+-- テーブルを読まずに候補者台帳との結合に使う
+CREATE INDEX IF NOT EXISTS idx_pol_elec_election_politician ON politician_elections(election_id, politician_id)
+    INCLUDE (id);
+
+-- 上の複合インデックスの先頭列と重複するため削除する
+DROP INDEX IF EXISTS idx_public_journals_ledger;
+DROP INDEX IF EXISTS idx_public_ledgers_pol_elec;
+DROP INDEX IF EXISTS idx_pol_elec_election;
+
+-- 同期の既存レコード検索（public_ledgers.ledger_source_id・public_journals.journal_source_id・
+-- public_contacts.contact_source_id の等価検索）は UNIQUE 制約のインデックスを使う。
+-- contact_source_id には制約と同じ列のインデックスが別にあり、書き込みのたびに
+-- 二重に更新されるため削除する
+DROP INDEX IF EXISTS idx_public_contacts_source;
@@ -0,0 +1,23 @@
+-- ============================================
+-- Webhook 購読（台帳更新の通知先）
+-- Supabase SQL Editor で実行してください
+-- ============================================
+
+-- 選挙単位または台帳単位で通知先 URL を登録する
+CREATE TABLE IF NOT EXISTS webhook_subscriptions (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    url TEXT NOT NULL,
+    secret TEXT,
+    election_id UUID REFERENCES elections(id),
+    ledger_id UUID REFERENCES public_ledgers(id) ON DELETE CASCADE,
+    is_active BOOLEAN DEFAULT TRUE,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    CHECK ((election_id IS NULL) <> (ledger_id IS NULL))
+);
+
+CREATE INDEX IF NOT EXISTS idx_webhook_subscriptions_election ON webhook_subscriptions(election_id) WHERE is_active;
+CREATE INDEX IF NOT EXISTS idx_webhook_subscriptions_ledger ON webhook_subscriptions(ledger_id) WHERE is_active;
+
+-- 通知先の secret を含むため service_role のみ読み書きできる
+ALTER TABLE webhook_subscriptions ENABLE ROW LEVEL SECURITY;
+CREATE POLICY "Allow service write" ON webhook_subscriptions FOR ALL USING (auth.role() = 'service_role');
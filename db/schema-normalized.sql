@@ -143,6 +143,22 @@ CREATE INDEX IF NOT EXISTS idx_elections_type ON elections(type);
 CREATE INDEX IF NOT EXISTS idx_elections_date ON elections(election_date);
 CREATE INDEX IF NOT EXISTS idx_elections_district ON elections(district_id);
 CREATE INDEX IF NOT EXISTS idx_elections_active ON elections(is_active);
+CREATE INDEX IF NOT EXISTS idx_elections_updated ON elections(updated_at, id);
+
+-- elections.updated_at を更新時に自動で設定する（変更フィード用）
+CREATE OR REPLACE FUNCTION set_elections_updated_at()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.updated_at = NOW();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_elections_updated_at ON elections;
+CREATE TRIGGER trg_elections_updated_at
+    BEFORE UPDATE ON elections
+    FOR EACH ROW
+    EXECUTE FUNCTION set_elections_updated_at();
 
 -- ============================================
 -- 中間テーブル（新規）
@@ -173,7 +189,7 @@ CREATE TABLE IF NOT EXISTS politician_elections (
 );
 
 CREATE INDEX IF NOT EXISTS idx_pol_elec_politician ON politician_elections(politician_id);
-CREATE INDEX IF NOT EXISTS idx_pol_elec_election ON politician_elections(election_id);
+CREATE INDEX IF NOT EXISTS idx_pol_elec_election_politician ON politician_elections(election_id, politician_id) INCLUDE (id);
 
 -- ============================================
 -- 公開データ（Ledger から同期）
@@ -265,12 +281,14 @@ CREATE TABLE IF NOT EXISTS ledger_change_logs (
 
 CREATE INDEX IF NOT EXISTS idx_public_ledgers_type ON public_ledgers(ledger_type);
 CREATE INDEX IF NOT EXISTS idx_public_ledgers_pol_org ON public_ledgers(politician_organization_id);
-CREATE INDEX IF NOT EXISTS idx_public_ledgers_pol_elec ON public_ledgers(politician_election_id);
+CREATE INDEX IF NOT EXISTS idx_public_ledgers_pol_elec_type ON public_ledgers(politician_election_id, ledger_type);
 CREATE INDEX IF NOT EXISTS idx_public_ledgers_fiscal_year ON public_ledgers(fiscal_year);
+CREATE INDEX IF NOT EXISTS idx_public_ledgers_last_updated ON public_ledgers(last_updated_at, id);
 CREATE INDEX IF NOT EXISTS idx_public_contacts_ledger ON public_contacts(ledger_id);
-CREATE INDEX IF NOT EXISTS idx_public_contacts_source ON public_contacts(contact_source_id);
-CREATE INDEX IF NOT EXISTS idx_public_journals_ledger ON public_journals(ledger_id);
+CREATE INDEX IF NOT EXISTS idx_public_journals_ledger_date ON public_journals(ledger_id, date, id);
+CREATE INDEX IF NOT EXISTS idx_public_journals_public_expense ON public_journals(ledger_id) INCLUDE (public_expense_amount) WHERE public_expense_amount > 0;
 CREATE INDEX IF NOT EXISTS idx_public_journals_date ON public_journals(date);
+CREATE INDEX IF NOT EXISTS idx_public_journals_synced ON public_journals(synced_at, id);
 CREATE INDEX IF NOT EXISTS idx_public_journals_contact ON public_journals(contact_id);
 CREATE INDEX IF NOT EXISTS idx_change_logs_ledger ON ledger_change_logs(ledger_id);
 CREATE INDEX IF NOT EXISTS idx_change_logs_changed_at ON ledger_change_logs(changed_at DESC);
@@ -380,6 +398,24 @@ CREATE TABLE IF NOT EXISTS admin_users (
 CREATE INDEX IF NOT EXISTS idx_admin_users_email ON admin_users(email);
 CREATE INDEX IF NOT EXISTS idx_admin_users_active ON admin_users(is_active);
 
+-- ============================================
+-- Webhook 購読（台帳更新の通知先）
+-- ============================================
+
+CREATE TABLE IF NOT EXISTS webhook_subscriptions (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    url TEXT NOT NULL,
+    secret TEXT,
+    election_id UUID REFERENCES elections(id),
+    ledger_id UUID REFERENCES public_ledgers(id) ON DELETE CASCADE,
+    is_active BOOLEAN DEFAULT TRUE,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    CHECK ((election_id IS NULL) <> (ledger_id IS NULL))
+);
+
+CREATE INDEX IF NOT EXISTS idx_webhook_subscriptions_election ON webhook_subscriptions(election_id) WHERE is_active;
+CREATE INDEX IF NOT EXISTS idx_webhook_subscriptions_ledger ON webhook_subscriptions(ledger_id) WHERE is_active;
+
 -- ============================================
 -- Row Level Security (RLS)
 -- ============================================
@@ -403,6 +439,7 @@ ALTER TABLE election_requests ENABLE ROW LEVEL SECURITY;
 ALTER TABLE organization_requests ENABLE ROW LEVEL SECURITY;
 ALTER TABLE unlock_requests ENABLE ROW LEVEL SECURITY;
 ALTER TABLE admin_users ENABLE ROW LEVEL SECURITY;
+ALTER TABLE webhook_subscriptions ENABLE ROW LEVEL SECURITY;
 
 -- 読み取りポリシー（全員許可）
 CREATE POLICY "Allow public read" ON municipalities FOR SELECT USING (true);
@@ -452,3 +489,4 @@ CREATE POLICY "Allow service write" ON election_requests FOR ALL USING (auth.rol
 CREATE POLICY "Allow service write" ON organization_requests FOR ALL USING (auth.role() = 'service_role');
 CREATE POLICY "Allow service write" ON unlock_requests FOR ALL USING (auth.role() = 'service_role');
 CREATE POLICY "Allow service write" ON admin_users FOR ALL USING (auth.role() = 'service_role');
+CREATE POLICY "Allow service write" ON webhook_subscriptions FOR ALL USING (auth.role() = 'service_role');